@@ -0,0 +1,69 @@
+"""
+Admin routes for the quota-aware odds fetch planner.
+
+Provides endpoints for:
+- Current odds refresh plan (budget, slate interval, per-event schedule)
+- Running one planner tick on demand
+"""
+import logging
+from typing import Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Header, Query
+
+from app.core.config import settings
+from app.services.core.odds_api_service import get_odds_service
+from app.services.core.odds_fetch_planner import get_odds_fetch_planner
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["admin"])
+
+
+def _check_admin_token(x_admin_token: Optional[str]) -> None:
+    """Reject the request if ADMIN_TOKEN is configured and does not match."""
+    if settings.ADMIN_TOKEN and x_admin_token != settings.ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or missing admin token"
+        )
+
+
+@router.get("/odds/plan")
+async def get_odds_plan(
+    refresh: bool = Query(False, description="Re-plan now from the last fetched slate"),
+    x_admin_token: Optional[str] = Header(None)
+) -> Dict:
+    """
+    Get the odds fetch planner's current plan.
+
+    Shows the remaining quota, daily budget, slate refresh interval and the
+    per-event refresh schedule by tip-off proximity. Planning makes no
+    Odds API requests.
+
+    Requires X-Admin-Token header when ADMIN_TOKEN is set.
+    """
+    _check_admin_token(x_admin_token)
+
+    planner = get_odds_fetch_planner()
+    plan = planner.last_plan
+    if plan is None or refresh:
+        odds_service = get_odds_service(settings.THE_ODDS_API_KEY)
+        plan = planner.replan(odds_service.requests_remaining)
+
+    return plan.to_dict()
+
+
+@router.post("/odds/plan/run")
+async def run_odds_plan(
+    x_admin_token: Optional[str] = Header(None)
+) -> Dict:
+    """
+    Run one planner tick now: fetch the slate and events that are due.
+
+    Requires X-Admin-Token header when ADMIN_TOKEN is set.
+    """
+    _check_admin_token(x_admin_token)
+
+    logger.info("🔄 Odds planner tick triggered via API")
+    planner = get_odds_fetch_planner()
+    return await planner.run_due(get_odds_service(settings.THE_ODDS_API_KEY))
@@ -197,7 +197,8 @@ async def capture_game_odds(
     Capture odds snapshots for a specific game.
 
     Fetches player props from The Odds API and stores them
-    as historical odds snapshots.
+    as historical odds snapshots. Only lines that are new or have moved
+    since the last capture are written; the rest are counted as unchanged.
 
     Typically called:
     - Pre-game: To capture opening odds
@@ -219,6 +220,9 @@ async def capture_game_odds(
         "game_id": game_id,
         "game": f"{game.away_team} @ {game.home_team}",
         "captured": result.get("captured", 0),
+        "new": result.get("new", 0),
+        "moved": result.get("moved", 0),
+        "unchanged": result.get("unchanged", 0),
         "errors": result.get("errors", 0)
     }
 
@@ -374,57 +374,61 @@ async def update_prediction_odds(
 
         # Bookmaker priority (highest first) - FanDuel only
         BOOKMAKER_PRIORITY = ["FanDuel"]
-        try:
-                for game in games:
-                    props_data = await service.get_event_player_props(game.external_id)
-
-                    # Map to prediction updates
-                    updates = await mapper.map_player_props_to_predictions(props_data, game)
-
-                    for update_data in updates:
-                        prediction = db.query(Prediction).filter(
-                            Prediction.id == update_data["prediction_id"]
-                        ).first()
-
-                        if prediction:
-                            new_bookmaker = update_data.get("bookmaker_name")
-                            current_bookmaker = prediction.bookmaker_name
-
-                            # Only update if:
-                            # 1. No existing bookmaker, OR
-                            # 2. New bookmaker is higher priority than current, OR
-                            # 3. Same bookmaker (update missing Over/Under prices)
-                            should_update = False
-                            if current_bookmaker is None:
-                                should_update = True
-                            elif new_bookmaker == current_bookmaker:
-                                # Same bookmaker - update to fill in missing Over/Under prices
-                                should_update = True
-                            elif new_bookmaker in BOOKMAKER_PRIORITY and current_bookmaker in BOOKMAKER_PRIORITY:
-                                new_priority = BOOKMAKER_PRIORITY.index(new_bookmaker)
-                                current_priority = BOOKMAKER_PRIORITY.index(current_bookmaker)
-                                should_update = new_priority < current_priority
-
-                            if should_update:
-                                # Only update prices if they're not None
-                                if update_data.get("over_price") is not None:
-                                    prediction.over_price = update_data.get("over_price")
-                                if update_data.get("under_price") is not None:
-                                    prediction.under_price = update_data.get("under_price")
-
-                                prediction.bookmaker_line = update_data.get("bookmaker_line")
-                                prediction.bookmaker_name = new_bookmaker
-                            prediction.odds_last_updated = update_data.get("odds_last_updated")
-
-                            if not prediction.odds_fetched_at:
-                                prediction.odds_fetched_at = update_data.get("odds_last_updated")
-
-                            prediction.updated_at = datetime.utcnow()
-                            total_updated += 1
 
+        # Fetch every game's props concurrently and apply each as it arrives
+        games_by_event = {game.external_id: game for game in games}
+        async for event_id, props_data in service.stream_event_player_props(list(games_by_event)):
+            game = games_by_event[event_id]
+            try:
+                # Map to prediction updates
+                updates = await mapper.map_player_props_to_predictions(props_data, game)
+
+                for update_data in updates:
+                    prediction = db.query(Prediction).filter(
+                        Prediction.id == update_data["prediction_id"]
+                    ).first()
+
+                    if prediction:
+                        new_bookmaker = update_data.get("bookmaker_name")
+                        current_bookmaker = prediction.bookmaker_name
+
+                        # Only update if:
+                        # 1. No existing bookmaker, OR
+                        # 2. New bookmaker is higher priority than current, OR
+                        # 3. Same bookmaker (update missing Over/Under prices)
+                        should_update = False
+                        if current_bookmaker is None:
+                            should_update = True
+                        elif new_bookmaker == current_bookmaker:
+                            # Same bookmaker - update to fill in missing Over/Under prices
+                            should_update = True
+                        elif new_bookmaker in BOOKMAKER_PRIORITY and current_bookmaker in BOOKMAKER_PRIORITY:
+                            new_priority = BOOKMAKER_PRIORITY.index(new_bookmaker)
+                            current_priority = BOOKMAKER_PRIORITY.index(current_bookmaker)
+                            should_update = new_priority < current_priority
+
+                        if should_update:
+                            # Only update prices if they're not None
+                            if update_data.get("over_price") is not None:
+                                prediction.over_price = update_data.get("over_price")
+                            if update_data.get("under_price") is not None:
+                                prediction.under_price = update_data.get("under_price")
+
+                            prediction.bookmaker_line = update_data.get("bookmaker_line")
+                            prediction.bookmaker_name = new_bookmaker
+                        prediction.odds_last_updated = update_data.get("odds_last_updated")
+
+                        if not prediction.odds_fetched_at:
+                            prediction.odds_fetched_at = update_data.get("odds_last_updated")
+
+                        prediction.updated_at = datetime.utcnow()
+                        total_updated += 1
+
+                db.commit()
                 games_processed += 1
 
-        except Exception as e:
+            except Exception as e:
+                db.rollback()
                 logger.error(f"Error processing game {game.external_id}: {e}")
                 errors.append(f"{game.external_id}: {str(e)}")
 
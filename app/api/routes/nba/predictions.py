@@ -709,7 +709,7 @@ async def get_enhanced_predictions_for_game(
     )
 
     # Generate predictions
-    predictions = prediction_service.generate_prop_predictions(
+    predictions = await prediction_service.generate_prop_predictions_async(
         game_id=game_id,
         stat_types=stat_type_list,
         bookmaker=bookmaker
@@ -807,6 +807,9 @@ async def generate_enhanced_predictions(
         odds_api_service=odds_service
     )
 
+    # Load season stats, recent games and injuries for the whole slate at once
+    prediction_service.load_slate_features(upcoming_games)
+
     # Generate predictions for each game
     all_predictions = []
     games_with_predictions = 0
@@ -820,7 +823,7 @@ async def generate_enhanced_predictions(
                 f"{game.away_team} @ {game.home_team}"
             )
 
-            predictions = prediction_service.generate_prop_predictions(
+            predictions = await prediction_service.generate_prop_predictions_async(
                 game_id=str(game.id),
                 stat_types=stat_type_list
             )
@@ -340,7 +340,7 @@ async def get_enhanced_nhl_predictions(
     )
 
     # Generate predictions
-    predictions = prediction_service.generate_prop_predictions(
+    predictions = await prediction_service.generate_prop_predictions_async(
         game_id=game_id,
         stat_types=stat_type_list,
         bookmaker=bookmaker
@@ -440,7 +440,7 @@ async def generate_enhanced_nhl_predictions(
                 f"{game.away_team} @ {game.home_team}"
             )
 
-            predictions = prediction_service.generate_prop_predictions(
+            predictions = await prediction_service.generate_prop_predictions_async(
                 game_id=str(game.id),
                 stat_types=stat_type_list
             )
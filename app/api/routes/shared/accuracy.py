@@ -5,13 +5,14 @@ Provides access to accuracy metrics, model drift detection, and
 prediction resolution status.
 """
 import logging
+from datetime import timedelta
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.services.core.accuracy_service import AccuracyService
+from app.services.core.accuracy_service import TIMELINE_BREAKDOWNS, AccuracyService
 from app.services.nba.boxscore_import_service import BoxscoreImportService
 
 logger = logging.getLogger(__name__)
@@ -80,6 +81,8 @@ async def get_accuracy_timeline(
     model_version: Optional[str] = Query(None, description="Filter by model version"),
     days_back: int = Query(30, ge=1, le=365, description="Total time period to analyze"),
     window_days: int = Query(1, ge=1, le=7, description="Size of each time window in days"),
+    window_hours: Optional[int] = Query(None, ge=1, le=720, description="Window size in hours (overrides window_days)"),
+    breakdown: Optional[str] = Query(None, description="Break windows down by stat_type and/or model_version (comma-separated)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -90,19 +93,31 @@ async def get_accuracy_timeline(
     - Detecting gradual model drift
     - Identifying sudden performance changes
 
-    Returns a list of time-ordered metric snapshots.
+    Returns a list of time-ordered metric snapshots, computed in one query.
     """
+    breakdown_columns = [column.strip() for column in breakdown.split(",") if column.strip()] if breakdown else []
+    unknown = [column for column in breakdown_columns if column not in TIMELINE_BREAKDOWNS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown breakdown column(s): {', '.join(unknown)}; use {', '.join(TIMELINE_BREAKDOWNS)}"
+        )
+
     try:
         service = AccuracyService(db)
         timeline = service.get_accuracy_timeline(
             model_version=model_version,
             days_back=days_back,
-            window_days=window_days
+            window_days=window_days,
+            window=timedelta(hours=window_hours) if window_hours else None,
+            breakdown=breakdown_columns
         )
         return {
             "model_version": model_version,
             "days_back": days_back,
             "window_days": window_days,
+            "window_hours": window_hours,
+            "breakdown": breakdown_columns,
             "timeline": timeline
         }
     except Exception as e:
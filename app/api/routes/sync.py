@@ -150,25 +150,74 @@ async def trigger_sync_games(
         )
 
 
+@router.post("/incremental")
+async def trigger_incremental_sync(
+    lookahead_days: int = Query(14, ge=0, le=30, description="Days of odds events to fetch"),
+    include_stats: bool = Query(True, description="Ingest game logs if games went final"),
+    orchestrator: SyncOrchestrator = Depends(get_orchestrator)
+) -> Dict:
+    """
+    Manually trigger the incremental sync DAG.
+
+    Games and odds are fetched concurrently, then unmatched games are
+    matched and game logs ingested when games went final. Only what
+    changed since each stage's watermark is processed.
+
+    Args:
+        lookahead_days: Days of odds events to fetch
+        include_stats: Run the player stats stage
+
+    Returns:
+        Per-stage status, duration and counts
+    """
+    try:
+        results = await orchestrator.run_incremental_sync(
+            lookahead_days=lookahead_days,
+            include_stats=include_stats
+        )
+
+        return {
+            'message': 'Incremental sync completed' if results['success'] else 'Incremental sync finished with errors',
+            'results': results
+        }
+
+    except Exception as e:
+        logger.error(f"Manual incremental sync failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Incremental sync failed: {str(e)}"
+        )
+
+
 @router.post("/odds")
 async def trigger_sync_odds(
     days: int = Query(7, ge=0, le=30, description="Days ahead to fetch"),
+    include_props: bool = Query(False, description="Also fetch and store player props for every game"),
+    max_concurrency: Optional[int] = Query(None, ge=1, le=32, description="Props requests in flight at once"),
     background_tasks: BackgroundTasks = None,
     orchestrator: SyncOrchestrator = Depends(get_orchestrator)
 ) -> Dict:
     """
     Manually trigger sync for odds.
 
-    Fetches current odds from The Odds API and caches them.
+    Fetches current odds from The Odds API and caches them. With
+    include_props, player props for the whole slate are fetched
+    concurrently and stored as odds snapshots as they arrive.
 
     Args:
         days: Number of days ahead to fetch
+        include_props: Also fetch and store player props
+        max_concurrency: Props requests in flight at once
 
     Returns:
         Sync results
     """
     try:
-        results = await orchestrator.sync_odds(days=days)
+        results = await orchestrator.sync_odds(
+            days=days,
+            include_props=include_props,
+            max_concurrency=max_concurrency
+        )
 
         return {
             'message': 'Odds sync completed',
@@ -0,0 +1,368 @@
+"""
+Write-behind sink for match_audit_log rows.
+
+GameMatcher and PlayerResolver used to add and commit one MatchAuditLog
+row (plus its JSON serialization) inside every match and alias write, so
+batch matching ran at the speed of audit inserts. They now hand an
+AuditEvent to the process-wide AuditSink and move on:
+
+    - Events are buffered in memory as plain tuples; JSON serialization
+      happens at flush time, off the matching path
+    - A background task flushes in bulk (one INSERT per batch, on a worker
+      thread with its own session) every AUDIT_FLUSH_INTERVAL_SECONDS or
+      as soon as AUDIT_FLUSH_BATCH_SIZE events are waiting
+    - Backpressure: when AUDIT_MAX_BUFFERED events are waiting, the oldest
+      batch is written right away. A caller on a worker thread writes it
+      itself; a caller on the event loop hands it to the shared blocking
+      executor (app.core.blocking) so the loop never waits on the database.
+      Nothing is dropped; the audit_sink_backpressure_total counter shows
+      how often the buffer overflowed
+    - stop() drains the buffer (application shutdown); a failed flush puts
+      its events back and is retried on the next one
+
+Until start() runs (scripts, tests, CLI tools) the sink writes through:
+events go straight to the caller's session, as before.
+
+Configuration (app.core.config.settings):
+    AUDIT_FLUSH_BATCH_SIZE:         Events per bulk INSERT
+    AUDIT_FLUSH_INTERVAL_SECONDS:   Maximum age of a buffered event
+    AUDIT_MAX_BUFFERED:             Buffered events before writers flush inline
+
+Usage:
+    from app.core.audit_sink import AuditEvent, get_audit_sink
+
+    get_audit_sink().record(AuditEvent('game', nba_game_id, 'matched', None, new_state), db=self.db)
+"""
+import asyncio
+import json
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.blocking import run_blocking
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Blocking executor source for overflow writes from the event loop
+BLOCKING_SOURCE = "audit_sink"
+
+
+class AuditEvent(NamedTuple):
+    """One match_audit_log entry, not yet serialized."""
+    entity_type: str
+    entity_id: str
+    action: str
+    previous_state: Optional[Dict[str, Any]]
+    new_state: Dict[str, Any]
+    match_details: Optional[Dict[str, Any]] = None
+    created_at: Optional[datetime] = None  # stamped by record() when not given
+
+
+def _serialize_datetime(obj: Any) -> Any:
+    """Convert datetime objects to ISO strings for JSON serialization."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    elif isinstance(obj, dict):
+        return {k: _serialize_datetime(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_serialize_datetime(item) for item in obj]
+    return obj
+
+
+def audit_row(event: AuditEvent) -> Dict[str, Any]:
+    """match_audit_log column dict with JSON-serialized states."""
+    return {
+        'id': str(uuid.uuid4()),
+        'entity_type': event.entity_type,
+        'entity_id': event.entity_id,
+        'action': event.action,
+        'previous_state': json.dumps(_serialize_datetime(event.previous_state)) if event.previous_state else None,
+        'new_state': json.dumps(_serialize_datetime(event.new_state)),
+        'match_details': json.dumps(_serialize_datetime(event.match_details)) if event.match_details else None,
+        'performed_by': 'system',
+        'created_at': event.created_at or datetime.utcnow()
+    }
+
+
+def write_audit_events(db: Session, events: List[AuditEvent]) -> None:
+    """Insert events in one statement and commit."""
+    from app.models import MatchAuditLog
+
+    if events:
+        db.execute(insert(MatchAuditLog), [audit_row(event) for event in events])
+        db.commit()
+
+
+def _default_session_factory() -> Session:
+    from app.core.database import SessionLocal
+
+    return SessionLocal()
+
+
+class AuditSink:
+    """Buffers audit events and writes them in bulk in the background."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_buffered: Optional[int] = None
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            session_factory: Creates the sessions flushes write with
+                             (default: app.core.database.SessionLocal)
+            batch_size: Events per INSERT and flush trigger (default: AUDIT_FLUSH_BATCH_SIZE)
+            flush_interval: Seconds between timed flushes (default: AUDIT_FLUSH_INTERVAL_SECONDS)
+            max_buffered: Buffered events before writers flush inline
+                          (default: AUDIT_MAX_BUFFERED)
+        """
+        from app.core.config import settings
+
+        self._session_factory = session_factory or _default_session_factory
+        self.batch_size = max(1, batch_size or settings.AUDIT_FLUSH_BATCH_SIZE)
+        self.flush_interval = flush_interval or settings.AUDIT_FLUSH_INTERVAL_SECONDS
+        self.max_buffered = max(self.batch_size, max_buffered or settings.AUDIT_MAX_BUFFERED)
+
+        self._buffer: Deque[AuditEvent] = deque()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._overflow_writes: Set[asyncio.Task] = set()
+        self._stopping = False
+        self._written = 0
+        self._flushes = 0
+        self._failures = 0
+        self._backpressure = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flusher is buffering events."""
+        return self._task is not None and not self._task.done()
+
+    def record(self, event: AuditEvent, db: Optional[Session] = None) -> None:
+        """
+        Queue one audit event.
+
+        Args:
+            event: Event to write
+            db: Session to write through when the sink is not running
+                (default: a new session)
+        """
+        self.record_many([event], db=db)
+
+    def record_many(self, events: Iterable[AuditEvent], db: Optional[Session] = None) -> None:
+        """
+        Queue audit events (one bulk write when the sink is not running).
+
+        Args:
+            events: Events to write
+            db: Session to write through when the sink is not running;
+                it is committed (default: a new session)
+        """
+        # Stamp the event time now: buffered rows are written up to a flush
+        # interval later, and out of order under backpressure
+        recorded_at = datetime.utcnow()
+        events = [
+            event if event.created_at is not None else event._replace(created_at=recorded_at)
+            for event in events
+        ]
+        if not events:
+            return
+
+        if not self.running:
+            if db is not None:
+                write_audit_events(db, events)
+            else:
+                self._write(events)
+            return
+
+        from app.core import metrics
+
+        overflow = None
+        with self._lock:
+            self._buffer.extend(events)
+            depth = len(self._buffer)
+            if depth > self.max_buffered:
+                overflow = self._take(self.batch_size)
+                self._backpressure += 1
+            depth = len(self._buffer)
+        metrics.audit_sink_buffered.set(depth)
+
+        if overflow:
+            metrics.audit_sink_backpressure_total.inc()
+            if self._on_loop():
+                logger.warning(
+                    f"Audit buffer full ({self.max_buffered}); writing {len(overflow)} events on the blocking executor"
+                )
+                self._write_off_loop(overflow)
+            else:
+                logger.warning(f"Audit buffer full ({self.max_buffered}); writing {len(overflow)} events inline")
+                self._write_or_requeue(overflow)
+        if depth >= self.batch_size:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _on_loop(self) -> bool:
+        """Whether the caller is running on the sink's event loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _write_off_loop(self, events: List[AuditEvent]) -> None:
+        """Write an overflow batch on the shared blocking executor (caller is on the loop)."""
+        task = self._loop.create_task(
+            run_blocking(BLOCKING_SOURCE, self._write_or_requeue, events, timeout=0)
+        )
+        self._overflow_writes.add(task)
+        task.add_done_callback(self._overflow_writes.discard)
+
+    def _take(self, limit: int) -> List[AuditEvent]:
+        """Pop up to limit of the oldest events (caller holds _lock)."""
+        return [self._buffer.popleft() for _ in range(min(limit, len(self._buffer)))]
+
+    def _write(self, events: List[AuditEvent]) -> None:
+        """Write events with a session of our own."""
+        from app.core import metrics
+
+        started = time.monotonic()
+        with self._write_lock:
+            db = self._session_factory()
+            try:
+                write_audit_events(db, events)
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+        metrics.audit_sink_flush_seconds.observe(time.monotonic() - started)
+        metrics.audit_events_written_total.inc(len(events))
+        with self._lock:
+            self._written += len(events)
+            self._flushes += 1
+
+    def _write_or_requeue(self, events: List[AuditEvent]) -> bool:
+        """Write events; on failure put them back at the front of the buffer."""
+        from app.core import metrics
+
+        try:
+            self._write(events)
+            return True
+        except Exception as e:
+            metrics.audit_sink_flush_failures_total.inc()
+            logger.error(f"Failed to write {len(events)} audit events: {e}")
+            with self._lock:
+                self._failures += 1
+                self._buffer.extendleft(reversed(events))
+                metrics.audit_sink_buffered.set(len(self._buffer))
+            return False
+
+    async def flush(self) -> int:
+        """
+        Write everything buffered, one INSERT per batch, off the event loop.
+
+        Returns:
+            Number of events written (stops at the first failed batch)
+        """
+        from app.core import metrics
+
+        written = 0
+        while True:
+            with self._lock:
+                batch = self._take(self.batch_size)
+                metrics.audit_sink_buffered.set(len(self._buffer))
+            if not batch:
+                return written
+            if not await asyncio.to_thread(self._write_or_requeue, batch):
+                return written
+            written += len(batch)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def start(self) -> None:
+        """Start buffering and the background flusher on the running loop."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="audit-sink")
+        logger.info(
+            f"Audit sink started (batch {self.batch_size}, every {self.flush_interval}s, "
+            f"max buffered {self.max_buffered})"
+        )
+
+    async def stop(self) -> None:
+        """Stop the flusher and drain the buffer; later events write through."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        await self._task
+        self._task = None
+        if self._overflow_writes:
+            await asyncio.gather(*self._overflow_writes, return_exceptions=True)
+        await self.flush()
+        remaining = len(self._buffer)
+        if remaining:
+            logger.error(f"Audit sink stopped with {remaining} unwritten events")
+        else:
+            logger.info(f"Audit sink drained ({self._written} events written)")
+
+    def stats(self) -> Dict[str, Any]:
+        """Buffer depth and write counters."""
+        with self._lock:
+            return {
+                "running": self.running,
+                "buffered": len(self._buffer),
+                "written": self._written,
+                "flushes": self._flushes,
+                "failures": self._failures,
+                "backpressure": self._backpressure,
+            }
+
+
+_sink: Optional[AuditSink] = None
+_sink_lock = threading.Lock()
+
+
+def get_audit_sink() -> AuditSink:
+    """Process-wide AuditSink (created on first use, write-through until started)."""
+    global _sink
+    with _sink_lock:
+        if _sink is None:
+            _sink = AuditSink()
+        return _sink
+
+
+async def start_audit_sink() -> None:
+    """Start write-behind buffering (application startup)."""
+    await get_audit_sink().start()
+
+
+async def shutdown_audit_sink() -> None:
+    """Drain and stop the shared sink (application shutdown, tests)."""
+    global _sink
+    with _sink_lock:
+        sink, _sink = _sink, None
+    if sink is not None:
+        await sink.stop()
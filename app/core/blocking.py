@@ -0,0 +1,268 @@
+"""
+Shared rate-limited executor for blocking third-party library calls.
+
+nba_api endpoints and nfl_data_py imports are synchronous (requests/pandas
+under the hood) and used to be called straight from async services, either
+inline or through loop.run_in_executor(None, ...). Inline calls froze the
+FastAPI/APScheduler event loop for seconds; the default executor was
+unbounded per caller and had no rate limiting or timeouts. Every such call
+now goes through one BlockingExecutor:
+
+    - Bounded thread pool (BLOCKING_EXECUTOR_MAX_WORKERS) shared by all
+      services, so scheduled syncs cannot starve the API of threads
+    - Per-source token bucket (AsyncRateLimiter): nba_api requests start at
+      most once per NBA_API_REQUEST_DELAY seconds across every caller
+    - Per-call timeout; the awaiting coroutine gets BlockingCallTimeout
+      (the worker thread finishes in the background)
+    - Queue depth, in-flight calls, queue wait and call latency exported as
+      Prometheus metrics labelled by source
+
+Configuration (app.core.config.settings):
+    BLOCKING_EXECUTOR_MAX_WORKERS:      Worker threads shared by all sources
+    BLOCKING_CALL_TIMEOUT_SECONDS:      Default per-call timeout
+    NBA_API_REQUEST_DELAY:              Seconds between nba_api request starts
+    NBA_API_TIMEOUT:                    nba_api per-call timeout
+    NFL_DATA_RATE_LIMIT_PER_SECOND:     nfl_data_py request starts per second
+
+Usage:
+    from app.core.blocking import run_blocking
+
+    frame = await run_blocking(
+        "nba_api",
+        lambda: playergamelog.PlayerGameLog(player_id=pid, season=season).get_data_frames()[0]
+    )
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.core.logging import get_logger
+from app.utils.async_utils import AsyncRateLimiter
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+NBA_API = "nba_api"
+NFL_DATA_PY = "nfl_data_py"
+
+
+class BlockingCallTimeout(TimeoutError):
+    """A blocking call did not finish within its timeout."""
+
+
+class _SourceStats:
+    """Counters for one source (guarded by BlockingExecutor._lock)."""
+
+    def __init__(self):
+        self.queued = 0
+        self.active = 0
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.total_wait_seconds = 0.0
+
+
+class BlockingExecutor:
+    """Bounded thread pool with per-source rate limits, timeouts and metrics."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        default_timeout: Optional[float] = None,
+        rate_limits: Optional[Dict[str, float]] = None,
+        timeouts: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Worker threads (default: BLOCKING_EXECUTOR_MAX_WORKERS)
+            default_timeout: Per-call timeout in seconds for sources without
+                             their own (default: BLOCKING_CALL_TIMEOUT_SECONDS)
+            rate_limits: Request starts per second by source (default: from
+                         settings; unlisted sources are not throttled)
+            timeouts: Per-call timeout in seconds by source (default: from settings)
+        """
+        from app.core.config import settings
+
+        self.max_workers = max(1, max_workers or settings.BLOCKING_EXECUTOR_MAX_WORKERS)
+        self.default_timeout = (
+            settings.BLOCKING_CALL_TIMEOUT_SECONDS if default_timeout is None else default_timeout
+        )
+        if rate_limits is None:
+            rate_limits = {
+                NBA_API: 1.0 / settings.NBA_API_REQUEST_DELAY if settings.NBA_API_REQUEST_DELAY > 0 else 0.0,
+                NFL_DATA_PY: settings.NFL_DATA_RATE_LIMIT_PER_SECOND,
+            }
+        if timeouts is None:
+            timeouts = {NBA_API: settings.NBA_API_TIMEOUT}
+
+        self._limiters = {source: AsyncRateLimiter(rate) for source, rate in rate_limits.items()}
+        self._timeouts = dict(timeouts)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="blocking")
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _SourceStats] = {}
+
+    def _source_stats(self, source: str) -> _SourceStats:
+        stats = self._stats.get(source)
+        if stats is None:
+            stats = self._stats[source] = _SourceStats()
+        return stats
+
+    async def run(
+        self,
+        source: str,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> T:
+        """
+        Run func(*args, **kwargs) on the shared pool without blocking the loop.
+
+        Waits for the source's rate-limit slot, then for a free worker.
+
+        Args:
+            source: Upstream/library name used for rate limits and metrics
+            func: Blocking callable
+            timeout: Seconds to wait for the result, counted from submission
+                     (default: the source's timeout, else default_timeout)
+
+        Returns:
+            func's return value
+
+        Raises:
+            BlockingCallTimeout: func did not finish in time
+            Exception: whatever func raised
+        """
+        from app.core import metrics
+
+        timeout = timeout if timeout is not None else self._timeouts.get(source, self.default_timeout)
+        submitted = time.monotonic()
+        with self._lock:
+            stats = self._source_stats(source)
+            stats.queued += 1
+        metrics.blocking_calls_queued.labels(source=source).inc()
+
+        def call():
+            began = time.monotonic()
+            with self._lock:
+                stats.queued -= 1
+                stats.active += 1
+                stats.total_wait_seconds += began - submitted
+            metrics.blocking_calls_queued.labels(source=source).dec()
+            metrics.blocking_calls_active.labels(source=source).inc()
+            metrics.blocking_call_wait_seconds.labels(source=source).observe(began - submitted)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.monotonic() - began
+                with self._lock:
+                    stats.active -= 1
+                    stats.calls += 1
+                    stats.total_seconds += elapsed
+                    stats.max_seconds = max(stats.max_seconds, elapsed)
+                metrics.blocking_calls_active.labels(source=source).dec()
+                metrics.blocking_call_duration_seconds.labels(source=source).observe(elapsed)
+
+        future = None
+        try:
+            async with asyncio.timeout(timeout if timeout and timeout > 0 else None):
+                limiter = self._limiters.get(source)
+                if limiter is not None:
+                    await limiter.acquire()
+                future = self._pool.submit(call)
+                return await asyncio.wrap_future(future)
+        except TimeoutError:
+            self._abandon(source, stats, future)
+            with self._lock:
+                stats.timeouts += 1
+            metrics.blocking_call_timeouts_total.labels(source=source).inc()
+            logger.warning(f"{source} call {getattr(func, '__name__', func)} timed out after {timeout}s")
+            raise BlockingCallTimeout(f"{source} call timed out after {timeout}s") from None
+        except asyncio.CancelledError:
+            self._abandon(source, stats, future)
+            raise
+        except Exception:
+            with self._lock:
+                stats.errors += 1
+            raise
+
+    def _abandon(self, source: str, stats: _SourceStats, future) -> None:
+        """Drop a call that will not be awaited; it leaves the queue if it never started."""
+        from app.core import metrics
+
+        if future is None or future.cancel():
+            with self._lock:
+                stats.queued -= 1
+            metrics.blocking_calls_queued.labels(source=source).dec()
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size and per-source queue depth, latency and failure counts."""
+        with self._lock:
+            sources = {
+                source: {
+                    "queued": s.queued,
+                    "active": s.active,
+                    "calls": s.calls,
+                    "errors": s.errors,
+                    "timeouts": s.timeouts,
+                    "avg_seconds": round(s.total_seconds / s.calls, 3) if s.calls else 0.0,
+                    "max_seconds": round(s.max_seconds, 3),
+                    "avg_wait_seconds": round(s.total_wait_seconds / s.calls, 3) if s.calls else 0.0,
+                }
+                for source, s in self._stats.items()
+            }
+        return {"max_workers": self.max_workers, "sources": sources}
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting calls; queued calls that have not started are cancelled."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_executor: Optional[BlockingExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_blocking_executor() -> BlockingExecutor:
+    """Process-wide BlockingExecutor (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = BlockingExecutor()
+        return _executor
+
+
+async def run_blocking(
+    source: str,
+    func: Callable[..., T],
+    *args: Any,
+    timeout: Optional[float] = None,
+    **kwargs: Any
+) -> T:
+    """
+    Run a blocking third-party call on the shared executor.
+
+    Args:
+        source: Upstream/library name ("nba_api", "nfl_data_py", ...)
+        func: Blocking callable
+        timeout: Override the source's timeout in seconds
+
+    Returns:
+        func's return value
+    """
+    return await get_blocking_executor().run(source, func, *args, timeout=timeout, **kwargs)
+
+
+def shutdown_blocking_executor() -> None:
+    """Shut the shared executor down (application shutdown, tests)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
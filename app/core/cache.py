@@ -0,0 +1,236 @@
+"""
+Bounded in-process TTL/LRU cache shared by the API client services.
+
+The services used to hand-roll an unbounded Dict[str, tuple] cache each,
+with expired entries removed only when somebody read them again, so
+long-running workers kept every response they had ever fetched. TTLCache
+replaces those dicts:
+
+    - Bounded: past max_size entries the least recently used is evicted
+    - TTL per entry (default per cache); expired entries are misses
+    - Proactive expiry: sweep() drops expired entries without waiting for
+      a read; it runs from the scheduler and opportunistically on writes
+    - Per-namespace stats (hits, misses, evictions, expirations) exported
+      as Prometheus gauges by app.core.metrics.update_cache_metrics()
+
+Caches are registered by namespace (one per subsystem, e.g. "espn",
+"injuries") so every instance of a service shares one bounded cache.
+
+Configuration (app.core.config.settings):
+    CACHE_DEFAULT_MAX_SIZE:         Entries per namespace unless overridden
+    CACHE_SWEEP_INTERVAL_SECONDS:   Minimum seconds between expiry sweeps
+
+Usage:
+    from app.core.cache import get_cache
+
+    cache = get_cache("espn", max_size=512, default_ttl=300)
+    cache.set("scoreboard:date=20260115", data, ttl=60)
+    data = cache.get("scoreboard:date=20260115")   # None on miss
+    cache.stats()
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry and hit statistics."""
+
+    def __init__(
+        self,
+        namespace: str,
+        max_size: Optional[int] = None,
+        default_ttl: float = 300,
+        sweep_interval: Optional[float] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            namespace: Subsystem name used in stats and metrics labels
+            max_size: Maximum entries held (default: CACHE_DEFAULT_MAX_SIZE)
+            default_ttl: Seconds an entry stays fresh unless set() overrides it
+            sweep_interval: Minimum seconds between opportunistic sweeps
+                            (default: CACHE_SWEEP_INTERVAL_SECONDS)
+        """
+        from app.core.config import settings
+
+        self.namespace = namespace
+        self.max_size = max(1, max_size or settings.CACHE_DEFAULT_MAX_SIZE)
+        self.default_ttl = default_ttl
+        self.sweep_interval = (
+            settings.CACHE_SWEEP_INTERVAL_SECONDS if sweep_interval is None else sweep_interval
+        )
+
+        # key -> (value, expires_at), least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() < entry[1]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Fresh value for key, or default on a miss.
+
+        Args:
+            key: Cache key
+            default: Returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if time.monotonic() >= entry[1]:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value for ttl seconds, evicting least recently used entries.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds the entry stays fresh (default: default_ttl)
+        """
+        now = time.monotonic()
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (value, now + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            sweep_due = now - self._last_sweep >= self.sweep_interval
+
+        if sweep_due:
+            self.sweep()
+
+    def delete(self, key: Hashable) -> None:
+        """Remove key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def sweep(self) -> int:
+        """
+        Drop every expired entry.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (_, expires_at) in self._entries.items() if now >= expires_at]
+            for key in expired:
+                del self._entries[key]
+            self.expirations += len(expired)
+            self._last_sweep = now
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit statistics for this namespace."""
+        lookups = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "entries": len(self._entries),
+            "max_size": self.max_size,
+            "default_ttl": self.default_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+# Namespace registry
+_caches: Dict[str, TTLCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_cache(
+    namespace: str,
+    max_size: Optional[int] = None,
+    default_ttl: float = 300
+) -> TTLCache:
+    """
+    Get or create the shared cache for a namespace.
+
+    The first caller's max_size and default_ttl configure the cache; later
+    callers get the same instance.
+
+    Args:
+        namespace: Subsystem name (e.g. "espn", "injuries")
+        max_size: Maximum entries (default: CACHE_DEFAULT_MAX_SIZE)
+        default_ttl: Default entry TTL in seconds
+
+    Returns:
+        TTLCache
+    """
+    with _registry_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            cache = TTLCache(namespace, max_size=max_size, default_ttl=default_ttl)
+            _caches[namespace] = cache
+        return cache
+
+
+def registered_caches() -> List[TTLCache]:
+    """Every namespace cache created so far."""
+    with _registry_lock:
+        return list(_caches.values())
+
+
+def sweep_all_caches() -> int:
+    """
+    Drop expired entries from every namespace cache.
+
+    Returns:
+        Total number of entries removed
+    """
+    removed = sum(cache.sweep() for cache in registered_caches())
+    if removed:
+        logger.debug(f"Cache sweep removed {removed} expired entries")
+    return removed
+
+
+def all_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every namespace cache, keyed by namespace."""
+    return {cache.namespace: cache.stats() for cache in registered_caches()}
+
+
+def clear_all_caches() -> None:
+    """Drop every entry from every namespace cache (tests, admin resets)."""
+    for cache in registered_caches():
+        cache.clear()
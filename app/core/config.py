@@ -56,20 +56,58 @@ class Settings(BaseSettings):
     RATE_LIMIT_STORAGE: str = "memory"  # "memory" or "redis"
     REDIS_URL: Optional[str] = None  # Required if using Redis storage
 
+    # ESPN API
+    ESPN_API_BASE_URL: str = "https://site.api.espn.com/apis/site/v2/sports"  # Override for a local stand-in
+
+    # In-process API response caches (app.core.cache)
+    CACHE_DEFAULT_MAX_SIZE: int = 1024  # Entries per namespace before LRU eviction
+    CACHE_SWEEP_INTERVAL_SECONDS: int = 60  # How often expired entries are dropped
+
+    # Blocking library calls (nba_api, nfl_data_py) - app.core.blocking
+    BLOCKING_EXECUTOR_MAX_WORKERS: int = 4  # Worker threads shared by all blocking calls
+    BLOCKING_CALL_TIMEOUT_SECONDS: int = 60  # Default per-call timeout
+    NFL_DATA_RATE_LIMIT_PER_SECOND: float = 1.0  # nfl_data_py download starts per second
+
+    # Write-behind match audit log - app.core.audit_sink
+    AUDIT_FLUSH_BATCH_SIZE: int = 500  # Events per bulk INSERT (also triggers a flush)
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 2.0  # Maximum time an event waits in the buffer
+    AUDIT_MAX_BUFFERED: int = 20000  # Beyond this, writers flush the oldest batch inline
+
     # NBA API (nba_api library)
     NBA_API_CACHE_TTL: int = 300  # 5 minutes
     NBA_API_TIMEOUT: int = 30  # 30 seconds
-    NBA_API_REQUEST_DELAY: float = 0.6  # Delay between requests to respect rate limits
+    BOXSCORE_RESOLUTION_CONCURRENCY: int = 4  # Boxscore fetches in flight when resolving many games
+    NBA_API_REQUEST_DELAY: float = 0.6  # Minimum seconds between nba_api request starts (all callers)
+    NBA_STATS_BASE_URL: Optional[str] = None  # Override stats.nba.com for nba_api (e.g. local stand-in)
+    NBA_CDN_BASE_URL: str = "https://cdn.nba.com"  # NBA.com live scoreboard host
+    NBA_GAME_LOG_BULK_SYNC: bool = True  # Nightly stats sync via one league-wide game log call
     CURRENT_SEASON: str = "2025-26"  # Current NBA season
 
     # The Odds API
     THE_ODDS_API_KEY: str = ""
+    ODDS_API_BASE_URL: str = "https://api.the-odds-api.com/v4"  # Override for a local stand-in
     ODDS_API_REGIONS: str = "us"  # us, uk, eu, au
     ODDS_API_CACHE_TTL: int = 600  # 10 minutes
+    ODDS_API_CACHE_BACKEND: str = "sqlite"  # "sqlite", "redis" or "memory"
+    ODDS_API_CACHE_PATH: str = ".cache/odds_api_cache.sqlite3"  # Shared by all local processes
+    ODDS_API_CACHE_REDIS_URL: Optional[str] = None  # Defaults to REDIS_URL when backend is redis
+    ODDS_API_MONTHLY_QUOTA: int = 20000  # Requests per billing period
+    ODDS_API_BILLING_DAY: int = 1  # Day of month the quota resets
+    ODDS_API_MAX_CONCURRENCY: int = 6  # Concurrent event requests when fetching a slate
+    ODDS_API_RATE_LIMIT_PER_SECOND: float = 5.0  # Sustained request starts per second
+
+    # Odds fetch planner (replaces fixed-time odds fetches)
+    ODDS_PLANNER_TICK_MINUTES: int = 5  # How often the scheduler runs due fetches
+    ODDS_PLANNER_HORIZON_HOURS: int = 72  # Only plan events tipping off within this window
+    ODDS_PLANNER_RESERVE_FRACTION: float = 0.1  # Remaining quota kept for ad-hoc/API calls
 
     # CORS - comma-separated string for env var parsing
     CORS_ORIGINS_STR: str = ""  # Environment variable: comma-separated origins
 
+    # Prediction slate generation
+    PREDICTION_POOL_WORKERS: int = 0  # Worker processes per slate run (0 or 1 = in-process)
+    PREDICTION_WRITE_BATCH_SIZE: int = 500  # Rows per bulk insert by the slate writer
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
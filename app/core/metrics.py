@@ -9,6 +9,8 @@ Metrics exposed:
 - API quota monitoring gauges
 - Database connection pool gauges
 - Scheduler status gauge
+- In-process cache gauges per namespace
+- Blocking library call queue depth, latency and timeouts per source
 """
 from prometheus_client import Counter, Gauge, Histogram
 
@@ -64,6 +66,24 @@ odds_api_quota_percentage = Gauge(
     "Percentage of Odds API quota used"
 )
 
+odds_api_cache_hits_total = Counter(
+    "odds_api_cache_hits_total",
+    "Odds API responses served from the shared cache",
+    ["endpoint"]
+)
+
+odds_api_cache_misses_total = Counter(
+    "odds_api_cache_misses_total",
+    "Odds API cache lookups that required an upstream request",
+    ["endpoint"]
+)
+
+odds_api_cache_requests_saved_total = Counter(
+    "odds_api_cache_requests_saved_total",
+    "Odds API quota requests saved by shared cache hits",
+    ["endpoint"]
+)
+
 # Database Metrics
 db_pool_connections = Gauge(
     "db_pool_connections",
@@ -128,6 +148,123 @@ circuit_breaker_failures_total = Counter(
 )
 
 
+# In-process Cache Metrics (app.core.cache), labelled by namespace
+cache_entries = Gauge(
+    "cache_entries",
+    "Entries currently held in the in-process cache",
+    ["namespace"]
+)
+
+cache_max_entries = Gauge(
+    "cache_max_entries",
+    "Maximum entries before LRU eviction",
+    ["namespace"]
+)
+
+cache_hits = Gauge(
+    "cache_hits",
+    "Cache hits since process start",
+    ["namespace"]
+)
+
+cache_misses = Gauge(
+    "cache_misses",
+    "Cache misses (including expired entries) since process start",
+    ["namespace"]
+)
+
+cache_evictions = Gauge(
+    "cache_evictions",
+    "Entries evicted to stay within the size bound since process start",
+    ["namespace"]
+)
+
+cache_expirations = Gauge(
+    "cache_expirations",
+    "Entries dropped after their TTL since process start",
+    ["namespace"]
+)
+
+cache_hit_ratio = Gauge(
+    "cache_hit_ratio",
+    "Cache hits / lookups since process start",
+    ["namespace"]
+)
+
+
+# Blocking library calls (app.core.blocking), labelled by source
+blocking_calls_queued = Gauge(
+    "blocking_calls_queued",
+    "Blocking calls waiting for a rate-limit slot or worker thread",
+    ["source"]
+)
+
+blocking_calls_active = Gauge(
+    "blocking_calls_active",
+    "Blocking calls currently running on a worker thread",
+    ["source"]
+)
+
+blocking_call_wait_seconds = Histogram(
+    "blocking_call_wait_seconds",
+    "Time from submission until a worker starts the call",
+    ["source"]
+)
+
+blocking_call_duration_seconds = Histogram(
+    "blocking_call_duration_seconds",
+    "Blocking call run time on the worker thread",
+    ["source"]
+)
+
+blocking_call_timeouts_total = Counter(
+    "blocking_call_timeouts_total",
+    "Blocking calls abandoned after their timeout",
+    ["source"]
+)
+
+
+# Sync DAG stages (app.services.sync.dag)
+sync_stage_duration_seconds = Histogram(
+    "sync_stage_duration_seconds",
+    "Wall time of one sync stage",
+    ["stage"]
+)
+
+sync_stage_runs_total = Counter(
+    "sync_stage_runs_total",
+    "Sync stage runs by outcome (success, failed, skipped)",
+    ["stage", "status"]
+)
+
+
+# Write-behind audit sink (app.core.audit_sink)
+audit_sink_buffered = Gauge(
+    "audit_sink_buffered",
+    "Audit events waiting to be written"
+)
+
+audit_sink_backpressure_total = Counter(
+    "audit_sink_backpressure_total",
+    "Times a full audit buffer made a writer flush inline"
+)
+
+audit_events_written_total = Counter(
+    "audit_events_written_total",
+    "Audit events written to match_audit_log"
+)
+
+audit_sink_flush_seconds = Histogram(
+    "audit_sink_flush_seconds",
+    "Time to write one batch of audit events"
+)
+
+audit_sink_flush_failures_total = Counter(
+    "audit_sink_flush_failures_total",
+    "Audit batches that failed to write (requeued)"
+)
+
+
 def update_db_pool_metrics():
     """
     Update database connection pool metrics from SQLAlchemy engine.
@@ -169,6 +306,26 @@ def update_scheduler_metrics():
         scheduler_jobs_total.set(0)
 
 
+def update_cache_metrics():
+    """
+    Update in-process cache gauges from every namespace cache.
+
+    Call this periodically (the scheduler's cache sweep does).
+    """
+    from app.core.cache import registered_caches
+
+    for cache in registered_caches():
+        stats = cache.stats()
+        namespace = stats["namespace"]
+        cache_entries.labels(namespace=namespace).set(stats["entries"])
+        cache_max_entries.labels(namespace=namespace).set(stats["max_size"])
+        cache_hits.labels(namespace=namespace).set(stats["hits"])
+        cache_misses.labels(namespace=namespace).set(stats["misses"])
+        cache_evictions.labels(namespace=namespace).set(stats["evictions"])
+        cache_expirations.labels(namespace=namespace).set(stats["expirations"])
+        cache_hit_ratio.labels(namespace=namespace).set(stats["hit_rate"])
+
+
 def update_odds_api_quota(remaining: int, used: int, monthly_quota: int = 20000):
     """
     Update Odds API quota metrics.
@@ -198,6 +355,24 @@ def record_odds_api_request_failure(error_type: str = "unknown"):
     odds_api_requests_failure_total.labels(error_type=error_type).inc()
 
 
+def record_odds_api_cache_hit(endpoint: str, quota_cost: int = 0):
+    """
+    Record an Odds API cache hit and the quota it saved.
+
+    Args:
+        endpoint: Cached endpoint (e.g. "player_props")
+        quota_cost: Quota the cached request originally cost
+    """
+    odds_api_cache_hits_total.labels(endpoint=endpoint).inc()
+    if quota_cost > 0:
+        odds_api_cache_requests_saved_total.labels(endpoint=endpoint).inc(quota_cost)
+
+
+def record_odds_api_cache_miss(endpoint: str):
+    """Record an Odds API cache miss."""
+    odds_api_cache_misses_total.labels(endpoint=endpoint).inc()
+
+
 def record_espn_api_request_success():
     """Record a successful ESPN API request."""
     espn_api_requests_success_total.inc()
@@ -9,6 +9,7 @@ This module provides scheduled background jobs for:
 - Lineup projections
 - Prediction generation
 - Result verification
+- In-process cache expiry sweep and metrics
 
 Scheduler: APScheduler (lightweight, FastAPI-compatible)
 """
@@ -23,12 +24,16 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from sqlalchemy.orm import Session
+from app.core import metrics
+from app.core.cache import sweep_all_caches
+from app.core.config import settings
 from app.core.database import SessionLocal
 from app.services.sync.orchestrator import SyncOrchestrator
-from app.services.nba.prediction_service import PredictionService
 from app.services.nba.injury_service import InjuryService
 from app.services.nba.lineup_service import LineupService
-from app.services.core.odds_api_service import OddsApiService
+from app.services.core.odds_api_service import OddsApiService, get_odds_service
+from app.services.core.odds_fetch_planner import get_odds_fetch_planner
+from app.services.core.slate_generator import SlateGenerator
 from app.services.nba.boxscore_import_service import BoxscoreImportService
 
 logger = logging.getLogger(__name__)
@@ -73,6 +78,7 @@ class AutomationScheduler:
         self._schedule_lineup_updates()
         self._schedule_prediction_generation()
         self._schedule_result_verification()
+        self._schedule_cache_sweep()
 
         # Start the scheduler
         self.scheduler.start()
@@ -99,6 +105,10 @@ class AutomationScheduler:
 
         Frequency: Every 6 hours (6AM, 12PM, 6PM, 12AM CT)
         Purpose: Keep games table up to date for next 14 days
+
+        Note: Runs the incremental sync DAG (games and odds concurrently,
+        then matching and game log ingest), so each run only handles games
+        and events that changed since the previous one.
         """
         if self.scheduler is None:
             return
@@ -117,15 +127,18 @@ class AutomationScheduler:
             db = SessionLocal()
             try:
                 orchestrator = SyncOrchestrator(db)
-                result = await orchestrator.sync_games(
-                    lookback_days=7,
+                result = await orchestrator.run_incremental_sync(
                     lookahead_days=14,
                     season='2025-26'
                 )
-                logger.info(
-                    f"✅ Games fetch: {result['matched']}/{result['processed']} "
-                    f"matched ({result['duration_ms']}ms)"
+                stages = ", ".join(
+                    f"{name} {entry['status']} ({entry['duration_ms']}ms)"
+                    for name, entry in result['stages'].items()
                 )
+                if result['success']:
+                    logger.info(f"✅ Games sync: {stages}")
+                else:
+                    logger.error(f"❌ Games sync incomplete: {stages}")
             except Exception as e:
                 logger.error(f"❌ Games fetch failed: {e}")
             finally:
@@ -137,68 +150,47 @@ class AutomationScheduler:
         """
         Schedule: Fetch betting odds from bookmakers.
 
-        Frequency: TWICE DAILY (12PM CT, 5PM CT)
-        Purpose: Update odds for upcoming games
+        Frequency: Every ODDS_PLANNER_TICK_MINUTES (default 5 minutes)
+        Purpose: Refresh odds according to the quota-aware fetch planner
 
-        Note: Weekend and holiday games start as early as 12PM CT.
-        - Midday: Get opening odds for early games (Sat/Sun/Holidays)
-        - Evening: Check for line movements before late games
-        - 2 requests/day = 60 requests/month (well within quota)
+        Note: Each tick fetches only what the planner says is due. Events
+        close to tip-off are refreshed often, far-out games rarely, and the
+        total stays within the remaining monthly quota (20,000 requests).
+        The current plan is exposed at /api/admin/odds/plan.
         """
         if self.scheduler is None:
             return
 
-        # Midday fetch - for early games (12 PM CT)
         @self.scheduler.scheduled_job(
-            trigger=CronTrigger(
-                hour=12,  # 12PM CT (noon)
-                minute=0,
-                timezone='America/Chicago'
-            ),
-            id='odds_fetch_midday',
-            name='Fetch Odds (Midday)',
-            misfire_grace_time=600
+            trigger=IntervalTrigger(minutes=settings.ODDS_PLANNER_TICK_MINUTES),
+            id='odds_fetch_planned',
+            name='Fetch Odds (Planned)',
+            misfire_grace_time=120
         )
-        async def fetch_odds_midday():
+        async def fetch_odds_planned():
             db = SessionLocal()
             try:
                 orchestrator = SyncOrchestrator(db)
-                result = await orchestrator.sync_odds(
-                    upcoming_only=True,
-                    days=7
+                result = await orchestrator.sync_planned_odds(
+                    planner=get_odds_fetch_planner(),
+                    odds_service=get_odds_service(settings.THE_ODDS_API_KEY)
                 )
-                logger.info(f"✅ Morning odds fetch: {result['processed']} games")
+                if result['slate_fetched'] or result['events_fetched']:
+                    logger.info(
+                        f"✅ Planned odds fetch: {len(result['events_fetched'])} events, "
+                        f"~{result['quota_spent']} requests"
+                    )
+                if result['errors']:
+                    logger.warning(f"⚠️ Planned odds fetch errors: {'; '.join(result['errors'])}")
             except Exception as e:
-                logger.error(f"❌ Morning odds fetch failed: {e}")
+                logger.error(f"❌ Planned odds fetch failed: {e}")
             finally:
                 db.close()
 
-        # Evening fetch - check for line movements (5 PM CT)
-        @self.scheduler.scheduled_job(
-            trigger=CronTrigger(
-                hour=17,  # 5PM CT
-                minute=0,
-                timezone='America/Chicago'
-            ),
-            id='odds_fetch_evening',
-            name='Fetch Odds (Evening)',
-            misfire_grace_time=600
+        logger.info(
+            f"💰 Scheduled: Odds fetch (planner tick every "
+            f"{settings.ODDS_PLANNER_TICK_MINUTES} minutes)"
         )
-        async def fetch_odds_evening():
-            db = SessionLocal()
-            try:
-                orchestrator = SyncOrchestrator(db)
-                result = await orchestrator.sync_odds(
-                    upcoming_only=True,
-                    days=3
-                )
-                logger.info(f"✅ Evening odds fetch: {result['processed']} games")
-            except Exception as e:
-                logger.error(f"❌ Evening odds fetch failed: {e}")
-            finally:
-                db.close()
-
-        logger.info("💰 Scheduled: Odds fetch (twice daily at 12PM and 5PM CT)")
 
     def _schedule_player_stats(self):
         """
@@ -226,7 +218,8 @@ class AutomationScheduler:
                 orchestrator = SyncOrchestrator(db)
                 result = await orchestrator.sync_player_stats(
                     games_limit=50,
-                    season='2025-26'
+                    season='2025-26',
+                    bulk=settings.NBA_GAME_LOG_BULK_SYNC
                 )
                 logger.info(
                     f"✅ Player stats: {result['success']}/{result['total']} "
@@ -366,37 +359,34 @@ class AutomationScheduler:
             misfire_grace_time=1800
         )
         async def daily_predictions():
-            db = SessionLocal()
+            def run_slate():
+                db = SessionLocal()
+                try:
+                    # Games for the next 3 days, split across the prediction
+                    # process pool (settings.PREDICTION_POOL_WORKERS)
+                    from datetime import date, timedelta
+                    today = date.today()
+                    dates = [today + timedelta(days=days_ahead) for days_ahead in range(3)]
+
+                    generator = SlateGenerator(db)
+                    return generator.run(["nba"], dates)
+                finally:
+                    db.close()
+
             try:
-                prediction_service = PredictionService(db)
-
-                # Get games for next 3 days
-                from datetime import date, timedelta
-                today = date.today()
-
-                for days_ahead in range(3):
-                    game_date = today + timedelta(days=days_ahead)
-
-                    # Fetch games for this date
-                    from app.models import Game
-                    games = db.query(Game).filter(
-                        Game.game_date >= game_date,
-                        Game.game_date < game_date + timedelta(days=1),
-                        Game.status == 'scheduled'
-                    ).all()
-
-                    for game in games:
-                        try:
-                            await prediction_service.generate_predictions_for_game(game.id)
-                            logger.info(f"✅ Generated predictions for game {game.external_id}")
-                        except Exception as e:
-                            logger.error(f"❌ Prediction generation failed for game {game.external_id}: {e}")
-
-                logger.info("✅ Daily predictions complete")
+                # Blocking DB/CPU work runs off the event loop
+                stats = await asyncio.to_thread(run_slate)
+
+                for failure in stats.failures:
+                    logger.error(f"❌ Prediction generation failed for game {failure['game_id']}: {failure['error']}")
+
+                logger.info(
+                    f"✅ Daily predictions complete: {stats.predictions} predictions for "
+                    f"{stats.games_succeeded}/{stats.games_total} games "
+                    f"({stats.games_per_second:.2f} games/s, {stats.workers} worker(s))"
+                )
             except Exception as e:
                 logger.error(f"❌ Daily predictions failed: {e}")
-            finally:
-                db.close()
 
         logger.info("🎯 Scheduled: Daily predictions (8AM CT)")
 
@@ -425,12 +415,15 @@ class AutomationScheduler:
             try:
                 boxscore_service = BoxscoreImportService(db)
 
-                # Get completed games from yesterday
-                from datetime import date, timedelta
-                yesterday = date.today() - timedelta(days=1)
-
-                result = await boxscore_service.import_boxscores_for_date(yesterday)
-                logger.info(f"✅ Result verification: {result.get('games_processed', 0)} games")
+                # Yesterday's completed games, resolved concurrently (one session per game)
+                result = await boxscore_service.resolve_predictions_for_completed_games(hours_back=36)
+                logger.info(
+                    f"✅ Result verification: {result.get('games_processed', 0)} games, "
+                    f"{result.get('predictions_resolved', 0)} predictions resolved"
+                )
+                if result.get('games_failed'):
+                    failed = [g['game_id'] for g in result['games'] if g['status'] != 'resolved']
+                    logger.warning(f"⚠️ Result verification: {len(failed)} games failed: {failed}")
             except Exception as e:
                 logger.error(f"❌ Result verification failed: {e}")
             finally:
@@ -438,6 +431,34 @@ class AutomationScheduler:
 
         logger.info("✅ Scheduled: Result verification (daily 1AM CT)")
 
+    def _schedule_cache_sweep(self):
+        """
+        Schedule: Drop expired in-process cache entries.
+
+        Frequency: Every CACHE_SWEEP_INTERVAL_SECONDS (default 60 seconds)
+        Purpose: Keep API response caches small between reads and refresh
+                 the per-namespace cache gauges exposed at /metrics
+        """
+        if self.scheduler is None:
+            return
+
+        @self.scheduler.scheduled_job(
+            trigger=IntervalTrigger(seconds=settings.CACHE_SWEEP_INTERVAL_SECONDS),
+            id='cache_sweep',
+            name='Sweep Expired Cache Entries',
+            misfire_grace_time=60
+        )
+        async def cache_sweep_job():
+            try:
+                sweep_all_caches()
+                metrics.update_cache_metrics()
+            except Exception as e:
+                logger.error(f"❌ Cache sweep failed: {e}")
+
+        logger.info(
+            f"🧹 Scheduled: Cache sweep (every {settings.CACHE_SWEEP_INTERVAL_SECONDS} seconds)"
+        )
+
     def _log_scheduled_jobs(self):
         """Log all scheduled jobs for visibility."""
         jobs = self.scheduler.get_jobs()
@@ -36,6 +36,7 @@ from app.api.routes.parlays import router as parlays_router
 from app.api.routes import parlays_v2  # Phase 4: Enhanced 2-leg parlays
 # Admin routes
 from app.api.routes.admin import deploy as admin_deploy
+from app.api.routes.admin import odds as admin_odds
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -102,6 +103,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     except Exception as e:
         logger.warning(f"Failed to initialize tracing: {e}")
 
+    # Buffer match audit rows and write them in bulk
+    from app.core.audit_sink import start_audit_sink
+    await start_audit_sink()
+
     # Start the automation scheduler
     from app.core.scheduler import start_scheduler
     await start_scheduler()
@@ -120,6 +125,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     from app.core.scheduler import stop_scheduler
     await stop_scheduler()
     logger.info("Automation scheduler stopped")
+
+    from app.core.audit_sink import shutdown_audit_sink
+    await shutdown_audit_sink()
+
+    from app.core.blocking import shutdown_blocking_executor
+    shutdown_blocking_executor()
     logger.info("Shutting down application")
 
 
@@ -205,6 +216,7 @@ app.include_router(parlays_v2.router, prefix="/api/v1")  # Phase 4: Enhanced 2-l
 app.include_router(sync.router, prefix="/api/v1")  # Data sync layer
 # Admin routes - not versioned (admin tools don't follow API versioning)
 app.include_router(admin_deploy.router, prefix="/api/admin")  # Admin deployment routes
+app.include_router(admin_odds.router, prefix="/api/admin")  # Odds fetch planner
 
 
 @app.get("/")
@@ -241,7 +253,8 @@ async def root(request: Request):
             "admin": {
                 "deploy": "/api/admin/deploy",
                 "status": "/api/admin/deploy/status",
-                "webhook": "/api/admin/deploy/webhook"
+                "webhook": "/api/admin/deploy/webhook",
+                "odds_plan": "/api/admin/odds/plan"
             },
             "docs": "/docs",
             "health": "/health"
@@ -39,6 +39,7 @@ from app.models.unified import (
     ExpectedLineup,
     PlayerSeasonStats,
     HistoricalOddsSnapshot,
+    HitRateAggregate,
     Parlay,
     ParlayLeg,
     PlacedBet,
@@ -67,6 +68,7 @@ __all__ = [
     "ExpectedLineup",
     "PlayerSeasonStats",
     "HistoricalOddsSnapshot",
+    "HitRateAggregate",
     "Parlay",
     "ParlayLeg",
     "PlacedBet",
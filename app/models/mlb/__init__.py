@@ -30,6 +30,7 @@ __all__ = [
     "PlayerSeasonStats",
     "GameOdds",
     "HistoricalOddsSnapshot",
+    "HitRateAggregate",
     "PlayerInjury",
     "ExpectedLineup",
     "NewsEvent",
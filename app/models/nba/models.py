@@ -508,6 +508,7 @@ class HistoricalOddsSnapshot(Base):
     bookmaker_line = Column(Float, nullable=False)  # The line (e.g., 23.5)
     over_price = Column(Float, nullable=True)  # American odds for OVER
     under_price = Column(Float, nullable=True)  # American odds for UNDER
+    line_hash = Column(String(16), nullable=True)  # Fingerprint of line + prices (change-only ingestion)
 
     # Snapshot timing
     snapshot_time = Column(DateTime, nullable=False, index=True)  # When odds were captured
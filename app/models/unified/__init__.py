@@ -18,7 +18,9 @@ Migration Path:
 """
 from datetime import datetime, date
 from sqlalchemy import Column, String, Float, Integer, DateTime, Date, ForeignKey, Boolean, Text, Index, UniqueConstraint, JSON
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.orm import relationship, declarative_base, validates
+
+from app.services.sync.utils.name_normalizer import normalize
 
 Base = declarative_base()
 
@@ -82,6 +84,7 @@ class Player(Base):
     # Player information (all sports)
     canonical_name = Column(String(255), nullable=True, index=True)
     name = Column(String(255), nullable=False, index=True)
+    normalized_name = Column(String(255), nullable=True)  # normalize(name), set on write
     team = Column(String(3), nullable=False, index=True)
     position = Column(String(10), nullable=True)
     active = Column(Boolean, nullable=False, index=True)
@@ -128,8 +131,15 @@ class Player(Base):
         Index('ix_players_sport_id', 'sport_id'),
         Index('ix_players_canonical_name', 'canonical_name'),
         Index('ix_players_odds_api_id', 'odds_api_id'),
+        Index('ix_players_sport_normalized_name', 'sport_id', 'normalized_name'),
     )
 
+    @validates('name')
+    def _set_normalized_name(self, key, name):
+        """Keep normalized_name in step with name."""
+        self.normalized_name = normalize(name) if name else None
+        return name
+
 
 # =============================================================================
 # GAME MODEL (Multi-Sport)
@@ -402,6 +412,11 @@ class PlayerStats(Base):
     player = relationship("Player", back_populates="stats")
     game = relationship("Game")
 
+    __table_args__ = (
+        # One stat line per player per game (bulk game log upserts conflict on this)
+        UniqueConstraint('player_id', 'game_id', name='uq_player_stats_player_game'),
+    )
+
 
 class GameOdds(Base):
     """Game-level betting odds from bookmakers."""
@@ -534,6 +549,7 @@ class HistoricalOddsSnapshot(Base):
     bookmaker_line = Column(Float, nullable=False)
     over_price = Column(Float, nullable=True)
     under_price = Column(Float, nullable=True)
+    line_hash = Column(String(16), nullable=True)  # Fingerprint of line + prices (change-only ingestion)
 
     snapshot_time = Column(DateTime, nullable=False, index=True)
     is_opening_line = Column(Boolean, default=False, nullable=False, index=True)
@@ -558,6 +574,32 @@ class HistoricalOddsSnapshot(Base):
     )
 
 
+class HitRateAggregate(Base):
+    """
+    Resolved snapshot hit counts per player, stat type, bookmaker, starter flag and day.
+
+    Maintained incrementally as HistoricalOddsService resolves snapshots;
+    get_batch_hit_rates reads a whole slate from here in one query.
+    """
+    __tablename__ = "hit_rate_aggregates"
+
+    player_id = Column(String(36), ForeignKey("players.id", ondelete="CASCADE"), primary_key=True)
+    stat_type = Column(String(50), primary_key=True)
+    bookmaker_name = Column(String(100), primary_key=True)
+    was_starter = Column(Boolean, primary_key=True)
+    bucket_date = Column(Date, primary_key=True)  # Day of snapshot_time
+
+    over_hits = Column(Integer, default=0, nullable=False)
+    under_hits = Column(Integer, default=0, nullable=False)
+    pushes = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('ix_hit_rate_aggregates_stat_bucket', 'stat_type', 'bucket_date'),
+    )
+
+
 # =============================================================================
 # BETTING MODELS (Shared across all sports)
 # =============================================================================
@@ -738,6 +780,7 @@ class PlayerAlias(Base):
     nba_player_id = Column(Integer, nullable=False, index=True)
     canonical_name = Column(String(128), nullable=False, index=True)
     alias_name = Column(String(128), nullable=False, index=True)
+    normalized_name = Column(String(128), nullable=True)  # normalize(alias_name), set on write
     alias_source = Column(String(32), nullable=False, index=True)
     match_confidence = Column(Float, nullable=False)
     is_verified = Column(Boolean, nullable=False, default=False, index=True)
@@ -752,8 +795,15 @@ class PlayerAlias(Base):
         Index('ix_player_aliases_nba_id', 'nba_player_id'),
         Index('ix_player_aliases_source', 'alias_source'),
         Index('ix_player_aliases_verified', 'is_verified'),
+        Index('ix_player_aliases_source_normalized', 'alias_source', 'normalized_name'),
     )
 
+    @validates('alias_name')
+    def _set_normalized_name(self, key, alias_name):
+        """Keep normalized_name in step with alias_name."""
+        self.normalized_name = normalize(alias_name) if alias_name else None
+        return alias_name
+
 
 class TeamMapping(Base):
     """Team name and ID mappings."""
@@ -791,6 +841,7 @@ class SyncMetadata(Base):
     records_failed = Column(Integer, nullable=False, default=0)
     error_message = Column(Text, nullable=True)
     sync_duration_ms = Column(Integer, nullable=True)
+    watermark = Column(DateTime, nullable=True)  # Latest source date ingested (incremental syncs)
 
     __table_args__ = (
         UniqueConstraint('source', 'data_type', name='uq_sync_metadata_source_type'),
@@ -8,10 +8,11 @@ Calculates prediction accuracy metrics including:
 - Model Drift Detection: Compares recent performance to baseline
 """
 import logging
+import math
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, case, literal_column, cast, Date, extract
+from sqlalchemy import func, and_, case, literal_column, cast, BigInteger, Date, extract
 
 # UTC timezone for Python < 3.11 compatibility
 try:
@@ -23,6 +24,9 @@ from app.models import Prediction, Player, Game
 
 logger = logging.getLogger(__name__)
 
+# Prediction columns get_accuracy_timeline can break windows down by
+TIMELINE_BREAKDOWNS = ("stat_type", "model_version")
+
 
 class AccuracyService:
     """
@@ -241,85 +245,113 @@ class AccuracyService:
         self,
         model_version: Optional[str] = None,
         days_back: int = 30,
-        window_days: int = 1
+        window_days: int = 1,
+        window: Optional[timedelta] = None,
+        breakdown: Optional[List[str]] = None
     ) -> List[Dict]:
         """
         Get accuracy metrics over time for drift detection.
 
+        One grouped query: created_at is bucketed into windows counted from
+        the start of the period, and error sums and recommendation counts
+        are aggregated per window (and per breakdown column) in the same
+        pass. Windows without resolved predictions are omitted.
+
         Args:
             model_version: Filter by model version (None = all versions)
             days_back: Total time period to analyze
             window_days: Size of each time window (default: 1 day)
+            window: Arbitrary window size; overrides window_days
+            breakdown: Columns to break each window down by, any of
+                       TIMELINE_BREAKDOWNS ("stat_type", "model_version")
 
         Returns:
-            List of time-ordered dictionaries with metrics for each window
+            List of time-ordered dictionaries with metrics for each window;
+            with a breakdown each also holds "breakdown", a list of the same
+            metrics per column value combination
         """
-        timeline = []
-        cutoff = datetime.now(UTC) - timedelta(days=days_back)
-
-        # Calculate number of windows
-        num_windows = days_back // window_days
-        if days_back % window_days != 0:
-            num_windows += 1
-
-        for i in range(num_windows):
-            window_start = cutoff + timedelta(days=i * window_days)
-            window_end = window_start + timedelta(days=window_days)
-
-            # Query for this window
-            base_query = self.db.query(Prediction).filter(
-                Prediction.actuals_resolved_at.isnot(None),
-                Prediction.created_at >= window_start,
-                Prediction.created_at < window_end
-            )
+        breakdown = list(dict.fromkeys(breakdown or []))
+        unknown = [column for column in breakdown if column not in TIMELINE_BREAKDOWNS]
+        if unknown:
+            raise ValueError(f"Unknown breakdown column(s): {', '.join(unknown)}")
 
-            if model_version:
-                base_query = base_query.filter(Prediction.model_version == model_version)
-
-            total = base_query.count()
-
-            if total == 0:
-                continue
+        window = window or timedelta(days=window_days)
+        window_seconds = int(window.total_seconds())
+        if window_seconds <= 0:
+            raise ValueError("Timeline window must be positive")
 
-            # MAE
-            mae_result = base_query.with_entities(
-                func.avg(func.abs(Prediction.predicted_value - Prediction.actual_value))
-            ).scalar()
-            mae = float(mae_result) if mae_result else 0.0
-
-            # RMSE
-            rmse_result = base_query.with_entities(
-                func.sqrt(
-                    func.avg(
-                        func.pow(Prediction.predicted_value - Prediction.actual_value, 2)
-                    )
-                )
-            ).scalar()
-            rmse = float(rmse_result) if rmse_result else 0.0
+        cutoff = datetime.now(UTC) - timedelta(days=days_back)
+        cutoff_epoch = int(cutoff.timestamp())
+
+        # Window index: whole windows elapsed since the cutoff (created_at is UTC).
+        # Inlined integers keep the GROUP BY expression identical to the selected one.
+        created_epoch = cast(extract('epoch', Prediction.created_at), BigInteger)
+        bucket = (
+            (created_epoch - literal_column(str(cutoff_epoch), BigInteger))
+            // literal_column(str(window_seconds), BigInteger)
+        ).label('bucket')
+        breakdown_columns = [getattr(Prediction, column) for column in breakdown]
+
+        error = Prediction.predicted_value - Prediction.actual_value
+        is_recommendation = Prediction.recommendation.in_(["OVER", "UNDER"])
+        query = self.db.query(
+            bucket,
+            *breakdown_columns,
+            func.count(Prediction.id),
+            func.sum(func.abs(error)),
+            func.sum(error * error),
+            func.sum(case((is_recommendation, 1), else_=0)),
+            func.sum(case((and_(is_recommendation, Prediction.was_correct == True), 1), else_=0))
+        ).filter(
+            Prediction.actuals_resolved_at.isnot(None),
+            Prediction.created_at >= cutoff
+        )
 
-            # Win rate
-            total_recs = base_query.filter(
-                Prediction.recommendation.in_(["OVER", "UNDER"])
-            ).count()
+        if model_version:
+            query = query.filter(Prediction.model_version == model_version)
 
-            correct_recs = base_query.filter(
-                Prediction.recommendation.in_(["OVER", "UNDER"]),
-                Prediction.was_correct == True
-            ).count()
+        rows = query.group_by(bucket, *breakdown_columns).order_by(bucket, *breakdown_columns).all()
 
-            win_rate = correct_recs / total_recs if total_recs > 0 else 0.0
+        windows: Dict[int, List] = {}
+        for row in rows:
+            windows.setdefault(int(row[0]), []).append(row)
 
-            timeline.append({
+        timeline = []
+        for index, window_rows in windows.items():
+            window_start = cutoff + index * window
+            sums = [sum(row[i] or 0 for row in window_rows) for i in range(-5, 0)]
+            entry = {
                 "window_start": window_start.isoformat(),
-                "window_end": window_end.isoformat(),
-                "total_predictions": total,
-                "mae": round(mae, 2),
-                "rmse": round(rmse, 2),
-                "win_rate": round(win_rate, 3)
-            })
+                "window_end": (window_start + window).isoformat(),
+                **self._timeline_metrics(*sums)
+            }
+            if breakdown:
+                entry["breakdown"] = [
+                    {
+                        **dict(zip(breakdown, row[1:1 + len(breakdown)])),
+                        **self._timeline_metrics(*row[-5:])
+                    }
+                    for row in window_rows
+                ]
+            timeline.append(entry)
 
         return timeline
 
+    @staticmethod
+    def _timeline_metrics(total, abs_error_sum, squared_error_sum, total_recs, correct_recs) -> Dict:
+        """Timeline window metrics from summed errors and recommendation counts."""
+        total = int(total or 0)
+        total_recs = int(total_recs or 0)
+        mae = float(abs_error_sum or 0) / total if total else 0.0
+        rmse = math.sqrt(float(squared_error_sum or 0) / total) if total else 0.0
+        win_rate = int(correct_recs or 0) / total_recs if total_recs > 0 else 0.0
+        return {
+            "total_predictions": total,
+            "mae": round(mae, 2),
+            "rmse": round(rmse, 2),
+            "win_rate": round(win_rate, 3)
+        }
+
     def detect_model_drift(
         self,
         model_version: Optional[str] = None,
@@ -21,8 +21,13 @@ import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Dict, Optional, Any, Type
+
+import numpy as np
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.orm import Session
 
+from app.services.core import projection_kernel
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -79,6 +84,10 @@ class BasePredictionService(ABC):
         self.db = db
         self._sport_id = sport_id
 
+        # Players, season stats and per-game rates of the game being
+        # generated (see _get_season_rates)
+        self._season_rates: Optional[Dict[str, Any]] = None
+
         # Load sport config if provided and available
         self._use_config_mode = (
             sport_id is not None and
@@ -325,7 +334,8 @@ class BasePredictionService(ABC):
     def generate_predictions_for_game(
         self,
         game_id: str,
-        stat_types: Optional[List[str]] = None
+        stat_types: Optional[List[str]] = None,
+        persist: bool = True
     ) -> List[Dict]:
         """
         Generate predictions for all players in a game.
@@ -340,9 +350,14 @@ class BasePredictionService(ABC):
            - Creates prediction record
         4. Commits all predictions to database
 
+        With persist=False nothing is written; each result dict carries the
+        prediction's column values under "record" so a single writer (see
+        app.services.core.slate_generator) can bulk insert them.
+
         Args:
             game_id: Database UUID of the game
             stat_types: List of stat types to predict (uses default if None)
+            persist: Add and commit prediction records (default True)
 
         Returns:
             List of generated prediction dictionaries with metadata
@@ -376,6 +391,9 @@ class BasePredictionService(ABC):
             logger.warning(f"No active players found for game {game_id}")
             return []
 
+        # Season stats for every player load in one query on first use
+        self._season_rates = {"game_id": game.id, "players": players, "stat_types": stat_types}
+
         predictions_generated = []
 
         for player in players:
@@ -436,7 +454,8 @@ class BasePredictionService(ABC):
                     confidence=confidence
                 )
 
-                self.db.add(prediction)
+                if persist:
+                    self.db.add(prediction)
 
                 # Build result dictionary
                 result = {
@@ -452,6 +471,9 @@ class BasePredictionService(ABC):
                 if hasattr(player, 'position'):
                     result["position"] = player.position
 
+                if not persist:
+                    result["record"] = self._prediction_to_row(prediction)
+
                 predictions_generated.append(result)
 
                 logger.info(
@@ -459,6 +481,9 @@ class BasePredictionService(ABC):
                     f"- {stat_type}: {predicted_value:.2f} (confidence: {confidence:.2f})"
                 )
 
+        if not persist:
+            return predictions_generated
+
         # Commit all predictions
         try:
             self.db.commit()
@@ -516,25 +541,19 @@ class BasePredictionService(ABC):
         """
         SeasonStats = self.get_season_stats_model()
 
-        # Build query filters for season stats
-        # Convert game.season (Integer) to string for comparison with PlayerSeasonStats.season (String)
-        season_str = str(game.season) if game.season else None
-        filters = [
-            SeasonStats.player_id == player.id,
-            SeasonStats.season == season_str
-        ]
-
-        # Add any sport-specific filters
-        additional_filters = self._get_season_stats_query_filters()
-        if additional_filters:
-            filters.extend(additional_filters)
-
-        # Try season stats first
-        season_stats = (
-            self.db.query(SeasonStats)
-            .filter(*filters)
-            .first()
-        )
+        # Try season stats first (loaded for the whole game when generating)
+        rates = self._get_season_rates(game)
+        if rates is not None and player.id in rates["rows"]:
+            season_stats = rates["rows"][player.id]
+        else:
+            season_stats = (
+                self.db.query(SeasonStats)
+                .filter(
+                    SeasonStats.player_id == player.id,
+                    *self._get_season_stats_filters(game)
+                )
+                .first()
+            )
 
         predicted_value = None
 
@@ -560,6 +579,78 @@ class BasePredictionService(ABC):
 
         return max(0, round(predicted_value, 2))
 
+    def _get_season_stats_filters(self, game: Any) -> List[Any]:
+        """Season and sport-specific filters for a game's season stats."""
+        SeasonStats = self.get_season_stats_model()
+
+        # Convert game.season (Integer) to string for comparison with PlayerSeasonStats.season (String)
+        season_str = str(game.season) if game.season else None
+        filters = [SeasonStats.season == season_str]
+
+        # Add any sport-specific filters
+        filters.extend(self._get_season_stats_query_filters())
+        return filters
+
+    def _get_season_rates(self, game: Any) -> Optional[Dict[str, Any]]:
+        """
+        Season stats and per-game rates for every player in the game being generated.
+
+        Loaded on first use with one query; the players × stats matrix of
+        season totals is converted with one projection kernel call.
+        _get_predicted_value and the default _extract_value_from_season_stats
+        read from the result instead of querying and dividing per player and
+        stat.
+
+        Args:
+            game: Game model instance
+
+        Returns:
+            Dict with rows (season stats by player id) and per_game (by
+            (player_id, stat_type)), or None outside generate_predictions_for_game
+        """
+        rates = self._season_rates
+        if rates is None or rates["game_id"] != getattr(game, 'id', None):
+            return None
+        if "rows" in rates:
+            return rates
+
+        SeasonStats = self.get_season_stats_model()
+        players = rates["players"]
+        stat_types = rates["stat_types"]
+
+        rows: Dict[Any, Any] = {player.id: None for player in players}
+        for season_stats in (
+            self.db.query(SeasonStats)
+            .filter(
+                SeasonStats.player_id.in_(list(rows)),
+                *self._get_season_stats_filters(game)
+            )
+        ):
+            if rows.get(season_stats.player_id) is None:
+                rows[season_stats.player_id] = season_stats
+
+        totals = np.full((len(players), len(stat_types)), np.nan)
+        games_played = np.zeros(len(players))
+        for i, player in enumerate(players):
+            season_stats = rows[player.id]
+            if season_stats is None:
+                continue
+            games_played[i] = getattr(season_stats, 'games_played', 0) or 0
+            for k, stat_type in enumerate(stat_types):
+                stat_value = getattr(season_stats, stat_type, None)
+                if stat_value is not None:
+                    totals[i, k] = stat_value
+
+        per_game = projection_kernel.per_game_rates(totals, games_played)
+
+        rates["rows"] = rows
+        rates["per_game"] = {
+            (player.id, stat_type): float(per_game[i, k])
+            for i, player in enumerate(players)
+            for k, stat_type in enumerate(stat_types)
+        }
+        return rates
+
     def _get_season_stats_query_filters(self) -> List[Any]:
         """
         Get additional filters for season stats queries.
@@ -598,10 +689,20 @@ class BasePredictionService(ABC):
             return None
 
         # Default: assume cumulative stats that need per-game normalization
-        games_played = getattr(season_stats, 'games_played', 0)
+        rates = self._get_season_rates(game)
+        if (
+            rates is not None
+            and rates["rows"].get(player.id) is season_stats
+            and (player.id, stat_type) in rates["per_game"]
+        ):
+            predicted_value = rates["per_game"][(player.id, stat_type)]
+        else:
+            games_played = getattr(season_stats, 'games_played', 0) or 0
+            predicted_value = float(
+                projection_kernel.per_game_rates([[stat_value]], [games_played])[0, 0]
+            )
 
-        if games_played and games_played > 0:
-            predicted_value = stat_value / games_played
+        if not np.isnan(predicted_value):
             logger.debug(
                 f"Using season stats for {player.name}: {stat_type} = "
                 f"{predicted_value:.2f}/game"
@@ -817,6 +918,20 @@ class BasePredictionService(ABC):
             created_at=datetime.utcnow()
         )
 
+    def _prediction_to_row(self, prediction: Any) -> Dict[str, Any]:
+        """
+        Column values explicitly set on an unsaved Prediction instance.
+
+        Unset columns are left out so database defaults still apply when
+        the row is bulk inserted.
+        """
+        state = sa_inspect(prediction)
+        return {
+            attr.key: state.dict[attr.key]
+            for attr in state.mapper.column_attrs
+            if attr.key in state.dict
+        }
+
     # ========================================================================
     # HOOK METHODS - Optional overrides for sport-specific behavior
     # ========================================================================
@@ -33,8 +33,10 @@ from sqlalchemy.orm import Session
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.utils.timezone import utc_to_central
+from app.core.cache import get_cache
 from app.core.logging import get_logger
 from app.services.core.circuit_breaker import espn_api_breaker, CircuitBreakerError
+from app.utils.async_utils import SingleFlight
 
 logger = get_logger(__name__)
 
@@ -72,7 +74,12 @@ class ESPNApiService:
         teams = await service.get_teams('nba')
     """
 
-    def __init__(self, cache_ttl: Optional[int] = None, default_sport: str = "nba"):
+    def __init__(
+        self,
+        cache_ttl: Optional[int] = None,
+        default_sport: str = "nba",
+        base_url: Optional[str] = None
+    ):
         """
         Initialize ESPN API service.
 
@@ -80,15 +87,23 @@ class ESPNApiService:
             cache_ttl: Override cache TTL in seconds. If None, uses dynamic
                       TTL based on season status.
             default_sport: Default sport for season-aware TTL (default: 'nba')
+            base_url: Site API root (default: ESPN_API_BASE_URL, e.g. a local
+                      stand-in server for load tests)
         """
+        from app.core.config import settings
+
         if cache_ttl is None:
             from app.core.config import get_dynamic_cache_ttl
             cache_ttl = get_dynamic_cache_ttl(default_sport)
 
+        self.base_url = (base_url or settings.ESPN_API_BASE_URL or ESPN_BASE_URL).rstrip("/")
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, tuple] = {}  # key -> (data, expiry)
+        # Shared bounded cache (app.core.cache) for every ESPNApiService
+        self._cache = get_cache("espn", max_size=512, default_ttl=cache_ttl)
         self._client: Optional[httpx.AsyncClient] = None
         self._default_sport = default_sport
+        # Concurrent fetches of the same URL share one upstream request
+        self._inflight = SingleFlight()
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -118,19 +133,11 @@ class ESPNApiService:
 
     async def _get_cached(self, key: str) -> Optional[Any]:
         """Get data from cache if valid."""
-        if key in self._cache:
-            data, expiry = self._cache[key]
-            if datetime.now() < expiry:
-                return data
-            else:
-                del self._cache[key]
-        return None
+        return self._cache.get(key)
 
     async def _set_cache(self, key: str, data: Any, ttl: Optional[int] = None):
         """Set data in cache with TTL."""
-        ttl = ttl or self.cache_ttl
-        expiry = datetime.now() + timedelta(seconds=ttl)
-        self._cache[key] = (data, expiry)
+        self._cache.set(key, data, ttl or self.cache_ttl)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -156,6 +163,9 @@ class ESPNApiService:
         """
         Fetch data from ESPN API.
 
+        Concurrent calls for the same URL are coalesced into one request;
+        every caller receives its result or exception.
+
         Args:
             url: Full API URL
             use_cache: Whether to use cache (default: True)
@@ -170,6 +180,10 @@ class ESPNApiService:
             if cached:
                 return cached
 
+        return await self._inflight.do(cache_key, lambda: self._load(url, cache_key))
+
+    async def _load(self, url: str, cache_key: str) -> Dict:
+        """Fetch and cache one URL (single-flight leader only)."""
         try:
             client = await self._get_client()
             data = await self._fetch_with_breaker(url, client)
@@ -201,7 +215,7 @@ class ESPNApiService:
             logger.warning(f"Unsupported sport: {sport_id}")
             return []
 
-        url = f"{ESPN_BASE_URL}/{sport_path}/news"
+        url = f"{self.base_url}/{sport_path}/news"
 
         try:
             data = await self._fetch(url)
@@ -290,7 +304,7 @@ class ESPNApiService:
         if not date:
             date = datetime.now().strftime('%Y%m%d')
 
-        url = f"{ESPN_BASE_URL}/{sport_path}/scoreboard?dates={date}"
+        url = f"{self.base_url}/{sport_path}/scoreboard?dates={date}"
 
         try:
             data = await self._fetch(url)
@@ -361,7 +375,7 @@ class ESPNApiService:
         if not date:
             date = datetime.now().strftime('%Y%m%d')
 
-        url = f"{ESPN_BASE_URL}/{sport_path}/scoreboard?dates={date}"
+        url = f"{self.base_url}/{sport_path}/scoreboard?dates={date}"
 
         try:
             data = await self._fetch(url, use_cache=False)  # Don't cache for fresh schedule data
@@ -484,7 +498,7 @@ class ESPNApiService:
             logger.warning(f"Unsupported sport: {sport_id}")
             return []
 
-        url = f"{ESPN_BASE_URL}/{sport_path}/teams"
+        url = f"{self.base_url}/{sport_path}/teams"
 
         try:
             data = await self._fetch(url)
@@ -531,7 +545,7 @@ class ESPNApiService:
             logger.warning(f"Unsupported sport: {sport_id}")
             return []
 
-        url = f"{ESPN_BASE_URL}/{sport_path}/teams/{team_id}"
+        url = f"{self.base_url}/{sport_path}/teams/{team_id}"
 
         try:
             data = await self._fetch(url)
@@ -584,7 +598,7 @@ class ESPNApiService:
             logger.warning(f"Unsupported sport: {sport_id}")
             return None
 
-        url = f"{ESPN_BASE_URL}/{sport_path}/athletes/{player_id}"
+        url = f"{self.base_url}/{sport_path}/athletes/{player_id}"
 
         try:
             data = await self._fetch(url)
@@ -636,7 +650,7 @@ class ESPNApiService:
             logger.warning(f"Unsupported sport: {sport_id}")
             return None
 
-        url = f"{ESPN_BASE_URL}/{sport_path}/summary?event={espn_game_id}"
+        url = f"{self.base_url}/{sport_path}/summary?event={espn_game_id}"
 
         try:
             data = await self._fetch(url, use_cache=False)  # Don't cache boxscores
@@ -25,6 +25,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 
 from app.models import Player, Game
+from app.services.sync.utils.name_normalizer import normalize
 
 logger = logging.getLogger(__name__)
 
@@ -198,15 +199,12 @@ class PlayerIdentityResolver:
         team: str,
         name: str
     ) -> Optional[Player]:
-        """Find player by team and canonical name."""
-        # Normalize name for comparison
-        canonical_name = self._normalize_name(name)
-
+        """Find player by team and normalized name (indexed equality)."""
         return self.db.query(Player).filter(
             and_(
                 Player.sport_id == sport_id,
+                Player.normalized_name == normalize(name),
                 Player.team == team,
-                Player.canonical_name == canonical_name,
                 Player.active == True
             )
         ).first()
@@ -223,6 +221,10 @@ class PlayerIdentityResolver:
         Improvement (P1 #11): Added suffix compatibility checking to prevent
         matching Jr/Sr players with the same name.
 
+        Candidates come from one equality query on the indexed
+        (sport_id, normalized_name) key; normalize() drops suffixes, so the
+        Jr/Sr check runs on that small result set.
+
         Args:
             sport_id: Sport identifier
             name: Player name
@@ -231,8 +233,6 @@ class PlayerIdentityResolver:
         Returns:
             Player if found, None otherwise
         """
-        canonical_name = self._normalize_name(name)
-
         # Get input suffix for comparison
         input_suffix = self._extract_suffix(name)
 
@@ -240,7 +240,7 @@ class PlayerIdentityResolver:
         query = self.db.query(Player).filter(
             and_(
                 Player.sport_id == sport_id,
-                Player.canonical_name == canonical_name,
+                Player.normalized_name == normalize(name),
                 Player.active == True
             )
         )
@@ -328,16 +328,14 @@ class PlayerIdentityResolver:
         """Find player by checking aliases table."""
         from app.models import PlayerAlias
 
-        canonical_name = self._normalize_name(name)
-
         # PlayerAlias table is NBA-specific and doesn't have sport_id
         # Only use it for NBA queries
         if sport_id != 'nba':
             return None
 
-        # First try to find the alias by canonical name
+        # First try to find the alias by normalized name
         alias = self.db.query(PlayerAlias).filter(
-            PlayerAlias.alias_name == canonical_name
+            PlayerAlias.normalized_name == normalize(name)
         ).first()
 
         if alias:
@@ -8,6 +8,7 @@ It delegates to sport-specific prediction services while providing:
 - Consistent API across all sports
 - Sport-specific prediction logic
 - Unified error handling and logging
+- Optional process-pool slate mode (see app.services.core.slate_generator)
 """
 import logging
 from typing import List, Dict, Optional
@@ -122,7 +123,8 @@ class MultiSportPredictionService:
         self,
         sport_id: str,
         target_date,
-        stat_types: Optional[List[str]] = None
+        stat_types: Optional[List[str]] = None,
+        workers: Optional[int] = None
     ) -> Dict[str, List[Dict]]:
         """
         Generate predictions for all games on a specific date.
@@ -131,14 +133,20 @@ class MultiSportPredictionService:
             sport_id: Sport identifier ('nba', 'nfl', 'mlb', 'nhl')
             target_date: Date to generate predictions for
             stat_types: List of stat types to predict
+            workers: When greater than 1, split games across this many worker
+                     processes and bulk insert results (slate mode)
 
         Returns:
             Dictionary mapping game_id to list of predictions
         """
-        from datetime import date
+        from datetime import date, datetime
+
+        if workers is not None and workers > 1:
+            slate_date = target_date.date() if isinstance(target_date, datetime) else target_date
+            stats = self.generate_slate([sport_id], [slate_date], stat_types, workers, keep_results=True)
+            return stats.results_by_game
 
         if isinstance(target_date, date):
-            from datetime import datetime
             start_date = datetime.combine(target_date, datetime.min.time())
             end_date = datetime.combine(target_date, datetime.max.time())
         else:
@@ -177,6 +185,36 @@ class MultiSportPredictionService:
 
         return all_predictions
 
+    def generate_slate(
+        self,
+        sport_ids: List[str],
+        dates: List,
+        stat_types: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+        keep_results: bool = False
+    ):
+        """
+        Generate predictions for several sports and dates with a process pool.
+
+        Args:
+            sport_ids: Sport identifiers to include
+            dates: Game dates to include
+            stat_types: List of stat types to predict (default: sport-specific defaults)
+            workers: Worker processes (default: settings.PREDICTION_POOL_WORKERS)
+            keep_results: Keep per-game prediction dicts on the returned stats
+
+        Returns:
+            SlateRunStats with counts, failures and throughput metrics
+        """
+        from app.services.core.slate_generator import SlateGenerator
+
+        for sport_id in sport_ids:
+            if sport_id not in self.SPORT_MODELS:
+                raise ValueError(f"Unsupported sport: {sport_id}")
+
+        generator = SlateGenerator(self.db, workers=workers)
+        return generator.run(sport_ids, dates, stat_types, keep_results=keep_results)
+
     def generate_all_sport_predictions(
         self,
         target_date,
@@ -7,21 +7,39 @@ This service provides access to betting odds from bookmakers including:
 
 Paid Plan: 20,000 requests/month (~666/day)
 Quota Tracking: Response headers x-requests-remaining, x-requests-used
+Caching: Responses go through a shared backend (app.services.core.odds_cache)
+so every process on the host reuses them across restarts
 """
 import asyncio
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.logging import get_logger
+from app.core.metrics import record_odds_api_cache_hit, record_odds_api_cache_miss
 from app.services.core.circuit_breaker import odds_api_breaker, CircuitBreakerError
+from app.services.core.odds_cache import OddsCacheBackend, get_shared_odds_cache
+from app.utils.async_utils import AsyncRateLimiter, SingleFlight
 
 logger = get_logger(__name__)
 
 # The Odds API base URL
 THE_ODDS_API_BASE = "https://api.the-odds-api.com/v4"
 
+# Markets requested per call; quota cost is markets × regions per request
+GAME_ODDS_MARKETS = ["h2h", "spreads", "totals"]
+PLAYER_PROPS_MARKETS = ["player_points", "player_rebounds", "player_assists", "player_threes"]
+
+
+def quota_cost_for(markets: int, regions: str) -> int:
+    """Quota cost of requesting `markets` markets for comma-separated `regions`."""
+    return markets * len(regions.split(","))
+
+
+class OddsApiError(Exception):
+    """An Odds API request failed (raised only when the caller asks for errors)."""
+
 
 class OddsApiService:
     """
@@ -31,10 +49,18 @@ class OddsApiService:
     Quota Tracking: Captures x-requests-remaining and x-requests-used headers
 
     Cache TTL is dynamic based on sport season status for better data freshness
-    during active seasons and better performance during offseason.
+    during active seasons and better performance during offseason. Cached
+    responses are shared with every other process using the same backend.
     """
 
-    def __init__(self, api_key: str, cache_ttl: Optional[int] = None, default_sport: str = "nba"):
+    def __init__(
+        self,
+        api_key: str,
+        cache_ttl: Optional[int] = None,
+        default_sport: str = "nba",
+        cache_backend: Optional[OddsCacheBackend] = None,
+        base_url: Optional[str] = None
+    ):
         """
         Initialize The Odds API service.
 
@@ -43,15 +69,34 @@ class OddsApiService:
             cache_ttl: Override cache TTL in seconds. If None, uses dynamic
                       TTL based on season status (10 min season, 24h offseason).
             default_sport: Default sport for season-aware TTL (default: 'nba')
+            cache_backend: Response cache backend (default: shared backend
+                          from ODDS_API_CACHE_BACKEND settings)
+            base_url: API root including /v4 (default: ODDS_API_BASE_URL,
+                      e.g. a local stand-in server for load tests)
         """
+        from app.core.config import settings
+
         if cache_ttl is None:
             from app.core.config import get_dynamic_cache_ttl
             cache_ttl = get_dynamic_cache_ttl(default_sport)
 
         self.api_key = api_key
+        self.base_url = (base_url or settings.ODDS_API_BASE_URL or THE_ODDS_API_BASE).rstrip("/")
+        # Every region requested is charged against quota
+        self.regions = settings.ODDS_API_REGIONS
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, tuple] = {}  # key -> (data, expiry)
-        self._lock = asyncio.Lock()
+        self._cache = cache_backend or get_shared_odds_cache()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._quota_saved = 0
+        # Concurrent misses for the same cache key share one upstream request
+        self._inflight = SingleFlight()
+        # Every upstream request start goes through the rate limiter
+        self.max_concurrency = settings.ODDS_API_MAX_CONCURRENCY
+        self._rate_limiter = AsyncRateLimiter(
+            settings.ODDS_API_RATE_LIMIT_PER_SECOND,
+            burst=self.max_concurrency
+        )
         self._client: Optional[httpx.AsyncClient] = None
 
         # Quota tracking (from response headers)
@@ -81,25 +126,78 @@ class OddsApiService:
     def _get_cache_key(self, endpoint: str, **kwargs) -> str:
         """Generate cache key from endpoint name and parameters."""
         params = ",".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
-        return f"{endpoint}:{params}" if params else endpoint
+        key = f"{endpoint}:{params}" if params else endpoint
+        # Responses from a stand-in server must never be served for the real API
+        if self.base_url != THE_ODDS_API_BASE:
+            key = f"{self.base_url}|{key}"
+        return key
 
     async def _get_cached(self, key: str) -> Optional[any]:
-        """Get data from cache if valid."""
-        async with self._lock:
-            if key in self._cache:
-                data, expiry = self._cache[key]
-                if datetime.now() < expiry:
-                    return data
-                else:
-                    del self._cache[key]
-        return None
-
-    async def _set_cache(self, key: str, data: any, ttl: Optional[int] = None):
-        """Set data in cache with TTL."""
+        """Get data from the shared cache if valid, recording hit/miss metrics."""
+        endpoint = key.split(":", 1)[0]
+        try:
+            entry = await asyncio.to_thread(self._cache.get, key)
+        except Exception as e:
+            logger.warning(f"Odds API cache read failed for {key}: {e}")
+            entry = None
+
+        if entry is None:
+            self._cache_misses += 1
+            record_odds_api_cache_miss(endpoint)
+            return None
+
+        data, quota_cost = entry
+        self._cache_hits += 1
+        self._quota_saved += quota_cost
+        record_odds_api_cache_hit(endpoint, quota_cost)
+        return data
+
+    async def _set_cache(
+        self,
+        key: str,
+        data: any,
+        ttl: Optional[int] = None,
+        quota_cost: int = 0
+    ):
+        """
+        Set data in the shared cache with TTL.
+
+        Args:
+            key: Cache key
+            data: JSON-serializable response data
+            ttl: Seconds to keep the entry (default: service cache_ttl)
+            quota_cost: Quota the request cost, credited as saved on each hit
+        """
         ttl = ttl or self.cache_ttl
-        expiry = datetime.now() + timedelta(seconds=ttl)
-        async with self._lock:
-            self._cache[key] = (data, expiry)
+        try:
+            await asyncio.to_thread(self._cache.set, key, data, ttl, quota_cost)
+        except Exception as e:
+            logger.warning(f"Odds API cache write failed for {key}: {e}")
+
+    def _quota_cost(self, markets: int) -> int:
+        """Quota cost of requesting `markets` markets in this service's regions."""
+        return quota_cost_for(markets, self.regions)
+
+    def get_cache_stats(self) -> Dict:
+        """
+        Cache hit/miss counts for this instance plus shared backend totals.
+
+        Returns:
+            Dictionary with per-instance and backend-wide statistics
+        """
+        lookups = self._cache_hits + self._cache_misses
+        try:
+            backend = self._cache.stats()
+        except Exception as e:
+            backend = {"backend": getattr(self._cache, "name", "unknown"), "error": str(e)}
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": round(self._cache_hits / lookups, 3) if lookups else 0.0,
+            "quota_saved": self._quota_saved,
+            "coalesced_requests": self._inflight.coalesced,
+            "backend": backend,
+        }
 
     async def close(self):
         """Close the HTTP client."""
@@ -166,6 +264,11 @@ class OddsApiService:
         except (ValueError, TypeError) as e:
             logger.warning(f"Failed to parse quota headers: {e}")
 
+    @property
+    def requests_remaining(self) -> Optional[int]:
+        """Remaining quota from the last response headers (None until a request)."""
+        return self._requests_remaining
+
     def get_quota_status(self) -> Dict:
         """
         Get current quota status.
@@ -207,16 +310,17 @@ class OddsApiService:
         """
         all_games = {}
 
-        for market in ["h2h", "spreads", "totals"]:
+        for market in GAME_ODDS_MARKETS:
             params = {
                 "apiKey": self.api_key,
                 "days": days_ahead,
                 "market": market,
-                "regions": "us"
+                "regions": self.regions
             }
 
+            await self._rate_limiter.acquire()
             response = await client.get(
-                f"{THE_ODDS_API_BASE}/sports/basketball_nba/odds",
+                f"{self.base_url}/sports/basketball_nba/odds",
                 params=params
             )
             response.raise_for_status()
@@ -253,40 +357,62 @@ class OddsApiService:
 
     async def get_upcoming_games_with_odds(
         self,
-        days_ahead: int = 7
+        days_ahead: int = 7,
+        force_refresh: bool = False,
+        cache_ttl: Optional[int] = None,
+        raise_errors: bool = False
     ) -> List[Dict]:
         """
         Fetch upcoming NBA games with odds.
 
+        Concurrent cache misses share one upstream request and its result.
+
         Args:
             days_ahead: Number of days ahead to fetch (default: 7)
+            force_refresh: Skip the cache lookup and fetch (odds fetch planner)
+            cache_ttl: Seconds to cache the result (default: 600)
+            raise_errors: Raise OddsApiError when the request fails instead of
+                          returning an empty list (odds fetch planner)
 
         Returns:
             List of games with odds data
         """
         cache_key = self._get_cache_key("upcoming_games", days=days_ahead)
-        cached = await self._get_cached(cache_key)
-        if cached:
-            return cached
+        if not force_refresh:
+            cached = await self._get_cached(cache_key)
+            if cached:
+                return cached
 
         try:
-            client = await self._get_client()
-
-            # Call through circuit breaker
-            result = await self._fetch_games_with_breaker(days_ahead, client)
-
-            # Cache for 10 minutes (odds change frequently)
-            await self._set_cache(cache_key, result, ttl=600)
-
-            return result
-
-        except CircuitBreakerError:
+            return await self._inflight.do(
+                cache_key, lambda: self._load_upcoming_games(days_ahead, cache_key, cache_ttl or 600)
+            )
+        except CircuitBreakerError as e:
             logger.warning("Odds API circuit breaker is OPEN - returning empty list")
+            if raise_errors:
+                raise OddsApiError("Odds API circuit breaker is open") from e
             return []
         except Exception as e:
             logger.error(f"Error fetching NBA game odds: {e}")
+            if raise_errors:
+                raise OddsApiError(f"Error fetching NBA game odds: {e}") from e
             return []
 
+    async def _load_upcoming_games(self, days_ahead: int, cache_key: str, ttl: int) -> List[Dict]:
+        """Fetch and cache upcoming games (single-flight leader only; errors propagate)."""
+        client = await self._get_client()
+
+        # Call through circuit breaker
+        result = await self._fetch_games_with_breaker(days_ahead, client)
+
+        # Cache for 10 minutes by default (odds change frequently); one call per market
+        await self._set_cache(
+            cache_key, result, ttl=ttl,
+            quota_cost=self._quota_cost(len(GAME_ODDS_MARKETS))
+        )
+
+        return result
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -312,11 +438,12 @@ class OddsApiService:
         params = {
             "apiKey": self.api_key,
             "markets": player_props_markets,
-            "regions": "us"
+            "regions": self.regions
         }
 
+        await self._rate_limiter.acquire()
         response = await client.get(
-            f"{THE_ODDS_API_BASE}/sports/basketball_nba/events/{event_id}/odds",
+            f"{self.base_url}/sports/basketball_nba/events/{event_id}/odds",
             params=params
         )
 
@@ -330,66 +457,49 @@ class OddsApiService:
 
     async def get_event_player_props(
         self,
-        event_id: str
+        event_id: str,
+        force_refresh: bool = False,
+        cache_ttl: Optional[int] = None,
+        raise_errors: bool = False
     ) -> Dict:
         """
         Fetch player props for specific NBA game.
 
+        Concurrent cache misses share one upstream request and its result.
+
         Args:
             event_id: The Odds API event ID
+            force_refresh: Skip the cache lookup and fetch (odds fetch planner)
+            cache_ttl: Seconds to cache the result (default: 300)
+            raise_errors: Raise OddsApiError when the request fails instead of
+                          returning empty props (odds fetch planner)
 
         Returns:
             Player props data by market
         """
         cache_key = self._get_cache_key("player_props", event_id=event_id)
-        cached = await self._get_cached(cache_key)
-        if cached:
-            return cached
-
-        # IMPORTANT: Request ALL player props markets in ONE API call
-        # Using 'markets' (plural) with comma-separated list instead of 'market' (singular)
-        # This prevents the API from returning fallback h2h markets when player props aren't available
-        player_props_markets = "player_points,player_rebounds,player_assists,player_threes"
+        if not force_refresh:
+            cached = await self._get_cached(cache_key)
+            if cached:
+                return cached
 
+        player_props_markets = ",".join(PLAYER_PROPS_MARKETS)
         try:
-            client = await self._get_client()
-
-            # Call through circuit breaker
-            data, status_code = await self._fetch_player_props_with_breaker(
-                event_id, player_props_markets, client
+            return await self._inflight.do(
+                cache_key, lambda: self._load_event_player_props(event_id, cache_key, cache_ttl or 300)
             )
-
-            if status_code == 200:
-                # Structure the response with markets keyed by market type
-                # The API returns a single game object with all requested markets
-                result = {
-                    "event_id": event_id,
-                    "markets": player_props_markets,
-                    "data": data  # Store the full game response
-                }
-
-                # Log what markets were actually returned
-                returned_markets = set()
-                for bm in data.get("bookmakers", []):
-                    for market in bm.get("markets", []):
-                        returned_markets.add(market.get("key"))
-
-                logger.info(f"Fetched player props for event {event_id}: returned markets = {list(returned_markets)}")
-
-                # Cache for 5 minutes (player props change frequently)
-                await self._set_cache(cache_key, result, ttl=300)
-
-                return result
-            else:
-                logger.warning(f"Failed to fetch player props for event {event_id}: {status_code}")
-                return {
-                    "event_id": event_id,
-                    "markets": player_props_markets,
-                    "data": {"bookmakers": []}
-                }
-
-        except CircuitBreakerError:
+        except CircuitBreakerError as e:
             logger.warning(f"Odds API circuit breaker is OPEN for event {event_id} - returning empty player props")
+            if raise_errors:
+                raise OddsApiError("Odds API circuit breaker is open") from e
+            return {
+                "event_id": event_id,
+                "markets": player_props_markets,
+                "data": {"bookmakers": []}
+            }
+        except OddsApiError:
+            if raise_errors:
+                raise
             return {
                 "event_id": event_id,
                 "markets": player_props_markets,
@@ -397,12 +507,99 @@ class OddsApiService:
             }
         except Exception as e:
             logger.error(f"Error fetching NBA player props for event {event_id}: {e}")
+            if raise_errors:
+                raise OddsApiError(f"Error fetching NBA player props for event {event_id}: {e}") from e
             return {
                 "event_id": event_id,
                 "markets": "",
                 "data": {"bookmakers": []}
             }
 
+    async def _load_event_player_props(self, event_id: str, cache_key: str, ttl: int) -> Dict:
+        """Fetch and cache player props for one event (single-flight leader only; errors propagate)."""
+        # IMPORTANT: Request ALL player props markets in ONE API call
+        # Using 'markets' (plural) with comma-separated list instead of 'market' (singular)
+        # This prevents the API from returning fallback h2h markets when player props aren't available
+        player_props_markets = ",".join(PLAYER_PROPS_MARKETS)
+
+        client = await self._get_client()
+
+        # Call through circuit breaker
+        data, status_code = await self._fetch_player_props_with_breaker(
+            event_id, player_props_markets, client
+        )
+
+        if status_code != 200:
+            logger.warning(f"Failed to fetch player props for event {event_id}: {status_code}")
+            raise OddsApiError(f"Player props request for event {event_id} returned {status_code}")
+
+        # Structure the response with markets keyed by market type
+        # The API returns a single game object with all requested markets
+        result = {
+            "event_id": event_id,
+            "markets": player_props_markets,
+            "data": data  # Store the full game response
+        }
+
+        # Log what markets were actually returned
+        returned_markets = set()
+        for bm in data.get("bookmakers", []):
+            for market in bm.get("markets", []):
+                returned_markets.add(market.get("key"))
+
+        logger.info(f"Fetched player props for event {event_id}: returned markets = {list(returned_markets)}")
+
+        # Cache for 5 minutes by default (player props change frequently)
+        await self._set_cache(
+            cache_key, result, ttl=ttl,
+            quota_cost=self._quota_cost(len(PLAYER_PROPS_MARKETS))
+        )
+
+        return result
+
+    async def stream_event_player_props(
+        self,
+        event_ids: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        force_refresh: bool = False,
+        cache_ttl: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Fetch player props for a whole slate concurrently, yielding as they arrive.
+
+        Event requests run in parallel under a semaphore, and every request
+        start passes through the service's rate limiter. Results are yielded
+        in completion order so the caller can parse and persist each event
+        while the others are still in flight; a slate takes about as long as
+        its slowest request rather than the sum of all of them.
+
+        Args:
+            event_ids: The Odds API event IDs (duplicates are fetched once)
+            max_concurrency: Requests in flight at once (default: ODDS_API_MAX_CONCURRENCY)
+            force_refresh: Skip cache lookups (odds fetch planner)
+            cache_ttl: Seconds to cache each result (default: 300)
+
+        Yields:
+            (event_id, props data) tuples as in get_event_player_props
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_concurrency))
+
+        async def fetch(event_id: str) -> Tuple[str, Dict]:
+            async with semaphore:
+                data = await self.get_event_player_props(
+                    event_id, force_refresh=force_refresh, cache_ttl=cache_ttl
+                )
+                return event_id, data
+
+        tasks = [asyncio.create_task(fetch(event_id)) for event_id in dict.fromkeys(event_ids)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early: don't leave requests running
+            for task in tasks:
+                task.cancel()
+
     async def get_quota_status(self) -> Dict:
         """
         Get remaining API quota for the month.
@@ -419,7 +616,7 @@ class OddsApiService:
                 "sport": "basketball_nba"
             }
             response = await client.get(
-                f"{THE_ODDS_API_BASE}/sports/basketball_nba/scores",
+                f"{self.base_url}/sports/basketball_nba/scores",
                 params=params
             )
             response.raise_for_status()
@@ -0,0 +1,323 @@
+"""
+Shared response cache backends for OddsApiService.
+
+OddsApiService used to cache responses in a per-instance dict, so every
+uvicorn worker, scheduler job and script started cold and spent paid quota
+(20,000 requests/month) on requests another process had just made. The
+backends here are shared across instances, processes and restarts:
+
+    - SQLiteOddsCache (default): a local SQLite file in WAL mode, safe for
+      concurrent readers/writers on one host
+    - RedisOddsCache (optional): a network cache shared across hosts;
+      requires the redis package
+    - MemoryOddsCache: per-process only (bounded app.core.cache.TTLCache),
+      used by tests
+
+Every entry records the quota cost of the request that produced it; each
+hit adds that cost to the entry's saved total so the cache can report how
+much quota it has saved.
+
+Configuration (app.core.config.settings):
+    ODDS_API_CACHE_BACKEND: "sqlite" (default), "redis" or "memory"
+    ODDS_API_CACHE_PATH:    SQLite file path
+    ODDS_API_CACHE_REDIS_URL: Redis URL (defaults to REDIS_URL)
+
+Usage:
+    from app.services.core.odds_cache import get_shared_odds_cache
+
+    cache = get_shared_odds_cache()
+    cache.set("player_props:event_id=abc", data, ttl=300, quota_cost=4)
+    hit = cache.get("player_props:event_id=abc")  # (data, quota_cost) or None
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app.core.cache import TTLCache, get_cache
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class OddsCacheBackend(ABC):
+    """Key/value store for Odds API responses with TTL and quota accounting."""
+
+    name = "base"
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[Any, int]]:
+        """
+        Return (data, quota_cost) for a fresh entry and count the hit, else None.
+        """
+
+    @abstractmethod
+    def set(self, key: str, data: Any, ttl: int, quota_cost: int = 0) -> None:
+        """Store data for ttl seconds, recording the quota the request cost."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove one entry."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, hits and quota saved across all processes sharing the cache."""
+
+
+class MemoryOddsCache(OddsCacheBackend):
+    """
+    Per-process bounded cache (no sharing; used in tests and as a fallback).
+
+    Entries live in an app.core.cache.TTLCache, so the backend is LRU
+    bounded and swept for expired entries like the other service caches.
+    """
+
+    name = "memory"
+
+    def __init__(self, cache: Optional[TTLCache] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            cache: TTLCache to store entries in (default: a private one in
+                   the "odds_api" namespace)
+        """
+        self._cache = cache if cache is not None else TTLCache("odds_api", max_size=512)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._quota_saved = 0
+
+    def get(self, key: str) -> Optional[Tuple[Any, int]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        with self._lock:
+            self._hits += 1
+            self._quota_saved += entry[1]
+        return entry
+
+    def set(self, key: str, data: Any, ttl: int, quota_cost: int = 0) -> None:
+        self._cache.set(key, (data, quota_cost), ttl)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        self._cache.sweep()
+        return {
+            "backend": self.name,
+            "entries": len(self._cache),
+            "hits": self._hits,
+            "quota_saved": self._quota_saved,
+        }
+
+
+class SQLiteOddsCache(OddsCacheBackend):
+    """
+    SQLite-file cache shared by every process on the host.
+
+    Each operation opens a short-lived connection, so the backend is safe
+    to use from threads, forked workers and separate processes. WAL mode
+    lets readers proceed while a writer commits.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        """
+        Initialize the cache, creating the file and table if needed.
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS odds_api_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    quota_cost INTEGER NOT NULL DEFAULT 0,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_odds_api_cache_expires_at "
+                "ON odds_api_cache (expires_at)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection: commits (or rolls back), then closes."""
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Tuple[Any, int]]:
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, quota_cost FROM odds_api_cache "
+                "WHERE key = ? AND expires_at > ?",
+                (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE odds_api_cache SET hits = hits + 1 WHERE key = ?",
+                (key,)
+            )
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, data: Any, ttl: int, quota_cost: int = 0) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO odds_api_cache "
+                "(key, value, expires_at, quota_cost, hits, created_at) "
+                "VALUES (?, ?, ?, ?, 0, ?)",
+                (key, json.dumps(data), now + ttl, quota_cost, now)
+            )
+            # Opportunistic purge keeps the file from growing without bound
+            conn.execute("DELETE FROM odds_api_cache WHERE expires_at <= ?", (now,))
+
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM odds_api_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM odds_api_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._connect() as conn:
+            entries, hits, saved = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0), "
+                "COALESCE(SUM(hits * quota_cost), 0) FROM odds_api_cache "
+                "WHERE expires_at > ?",
+                (time.time(),)
+            ).fetchone()
+        return {
+            "backend": self.name,
+            "path": self.path,
+            "entries": entries,
+            "hits": hits,
+            "quota_saved": saved,
+        }
+
+
+class RedisOddsCache(OddsCacheBackend):
+    """Redis cache shared across hosts (optional; requires the redis package)."""
+
+    name = "redis"
+    PREFIX = "odds_api_cache:"
+
+    def __init__(self, url: str):
+        """
+        Initialize the cache.
+
+        Args:
+            url: Redis connection URL
+
+        Raises:
+            ImportError: If the redis package is not installed
+        """
+        import redis
+
+        self.url = url
+        self._redis = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[Tuple[Any, int]]:
+        raw = self._redis.get(self.PREFIX + key)
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        pipe = self._redis.pipeline()
+        pipe.hincrby(self.PREFIX + "hits", key, 1)
+        pipe.incrby(self.PREFIX + "quota_saved", entry["quota_cost"])
+        pipe.execute()
+        return entry["data"], entry["quota_cost"]
+
+    def set(self, key: str, data: Any, ttl: int, quota_cost: int = 0) -> None:
+        payload = json.dumps({"data": data, "quota_cost": quota_cost})
+        self._redis.setex(self.PREFIX + key, ttl, payload)
+
+    def delete(self, key: str) -> None:
+        self._redis.delete(self.PREFIX + key)
+
+    def clear(self) -> None:
+        keys = list(self._redis.scan_iter(self.PREFIX + "*"))
+        if keys:
+            self._redis.delete(*keys)
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self._redis.hvals(self.PREFIX + "hits")
+        return {
+            "backend": self.name,
+            "entries": sum(
+                1 for k in self._redis.scan_iter(self.PREFIX + "*")
+                if k.decode() not in (self.PREFIX + "hits", self.PREFIX + "quota_saved")
+            ),
+            "hits": sum(int(h) for h in hits),
+            "quota_saved": int(self._redis.get(self.PREFIX + "quota_saved") or 0),
+        }
+
+
+def create_odds_cache(backend: Optional[str] = None) -> OddsCacheBackend:
+    """
+    Build the configured cache backend, falling back to memory on failure.
+
+    Args:
+        backend: "sqlite", "redis" or "memory" (default: settings.ODDS_API_CACHE_BACKEND)
+
+    Returns:
+        OddsCacheBackend instance
+    """
+    from app.core.config import settings
+
+    backend = (backend or settings.ODDS_API_CACHE_BACKEND).lower()
+    try:
+        if backend == "sqlite":
+            return SQLiteOddsCache(settings.ODDS_API_CACHE_PATH)
+        if backend == "redis":
+            url = settings.ODDS_API_CACHE_REDIS_URL or settings.REDIS_URL
+            if not url:
+                raise ValueError("ODDS_API_CACHE_REDIS_URL or REDIS_URL must be set")
+            return RedisOddsCache(url)
+        if backend != "memory":
+            logger.warning(f"Unknown ODDS_API_CACHE_BACKEND '{backend}', using memory")
+    except Exception as e:
+        logger.warning(f"Odds API cache backend '{backend}' unavailable ({e}), using memory")
+    return MemoryOddsCache(get_cache("odds_api", max_size=512))
+
+
+_shared_cache: Optional[OddsCacheBackend] = None
+
+
+def get_shared_odds_cache() -> OddsCacheBackend:
+    """Get or create the process-wide odds cache backend."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = create_odds_cache()
+    return _shared_cache
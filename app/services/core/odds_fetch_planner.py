@@ -0,0 +1,496 @@
+"""
+Quota-aware odds fetch planner driven by tip-off proximity.
+
+The scheduler used to fetch odds at fixed times (12PM and 5PM CT) whatever
+the remaining quota and slate size, so lines were stale at tip-off while
+far-out games were refreshed as often as tonight's. The planner turns the
+remaining monthly budget into a per-event refresh schedule instead:
+
+    1. Daily budget = remaining requests (minus a reserve for ad-hoc calls)
+       spread over the days left in the billing period
+    2. A share of it refreshes the slate (game odds list: discovers events
+       and tip-off times)
+    3. The rest is split across upcoming events by tip-off proximity
+       weight, so an event an hour from tip refreshes many times more often
+       than one two days out
+    4. Each event gets a refresh interval and a next-fetch time; the
+       scheduler's tick fetches whatever is due
+
+Planned fetches write through the shared Odds API cache with a TTL equal to
+the planned interval, so API reads are served from the plan instead of
+spending quota on their own cache misses. Fetches are made with
+raise_errors, so an upstream failure or open circuit breaker is never
+mistaken for an empty slate or empty props: the previous slate is kept and
+retried on backoff, and failed events stay due.
+
+Usage:
+    from app.services.core.odds_fetch_planner import get_odds_fetch_planner
+
+    planner = get_odds_fetch_planner()
+    result = await planner.run_due(odds_service)   # scheduler tick
+    planner.last_plan.to_dict()                    # admin endpoint
+"""
+import asyncio
+import calendar
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.core.odds_api_service import (
+    GAME_ODDS_MARKETS, PLAYER_PROPS_MARKETS, OddsApiError, OddsApiService, quota_cost_for
+)
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PlannedEvent:
+    """Refresh schedule for one odds event."""
+
+    event_id: str
+    commence_time: datetime
+    hours_to_tip: float
+    weight: float
+    interval_minutes: int
+    next_fetch_at: datetime
+    last_fetched_at: Optional[datetime] = None
+    home_team: Optional[str] = None
+    away_team: Optional[str] = None
+
+    @property
+    def refreshes_per_day(self) -> float:
+        return 1440 / self.interval_minutes
+
+    def to_dict(self) -> Dict:
+        return {
+            "event_id": self.event_id,
+            "matchup": f"{self.away_team} @ {self.home_team}" if self.home_team else None,
+            "commence_time": self.commence_time.isoformat(),
+            "hours_to_tip": round(self.hours_to_tip, 2),
+            "weight": self.weight,
+            "interval_minutes": self.interval_minutes,
+            "refreshes_per_day": round(self.refreshes_per_day, 2),
+            "next_fetch_at": self.next_fetch_at.isoformat(),
+            "last_fetched_at": self.last_fetched_at.isoformat() if self.last_fetched_at else None,
+        }
+
+
+@dataclass
+class FetchPlan:
+    """Budget and per-event refresh schedule at one point in time."""
+
+    generated_at: datetime
+    requests_remaining: int
+    quota_source: str  # "headers" or "estimated"
+    days_left_in_period: float
+    daily_budget: float
+    slate_interval_minutes: int
+    slate_next_fetch_at: datetime
+    events: List[PlannedEvent] = field(default_factory=list)
+    props_cost: int = len(PLAYER_PROPS_MARKETS)
+    slate_cost: int = len(GAME_ODDS_MARKETS)
+
+    @property
+    def planned_daily_cost(self) -> float:
+        """Requests per day if the current schedule held all day."""
+        slate = self.slate_cost * 1440 / self.slate_interval_minutes
+        return slate + sum(self.props_cost * e.refreshes_per_day for e in self.events)
+
+    def due_events(self, now: datetime) -> List[PlannedEvent]:
+        """Events whose next fetch is due, closest tip-off first."""
+        due = [e for e in self.events if e.next_fetch_at <= now]
+        return sorted(due, key=lambda e: e.commence_time)
+
+    def to_dict(self) -> Dict:
+        return {
+            "generated_at": self.generated_at.isoformat(),
+            "requests_remaining": self.requests_remaining,
+            "quota_source": self.quota_source,
+            "days_left_in_period": round(self.days_left_in_period, 2),
+            "daily_budget": round(self.daily_budget, 1),
+            "planned_daily_cost": round(self.planned_daily_cost, 1),
+            "slate": {
+                "interval_minutes": self.slate_interval_minutes,
+                "next_fetch_at": self.slate_next_fetch_at.isoformat(),
+                "cost": self.slate_cost,
+            },
+            "props_cost": self.props_cost,
+            "events": [e.to_dict() for e in sorted(self.events, key=lambda e: e.commence_time)],
+        }
+
+
+class OddsFetchPlanner:
+    """
+    Plans odds refreshes within the monthly quota and runs the due fetches.
+
+    The planner keeps when each event and the slate were last fetched, so it
+    is used as a process-wide singleton (get_odds_fetch_planner()).
+    """
+
+    # (hours before tip-off, weight); weights are relative refresh rates
+    PROXIMITY_WEIGHTS: List[Tuple[float, float]] = [
+        (1, 12.0),
+        (3, 6.0),
+        (6, 3.0),
+        (12, 1.5),
+        (24, 1.0),
+        (48, 0.35),
+    ]
+    FAR_WEIGHT = 0.15
+
+    MIN_INTERVAL_MINUTES = 10
+    MAX_INTERVAL_MINUTES = 24 * 60
+    # Slate refresh: at most every hour, at least every 12 hours
+    SLATE_MIN_INTERVAL_MINUTES = 60
+    SLATE_MAX_INTERVAL_MINUTES = 12 * 60
+    SLATE_BUDGET_SHARE = 0.15
+    # Failed slate fetches retry after this, doubling up to the slate interval
+    SLATE_RETRY_MINUTES = 15
+
+    def __init__(
+        self,
+        monthly_quota: Optional[int] = None,
+        billing_day: Optional[int] = None,
+        reserve_fraction: Optional[float] = None,
+        horizon_hours: Optional[int] = None
+    ):
+        """
+        Initialize the planner.
+
+        Args:
+            monthly_quota: Requests per billing period (default: settings)
+            billing_day: Day of month the quota resets (default: settings)
+            reserve_fraction: Share of remaining quota kept for ad-hoc calls
+            horizon_hours: Only plan events tipping off within this window
+        """
+        self.monthly_quota = monthly_quota or settings.ODDS_API_MONTHLY_QUOTA
+        self.billing_day = billing_day or settings.ODDS_API_BILLING_DAY
+        self.reserve_fraction = (
+            settings.ODDS_PLANNER_RESERVE_FRACTION if reserve_fraction is None else reserve_fraction
+        )
+        self.horizon_hours = horizon_hours or settings.ODDS_PLANNER_HORIZON_HOURS
+
+        self._event_fetched_at: Dict[str, datetime] = {}
+        self._slate_fetched_at: Optional[datetime] = None
+        self._slate_failures = 0
+        self._slate_retry_at: Optional[datetime] = None
+        self._games: List[Dict] = []
+        self.last_plan: Optional[FetchPlan] = None
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def period_bounds(self, now: datetime) -> Tuple[datetime, datetime]:
+        """Start and end of the billing period containing now."""
+        def reset_in(year: int, month: int) -> datetime:
+            day = min(self.billing_day, calendar.monthrange(year, month)[1])
+            return datetime(year, month, day, tzinfo=timezone.utc)
+
+        start = reset_in(now.year, now.month)
+        if now < start:
+            year, month = (now.year, now.month - 1) if now.month > 1 else (now.year - 1, 12)
+            start = reset_in(year, month)
+        year, month = (start.year, start.month + 1) if start.month < 12 else (start.year + 1, 1)
+        return start, reset_in(year, month)
+
+    def proximity_weight(self, hours_to_tip: float) -> float:
+        """Relative refresh rate for an event tipping off in hours_to_tip hours."""
+        for max_hours, weight in self.PROXIMITY_WEIGHTS:
+            if hours_to_tip <= max_hours:
+                return weight
+        return self.FAR_WEIGHT
+
+    def plan(
+        self,
+        games: List[Dict],
+        requests_remaining: Optional[int],
+        now: Optional[datetime] = None
+    ) -> FetchPlan:
+        """
+        Build a refresh schedule for the given games.
+
+        Args:
+            games: Odds API events (id, commence_time, home_team, away_team)
+            requests_remaining: Remaining quota from response headers, or None
+                                to estimate it pro rata from the period
+            now: Planning time (default: current UTC time)
+
+        Returns:
+            FetchPlan
+        """
+        now = now or datetime.now(timezone.utc)
+        period_start, period_end = self.period_bounds(now)
+        days_left = max((period_end - now).total_seconds() / 86400, 1 / 24)
+
+        quota_source = "headers"
+        if requests_remaining is None:
+            period_days = (period_end - period_start).total_seconds() / 86400
+            requests_remaining = int(self.monthly_quota * days_left / period_days)
+            quota_source = "estimated"
+
+        spendable = max(requests_remaining, 0) * (1 - self.reserve_fraction)
+        daily_budget = spendable / days_left
+
+        slate_cost = quota_cost_for(len(GAME_ODDS_MARKETS), settings.ODDS_API_REGIONS)
+        props_cost = quota_cost_for(len(PLAYER_PROPS_MARKETS), settings.ODDS_API_REGIONS)
+
+        # Slate refresh first: it is how new events and moved tip-offs are found
+        slate_daily = max(daily_budget * self.SLATE_BUDGET_SHARE, 1e-9)
+        slate_interval = self._clamp(
+            1440 * slate_cost / slate_daily,
+            self.SLATE_MIN_INTERVAL_MINUTES,
+            self.SLATE_MAX_INTERVAL_MINUTES
+        )
+        events_budget = max(daily_budget - slate_cost * 1440 / slate_interval, 0)
+
+        upcoming = []
+        for game in games:
+            commence = self._parse_time(game.get("commence_time"))
+            if not game.get("id") or commence is None:
+                continue
+            hours_to_tip = (commence - now).total_seconds() / 3600
+            if 0 <= hours_to_tip <= self.horizon_hours:
+                upcoming.append((game, commence, hours_to_tip, self.proximity_weight(hours_to_tip)))
+
+        # Every planned event costs at least one refresh per MAX interval; when
+        # quota is nearly gone, keep only the events closest to tip-off
+        affordable = int(events_budget / (props_cost * 1440 / self.MAX_INTERVAL_MINUTES))
+        upcoming = sorted(upcoming, key=lambda u: u[1])[:affordable]
+
+        intervals = self._allocate([weight for *_, weight in upcoming], events_budget, props_cost)
+
+        events = []
+        for (game, commence, hours_to_tip, weight), interval in zip(upcoming, intervals):
+            last = self._event_fetched_at.get(game["id"])
+            next_fetch = now
+            if last:
+                next_fetch = last + timedelta(minutes=interval)
+                # Always refresh once inside the final interval before tip-off
+                final_window = commence - timedelta(minutes=interval)
+                if last < final_window:
+                    next_fetch = min(next_fetch, final_window)
+            events.append(PlannedEvent(
+                event_id=game["id"],
+                commence_time=commence,
+                hours_to_tip=hours_to_tip,
+                weight=weight,
+                interval_minutes=interval,
+                next_fetch_at=next_fetch,
+                last_fetched_at=last,
+                home_team=game.get("home_team"),
+                away_team=game.get("away_team"),
+            ))
+
+        # An empty slate (off-day, off-season) waits a full interval like any
+        # other; only a failed fetch retries sooner, on its backoff
+        if self._slate_retry_at:
+            slate_next = self._slate_retry_at
+        elif self._slate_fetched_at:
+            slate_next = self._slate_fetched_at + timedelta(minutes=slate_interval)
+        else:
+            slate_next = now
+
+        self.last_plan = FetchPlan(
+            generated_at=now,
+            requests_remaining=requests_remaining,
+            quota_source=quota_source,
+            days_left_in_period=days_left,
+            daily_budget=daily_budget,
+            slate_interval_minutes=slate_interval,
+            slate_next_fetch_at=slate_next,
+            events=events,
+            props_cost=props_cost,
+            slate_cost=slate_cost,
+        )
+        return self.last_plan
+
+    def replan(self, requests_remaining: Optional[int]) -> FetchPlan:
+        """Re-plan from the last fetched slate without making any requests."""
+        return self.plan(self._games, requests_remaining)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def run_due(
+        self,
+        odds_service: OddsApiService,
+        now: Optional[datetime] = None
+    ) -> Dict:
+        """
+        Re-plan and fetch everything that is due (one scheduler tick).
+
+        Args:
+            odds_service: Odds API service used for the fetches
+            now: Tick time (default: current UTC time)
+
+        Returns:
+            Dict with slate_fetched, events_fetched, events_failed,
+            quota_spent, errors and the plan
+        """
+        now = now or datetime.now(timezone.utc)
+        plan = self.plan(self._games, odds_service.requests_remaining, now)
+        slate_fetched = False
+        slate_failed = False
+        quota_spent = 0
+        errors: List[str] = []
+
+        if plan.slate_next_fetch_at <= now:
+            days_ahead = max(1, -(-self.horizon_hours // 24))
+            try:
+                self._games = await odds_service.get_upcoming_games_with_odds(
+                    days_ahead=days_ahead,
+                    force_refresh=True,
+                    cache_ttl=plan.slate_interval_minutes * 60,
+                    raise_errors=True
+                )
+            except OddsApiError as e:
+                # Keep the previous slate; its events are still worth refreshing
+                errors.append(str(e))
+                slate_failed = True
+                self._slate_failures += 1
+                backoff = min(
+                    self.SLATE_RETRY_MINUTES * 2 ** (self._slate_failures - 1),
+                    plan.slate_interval_minutes
+                )
+                self._slate_retry_at = now + timedelta(minutes=backoff)
+                logger.warning(
+                    f"Odds planner slate fetch failed ({self._slate_failures} in a row), "
+                    f"retrying in {backoff} min: {e}"
+                )
+            else:
+                self._slate_fetched_at = now
+                self._slate_failures = 0
+                self._slate_retry_at = None
+                slate_fetched = True
+                quota_spent += plan.slate_cost
+            plan = self.plan(self._games, odds_service.requests_remaining, now)
+
+        # Due events are fetched concurrently; each keeps its own cache TTL
+        due = plan.due_events(now)
+        semaphore = asyncio.Semaphore(settings.ODDS_API_MAX_CONCURRENCY)
+
+        async def fetch(event: PlannedEvent) -> Optional[str]:
+            async with semaphore:
+                try:
+                    await odds_service.get_event_player_props(
+                        event.event_id,
+                        force_refresh=True,
+                        cache_ttl=event.interval_minutes * 60,
+                        raise_errors=True
+                    )
+                except OddsApiError as e:
+                    return str(e)
+            return None
+
+        outcomes = await asyncio.gather(*(fetch(event) for event in due))
+        fetched = []
+        failed = []
+        for event, error in zip(due, outcomes):
+            if error:
+                # Not stamped: the event stays due and is retried next tick
+                failed.append(event.event_id)
+                errors.append(error)
+                continue
+            self._event_fetched_at[event.event_id] = now
+            fetched.append(event.event_id)
+            quota_spent += plan.props_cost
+
+        # Forget events that have tipped off
+        live_ids = {e.event_id for e in plan.events}
+        for event_id in list(self._event_fetched_at):
+            if event_id not in live_ids:
+                del self._event_fetched_at[event_id]
+
+        if slate_fetched or fetched:
+            plan = self.plan(self._games, odds_service.requests_remaining, now)
+
+        logger.info(
+            f"Odds planner tick: slate={'fetched' if slate_fetched else 'failed' if slate_failed else 'fresh'}, "
+            f"{len(fetched)}/{len(plan.events)} events refreshed ({len(failed)} failed), ~{quota_spent} requests "
+            f"(budget {plan.daily_budget:.0f}/day, {plan.requests_remaining} remaining)"
+        )
+
+        return {
+            "slate_fetched": slate_fetched,
+            "slate_games": len(self._games) if slate_fetched else None,
+            "events_fetched": fetched,
+            "events_failed": failed,
+            "quota_spent": quota_spent,
+            "errors": errors,
+            "plan": plan.to_dict(),
+        }
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _allocate(self, weights: List[float], budget: float, cost: int) -> List[int]:
+        """
+        Refresh interval (minutes) per weight within a daily budget.
+
+        Refreshes/day = scale × weight, with the scale chosen so the combined
+        cost matches the budget. Events pinned at the maximum interval still
+        cost quota, so they are taken out of the budget and the scale is
+        solved again for the rest.
+        """
+        intervals: List[Optional[int]] = [None] * len(weights)
+        while True:
+            open_idx = [i for i, iv in enumerate(intervals) if iv is None]
+            if not open_idx:
+                break
+            pinned_cost = sum(
+                cost * 1440 / iv for iv in intervals if iv is not None
+            )
+            total_weight = sum(weights[i] for i in open_idx)
+            scale = max(budget - pinned_cost, 0) / (cost * total_weight)
+
+            newly_pinned = False
+            for i in open_idx:
+                per_day = scale * weights[i]
+                if per_day <= 1440 / self.MAX_INTERVAL_MINUTES:
+                    intervals[i] = self.MAX_INTERVAL_MINUTES
+                    newly_pinned = True
+            if newly_pinned:
+                continue
+
+            for i in open_idx:
+                intervals[i] = self._clamp(
+                    1440 / (scale * weights[i]),
+                    self.MIN_INTERVAL_MINUTES,
+                    self.MAX_INTERVAL_MINUTES
+                )
+        return intervals
+
+    @staticmethod
+    def _clamp(minutes: float, low: int, high: int) -> int:
+        # Round up so rounding never pushes spending over budget
+        return int(min(max(math.ceil(minutes), low), high))
+
+    @staticmethod
+    def _parse_time(value) -> Optional[datetime]:
+        if isinstance(value, datetime):
+            return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+# Singleton instance
+_planner: Optional[OddsFetchPlanner] = None
+
+
+def get_odds_fetch_planner() -> OddsFetchPlanner:
+    """Get or create the process-wide odds fetch planner."""
+    global _planner
+    if _planner is None:
+        _planner = OddsFetchPlanner()
+    return _planner
@@ -0,0 +1,335 @@
+"""
+Process-Pool Slate Generator.
+
+Generating predictions game by game in one process leaves every core but one
+idle on busy slates (a full NBA night plus NHL is 20+ games). This module
+splits the games of a slate across a configurable pool of worker processes:
+
+    - Each worker process opens its own SQLAlchemy engine and session
+      (connections are never shared across a fork)
+    - Workers compute predictions with persist=False and send the rows back
+    - The parent process is the single writer: it bulk inserts rows per
+      sport Prediction table in batches and commits once per batch
+    - Throughput metrics (games/sec, predictions/sec, compute vs. write
+      time) are logged and returned in a SlateRunStats
+
+With workers <= 1 the same compute/write split runs in-process, which keeps
+the bulk write path without the process start-up cost.
+
+Usage:
+    from app.services.core.slate_generator import SlateGenerator
+
+    generator = SlateGenerator(db, workers=4)
+    stats = generator.run(["nba", "nhl"], [date.today()])
+    print(stats.to_dict())
+"""
+import logging
+import multiprocessing
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.core.metrics import predictions_generated_total, prediction_errors_total
+
+logger = logging.getLogger(__name__)
+
+# Session factory of the current worker process (set by _init_worker)
+_worker_session_factory: Optional[sessionmaker] = None
+
+
+@dataclass
+class SlateRunStats:
+    """Outcome and throughput of one slate generation run."""
+    workers: int
+    games_total: int = 0
+    games_succeeded: int = 0
+    games_failed: int = 0
+    predictions: int = 0
+    wall_seconds: float = 0.0
+    compute_seconds: float = 0.0   # Sum of per-game compute time across workers
+    write_seconds: float = 0.0     # Time spent in the single writer
+    predictions_by_sport: Dict[str, int] = field(default_factory=dict)
+    failures: List[Dict[str, str]] = field(default_factory=list)
+    # game_id -> prediction dicts, only filled when run with keep_results=True
+    results_by_game: Dict[str, List[Dict]] = field(default_factory=dict)
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games_total / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def predictions_per_second(self) -> float:
+        return self.predictions / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "games_total": self.games_total,
+            "games_succeeded": self.games_succeeded,
+            "games_failed": self.games_failed,
+            "predictions": self.predictions,
+            "predictions_by_sport": dict(self.predictions_by_sport),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "compute_seconds": round(self.compute_seconds, 3),
+            "write_seconds": round(self.write_seconds, 3),
+            "games_per_second": round(self.games_per_second, 2),
+            "predictions_per_second": round(self.predictions_per_second, 2),
+            "failures": list(self.failures),
+        }
+
+
+def _init_worker(database_url: str) -> None:
+    """Process pool initializer: give this worker its own engine and sessions."""
+    global _worker_session_factory
+    engine = create_engine(
+        database_url,
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=True
+    )
+    _worker_session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _compute_game(
+    db: Session,
+    sport_id: str,
+    game_id: str,
+    stat_types: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Compute (but do not persist) predictions for one game."""
+    from app.services.core.multi_sport_service import MultiSportPredictionService
+
+    started = time.perf_counter()
+    try:
+        service = MultiSportPredictionService(db).get_sport_service(sport_id)
+        results = service.generate_predictions_for_game(game_id, stat_types, persist=False)
+        rows = [r.pop("record") for r in results if "record" in r]
+        error = None
+    except Exception as e:
+        db.rollback()
+        results, rows, error = [], [], f"{type(e).__name__}: {e}"
+
+    return {
+        "sport_id": sport_id,
+        "game_id": game_id,
+        "rows": rows,
+        "results": results,
+        "error": error,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def _worker_generate_game(
+    sport_id: str,
+    game_id: str,
+    stat_types: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Process pool task: compute one game with this worker's own session."""
+    db = _worker_session_factory()
+    try:
+        return _compute_game(db, sport_id, game_id, stat_types)
+    finally:
+        db.close()
+
+
+class SlateGenerator:
+    """Generate predictions for many games with a pool of worker processes."""
+
+    def __init__(
+        self,
+        db: Session,
+        workers: Optional[int] = None,
+        write_batch_size: Optional[int] = None,
+        database_url: Optional[str] = None
+    ):
+        """
+        Initialize the slate generator.
+
+        Args:
+            db: Session used for game lookup and as the single writer
+            workers: Worker processes (default: settings.PREDICTION_POOL_WORKERS;
+                     0 or 1 computes in-process)
+            write_batch_size: Rows per bulk insert
+                              (default: settings.PREDICTION_WRITE_BATCH_SIZE)
+            database_url: Database URL for worker engines (default: settings.DATABASE_URL)
+        """
+        self.db = db
+        self.workers = settings.PREDICTION_POOL_WORKERS if workers is None else workers
+        self.write_batch_size = write_batch_size or settings.PREDICTION_WRITE_BATCH_SIZE
+        self.database_url = database_url or settings.DATABASE_URL
+
+    def find_games(self, sport_ids: Iterable[str], dates: Iterable[date]) -> List[Tuple[str, str]]:
+        """
+        Find scheduled games for the given sports and dates.
+
+        Returns:
+            List of (sport_id, game_id) tuples
+        """
+        from app.services.core.multi_sport_service import MultiSportPredictionService
+
+        coordinator = MultiSportPredictionService(self.db)
+        dates = list(dates)
+        jobs = []
+        for sport_id in sport_ids:
+            game_model = coordinator._get_game_model(sport_id)
+            for target_date in dates:
+                start = datetime.combine(target_date, datetime.min.time())
+                games = self.db.query(game_model.id).filter(
+                    game_model.game_date >= start,
+                    game_model.game_date < start + timedelta(days=1),
+                    game_model.status == 'scheduled'
+                ).all()
+                jobs.extend((sport_id, str(g.id)) for g in games)
+        return jobs
+
+    def run(
+        self,
+        sport_ids: Iterable[str],
+        dates: Iterable[date],
+        stat_types: Optional[List[str]] = None,
+        keep_results: bool = False
+    ) -> SlateRunStats:
+        """
+        Generate and persist predictions for every scheduled game on the dates.
+
+        Args:
+            sport_ids: Sports to include ('nba', 'nfl', 'mlb', 'nhl')
+            dates: Game dates to include
+            stat_types: Stat types to predict (default: sport-specific defaults)
+            keep_results: Keep per-game prediction dicts in results_by_game
+
+        Returns:
+            SlateRunStats with counts, failures and throughput
+        """
+        return self.run_games(self.find_games(sport_ids, dates), stat_types, keep_results)
+
+    def run_games(
+        self,
+        jobs: List[Tuple[str, str]],
+        stat_types: Optional[List[str]] = None,
+        keep_results: bool = False
+    ) -> SlateRunStats:
+        """
+        Generate and persist predictions for explicit (sport_id, game_id) pairs.
+
+        Args:
+            jobs: (sport_id, game_id) tuples
+            stat_types: Stat types to predict (default: sport-specific defaults)
+            keep_results: Keep per-game prediction dicts in results_by_game
+
+        Returns:
+            SlateRunStats with counts, failures and throughput
+        """
+        workers = max(1, self.workers)
+        stats = SlateRunStats(workers=workers, games_total=len(jobs))
+        if not jobs:
+            logger.info("Slate generation: no scheduled games")
+            return stats
+
+        started = time.perf_counter()
+        pending: Dict[str, List[Dict]] = defaultdict(list)
+
+        for result in self._iter_results(jobs, stat_types, workers):
+            stats.compute_seconds += result["seconds"]
+            sport_id = result["sport_id"]
+
+            if result["error"]:
+                stats.games_failed += 1
+                stats.failures.append({
+                    "sport_id": sport_id,
+                    "game_id": result["game_id"],
+                    "error": result["error"],
+                })
+                prediction_errors_total.labels(sport=sport_id, error_type="slate_worker").inc()
+                logger.error(f"Slate generation failed for {sport_id} game {result['game_id']}: {result['error']}")
+                continue
+
+            stats.games_succeeded += 1
+            if keep_results and result["results"]:
+                stats.results_by_game[result["game_id"]] = result["results"]
+            pending[sport_id].extend(result["rows"])
+            if len(pending[sport_id]) >= self.write_batch_size:
+                self._write(sport_id, pending.pop(sport_id), stats)
+
+        for sport_id, rows in pending.items():
+            self._write(sport_id, rows, stats)
+
+        stats.wall_seconds = time.perf_counter() - started
+        logger.info(
+            f"Slate generation: {stats.predictions} predictions for "
+            f"{stats.games_succeeded}/{stats.games_total} games with {workers} worker(s) "
+            f"in {stats.wall_seconds:.2f}s ({stats.games_per_second:.2f} games/s, "
+            f"{stats.predictions_per_second:.1f} predictions/s, "
+            f"write {stats.write_seconds:.2f}s)"
+        )
+        return stats
+
+    def _iter_results(
+        self,
+        jobs: List[Tuple[str, str]],
+        stat_types: Optional[List[str]],
+        workers: int
+    ):
+        """Yield per-game results as they complete."""
+        if workers == 1:
+            for sport_id, game_id in jobs:
+                yield _compute_game(self.db, sport_id, game_id, stat_types)
+            return
+
+        # spawn: workers must not inherit the parent's pooled connections
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(jobs)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.database_url,)
+        ) as pool:
+            futures = {
+                pool.submit(_worker_generate_game, sport_id, game_id, stat_types): (sport_id, game_id)
+                for sport_id, game_id in jobs
+            }
+            for future in as_completed(futures):
+                sport_id, game_id = futures[future]
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # Worker process died or the result could not be unpickled
+                    yield {
+                        "sport_id": sport_id,
+                        "game_id": game_id,
+                        "rows": [],
+                        "results": [],
+                        "error": f"{type(e).__name__}: {e}",
+                        "seconds": 0.0,
+                    }
+
+    def _write(self, sport_id: str, rows: List[Dict], stats: SlateRunStats) -> None:
+        """Bulk insert one batch of prediction rows for a sport."""
+        if not rows:
+            return
+
+        from app.services.core.multi_sport_service import MultiSportPredictionService
+
+        prediction_model = MultiSportPredictionService.SPORT_MODELS[sport_id]["prediction"]
+        started = time.perf_counter()
+        try:
+            self.db.execute(insert(prediction_model), rows)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Bulk insert of {len(rows)} {sport_id} predictions failed: {e}")
+            raise
+        finally:
+            stats.write_seconds += time.perf_counter() - started
+
+        stats.predictions += len(rows)
+        stats.predictions_by_sport[sport_id] = stats.predictions_by_sport.get(sport_id, 0) + len(rows)
+        predictions_generated_total.labels(sport=sport_id).inc(len(rows))
@@ -6,13 +6,27 @@ Resolves predictions with actual game results by:
 2. Creating/updating PlayerStats records
 3. Calculating prediction accuracy (difference, correctness)
 4. Marking predictions as resolved
+
+Each game is resolved set-based: predictions are read joined to their
+players, PlayerStats lines are written with one INSERT ... ON CONFLICT
+(player_id, game_id) DO UPDATE and predictions with one bulk UPDATE by
+primary key, so a night's games take a few statements each. A dry run
+returns the same changes as a diff instead of writing them.
+
+resolve_games (used by resolve_predictions_for_completed_games and the
+nightly result verification job) fetches boxscores for many games in
+parallel under a semaphore and resolves each game in its own short-lived
+session and transaction, opened only once its boxscore has arrived, so
+waiting on the network never holds a pooled connection. Failed games are
+reported without rolling back the others.
 """
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import update
 
 # UTC timezone for Python < 3.11 compatibility
 try:
@@ -20,12 +34,19 @@ try:
 except ImportError:
     UTC = timezone.utc
 
+from app.core.audit_sink import AuditEvent, get_audit_sink
 from app.models import Game, Prediction, Player, PlayerStats
 from app.services.nba.nba_service import NBAService
 
 logger = logging.getLogger(__name__)
 
 
+def _default_session_factory() -> Session:
+    from app.core.database import SessionLocal
+
+    return SessionLocal()
+
+
 class BoxscoreImportService:
     """
     Service for importing boxscore data and resolving predictions.
@@ -50,15 +71,19 @@ class BoxscoreImportService:
         'FG3M': 'threes',
         'MIN': 'minutes'
     }
+    _BOXSCORE_FIELD_BY_STAT = {db_field: api_field for api_field, db_field in BOXSCORE_FIELD_MAPPING.items()}
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, session_factory: Optional[Callable[[], Session]] = None):
         """
         Initialize the boxscore import service.
 
         Args:
             db: SQLAlchemy database session
+            session_factory: Creates the per-game sessions resolve_games uses
+                             (default: app.core.database.SessionLocal)
         """
         self.db = db
+        self._session_factory = session_factory or _default_session_factory
         self.nba_service = NBAService()
         self._player_resolver = None  # Lazy load for sync layer
 
@@ -103,123 +128,231 @@ class BoxscoreImportService:
 
         return True
 
-    async def _log_player_match(
-        self,
-        player: Player,
-        boxscore_player_id: str,
+    @staticmethod
+    def _player_match_event(
+        player_id: str,
+        player_name: str,
+        boxscore_stats: Dict,
         match_method: str = "external_id"
-    ):
+    ) -> AuditEvent:
         """
-        Log player identity match to audit trail.
+        Audit event for a player identity matched to a boxscore line.
 
         Args:
-            player: Player object from our database
-            boxscore_player_id: Player ID from boxscore source
+            player_id: Player ID from our database
+            player_name: Player name
+            boxscore_stats: The player's boxscore line
             match_method: How the player was matched
         """
-        from app.models import MatchAuditLog
-        import json
-
-        try:
-            audit_log = MatchAuditLog(
-                id=str(uuid.uuid4()),
-                entity_type='player',
-                entity_id=str(player.id),
-                action='matched',
-                new_state=json.dumps({
-                    'player_name': player.name,
-                    'external_id': player.external_id,
-                    'boxscore_player_id': boxscore_player_id
-                }),
-                match_details=json.dumps({
-                    'match_method': match_method,
-                    'source': 'boxscore_import'
-                }),
-                performed_by='system',
-                created_at=datetime.now(timezone.utc)
-            )
-            self.db.add(audit_log)
-        except Exception as e:
-            logger.debug(f"Failed to log player match audit: {e}")
+        return AuditEvent(
+            entity_type='player',
+            entity_id=str(player_id),
+            action='matched',
+            previous_state=None,
+            new_state={
+                'player_name': player_name,
+                'external_id': boxscore_stats.get('PLAYER_ID'),
+                'boxscore_player_id': boxscore_stats.get('PLAYER_ID')
+            },
+            match_details={
+                'match_method': match_method,
+                'source': 'boxscore_import'
+            }
+        )
 
     async def resolve_predictions_for_completed_games(
         self,
         hours_back: int = 48,
-        dry_run: bool = False
+        dry_run: bool = False,
+        max_concurrency: Optional[int] = None
     ) -> Dict:
         """
         Resolve predictions for completed games within the specified time window.
 
+        Games are resolved concurrently (see resolve_games).
+
         Args:
             hours_back: Look back this many hours for completed games (default: 48)
             dry_run: If True, simulate without making database changes
+            max_concurrency: Boxscore fetches in flight at once
+                             (default: BOXSCORE_RESOLUTION_CONCURRENCY)
 
         Returns:
             Dictionary with results:
             - games_processed: Number of games processed
+            - games_failed: Number of games whose changes were rolled back
             - predictions_resolved: Number of predictions resolved
             - player_stats_created: Number of PlayerStats records created
             - player_stats_updated: Number of PlayerStats records updated
             - errors: List of error messages
+            - games: Per-game results (see resolve_games)
+            - diff: Changes that would be written (dry run only)
         """
         logger.info(f"Starting boxscore import (hours_back={hours_back}, dry_run={dry_run})")
 
-        stats = {
-            "games_processed": 0,
-            "predictions_resolved": 0,
-            "player_stats_created": 0,
-            "player_stats_updated": 0,
-            "errors": []
-        }
-
         # Calculate time window
         cutoff = datetime.now(UTC) - timedelta(hours=hours_back)
 
         try:
             # Find completed games without resolved predictions
             # Games that are "final" status and haven't been resolved recently
-            games = self.db.query(Game).filter(
+            games = self.db.query(Game.id, Game.external_id).filter(
                 Game.status == "final",
                 Game.game_date >= cutoff
             ).all()
 
             # Filter out games that were recently resolved (within last hour)
-            games_to_process = []
-            for game in games:
-                # Check if any predictions for this game were recently resolved
-                recently_resolved = self.db.query(Prediction).filter(
-                    Prediction.game_id == game.id,
-                    Prediction.actuals_resolved_at.isnot(None),
-                    Prediction.actuals_resolved_at >= datetime.now(UTC) - timedelta(hours=1)
-                ).first()
-
-                if not recently_resolved:
-                    games_to_process.append(game)
+            recently_resolved = set()
+            if games:
+                recently_resolved = {
+                    game_id for (game_id,) in self.db.query(Prediction.game_id).filter(
+                        Prediction.game_id.in_([game.id for game in games]),
+                        Prediction.actuals_resolved_at.isnot(None),
+                        Prediction.actuals_resolved_at >= datetime.now(UTC) - timedelta(hours=1)
+                    ).distinct()
+                }
+            games_to_process = {
+                game.id: game.external_id for game in games if game.id not in recently_resolved
+            }
 
             logger.info(f"Found {len(games_to_process)} completed games to process")
 
-            for game in games_to_process:
-                result = await self._resolve_game(game, dry_run=dry_run)
-
-                stats["games_processed"] += 1
-                stats["predictions_resolved"] += result["predictions_resolved"]
-                stats["player_stats_created"] += result["player_stats_created"]
-                stats["player_stats_updated"] += result["player_stats_updated"]
-                stats["errors"].extend(result.get("errors", []))
-
-                if not dry_run:
-                    self.db.commit()
-
-            logger.info(f"Boxscore import complete: {stats}")
+            stats = await self.resolve_games(
+                list(games_to_process), dry_run=dry_run, max_concurrency=max_concurrency,
+                external_ids=games_to_process
+            )
+            logger.info(
+                f"Boxscore import complete: {stats['games_processed']} games "
+                f"({stats['games_failed']} failed), {stats['predictions_resolved']} predictions resolved"
+            )
 
         except Exception as e:
             logger.error(f"Error in boxscore import: {e}")
-            if not dry_run:
-                self.db.rollback()
+            stats = self._empty_run_stats(dry_run)
             stats["errors"].append(str(e))
 
         return stats
 
+    @staticmethod
+    def _empty_run_stats(dry_run: bool) -> Dict:
+        stats = {
+            "games_processed": 0,
+            "games_failed": 0,
+            "predictions_resolved": 0,
+            "player_stats_created": 0,
+            "player_stats_updated": 0,
+            "errors": [],
+            "games": []
+        }
+        if dry_run:
+            stats["diff"] = {"predictions": [], "player_stats": []}
+        return stats
+
+    async def resolve_games(
+        self,
+        game_ids: List[str],
+        dry_run: bool = False,
+        max_concurrency: Optional[int] = None,
+        external_ids: Optional[Dict[str, str]] = None
+    ) -> Dict:
+        """
+        Resolve several games concurrently, each in its own session.
+
+        Boxscores are fetched in parallel under a semaphore; as each one
+        arrives its game is resolved in a fresh session and committed (or
+        rolled back) on its own, so a failing game does not undo the others
+        and a night's games take about one boxscore round trip plus DB time.
+        The per-game session is opened after the fetch and closed before
+        the next await, so at most one is checked out at a time however
+        many games are waiting.
+
+        Args:
+            game_ids: Game UUIDs to resolve
+            dry_run: If True, simulate without making database changes
+            max_concurrency: Boxscore fetches in flight at once
+                             (default: BOXSCORE_RESOLUTION_CONCURRENCY)
+            external_ids: Game UUID -> NBA game ID, when the caller already
+                          has them (default: looked up in one query)
+
+        Returns:
+            Totals as in resolve_predictions_for_completed_games, with
+            "games" holding one entry per game: game_id, external_id,
+            status ("resolved", "failed" or "not_found"), the game's counts
+            and errors
+        """
+        from app.core.config import settings
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or settings.BOXSCORE_RESOLUTION_CONCURRENCY))
+
+        game_ids = list(dict.fromkeys(game_ids))
+        if external_ids is None:
+            external_ids = dict(
+                self.db.query(Game.id, Game.external_id).filter(Game.id.in_(game_ids)).all()
+            ) if game_ids else {}
+
+        async def resolve(game_id: str) -> Dict:
+            external_id = external_ids.get(game_id)
+            if external_id is None:
+                return {"game_id": game_id, "status": "not_found", "errors": ["Game not found"]}
+
+            try:
+                async with semaphore:
+                    boxscore = await self.nba_service.get_boxscore(external_id)
+            except Exception as e:
+                logger.error(f"Error fetching boxscore for game {game_id}: {e}")
+                return {"game_id": game_id, "external_id": external_id, "status": "failed", "errors": [str(e)]}
+
+            # An empty boxscore fails here: _resolve_game would otherwise refetch it inside the session
+            if not boxscore or not boxscore.get("PlayerStats"):
+                logger.warning(f"No boxscore data for game {external_id}")
+                return {
+                    "game_id": game_id, "external_id": external_id, "status": "failed",
+                    "errors": [f"No boxscore data for {external_id}"]
+                }
+
+            # No awaits from here to close(): the session only lives for the DB write
+            db = self._session_factory()
+            try:
+                game = db.get(Game, game_id)
+                if game is None:
+                    return {"game_id": game_id, "status": "not_found", "errors": ["Game not found"]}
+
+                service = BoxscoreImportService(db, session_factory=self._session_factory)
+                service.nba_service = self.nba_service
+                result = await service._resolve_game(game, dry_run=dry_run, boxscore=boxscore)
+
+                failed = result.pop("failed", False)
+                if dry_run or failed:
+                    db.rollback()
+                else:
+                    db.commit()
+                status = "failed" if failed else "resolved"
+                return {"game_id": game_id, "external_id": game.external_id, "status": status, **result}
+            except Exception as e:
+                logger.error(f"Error resolving game {game_id}: {e}")
+                db.rollback()
+                return {"game_id": game_id, "status": "failed", "errors": [str(e)]}
+            finally:
+                db.close()
+
+        results = await asyncio.gather(*(resolve(game_id) for game_id in game_ids))
+
+        stats = self._empty_run_stats(dry_run)
+        for result in results:
+            stats["games_processed"] += 1
+            if result["status"] != "resolved":
+                stats["games_failed"] += 1
+            for key in ("predictions_resolved", "player_stats_created", "player_stats_updated"):
+                stats[key] += result.get(key, 0)
+            stats["errors"].extend(result.get("errors", []))
+            for key, changes in result.pop("diff", {}).items():
+                stats["diff"][key].extend(changes)
+            stats["games"].append(result)
+
+        if stats["games_failed"]:
+            logger.warning(f"{stats['games_failed']} of {stats['games_processed']} games failed to resolve")
+        return stats
+
     async def resolve_predictions_for_game(
         self,
         game_id: str,
@@ -247,13 +380,21 @@ class BoxscoreImportService:
 
         return await self._resolve_game(game, dry_run=dry_run)
 
-    async def _resolve_game(self, game: Game, dry_run: bool = False) -> Dict:
+    async def _resolve_game(self, game: Game, dry_run: bool = False, boxscore: Optional[Dict] = None) -> Dict:
         """
         Internal method to resolve predictions for a single game.
 
+        Set-based: one query for the game's unresolved predictions joined to
+        their players, one for the existing PlayerStats lines, one batched
+        upsert of PlayerStats from the boxscore and one bulk UPDATE of the
+        predictions. Nothing is committed; callers commit per game. On an
+        error the session is rolled back and result["failed"] is set.
+
         Args:
             game: Game object
-            dry_run: If True, simulate without making database changes
+            dry_run: If True, simulate without making database changes and
+                     return the changes as result["diff"]
+            boxscore: Boxscore already fetched with get_boxscore (default: fetch it)
 
         Returns:
             Dictionary with resolution results
@@ -270,20 +411,25 @@ class BoxscoreImportService:
             if not self._validate_game_mapping(game):
                 logger.warning(f"Game {game.external_id} failed mapping validation")
                 result["errors"].append(f"Game mapping validation failed")
+                result["failed"] = True
                 return result
 
             # Fetch boxscore from NBA API
-            boxscore = await self.nba_service.get_boxscore(game.external_id)
+            if boxscore is None:
+                boxscore = await self.nba_service.get_boxscore(game.external_id)
 
             if not boxscore or not boxscore.get("PlayerStats"):
                 logger.warning(f"No boxscore data for game {game.external_id}")
                 result["errors"].append(f"No boxscore data for {game.external_id}")
+                result["failed"] = True
                 return result
 
-            player_stats_list = boxscore["PlayerStats"]
-
-            # Get all predictions for this game
-            predictions = self.db.query(Prediction).filter(
+            # Unresolved predictions with their players in one query
+            predictions = self.db.query(
+                Prediction.id, Prediction.player_id, Prediction.stat_type,
+                Prediction.predicted_value, Prediction.bookmaker_line, Prediction.recommendation,
+                Player.name, Player.external_id
+            ).join(Player, Player.id == Prediction.player_id).filter(
                 Prediction.game_id == game.id,
                 Prediction.actuals_resolved_at.is_(None)  # Only unresolved
             ).all()
@@ -296,29 +442,26 @@ class BoxscoreImportService:
 
             # Build a lookup map for boxscore stats
             stats_lookup = {}
-            for ps in player_stats_list:
+            for ps in boxscore["PlayerStats"]:
                 player_id = ps.get("PLAYER_ID")
                 if player_id:
                     stats_lookup[player_id] = ps
 
-            # Process each prediction
-            for prediction in predictions:
-                player = self.db.query(Player).filter(Player.id == prediction.player_id).first()
-
-                if not player:
-                    logger.warning(f"Player {prediction.player_id} not found for prediction {prediction.id}")
-                    continue
+            resolved_at = datetime.now(UTC)
+            prediction_rows = []
+            stat_lines = {}  # players.id -> (player name, boxscore stats)
 
+            for prediction in predictions:
                 # Find player's boxscore stats by external_id
-                boxscore_stats = stats_lookup.get(player.external_id)
+                boxscore_stats = stats_lookup.get(prediction.external_id)
 
                 if not boxscore_stats:
                     logger.warning(
-                        f"No boxscore stats for player {player.name} "
-                        f"(external_id: {player.external_id})"
+                        f"No boxscore stats for player {prediction.name} "
+                        f"(external_id: {prediction.external_id})"
                     )
                     result["errors"].append(
-                        f"No stats for {player.name} (external_id: {player.external_id})"
+                        f"No stats for {prediction.name} (external_id: {prediction.external_id})"
                     )
                     continue
 
@@ -328,13 +471,8 @@ class BoxscoreImportService:
                     logger.warning(f"Unknown stat_type: {prediction.stat_type}")
                     continue
 
-                # Map boxscore field to database field
-                boxscore_field = None
-                for api_field, db_field in self.BOXSCORE_FIELD_MAPPING.items():
-                    if db_field == stat_field:
-                        boxscore_field = api_field
-                        break
-
+                # Map database field to boxscore field
+                boxscore_field = self._BOXSCORE_FIELD_BY_STAT.get(stat_field)
                 if not boxscore_field:
                     logger.warning(f"No boxscore field mapping for stat_type: {prediction.stat_type}")
                     continue
@@ -345,44 +483,7 @@ class BoxscoreImportService:
                     logger.warning(f"Boxscore missing value for {boxscore_field}")
                     continue
 
-                # Create/update PlayerStats record
-                player_stats = self.db.query(PlayerStats).filter(
-                    PlayerStats.player_id == player.id,
-                    PlayerStats.game_id == game.id
-                ).first()
-
-                if player_stats:
-                    # Update existing stats
-                    setattr(player_stats, stat_field, actual_value)
-                    if boxscore_stats.get('MIN') is not None:
-                        player_stats.minutes = boxscore_stats.get('MIN')
-                    player_stats.updated_at = datetime.now(UTC)
-                    result["player_stats_updated"] += 1
-                else:
-                    # Create new stats record
-                    player_stats = PlayerStats(
-                        id=str(uuid.uuid4()),
-                        player_id=player.id,
-                        game_id=game.id,
-                        points=boxscore_stats.get('PTS'),
-                        rebounds=boxscore_stats.get('REB'),
-                        assists=boxscore_stats.get('AST'),
-                        threes=boxscore_stats.get('FG3M'),
-                        minutes=boxscore_stats.get('MIN'),
-                        created_at=datetime.now(UTC),
-                        updated_at=datetime.now(UTC)
-                    )
-                    if not dry_run:
-                        self.db.add(player_stats)
-
-                        # Log player match to audit trail
-                        await self._log_player_match(
-                            player=player,
-                            boxscore_player_id=str(player.external_id),
-                            match_method="external_id"
-                        )
-
-                    result["player_stats_created"] += 1
+                stat_lines[prediction.player_id] = (prediction.name, boxscore_stats)
 
                 # Calculate accuracy metrics
                 difference = abs(prediction.predicted_value - actual_value)
@@ -401,26 +502,170 @@ class BoxscoreImportService:
                     was_correct = actual_value < line
                 # For "NONE" recommendations, was_correct stays None
 
-                # Update prediction with accuracy data
-                prediction.actual_value = actual_value
-                prediction.difference = difference
-                prediction.was_correct = was_correct
-                prediction.actuals_resolved_at = datetime.now(UTC)
-
-                result["predictions_resolved"] += 1
+                prediction_rows.append({
+                    'id': prediction.id,
+                    'actual_value': actual_value,
+                    'difference': difference,
+                    'was_correct': was_correct,
+                    'actuals_resolved_at': resolved_at
+                })
 
                 logger.debug(
-                    f"Resolved: {player.name} {prediction.stat_type} "
+                    f"Resolved: {prediction.name} {prediction.stat_type} "
                     f"(predicted: {prediction.predicted_value}, line: {line}, actual: {actual_value}, "
                     f"difference: {difference:.2f}, correct: {was_correct})"
                 )
 
+            # One stat line per player with a resolved prediction
+            stats_rows = [
+                {
+                    'id': str(uuid.uuid4()),
+                    'player_id': player_id,
+                    'game_id': game.id,
+                    **{
+                        db_field: self._stat_value(db_field, boxscore_stats.get(api_field))
+                        for api_field, db_field in self.BOXSCORE_FIELD_MAPPING.items()
+                    },
+                    'created_at': resolved_at
+                }
+                for player_id, (_, boxscore_stats) in stat_lines.items()
+            ]
+            existing_stats = {}
+            if stats_rows:
+                existing_stats = {
+                    stats.player_id: stats
+                    for stats in self.db.query(PlayerStats).filter(
+                        PlayerStats.game_id == game.id,
+                        PlayerStats.player_id.in_(list(stat_lines))
+                    )
+                }
+
+            result["predictions_resolved"] = len(prediction_rows)
+            result["player_stats_updated"] = len(existing_stats)
+            result["player_stats_created"] = len(stats_rows) - len(existing_stats)
+
+            if dry_run:
+                result["diff"] = self._resolution_diff(
+                    game, predictions, prediction_rows, stats_rows, existing_stats
+                )
+                return result
+
+            self._upsert_player_stats(stats_rows)
+            if prediction_rows:
+                self.db.execute(update(Prediction), prediction_rows)
+
+            # Log new player matches to the audit trail
+            get_audit_sink().record_many(
+                [
+                    self._player_match_event(row['player_id'], *stat_lines[row['player_id']])
+                    for row in stats_rows
+                    if row['player_id'] not in existing_stats
+                ],
+                db=self.db
+            )
+
         except Exception as e:
             logger.error(f"Error resolving game {game.id}: {e}")
+            self.db.rollback()
             result["errors"].append(str(e))
+            result["failed"] = True
 
         return result
 
+    @staticmethod
+    def _stat_value(db_field: str, value):
+        """Boxscore value as stored in player_stats ("MM:SS" minutes become whole minutes)."""
+        if db_field == 'minutes' and isinstance(value, str):
+            try:
+                minutes, _, seconds = value.partition(':')
+                return round(float(minutes) + float(seconds or 0) / 60)
+            except ValueError:
+                return None
+        return value
+
+    def _upsert_player_stats(self, rows: List[Dict]) -> None:
+        """
+        Insert or update player_stats rows in one batched statement.
+
+        Conflicts on (player_id, game_id) overwrite the boxscore columns and
+        keep the original id and created_at.
+        """
+        if not rows:
+            return
+
+        if self.db.get_bind().dialect.name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(PlayerStats)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PlayerStats.player_id, PlayerStats.game_id],
+            set_={column: stmt.excluded[column] for column in self.BOXSCORE_FIELD_MAPPING.values()}
+        )
+        self.db.execute(stmt, rows)
+
+    def _resolution_diff(
+        self,
+        game: Game,
+        predictions: List,
+        prediction_rows: List[Dict],
+        stats_rows: List[Dict],
+        existing_stats: Dict[str, PlayerStats]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Changes a bulk resolution would write (dry run).
+
+        Returns:
+            Dictionary with:
+            - predictions: Resolved values per prediction
+            - player_stats: Stat lines to create, or changed columns
+              ({column: [old, new]}) of lines to update
+        """
+        by_id = {prediction.id: prediction for prediction in predictions}
+        prediction_diff = []
+        for row in prediction_rows:
+            prediction = by_id[row['id']]
+            prediction_diff.append({
+                'game_id': game.id,
+                'prediction_id': row['id'],
+                'player': prediction.name,
+                'stat_type': prediction.stat_type,
+                'predicted_value': prediction.predicted_value,
+                'bookmaker_line': prediction.bookmaker_line,
+                'recommendation': prediction.recommendation,
+                'actual_value': row['actual_value'],
+                'difference': row['difference'],
+                'was_correct': row['was_correct']
+            })
+
+        stats_diff = []
+        for row in stats_rows:
+            existing = existing_stats.get(row['player_id'])
+            columns = self.BOXSCORE_FIELD_MAPPING.values()
+            if existing is None:
+                stats_diff.append({
+                    'game_id': game.id,
+                    'player_id': row['player_id'],
+                    'action': 'create',
+                    'values': {column: row[column] for column in columns}
+                })
+                continue
+            changes = {
+                column: [getattr(existing, column), row[column]]
+                for column in columns
+                if getattr(existing, column) != row[column]
+            }
+            if changes:
+                stats_diff.append({
+                    'game_id': game.id,
+                    'player_id': row['player_id'],
+                    'action': 'update',
+                    'changes': changes
+                })
+
+        return {'predictions': prediction_diff, 'player_stats': stats_diff}
+
     def get_unresolved_games(self, hours_back: int = 48) -> List[Dict]:
         """
         Get list of completed games that haven't been resolved yet.
@@ -40,6 +40,9 @@ Usage:
 
     odds_service = OddsApiService(api_key="your_key")
     service = EnhancedPredictionService(db, odds_api_service=odds_service)
+    predictions = await service.generate_prop_predictions_async(game_id, stat_types)
+
+    # Sync callers (scripts, scheduler threads)
     predictions = service.generate_prop_predictions(game_id, stat_types)
 """
 import logging
@@ -52,6 +55,11 @@ import numpy as np  # TIER 2: For robust EWMA calculations
 
 from app.models import Player, Game, Prediction, PlayerSeasonStats, PlayerStats
 from app.core.logging import get_logger
+from app.services.core import projection_kernel
+from app.services.nba.feature_loader import SlateFeatureLoader, SlateFeatures
+from app.services.nba.odds_line_cache import OddsLineCache
+from app.services.nba.player_props_parser import PropLineIndex
+from app.utils.async_utils import run_sync
 
 logger = get_logger(__name__)
 
@@ -181,6 +189,9 @@ class EnhancedPredictionService:
     - REAL ODDS API INTEGRATION for live bookmaker lines
     """
 
+    # Odds events kept in the compact line cache (a full slate is ~15)
+    ODDS_CACHE_MAX_EVENTS = 64
+
     def __init__(
         self,
         db: Session,
@@ -215,10 +226,19 @@ class EnhancedPredictionService:
         self._game_odds_mapper = None
         self._player_props_parser = None
 
-        # Odds cache to prevent redundant API calls within same prediction run
-        # Key: (game_id, stat_type), Value: (odds_response, fetched_at)
-        self._odds_cache: Dict[tuple, tuple] = {}
+        # Compact odds cache: one compiled line index per (odds event,
+        # snapshot version), bounded and TTL-evicted. _game_events maps
+        # game_id -> (odds_event_id or None, resolved_at).
         self._cache_ttl_seconds = 300  # 5 minutes cache
+        self._odds_cache = OddsLineCache(
+            max_entries=self.ODDS_CACHE_MAX_EVENTS,
+            ttl_seconds=self._cache_ttl_seconds
+        )
+        self._game_events: Dict[str, Tuple[Optional[str], datetime]] = {}
+
+        # Batched per-slate features (season stats, recent games, injuries,
+        # lineups). Loaded once per game/slate instead of per player/stat.
+        self._features: Optional[SlateFeatures] = None
 
     @property
     def injury_service(self):
@@ -228,7 +248,7 @@ class EnhancedPredictionService:
             self._injury_service = InjuryService(self.db)
         return self._injury_service
 
-    def generate_prop_predictions(
+    async def generate_prop_predictions_async(
         self,
         game_id: str,
         stat_types: Optional[List[str]] = None,
@@ -237,6 +257,10 @@ class EnhancedPredictionService:
         """
         Generate prop predictions for a game with line comparisons.
 
+        The game's Odds API event is resolved once and its player props are
+        fetched in a single awaited call; every player/stat line is then
+        served from that response.
+
         Args:
             game_id: Game UUID
             stat_types: Stats to predict (default: points, rebounds, assists, threes)
@@ -254,9 +278,20 @@ class EnhancedPredictionService:
             logger.error(f"Game {game_id} not found")
             return []
 
+        # Batch-load features for every player in the game (reuses the
+        # bundle from load_slate_features when it already covers this game)
+        self._ensure_features([game])
+
         # Get active players
         players = self._get_active_players(game)
 
+        # Project recent form for every player/stat in one kernel pass
+        self._compute_recent_forms(players, stat_types)
+
+        # One event lookup + one props fetch for the whole game
+        if self._odds_api_service:
+            await self._prefetch_event_odds(game)
+
         predictions = []
         for player in players:
             for stat_type in stat_types:
@@ -270,6 +305,93 @@ class EnhancedPredictionService:
 
         return predictions
 
+    def generate_prop_predictions(
+        self,
+        game_id: str,
+        stat_types: Optional[List[str]] = None,
+        bookmaker: str = "draftkings"
+    ) -> List[Dict]:
+        """
+        Sync adapter for generate_prop_predictions_async (scripts, scheduler).
+
+        Args:
+            game_id: Game UUID
+            stat_types: Stats to predict (default: points, rebounds, assists, threes)
+            bookmaker: Bookmaker for line data
+
+        Returns:
+            List of prediction dictionaries with line comparison
+        """
+        return run_sync(
+            self.generate_prop_predictions_async(game_id, stat_types, bookmaker)
+        )
+
+    def generate_slate_predictions(
+        self,
+        games: List[Game],
+        stat_types: Optional[List[str]] = None,
+        bookmaker: str = "draftkings"
+    ) -> Dict[str, List[Dict]]:
+        """
+        Generate prop predictions for a whole slate of games.
+
+        Features for every player on the slate are loaded up front in a fixed
+        number of queries, so cost scales with games rather than with
+        players × stat types.
+
+        Args:
+            games: Game model instances (e.g., one night's slate)
+            stat_types: Stats to predict (default: points, rebounds, assists, threes)
+            bookmaker: Bookmaker for line data
+
+        Returns:
+            Dict mapping game ID to that game's list of predictions
+        """
+        self.load_slate_features(games)
+
+        results = {}
+        for game in games:
+            try:
+                results[str(game.id)] = self.generate_prop_predictions(
+                    str(game.id), stat_types, bookmaker
+                )
+            except Exception as e:
+                logger.error(f"Error generating predictions for game {game.id}: {e}")
+                results[str(game.id)] = []
+        return results
+
+    def load_slate_features(self, games: List[Game]) -> SlateFeatures:
+        """
+        Batch-load features for every player in a set of games.
+
+        Subsequent generate_prop_predictions calls for any of these games
+        read from the loaded bundle instead of querying per player.
+
+        Args:
+            games: Game model instances
+
+        Returns:
+            The loaded SlateFeatures bundle
+        """
+        self._features = SlateFeatureLoader(self.db, season=self.season).load_for_games(games)
+        return self._features
+
+    def _ensure_features(self, games: List[Game]) -> SlateFeatures:
+        """Load the feature bundle unless the current one already covers the games."""
+        if self._features is None or not all(self._features.covers_game(g) for g in games):
+            self._features = SlateFeatureLoader(self.db, season=self.season).load_for_games(games)
+        return self._features
+
+    def _get_season_stats(self, player_id: str) -> Optional[PlayerSeasonStats]:
+        """Get a player's season stats from the feature bundle, or the database."""
+        if self._features is not None and self._features.covers_player(player_id):
+            return self._features.get_season_stats(player_id)
+
+        return self.db.query(PlayerSeasonStats).filter(
+            PlayerSeasonStats.player_id == player_id,
+            PlayerSeasonStats.season == self.season
+        ).first()
+
     # Minimum games threshold for reliable predictions
     MIN_GAMES_THRESHOLD = 10  # Require at least 10 games of data
     ROOKIE_GAMES_THRESHOLD = 50  # Career games below this = rookie variance penalty
@@ -292,18 +414,14 @@ class EnhancedPredictionService:
         - Have reasonable stats
         - Have played within the last 7 days (not injured)
         """
-        from app.models import PlayerSeasonStats
         from datetime import datetime, timedelta
 
         # Calculate cutoff date for recent activity check
         recent_cutoff = datetime.now() - timedelta(days=self.RECENT_DAYS_THRESHOLD)
 
-        # Get players on the teams
-        players = self.db.query(Player).filter(
-            Player.team.in_([game.home_team, game.away_team]),
-            Player.active == True,
-            Player.sport_id == "nba"
-        ).all()
+        # Get players on the teams (from the batched feature bundle)
+        features = self._ensure_features([game])
+        players = features.get_roster(game.home_team) + features.get_roster(game.away_team)
 
         # Filter to only rotation players (15+ minutes per game)
         # This eliminates college prospects and deep bench players
@@ -315,10 +433,7 @@ class EnhancedPredictionService:
                 continue
 
             # Check if player has season stats with meaningful minutes
-            stats = self.db.query(PlayerSeasonStats).filter(
-                PlayerSeasonStats.player_id == p.id,
-                PlayerSeasonStats.season == self.season
-            ).first()
+            stats = features.get_season_stats(p.id)
 
             # Require minimum games and minutes
             games_count = stats.games_count if stats else 0
@@ -370,13 +485,16 @@ class EnhancedPredictionService:
 
             valid_players.append(p)
 
-        # **TIER 1 FIX**: Filter out injured players using injury service
+        # **TIER 1 FIX**: Filter out injured players using the batched injury data
         # This excludes players marked as OUT, DOUBTFUL, or QUESTIONABLE
         if valid_players:
-            player_ids = [p.id for p in valid_players]
-            healthy_ids = self.injury_service.filter_by_injury_status(player_ids)
-            valid_players = [p for p in valid_players if p.id in healthy_ids]
-            logger.debug(f"Injury filter: {len(player_ids)} → {len(valid_players)} healthy players")
+            injured_ids = features.get_injured_ids()
+            total = len(valid_players)
+            for p in valid_players:
+                if p.id in injured_ids:
+                    logger.info(f"Excluding {p.name} - injury status")
+            valid_players = [p for p in valid_players if p.id not in injured_ids]
+            logger.debug(f"Injury filter: {total} → {len(valid_players)} healthy players")
 
         return valid_players
 
@@ -540,128 +658,124 @@ class EnhancedPredictionService:
         - Tracks career games for rookie penalty
         - Detects new team transitions (recent trades/signings)
         - Boosts recent weight for players on new teams
-        """
-        # Get recent game stats
-        recent_games = self.db.query(PlayerStats).filter(
-            PlayerStats.player_id == player.id
-        ).order_by(PlayerStats.created_at.desc()).limit(games_back).all()
-
-        # Get season stats for career games total
-        season_stats = self.db.query(PlayerSeasonStats).filter(
-            PlayerSeasonStats.player_id == player.id,
-            PlayerSeasonStats.season == self.season
-        ).first()
-
-        if not recent_games:
-            # Fall back to season stats
-            if season_stats:
-                return {
-                    "ewma_per_36": float(getattr(season_stats, f"{stat_type}_per_36", 10.0)),
-                    "avg_minutes": float(season_stats.avg_minutes or 30.0),
-                    "sample_size": season_stats.games_count or 0,
-                    "std_dev": None,
-                    "career_games": season_stats.games_count or 0,
-                    "new_team": False
-                }
-            return None
 
-        # Check if player is on a new team (recently traded/signed)
-        career_games = season_stats.games_count if season_stats else 0
-        new_team = False
-        recent_boost = 0.0
+        Results are memoized in the feature bundle; generation primes the
+        memo for every player on the game with a single kernel call.
+        """
+        memo_key = (player.id, stat_type, games_back)
+        if self._features is not None and memo_key in self._features.recent_form:
+            return self._features.recent_form[memo_key]
 
-        # If player has fewer than 20 games this season, likely new/rookie
-        if career_games and career_games < 20:
-            new_team = True
-            recent_boost = 0.5
+        forms = self._compute_recent_forms([player], [stat_type], games_back)
+        return forms[(player.id, stat_type)]
 
-        # Extract per-36 values
-        per_36_values = []
-        minutes_values = []
+    def _compute_recent_forms(
+        self,
+        players: List[Player],
+        stat_types: List[str],
+        games_back: int = 10
+    ) -> Dict[Tuple[str, str], Optional[Dict]]:
+        """
+        Compute recent form for players × stat types with the projection kernel.
 
-        for i, game in enumerate(recent_games):
-            stat_val = getattr(game, stat_type, None)
-            mins = getattr(game, "minutes", None)
+        Builds a players × games × stats array from the last `games_back`
+        box scores and runs EWMA, outlier capping, adaptive alpha and
+        variance as whole-array operations.
 
-            # Explicit zero-check protection to prevent division-by-zero errors
-            if stat_val and mins and mins > 0:
-                per_36 = stat_val * (36.0 / mins)
-                per_36_values.append(per_36)
-                minutes_values.append(mins)
+        Returns:
+            Dict keyed by (player_id, stat_type) with recent form dicts
+            (None when the player has no usable data)
+        """
+        results: Dict[Tuple[str, str], Optional[Dict]] = {}
+        with_games = []
+        recent_by_player = {}
+        season_by_player = {}
 
-        if not per_36_values:
-            return None
+        for player in players:
+            # Get recent game stats
+            features = self._features
+            if (
+                features is not None
+                and features.covers_player(player.id)
+                and games_back <= features.games_back
+            ):
+                recent_games = features.get_recent_stats(player.id, games_back)
+            else:
+                recent_games = self.db.query(PlayerStats).filter(
+                    PlayerStats.player_id == player.id
+                ).order_by(PlayerStats.created_at.desc()).limit(games_back).all()
+
+            # Get season stats for career games total
+            season_stats = self._get_season_stats(player.id)
+            season_by_player[player.id] = season_stats
+
+            if not recent_games:
+                # Fall back to season stats
+                for stat_type in stat_types:
+                    if season_stats:
+                        results[(player.id, stat_type)] = {
+                            "ewma_per_36": float(getattr(season_stats, f"{stat_type}_per_36", 10.0)),
+                            "avg_minutes": float(season_stats.avg_minutes or 30.0),
+                            "sample_size": season_stats.games_count or 0,
+                            "std_dev": None,
+                            "career_games": season_stats.games_count or 0,
+                            "new_team": False
+                        }
+                    else:
+                        results[(player.id, stat_type)] = None
+                continue
 
-        # TIER 2: Robust EWMA with outlier detection and adaptive alpha
-        try:
-            per_36_array = np.array(per_36_values)
-            median = np.median(per_36_array)
-            mad = np.median(np.abs(per_36_array - median))
-
-            # Define outlier threshold (3 MAD)
-            outlier_threshold = 3 * mad if mad > 0 else 0
-
-            # Cap outliers at median ± threshold
-            cleaned_values = np.clip(
-                per_36_array,
-                median - outlier_threshold if outlier_threshold > 0 else median,
-                median + outlier_threshold if outlier_threshold > 0 else median
+            with_games.append(player)
+            recent_by_player[player.id] = recent_games
+
+        if with_games:
+            num_games = max(len(recent_by_player[p.id]) for p in with_games)
+            stats = np.full((len(with_games), num_games, len(stat_types)), np.nan)
+            minutes = np.full((len(with_games), num_games), np.nan)
+            new_team = np.zeros(len(with_games), dtype=bool)
+
+            for i, player in enumerate(with_games):
+                for g, box in enumerate(recent_by_player[player.id]):
+                    minutes[i, g] = getattr(box, "minutes", None) or np.nan
+                    for k, stat_type in enumerate(stat_types):
+                        stat_val = getattr(box, stat_type, None)
+                        stats[i, g, k] = stat_val if stat_val is not None else np.nan
+
+                # If player has fewer than 20 games this season, likely new/rookie
+                season_stats = season_by_player[player.id]
+                career_games = season_stats.games_count if season_stats else 0
+                new_team[i] = bool(career_games and career_games < 20)
+
+            # TIER 2: Robust EWMA with outlier detection and adaptive alpha
+            form = projection_kernel.project_recent_form(
+                stats, minutes, per_minutes=projection_kernel.PER_36, new_team=new_team
             )
 
-            # TIER 2: Adaptive alpha based on volatility (CV)
-            mean_val = np.mean(cleaned_values)
-            cv = (np.std(cleaned_values) / mean_val) if mean_val > 0 else 0
-
-            # Adaptive alpha: 0.2 (stable) to 0.5 (volatile)
-            if cv < 0.15:
-                adaptive_alpha = 0.2
-            elif cv < 0.25:
-                adaptive_alpha = 0.3
-            else:
-                adaptive_alpha = 0.5
-
-            # Adjust for new team
-            if new_team:
-                adaptive_alpha = min(adaptive_alpha + recent_boost, 0.7)
-
-            # Calculate EWMA with adaptive alpha
-            games_to_use = min(games_back, len(cleaned_values))
-            weights = [(1 - adaptive_alpha) ** i for i in range(games_to_use)]
-            weights = [w / sum(weights) for w in reversed(weights)]
-
-            ewma_per_36 = sum(w * v for w, v in zip(weights[:len(cleaned_values)], cleaned_values))
-
-            # Track outliers capped
-            outliers_capped = int(np.sum(per_36_array != cleaned_values))
-        except Exception:
-            # Fallback to simple calculation if numpy fails
-            alpha = self.ewma_alpha + (recent_boost if new_team else 0)
-            games_to_use = min(games_back, len(per_36_values))
-            weights = [(1 - alpha) ** i for i in range(games_to_use)]
-            weights = [w / sum(weights) for w in reversed(weights)]
-            ewma_per_36 = sum(w * v for w, v in zip(weights[:len(per_36_values)], per_36_values))
-            outliers_capped = 0
-            cleaned_values = per_36_values
-
-        avg_minutes = sum(minutes_values) / len(minutes_values)
-
-        # Calculate standard deviation (for confidence)
-        if len(per_36_values) >= 2:
-            mean = sum(per_36_values) / len(per_36_values)
-            variance = sum((x - mean) ** 2 for x in per_36_values) / (len(per_36_values) - 1)
-            std_dev = variance ** 0.5
-        else:
-            std_dev = None
-
-        return {
-            "ewma_per_36": float(ewma_per_36),
-            "avg_minutes": float(avg_minutes),
-            "sample_size": len(per_36_values),
-            "std_dev": float(std_dev) if std_dev is not None else None,
-            "career_games": career_games,
-            "new_team": new_team,
-            "outliers_capped": outliers_capped
-        }
+            for i, player in enumerate(with_games):
+                season_stats = season_by_player[player.id]
+                career_games = season_stats.games_count if season_stats else 0
+                for k, stat_type in enumerate(stat_types):
+                    sample_size = int(form.sample_size[i, k])
+                    if sample_size == 0:
+                        results[(player.id, stat_type)] = None
+                        continue
+
+                    std_dev = form.std_dev[i, k]
+                    results[(player.id, stat_type)] = {
+                        "ewma_per_36": float(form.ewma[i, k]),
+                        "avg_minutes": float(form.avg_minutes[i, k]),
+                        "sample_size": sample_size,
+                        "std_dev": None if np.isnan(std_dev) else float(std_dev),
+                        "career_games": career_games,
+                        "new_team": bool(new_team[i]),
+                        "outliers_capped": int(form.outliers_capped[i, k])
+                    }
+
+        if self._features is not None:
+            for (player_id, stat_type), form_dict in results.items():
+                self._features.recent_form[(player_id, stat_type, games_back)] = form_dict
+
+        return results
 
     def _get_projected_minutes(
         self,
@@ -1060,6 +1174,25 @@ class EnhancedPredictionService:
         Queries recent games to see what the opponent actually allows
         to players of the same position.
         """
+        # Opponent/position/stat adjustments are identical for every player
+        # sharing them, so compute each combination once per slate
+        memo_key = (opponent, player.position or "G", stat_type)
+        if self._features is not None and memo_key in self._features.opponent_adjustments:
+            return self._features.opponent_adjustments[memo_key]
+
+        adj = self._query_opponent_adjustment(player, opponent, stat_type)
+
+        if self._features is not None:
+            self._features.opponent_adjustments[memo_key] = adj
+        return adj
+
+    def _query_opponent_adjustment(
+        self,
+        player: Player,
+        opponent: str,
+        stat_type: str
+    ) -> float:
+        """Query what the opponent allows to this position vs. league average."""
         from sqlalchemy import text
 
         # Map stat_type to column name
@@ -1160,31 +1293,32 @@ class EnhancedPredictionService:
 
         # Get active injuries for this game
         player_team = player.team
-        cutoff_date = date.today() - timedelta(days=7)
-
-        injured_query = text("""
-            SELECT DISTINCT p.id, p.position, p.name
-            FROM player_injuries pi
-            JOIN players p ON pi.player_id = p.id
-            WHERE p.team = :team
-              AND pi.reported_date >= :cutoff
-              AND UPPER(pi.status) IN ('OUT', 'DOUBTFUL', 'QUESTIONABLE')
-        """)
-
-        injured = self.db.execute(injured_query, {
-            "team": player_team,
-            "cutoff": cutoff_date
-        }).fetchall()
+
+        if self._features is not None and self._features.covers_team(player_team):
+            injured = self._features.get_team_injuries(player_team)
+        else:
+            cutoff_date = date.today() - timedelta(days=7)
+
+            injured_query = text("""
+                SELECT DISTINCT p.id, p.position, p.name
+                FROM player_injuries pi
+                JOIN players p ON pi.player_id = p.id
+                WHERE p.team = :team
+                  AND pi.reported_date >= :cutoff
+                  AND UPPER(pi.status) IN ('OUT', 'DOUBTFUL', 'QUESTIONABLE')
+            """)
+
+            injured = self.db.execute(injured_query, {
+                "team": player_team,
+                "cutoff": cutoff_date
+            }).fetchall()
 
         if not injured:
             return 0.0
 
         # Get current player's estimated usage rate (from season stats)
         # Simplified: use points per 36 as proxy for usage
-        season_stats = self.db.query(PlayerSeasonStats).filter(
-            PlayerSeasonStats.player_id == player.id,
-            PlayerSeasonStats.season == self.season
-        ).first()
+        season_stats = self._get_season_stats(player.id)
 
         if not season_stats:
             return 0.0
@@ -1197,10 +1331,10 @@ class EnhancedPredictionService:
 
         for inj_player in injured:
             # Get injured player's stats
-            inj_stats = self.db.query(PlayerSeasonStats).filter(
-                PlayerSeasonStats.player_id == inj_player.id,
-                PlayerSeasonStats.season == self.season
-            ).first()
+            if self._features is not None and self._features.covers_team(player_team):
+                inj_stats = self._features.get_season_stats(inj_player.id)
+            else:
+                inj_stats = self._get_season_stats(inj_player.id)
 
             if inj_stats:
                 inj_usage = inj_stats.points_per_36 or 10.0
@@ -1281,13 +1415,9 @@ class EnhancedPredictionService:
         Get bookmaker line for this prop from Odds API.
 
         Uses a tiered approach:
-        1. Fetch real odds from Odds API (if service available)
+        1. Real line from the game's prefetched player props (if service available)
         2. Fall back to season stats estimation if API unavailable
 
-        Note: This method runs async code in a sync context using asyncio.run()
-        when the odds service is available. This is safe for prediction generation
-        which is typically called from background tasks or CLI scripts.
-
         Args:
             player: Player model instance
             game: Game model instance
@@ -1297,9 +1427,9 @@ class EnhancedPredictionService:
         Returns:
             Dict with keys: line, line_open, over_price, under_price
         """
-        # Try to fetch real odds from Odds API if service is available
+        # Try the real line from the Odds API if service is available
         if self._odds_api_service:
-            real_line = self._fetch_real_odds_line_sync(
+            real_line = self._lookup_odds_line(
                 player, game, stat_type, bookmaker
             )
             if real_line:
@@ -1308,67 +1438,96 @@ class EnhancedPredictionService:
         # Fall back to estimation based on season stats
         return self._estimate_line_from_season_stats(player, stat_type)
 
-    def _fetch_real_odds_line_sync(
-        self,
-        player: Player,
-        game: Game,
-        stat_type: str,
-        bookmaker: str
-    ) -> Optional[Dict]:
+    async def _prefetch_event_odds(self, game: Game) -> Optional[PropLineIndex]:
         """
-        Fetch real odds line from Odds API (sync wrapper).
+        Resolve the game's Odds API event and fetch its player props once.
 
-        This method runs the async odds fetching in a synchronous context.
-        It creates a new event loop if one doesn't exist.
+        The response is compiled into a PropLineIndex and stored in the
+        compact odds cache under (event_id, snapshot_version); the raw JSON
+        is not kept. The game -> event mapping (including "no event") is
+        remembered for _cache_ttl_seconds, so every player/stat lookup for
+        the game is served without further API calls.
 
         Args:
-            player: Player model instance
             game: Game model instance
-            stat_type: Stat type (points, rebounds, assists, threes)
-            bookmaker: Preferred bookmaker name
 
         Returns:
-            Dict with line data or None if not found
+            PropLineIndex (empty when the event has no props) or None when
+            the game has no odds event
         """
-        import asyncio
+        from app.services.nba.player_props_parser import PlayerPropsParser
 
-        async def _fetch():
-            return await self._fetch_real_odds_line_async(
-                player, game, stat_type, bookmaker
-            )
+        current_time = datetime.utcnow()
+
+        resolved = self._game_events.get(game.id)
+        fresh = (
+            resolved is not None
+            and (current_time - resolved[1]).total_seconds() < self._cache_ttl_seconds
+        )
+        if fresh:
+            if resolved[0] is None:
+                return None
+            index = self._odds_cache.get(resolved[0])
+            if index is not None:
+                return index
 
+        odds_event_id = resolved[0] if fresh else None
+        index = None
         try:
-            # Try to get the existing event loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # We're in an async context, create a new loop in a thread
-                import concurrent.futures
-                import threading
-
-                result = [None]
-
-                def run_in_new_loop():
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        result[0] = new_loop.run_until_complete(_fetch())
-                    finally:
-                        new_loop.close()
-
-                thread = threading.Thread(target=run_in_new_loop)
-                thread.start()
-                thread.join(timeout=10)  # 10 second timeout
-
-                return result[0]
-            else:
-                # No running loop, we can use run_until_complete
-                return loop.run_until_complete(_fetch())
+            # Import mapper here to avoid circular imports
+            from app.services.nba.game_odds_mapper import GameOddsMapper
+
+            if self._game_odds_mapper is None:
+                self._game_odds_mapper = GameOddsMapper(
+                    self.db,
+                    self._odds_api_service
+                )
 
-        except RuntimeError:
-            # No event loop exists, create a new one
-            return asyncio.run(_fetch())
+            # Step 1: Get Odds API event ID for this game
+            if odds_event_id is None:
+                odds_event_id = await self._game_odds_mapper.get_odds_event_id(game)
 
-    async def _fetch_real_odds_line_async(
+            if odds_event_id:
+                # Step 2: Fetch every player prop market for the event
+                odds_response = await self._odds_api_service.get_event_player_props(
+                    odds_event_id
+                )
+                # Step 3: Compile once; empty responses are cached as empty indexes
+                index = PlayerPropsParser().build_line_index(odds_response)
+                index.event_id = odds_event_id
+                self._odds_cache.put(index)
+            else:
+                logger.debug(
+                    f"No odds_event_id found for game {game.id}, "
+                    f"falling back to estimation"
+                )
+        except Exception as e:
+            logger.error(f"Error fetching real odds for game {game.id}: {e}", exc_info=True)
+
+        # Remember misses too, so the game's remaining lookups don't retry the API
+        self._game_events[game.id] = (odds_event_id or None, current_time)
+        return index
+
+    def get_odds_cache_stats(self) -> Dict:
+        """Size and hit statistics of the compact odds cache."""
+        return self._odds_cache.stats()
+
+    def _get_props_parser(self, bookmaker: str):
+        """Player props parser with the requested bookmaker as top priority."""
+        from app.services.nba.player_props_parser import PlayerPropsParser
+
+        # Only return lines from the requested bookmaker; rebuild the parser
+        # if the bookmaker changes between calls
+        if (
+            self._player_props_parser is None
+            or self._player_props_parser.bookmaker_priority[0] != bookmaker.lower()
+        ):
+            self._player_props_parser = PlayerPropsParser(
+                bookmaker_priority=[bookmaker.lower()]
+            )
+        return self._player_props_parser
+
+    def _lookup_odds_line(
         self,
         player: Player,
         game: Game,
@@ -1376,13 +1535,11 @@ class EnhancedPredictionService:
         bookmaker: str
     ) -> Optional[Dict]:
         """
-        Fetch real odds line from Odds API (async implementation).
+        Extract a player's line from the game's cached line index.
 
-        This is the core async method that:
-        1. Maps the internal game to Odds API event ID
-        2. Fetches player props for that event (with caching to avoid redundant calls)
-        3. Extracts the specific player's line for the stat type
-        4. Populates odds_fetched_at and odds_last_updated timestamps
+        Callers outside generate_prop_predictions_async (e.g. scripts calling
+        _get_bookmaker_line directly), or lookups after the entry expired or
+        was evicted, trigger a one-time fetch for the game.
 
         Args:
             player: Player model instance
@@ -1393,147 +1550,49 @@ class EnhancedPredictionService:
         Returns:
             Dict with line data or None if not found
         """
-        from datetime import datetime
-
-        try:
-            # Import mapper and parser here to avoid circular imports
-            from app.services.nba.game_odds_mapper import GameOddsMapper
-            from app.services.nba.player_props_parser import PlayerPropsParser
-
-            # Initialize mapper and parser if not already done
-            if self._game_odds_mapper is None:
-                self._game_odds_mapper = GameOddsMapper(
-                    self.db,
-                    self._odds_api_service
-                )
-
-            # Create parser with the requested bookmaker as top priority
-            # This ensures we only return lines from the requested bookmaker
-            if self._player_props_parser is None:
-                self._player_props_parser = PlayerPropsParser(
-                    bookmaker_priority=[bookmaker.lower()]
-                )
-            # Update priority if bookmaker changes between calls
-            elif self._player_props_parser.bookmaker_priority[0] != bookmaker.lower():
-                self._player_props_parser = PlayerPropsParser(
-                    bookmaker_priority=[bookmaker.lower()]
-                )
-
-            # Step 1: Get Odds API event ID for this game
-            odds_event_id = await self._game_odds_mapper.get_odds_event_id(game)
-
-            if not odds_event_id:
-                logger.debug(
-                    f"No odds_event_id found for game {game.id}, "
-                    f"falling back to estimation"
-                )
-                return None
-
-            # Step 2: Check cache for existing odds data (prevents redundant API calls)
-            cache_key = (game.id, stat_type)
-            current_time = datetime.utcnow()
-
-            if cache_key in self._odds_cache:
-                cached_response, cached_at = self._odds_cache[cache_key]
-                cache_age = (current_time - cached_at).total_seconds()
-
-                if cache_age < self._cache_ttl_seconds:
-                    logger.debug(
-                        f"Using cached odds for game {game.id}, stat_type={stat_type} "
-                        f"(age: {cache_age:.0f}s)"
-                    )
-                    odds_response = cached_response
-                else:
-                    # Cache expired, fetch fresh data
-                    logger.debug(
-                        f"Cache expired for game {game.id}, stat_type={stat_type}, "
-                        f"fetching fresh odds"
-                    )
-                    odds_response = await self._fetch_and_cache_odds(
-                        odds_event_id, cache_key, current_time
-                    )
-            else:
-                # Cache miss, fetch from API
-                logger.debug(
-                    f"Cache miss for game {game.id}, stat_type={stat_type}, "
-                    f"fetching from Odds API"
-                )
-                odds_response = await self._fetch_and_cache_odds(
-                    odds_event_id, cache_key, current_time
-                )
-
-            if not odds_response or not odds_response.get("data"):
-                logger.debug(
-                    f"No player props data for event {odds_event_id}, "
-                    f"falling back to estimation"
-                )
-                return None
-
-            # Step 3: Extract the specific player's line
-            line_data = self._player_props_parser.extract_player_lines(
-                odds_response=odds_response,
-                player_name=player.name,
-                stat_type=stat_type
-            )
-
-            if line_data:
-                logger.info(
-                    f"Found real odds line for {player.name} {stat_type}: "
-                    f"{line_data['line']} ({line_data['bookmaker']})"
-                )
-                actual_bookmaker = line_data.get("bookmaker", bookmaker)
-                fetched_at = line_data.get("fetched_at", current_time.isoformat())
-
-                return {
-                    "line": line_data["line"],
-                    "line_open": line_data["line"],  # TODO: fetch opening line separately
-                    "over_price": line_data.get("over_price", -110),
-                    "under_price": line_data.get("under_price", -110),
-                    "bookmaker": actual_bookmaker,
-                    "line_source": actual_bookmaker,  # Track actual source
-                    "fetched_at": fetched_at,
-                    "odds_fetched_at": current_time,  # For database storage
-                    "odds_last_updated": current_time  # For database storage
-                }
+        resolved = self._game_events.get(game.id)
+        if resolved is not None and resolved[0] is None:
+            return None
 
-            logger.debug(
-                f"No line found for {player.name} {stat_type} in event {odds_event_id}"
-            )
+        index = self._odds_cache.get(resolved[0]) if resolved is not None else None
+        if index is None:
+            index = run_sync(self._prefetch_event_odds(game))
+        if not index:
             return None
 
+        try:
+            line_data = self._get_props_parser(bookmaker).extract_from_index(
+                index, player.name, stat_type
+            )
         except Exception as e:
             logger.error(
-                f"Error fetching real odds for {player.name} {stat_type}: {e}",
+                f"Error parsing odds for {player.name} {stat_type}: {e}",
                 exc_info=True
             )
             return None
 
-    async def _fetch_and_cache_odds(
-        self,
-        odds_event_id: str,
-        cache_key: tuple,
-        current_time: datetime
-    ) -> Optional[Dict]:
-        """
-        Fetch odds from API and cache the response.
-
-        Args:
-            odds_event_id: The Odds API event ID
-            cache_key: Cache key tuple (game_id, stat_type)
-            current_time: Current datetime for cache timestamp
+        if not line_data:
+            logger.debug(f"No line found for {player.name} {stat_type} in game {game.id}")
+            return None
 
-        Returns:
-            Odds response dict or None
-        """
-        odds_response = await self._odds_api_service.get_event_player_props(
-            odds_event_id
+        logger.info(
+            f"Found real odds line for {player.name} {stat_type}: "
+            f"{line_data['line']} ({line_data['bookmaker']})"
         )
+        actual_bookmaker = line_data.get("bookmaker", bookmaker)
+        fetched_at = datetime.fromisoformat(index.compiled_at)
 
-        # Cache the response even if it's empty (to prevent repeated failed calls)
-        if odds_response is not None:
-            self._odds_cache[cache_key] = (odds_response, current_time)
-
-        return odds_response
+        return {
+            "line": line_data["line"],
+            "line_open": line_data["line"],  # TODO: fetch opening line separately
+            "over_price": line_data.get("over_price", -110),
+            "under_price": line_data.get("under_price", -110),
+            "bookmaker": actual_bookmaker,
+            "line_source": actual_bookmaker,  # Track actual source
+            "fetched_at": line_data.get("fetched_at", index.compiled_at),
+            "odds_fetched_at": fetched_at,  # For database storage
+            "odds_last_updated": fetched_at  # For database storage
+        }
 
     def _estimate_line_from_season_stats(
         self,
@@ -1553,10 +1612,7 @@ class EnhancedPredictionService:
             Dict with estimated line data
         """
         # Get season stats
-        season_stats = self.db.query(PlayerSeasonStats).filter(
-            PlayerSeasonStats.player_id == player.id,
-            PlayerSeasonStats.season == self.season
-        ).first()
+        season_stats = self._get_season_stats(player.id)
 
         if season_stats:
             per_game_value = getattr(season_stats, f"{stat_type}_per_36", None)
@@ -1696,10 +1752,7 @@ class EnhancedPredictionService:
         from datetime import date, datetime
 
         # Get player's season stats which has last_game_date
-        season_stats = self.db.query(PlayerSeasonStats).filter(
-            PlayerSeasonStats.player_id == player.id,
-            PlayerSeasonStats.season == self.season
-        ).first()
+        season_stats = self._get_season_stats(player.id)
 
         if not season_stats or not season_stats.last_game_date:
             # No previous game found (rookie/first game)
@@ -0,0 +1,260 @@
+"""
+Slate Feature Loader for NBA prop predictions.
+
+EnhancedPredictionService used to look up season stats, recent box scores and
+injuries one player (and often one stat type) at a time, which cost hundreds
+of round trips per game. This module loads every feature the projection path
+needs for a set of games in a fixed number of queries:
+
+    1. Roster players for every team on the slate
+    2. Injuries (OUT / DOUBTFUL / QUESTIONABLE) reported for those teams
+    3. PlayerSeasonStats for roster players and injured players
+    4. Last N PlayerStats rows per player (window function, one query)
+    5. ExpectedLineup rows for the games
+
+The result is an in-memory SlateFeatures bundle that the prediction service
+reads from, so generation time scales with the number of games instead of
+players × stat types × queries.
+
+Usage:
+    from app.services.nba.feature_loader import SlateFeatureLoader
+
+    loader = SlateFeatureLoader(db, season="2025-26")
+    features = loader.load_for_games(games)
+    stats = features.get_season_stats(player_id)
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, aliased
+
+from app.models import (
+    Player, Game, PlayerStats, PlayerSeasonStats, PlayerInjury, ExpectedLineup
+)
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Statuses treated as unavailable by both the roster filter and the
+# teammate usage boost (mirrors InjuryService.filter_by_injury_status)
+UNAVAILABLE_STATUSES = ("OUT", "DOUBTFUL", "QUESTIONABLE")
+
+# Injury reports older than this are ignored
+INJURY_LOOKBACK_DAYS = 7
+
+
+@dataclass
+class InjuredPlayer:
+    """Injured player row used for teammate usage calculations."""
+    id: str
+    position: Optional[str]
+    name: str
+    status: str
+
+
+@dataclass
+class SlateFeatures:
+    """
+    In-memory feature bundle for every player in a set of games.
+
+    Lookups return None / empty lists for players that were loaded but have
+    no data; use covers_player() / covers_team() to tell whether a player or
+    team is part of the bundle at all.
+    """
+    season: str
+    games_back: int
+    game_ids: Set[str] = field(default_factory=set)
+    teams: Set[str] = field(default_factory=set)
+    players_by_team: Dict[str, List[Player]] = field(default_factory=dict)
+    season_stats: Dict[str, PlayerSeasonStats] = field(default_factory=dict)
+    recent_stats: Dict[str, List[PlayerStats]] = field(default_factory=dict)
+    injuries_by_team: Dict[str, List[InjuredPlayer]] = field(default_factory=dict)
+    lineups: Dict[Tuple[str, str], ExpectedLineup] = field(default_factory=dict)
+    player_ids: Set[str] = field(default_factory=set)
+    # Memoized (opponent, position, stat_type) -> defensive adjustment
+    opponent_adjustments: Dict[Tuple[str, str, str], float] = field(default_factory=dict)
+    # Memoized (player_id, stat_type, games_back) -> recent form dict
+    recent_form: Dict[Tuple[str, str, int], Optional[Dict]] = field(default_factory=dict)
+    query_count: int = 0
+
+    def covers_game(self, game: Game) -> bool:
+        return game.id in self.game_ids
+
+    def covers_team(self, team: str) -> bool:
+        return team in self.teams
+
+    def covers_player(self, player_id: str) -> bool:
+        return player_id in self.player_ids
+
+    def get_roster(self, team: str) -> List[Player]:
+        return self.players_by_team.get(team, [])
+
+    def get_season_stats(self, player_id: str) -> Optional[PlayerSeasonStats]:
+        return self.season_stats.get(player_id)
+
+    def get_recent_stats(self, player_id: str, games_back: int) -> List[PlayerStats]:
+        return self.recent_stats.get(player_id, [])[:games_back]
+
+    def get_team_injuries(self, team: str) -> List[InjuredPlayer]:
+        return self.injuries_by_team.get(team, [])
+
+    def get_injured_ids(self) -> Set[str]:
+        return {
+            inj.id
+            for injuries in self.injuries_by_team.values()
+            for inj in injuries
+        }
+
+    def get_lineup(self, game_id: str, player_id: str) -> Optional[ExpectedLineup]:
+        return self.lineups.get((game_id, player_id))
+
+
+class SlateFeatureLoader:
+    """Load SlateFeatures for one game or a whole date's slate."""
+
+    def __init__(self, db: Session, season: str = "2025-26", games_back: int = 10):
+        """
+        Initialize the loader.
+
+        Args:
+            db: Database session
+            season: NBA season for PlayerSeasonStats (e.g., "2025-26")
+            games_back: Number of recent PlayerStats rows kept per player
+        """
+        self.db = db
+        self.season = season
+        self.games_back = games_back
+
+    def load_for_date(self, game_date: date) -> SlateFeatures:
+        """Load features for every NBA game on a date."""
+        start = datetime.combine(game_date, time.min)
+        games = self.db.query(Game).filter(
+            Game.sport_id == "nba",
+            Game.game_date >= start,
+            Game.game_date < start + timedelta(days=1)
+        ).all()
+        features = self.load_for_games(games)
+        features.query_count += 1
+        return features
+
+    def load_for_games(self, games: Iterable[Game]) -> SlateFeatures:
+        """
+        Load features for every player in the given games.
+
+        Issues at most five queries regardless of slate size.
+
+        Args:
+            games: Game model instances
+
+        Returns:
+            SlateFeatures bundle
+        """
+        games = list(games)
+        features = SlateFeatures(season=self.season, games_back=self.games_back)
+        if not games:
+            return features
+
+        features.game_ids = {g.id for g in games}
+        features.teams = {t for g in games for t in (g.home_team, g.away_team) if t}
+        teams = list(features.teams)
+
+        # 1. Roster players
+        players = self.db.query(Player).filter(
+            Player.team.in_(teams),
+            Player.active == True,
+            Player.sport_id == "nba"
+        ).all()
+        features.query_count += 1
+
+        for team in teams:
+            features.players_by_team[team] = []
+        for p in players:
+            features.players_by_team[p.team].append(p)
+            features.player_ids.add(p.id)
+
+        # 2. Injuries for every team on the slate
+        cutoff_date = date.today() - timedelta(days=INJURY_LOOKBACK_DAYS)
+        injury_rows = self.db.query(
+            Player.id, Player.position, Player.name, Player.team, PlayerInjury.status
+        ).join(
+            PlayerInjury, PlayerInjury.player_id == Player.id
+        ).filter(
+            Player.team.in_(teams),
+            PlayerInjury.reported_date >= cutoff_date,
+            func.upper(PlayerInjury.status).in_(UNAVAILABLE_STATUSES)
+        ).all()
+        features.query_count += 1
+
+        seen: Set[Tuple[str, str]] = set()
+        for team in teams:
+            features.injuries_by_team[team] = []
+        for row in injury_rows:
+            # DISTINCT on player per team, matching the old per-team query
+            if (row.team, row.id) in seen:
+                continue
+            seen.add((row.team, row.id))
+            features.injuries_by_team[row.team].append(
+                InjuredPlayer(id=row.id, position=row.position, name=row.name, status=row.status)
+            )
+
+        # 3. Season stats for roster and injured players
+        stat_player_ids = features.player_ids | {row.id for row in injury_rows}
+        if stat_player_ids:
+            season_rows = self.db.query(PlayerSeasonStats).filter(
+                PlayerSeasonStats.player_id.in_(list(stat_player_ids)),
+                PlayerSeasonStats.season == self.season
+            ).all()
+            features.query_count += 1
+            features.season_stats = {s.player_id: s for s in season_rows}
+
+        # 4. Last N box scores per roster player
+        if features.player_ids:
+            features.recent_stats = self._load_recent_stats(list(features.player_ids))
+            features.query_count += 1
+
+        # 5. Expected lineups for the games
+        lineup_rows = self.db.query(ExpectedLineup).filter(
+            ExpectedLineup.game_id.in_(list(features.game_ids))
+        ).all()
+        features.query_count += 1
+        for lineup in lineup_rows:
+            features.lineups[(lineup.game_id, lineup.player_id)] = lineup
+
+        logger.info(
+            f"Loaded slate features for {len(games)} games: "
+            f"{len(features.player_ids)} players, "
+            f"{len(features.season_stats)} season stat rows, "
+            f"{sum(len(v) for v in features.recent_stats.values())} box scores, "
+            f"{len(seen)} injuries in {features.query_count} queries"
+        )
+
+        return features
+
+    def _load_recent_stats(self, player_ids: List[str]) -> Dict[str, List[PlayerStats]]:
+        """
+        Fetch the last `games_back` PlayerStats rows for each player in one query.
+
+        Uses ROW_NUMBER() partitioned by player so the per-player LIMIT is
+        applied in the database (supported by PostgreSQL and SQLite 3.25+).
+        """
+        row_number = func.row_number().over(
+            partition_by=PlayerStats.player_id,
+            order_by=PlayerStats.created_at.desc()
+        ).label("rn")
+
+        ranked = self.db.query(PlayerStats, row_number).filter(
+            PlayerStats.player_id.in_(player_ids)
+        ).subquery()
+
+        recent = aliased(PlayerStats, ranked)
+        rows = self.db.query(recent).filter(
+            ranked.c.rn <= self.games_back
+        ).order_by(ranked.c.player_id, ranked.c.rn).all()
+
+        result: Dict[str, List[PlayerStats]] = defaultdict(list)
+        for row in rows:
+            result[row.player_id].append(row)
+        return dict(result)
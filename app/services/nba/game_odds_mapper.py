@@ -8,6 +8,9 @@ This service maps internal Game IDs to The Odds API event IDs using:
 
 The Game model already has an odds_api_event_id column (Phase 1).
 This service leverages that cache and provides fallback mechanisms.
+Live-query fallback results, including misses, are kept in the shared
+"game_odds_mapper" cache (app.core.cache) so unmapped games do not repeat
+the lookup on every call.
 """
 import logging
 from typing import Optional, Dict, Any
@@ -16,10 +19,17 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 
 from app.models import Game, GameMapping
+from app.core.cache import get_cache
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds to remember live-query fallback results per game
+FALLBACK_HIT_TTL = 3600
+FALLBACK_MISS_TTL = 300
+
+_NOT_CACHED = object()
+
 
 class GameOddsMapper:
     """
@@ -41,6 +51,7 @@ class GameOddsMapper:
         """
         self.db = db
         self.odds_api_service = odds_api_service
+        self._fallback_cache = get_cache("game_odds_mapper", max_size=2048)
 
     async def get_odds_event_id(
         self,
@@ -161,6 +172,19 @@ class GameOddsMapper:
         if not self.odds_api_service:
             return None
 
+        cached = self._fallback_cache.get(game.id, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached
+
+        odds_event_id = await self._match_upcoming_odds_event(game)
+        self._fallback_cache.set(
+            game.id, odds_event_id,
+            FALLBACK_HIT_TTL if odds_event_id else FALLBACK_MISS_TTL
+        )
+        return odds_event_id
+
+    async def _match_upcoming_odds_event(self, game: Game) -> Optional[str]:
+        """Find the game among upcoming Odds API events by teams and date."""
         try:
             # Fetch upcoming games from Odds API
             games_data = await self.odds_api_service.get_upcoming_games_with_odds(
@@ -278,6 +302,7 @@ class GameOddsMapper:
         Args:
             game: Game model instance
         """
+        self._fallback_cache.delete(game.id)
         if game.odds_api_event_id:
             logger.info(
                 f"Invalidating cached odds_api_event_id for game {game.id}: "
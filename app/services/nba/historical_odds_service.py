@@ -15,8 +15,17 @@ Data Flow:
 2. Resolve snapshots with actual boxscore results (post-game)
 3. Calculate hit rates per (player, stat_type, bookmaker)
 4. Apply hit rate weights to prediction confidence
+
+Resolution is a single UPDATE joining historical_odds_snapshots to
+player_stats, per game (resolve_snapshots_for_game) or for a whole season
+(resolve_unresolved_snapshots), so re-resolving a season takes seconds.
+The same transaction adds the newly resolved snapshots to the
+hit_rate_aggregates table (OVER/UNDER/PUSH counts per player, stat type,
+bookmaker, starter flag and day), which get_batch_hit_rates reads for a
+whole slate in one query.
 """
 import asyncio
+import hashlib
 import logging
 import os
 import uuid
@@ -30,10 +39,11 @@ except ImportError:
     UTC = timezone.utc
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import DateTime, and_, case, delete, func, insert, literal, select, update
 
 from app.models import (
     HistoricalOddsSnapshot,
+    HitRateAggregate,
     Player,
     Game,
     PlayerStats,
@@ -43,10 +53,53 @@ from app.services.core.odds_api_service import get_odds_service
 
 logger = logging.getLogger(__name__)
 
+# Snapshot stat_type -> player_stats column used to resolve it
+SNAPSHOT_STAT_COLUMNS = {
+    "points": "points",
+    "rebounds": "rebounds",
+    "assists": "assists",
+    "threes": "threes",
+}
+
+
+def line_fingerprint(
+    game_id: str,
+    player_id: str,
+    stat_type: str,
+    bookmaker_name: str,
+    line: Optional[float],
+    over_price: Optional[float],
+    under_price: Optional[float]
+) -> str:
+    """
+    Content hash of one bookmaker line and its prices.
+
+    Numbers are normalized to floats so 110 and 110.0 hash the same.
+
+    Returns:
+        16-character hex fingerprint
+    """
+    def num(value) -> str:
+        return "" if value is None else repr(float(value))
+
+    content = "|".join([
+        game_id, player_id, stat_type, bookmaker_name,
+        num(line), num(over_price), num(under_price)
+    ])
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
 
 class HistoricalOddsService:
     """Service for tracking historical odds and calculating hit rates."""
 
+    # Odds API player prop market -> stat type
+    MARKET_STAT_TYPES = {
+        "player_points": "points",
+        "player_rebounds": "rebounds",
+        "player_assists": "assists",
+        "player_threes": "threes"
+    }
+
     def __init__(self, db: Session):
         """
         Initialize historical odds service.
@@ -133,17 +186,26 @@ class HistoricalOddsService:
         """
         Capture odds for all players in a game from The Odds API.
 
+        Change-only ingestion: each (game, player, stat, bookmaker) line and
+        its prices are fingerprinted and compared with the last stored
+        fingerprint for that key. Only new and moved lines are written, in
+        one bulk insert, so repeated captures no longer duplicate unchanged
+        lines and the table holds an exact line-movement history.
+
         Args:
             game_id: Database UUID of the game
             starters_only: Only capture odds for players marked as starters
 
         Returns:
-            Dict with capture results: {"captured": int, "errors": int}
+            Dict with capture results:
+            {"captured": int, "new": int, "moved": int, "unchanged": int, "errors": int}
         """
+        empty = {"captured": 0, "new": 0, "moved": 0, "unchanged": 0, "errors": 0}
+
         game = self.db.query(Game).filter(Game.id == game_id).first()
         if not game:
             logger.error(f"Game {game_id} not found")
-            return {"captured": 0, "errors": 1}
+            return {**empty, "errors": 1}
 
         # Only process games with Odds API format IDs (32 character hex)
         if len(game.external_id) != 32:
@@ -151,214 +213,375 @@ class HistoricalOddsService:
                 f"Skipping {game.away_team} @ {game.home_team}: "
                 f"not an Odds API game ID format"
             )
-            return {"captured": 0, "errors": 0}
+            return empty
 
         # Fetch player props from The Odds API
         if not self.odds_api:
             logger.error("Odds API service not available (missing API key)")
-            return {"captured": 0, "errors": 1}
+            return {**empty, "errors": 1}
 
         try:
             props_data = await self.odds_api.get_event_player_props(game.external_id)
+            return self.ingest_event_props(game, props_data, starters_only=starters_only)
 
-            if not props_data.get("data") or not props_data["data"].get("bookmakers"):
-                logger.info(f"No player props available for game {game.external_id}")
-                return {"captured": 0, "errors": 0}
+        except Exception as e:
+            logger.error(f"Error batch capturing game odds: {e}")
+            self.db.rollback()
+            return {**empty, "errors": 1}
 
-            captured = 0
-            errors = 0
+    def ingest_event_props(
+        self,
+        game: Game,
+        props_data: Dict,
+        starters_only: bool = True
+    ) -> Dict[str, int]:
+        """
+        Persist the new and moved lines from one event's props payload.
 
-            # Get starters for this game if filtering
-            starter_ids = set()
-            if starters_only:
-                starters = self.db.query(ExpectedLineup).filter(
-                    ExpectedLineup.game_id == game_id,
-                    ExpectedLineup.starter_position.isnot(None)
-                ).all()
-                starter_ids = {s.player_id for s in starters}
-
-            # Process each bookmaker's player props
-            for bookmaker in props_data["data"].get("bookmakers", []):
-                bookmaker_name = bookmaker.get("title", "Unknown")
-
-                for market in bookmaker.get("markets", []):
-                    market_key = market.get("key")  # e.g., "player_points"
-
-                    # Map market key to stat_type
-                    stat_type_map = {
-                        "player_points": "points",
-                        "player_rebounds": "rebounds",
-                        "player_assists": "assists",
-                        "player_threes": "threes"
-                    }
-
-                    stat_type = stat_type_map.get(market_key)
-                    if not stat_type:
-                        continue
+        This is the parse/persist stage of batch_capture_game_odds, also fed
+        directly by slate-level fetchers that stream payloads as they arrive.
 
-                    for outcome in market.get("outcomes", []):
-                        player_name = outcome.get("name")
-                        if not player_name:
-                            continue
-
-                        # Find player by name and team
-                        player = self.db.query(Player).filter(
-                            Player.name.ilike(f"%{player_name}%"),
-                            Player.team.in_([game.away_team, game.home_team])
-                        ).first()
-
-                        if not player:
-                            logger.debug(f"Player not found: {player_name}")
-                            errors += 1
-                            continue
-
-                        # Skip if starters_only and player not a starter
-                        if starters_only and player.id not in starter_ids:
-                            continue
-
-                        # Check if snapshot already exists for this combination
-                        existing = self.db.query(HistoricalOddsSnapshot).filter(
-                            HistoricalOddsSnapshot.game_id == game_id,
-                            HistoricalOddsSnapshot.player_id == player.id,
-                            HistoricalOddsSnapshot.stat_type == stat_type,
-                            HistoricalOddsSnapshot.bookmaker_name == bookmaker_name
-                        ).first()
-
-                        if existing:
-                            logger.debug(
-                                f"Snapshot already exists for {player_name} "
-                                f"{stat_type} from {bookmaker_name}"
-                            )
-                            continue
-
-                        # Parse odds
-                        bookmaker_line = outcome.get("point")
-                        over_price = outcome.get("price")  # For OVER outcome
-                        # UNDER price would be in a different outcome
-
-                        # Create snapshot
-                        snapshot = await self.capture_odds_snapshot(
-                            game_id=game_id,
-                            player_id=player.id,
-                            stat_type=stat_type,
-                            bookmaker_name=bookmaker_name,
-                            bookmaker_line=bookmaker_line,
-                            over_price=over_price,
-                            under_price=None,  # Would need to find UNDER outcome
-                            was_starter=player.id in starter_ids if starters_only else False
-                        )
-
-                        if snapshot:
-                            captured += 1
-                        else:
-                            errors += 1
+        Args:
+            game: Game the event belongs to
+            props_data: Result of OddsApiService.get_event_player_props
+            starters_only: Only capture odds for players marked as starters
 
-            self.db.commit()
-            logger.info(
-                f"Captured {captured} odds snapshots for "
-                f"{game.away_team} @ {game.home_team}"
+        Returns:
+            Dict with capture results:
+            {"captured": int, "new": int, "moved": int, "unchanged": int, "errors": int}
+        """
+        game_id = game.id
+        if not props_data.get("data") or not props_data["data"].get("bookmakers"):
+            logger.info(f"No player props available for game {game.external_id}")
+            return {"captured": 0, "new": 0, "moved": 0, "unchanged": 0, "errors": 0}
+
+        # Get starters for this game if filtering
+        starter_ids = set()
+        if starters_only:
+            starters = self.db.query(ExpectedLineup.player_id).filter(
+                ExpectedLineup.game_id == game_id,
+                ExpectedLineup.starter_position.isnot(None)
+            ).all()
+            starter_ids = {s.player_id for s in starters}
+
+        find_player = self._player_finder(game)
+        last_fingerprints = self._last_line_fingerprints(game_id)
+
+        now = datetime.now(UTC)
+        rows = []
+        counts = {"new": 0, "moved": 0, "unchanged": 0, "errors": 0}
+
+        for line in self._iter_prop_lines(props_data["data"]):
+            player = find_player(line["player_name"])
+            if not player:
+                logger.debug(f"Player not found: {line['player_name']}")
+                counts["errors"] += 1
+                continue
+
+            # Skip if starters_only and player not a starter
+            if starters_only and player.id not in starter_ids:
+                continue
+
+            key = (player.id, line["stat_type"], line["bookmaker_name"])
+            fingerprint = line_fingerprint(
+                game_id, *key, line["line"], line["over_price"], line["under_price"]
             )
+            previous = last_fingerprints.get(key)
+            if previous == fingerprint:
+                counts["unchanged"] += 1
+                continue
+
+            counts["moved" if previous else "new"] += 1
+            last_fingerprints[key] = fingerprint
+            rows.append({
+                "id": str(uuid.uuid4()),
+                "game_id": game_id,
+                "player_id": player.id,
+                "stat_type": line["stat_type"],
+                "bookmaker_name": line["bookmaker_name"],
+                "bookmaker_line": line["line"],
+                "over_price": line["over_price"],
+                "under_price": line["under_price"],
+                "line_hash": fingerprint,
+                "snapshot_time": now,
+                "is_opening_line": False,
+                "line_movement": 0.0,
+                "was_starter": player.id in starter_ids if starters_only else False,
+                "created_at": now,
+            })
+
+        if rows:
+            self.db.execute(insert(HistoricalOddsSnapshot), rows)
+        self.db.commit()
+
+        logger.info(
+            f"Captured {len(rows)} odds snapshots for "
+            f"{game.away_team} @ {game.home_team} "
+            f"({counts['new']} new, {counts['moved']} moved, "
+            f"{counts['unchanged']} unchanged)"
+        )
 
-            return {"captured": captured, "errors": errors}
+        return {"captured": len(rows), **counts}
 
-        except Exception as e:
-            logger.error(f"Error batch capturing game odds: {e}")
-            self.db.rollback()
-            return {"captured": 0, "errors": 1}
+    def _iter_prop_lines(self, event_data: Dict):
+        """
+        Yield one line per (bookmaker, market, player) from an event props payload.
+
+        Over and Under outcomes for the same player are paired so each line
+        carries both prices.
+        """
+        for bookmaker in event_data.get("bookmakers", []):
+            bookmaker_name = bookmaker.get("title", "Unknown")
+
+            for market in bookmaker.get("markets", []):
+                stat_type = self.MARKET_STAT_TYPES.get(market.get("key"))
+                if not stat_type:
+                    continue
+
+                lines: Dict[str, Dict] = {}
+                for outcome in market.get("outcomes", []):
+                    # Player props put the player in "description" and Over/Under in "name"
+                    player_name = outcome.get("description") or outcome.get("name")
+                    point = outcome.get("point")
+                    if not player_name or point is None:
+                        continue
+
+                    line = lines.setdefault(player_name, {
+                        "player_name": player_name,
+                        "stat_type": stat_type,
+                        "bookmaker_name": bookmaker_name,
+                        "line": float(point),
+                        "over_price": None,
+                        "under_price": None,
+                    })
+                    side = (outcome.get("name") or "").lower()
+                    if side == "under":
+                        line["under_price"] = outcome.get("price")
+                    else:
+                        line["over_price"] = outcome.get("price")
+
+                yield from lines.values()
+
+    def _player_finder(self, game: Game):
+        """
+        Resolve prop player names against the two teams' rosters.
+
+        Loads the rosters in one query; matching is exact (case-insensitive)
+        first, then the previous substring match on the player's name.
+        """
+        players = self.db.query(Player).filter(
+            Player.team.in_([game.away_team, game.home_team])
+        ).all()
+        by_name = {}
+        for player in players:
+            by_name.setdefault((player.name or "").lower(), player)
+        cache: Dict[str, Optional[Player]] = {}
+
+        def find(player_name: str) -> Optional[Player]:
+            key = player_name.lower()
+            if key not in cache:
+                player = by_name.get(key)
+                if player is None:
+                    player = next((p for name, p in by_name.items() if key in name), None)
+                cache[key] = player
+            return cache[key]
+
+        return find
+
+    def _last_line_fingerprints(self, game_id: str) -> Dict[tuple, str]:
+        """
+        Fingerprint of the most recent stored line per (player, stat, bookmaker).
+
+        Rows stored before fingerprints existed are fingerprinted from their
+        line and prices.
+        """
+        rows = self.db.query(
+            HistoricalOddsSnapshot.player_id,
+            HistoricalOddsSnapshot.stat_type,
+            HistoricalOddsSnapshot.bookmaker_name,
+            HistoricalOddsSnapshot.bookmaker_line,
+            HistoricalOddsSnapshot.over_price,
+            HistoricalOddsSnapshot.under_price,
+            HistoricalOddsSnapshot.line_hash,
+        ).filter(
+            HistoricalOddsSnapshot.game_id == game_id
+        ).order_by(HistoricalOddsSnapshot.snapshot_time).all()
+
+        fingerprints = {}
+        for row in rows:
+            key = (row.player_id, row.stat_type, row.bookmaker_name)
+            fingerprints[key] = row.line_hash or line_fingerprint(
+                game_id, *key, row.bookmaker_line, row.over_price, row.under_price
+            )
+        return fingerprints
 
     def resolve_snapshots_for_game(self, game_id: str) -> Dict[str, int]:
         """
         Resolve snapshots with actual game results.
 
         Fetches actual stats from PlayerStats and updates snapshots
-        with hit_result (OVER, UNDER, PUSH).
+        with hit_result (OVER, UNDER, PUSH) in one statement.
 
         Args:
             game_id: Database UUID of the game
 
         Returns:
             Dict with resolution results: {"resolved": int, "errors": int}
+            (errors: snapshots left unresolved for lack of a stat value)
         """
-        # Get unresolved snapshots for this game
-        snapshots = self.db.query(HistoricalOddsSnapshot).filter(
-            HistoricalOddsSnapshot.game_id == game_id,
-            HistoricalOddsSnapshot.hit_result.is_(None)
-        ).all()
-
-        resolved_count = 0
-        error_count = 0
-
-        for snapshot in snapshots:
-            try:
-                # Get actual stats from PlayerStats
-                player_stat = self.db.query(PlayerStats).filter(
-                    PlayerStats.player_id == snapshot.player_id,
-                    PlayerStats.game_id == game_id
-                ).first()
-
-                if not player_stat:
-                    logger.debug(
-                        f"No player stats found for snapshot {snapshot.id} "
-                        f"(player_id: {snapshot.player_id}, game_id: {game_id})"
-                    )
-                    error_count += 1
-                    continue
+        return self._resolve_snapshots(
+            HistoricalOddsSnapshot.game_id == game_id, f"game {game_id}"
+        )
 
-                # Get actual value based on stat_type
-                stat_to_field = {
-                    "points": player_stat.points,
-                    "rebounds": player_stat.rebounds,
-                    "assists": player_stat.assists,
-                    "threes": player_stat.threes
-                }
-
-                actual_value = stat_to_field.get(snapshot.stat_type)
-                if actual_value is None:
-                    logger.debug(
-                        f"Stat value not found for {snapshot.stat_type} "
-                        f"in player stats"
-                    )
-                    error_count += 1
-                    continue
+    def resolve_unresolved_snapshots(self, season: Optional[int] = None) -> Dict[str, int]:
+        """
+        Resolve every unresolved snapshot at once (season backfill).
 
-                # Determine hit result
-                if actual_value > snapshot.bookmaker_line:
-                    hit_result = "OVER"
-                elif actual_value < snapshot.bookmaker_line:
-                    hit_result = "UNDER"
-                else:
-                    hit_result = "PUSH"
+        Args:
+            season: Only snapshots of this season's games (default: all seasons)
 
-                # Update snapshot
-                snapshot.actual_value = actual_value
-                snapshot.hit_result = hit_result
-                snapshot.resolved_at = datetime.now(UTC)
+        Returns:
+            Dict with resolution results: {"resolved": int, "errors": int}
+        """
+        if season is None:
+            return self._resolve_snapshots(None, "all seasons")
+        return self._resolve_snapshots(
+            HistoricalOddsSnapshot.game_id.in_(select(Game.id).where(Game.season == season)),
+            f"season {season}"
+        )
 
-                resolved_count += 1
+    def _resolve_snapshots(self, scope, label: str) -> Dict[str, int]:
+        """
+        Resolve unresolved snapshots in scope with one UPDATE ... FROM player_stats.
 
-                logger.debug(
-                    f"Resolved snapshot: {snapshot.stat_type} "
-                    f"line={snapshot.bookmaker_line} actual={actual_value} "
-                    f"result={hit_result}"
-                )
+        The stat type picks the player_stats column and OVER/UNDER/PUSH is
+        decided in SQL; snapshots without a matching stat value are left
+        unresolved and counted as errors. Newly resolved snapshots are added
+        to hit_rate_aggregates in the same transaction.
 
-            except Exception as e:
-                logger.error(f"Error resolving snapshot {snapshot.id}: {e}")
-                error_count += 1
+        Args:
+            scope: Extra WHERE criterion on historical_odds_snapshots (None: all)
+            label: Scope description for logging
+        """
+        snapshot = HistoricalOddsSnapshot
+        resolved_at = datetime.now(UTC)
+        actual_value = case(
+            {stat_type: getattr(PlayerStats, column) for stat_type, column in SNAPSHOT_STAT_COLUMNS.items()},
+            value=snapshot.stat_type
+        )
+        criteria = [snapshot.hit_result.is_(None)]
+        if scope is not None:
+            criteria.append(scope)
+
+        stmt = (
+            update(snapshot)
+            .where(
+                *criteria,
+                PlayerStats.player_id == snapshot.player_id,
+                PlayerStats.game_id == snapshot.game_id,
+                actual_value.isnot(None)
+            )
+            .values(
+                actual_value=actual_value,
+                hit_result=case(
+                    (actual_value > snapshot.bookmaker_line, "OVER"),
+                    (actual_value < snapshot.bookmaker_line, "UNDER"),
+                    else_="PUSH"
+                ),
+                resolved_at=resolved_at
+            )
+            .execution_options(synchronize_session=False)
+        )
 
         try:
+            resolved_count = self.db.execute(stmt).rowcount
+            if resolved_count:
+                resolved_now = [snapshot.resolved_at == resolved_at]
+                if scope is not None:
+                    resolved_now.append(scope)
+                self._add_to_hit_rate_aggregates(*resolved_now)
+            error_count = self.db.query(func.count(snapshot.id)).filter(*criteria).scalar()
             self.db.commit()
             logger.info(
-                f"Resolved {resolved_count} snapshots for game {game_id} "
+                f"Resolved {resolved_count} snapshots for {label} "
                 f"({error_count} errors)"
             )
         except Exception as e:
-            logger.error(f"Error committing resolved snapshots: {e}")
+            logger.error(f"Error resolving snapshots for {label}: {e}")
             self.db.rollback()
-            return {"resolved": 0, "errors": error_count}
+            return {"resolved": 0, "errors": 0}
 
         return {"resolved": resolved_count, "errors": error_count}
 
+    def _add_to_hit_rate_aggregates(self, *criteria) -> None:
+        """
+        Add resolved snapshots matching criteria to hit_rate_aggregates.
+
+        One INSERT ... SELECT ... GROUP BY with ON CONFLICT adding the
+        counts to existing (player, stat type, bookmaker, starter, day) rows.
+        """
+        snapshot = HistoricalOddsSnapshot
+        bucket_date = func.date(snapshot.snapshot_time)
+        counts = (
+            select(
+                snapshot.player_id,
+                snapshot.stat_type,
+                snapshot.bookmaker_name,
+                snapshot.was_starter,
+                bucket_date,
+                func.sum(case((snapshot.hit_result == "OVER", 1), else_=0)),
+                func.sum(case((snapshot.hit_result == "UNDER", 1), else_=0)),
+                func.sum(case((snapshot.hit_result == "PUSH", 1), else_=0)),
+                literal(datetime.utcnow(), DateTime)
+            )
+            .where(snapshot.hit_result.isnot(None), *criteria)
+            .group_by(
+                snapshot.player_id, snapshot.stat_type, snapshot.bookmaker_name,
+                snapshot.was_starter, bucket_date
+            )
+        )
+
+        if self.db.get_bind().dialect.name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(HitRateAggregate).from_select(
+            ['player_id', 'stat_type', 'bookmaker_name', 'was_starter', 'bucket_date',
+             'over_hits', 'under_hits', 'pushes', 'updated_at'],
+            counts
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                HitRateAggregate.player_id, HitRateAggregate.stat_type,
+                HitRateAggregate.bookmaker_name, HitRateAggregate.was_starter,
+                HitRateAggregate.bucket_date
+            ],
+            set_={
+                'over_hits': HitRateAggregate.over_hits + stmt.excluded.over_hits,
+                'under_hits': HitRateAggregate.under_hits + stmt.excluded.under_hits,
+                'pushes': HitRateAggregate.pushes + stmt.excluded.pushes,
+                'updated_at': stmt.excluded.updated_at,
+            }
+        )
+        self.db.execute(stmt)
+
+    def rebuild_hit_rate_aggregates(self) -> int:
+        """
+        Recompute hit_rate_aggregates from every resolved snapshot.
+
+        For data resolved before the table existed or edited by hand.
+
+        Returns:
+            Number of aggregate rows written
+        """
+        self.db.execute(delete(HitRateAggregate))
+        self._add_to_hit_rate_aggregates()
+        self.db.commit()
+        rows = self.db.query(func.count()).select_from(HitRateAggregate).scalar()
+        logger.info(f"Rebuilt hit rate aggregates: {rows} rows")
+        return rows
+
     def get_player_hit_rate(
         self,
         player_id: str,
@@ -414,7 +637,17 @@ class HistoricalOddsService:
 
         snapshots = query.all()
 
-        if not snapshots:
+        return self._hit_rate_stats(
+            over_hits=sum(1 for s in snapshots if s.hit_result == "OVER"),
+            under_hits=sum(1 for s in snapshots if s.hit_result == "UNDER"),
+            pushes=sum(1 for s in snapshots if s.hit_result == "PUSH")
+        )
+
+    @staticmethod
+    def _hit_rate_stats(over_hits: int, under_hits: int, pushes: int) -> Dict[str, any]:
+        """Hit rate dict (as returned by get_player_hit_rate) from result counts."""
+        total = over_hits + under_hits + pushes
+        if not total:
             return {
                 "hit_rate": 0.500,  # Neutral when no data
                 "total_games": 0,
@@ -425,12 +658,7 @@ class HistoricalOddsService:
             }
 
         # Calculate hit rate
-        over_hits = sum(1 for s in snapshots if s.hit_result == "OVER")
-        under_hits = sum(1 for s in snapshots if s.hit_result == "UNDER")
-        pushes = sum(1 for s in snapshots if s.hit_result == "PUSH")
-        total = len(snapshots)
-
-        hit_rate = over_hits / total if total > 0 else 0.5
+        hit_rate = over_hits / total
 
         # Determine sample size adjective
         if total >= 10:
@@ -502,7 +730,11 @@ class HistoricalOddsService:
         """
         Get hit rates for multiple players at once.
 
-        Useful for generating predictions for multiple players.
+        Useful for generating predictions for multiple players. Served from
+        hit_rate_aggregates in one query: per player and stat type, the most
+        recent days within the get_player_hit_rate window are summed until
+        they cover games_back snapshots (whole days, so the last day counted
+        may take the sample slightly past games_back).
 
         Args:
             player_ids: List of player database UUIDs
@@ -520,17 +752,46 @@ class HistoricalOddsService:
                 ...
             }
         """
-        results = {}
+        counts = {
+            (player_id, stat_type): [0, 0, 0]
+            for player_id in player_ids
+            for stat_type in stat_types
+        }
 
-        for player_id in player_ids:
-            results[player_id] = {}
-            for stat_type in stat_types:
-                results[player_id][stat_type] = self.get_player_hit_rate(
-                    player_id=player_id,
-                    stat_type=stat_type,
-                    games_back=games_back,
-                    starters_only=starters_only
-                )
+        if counts:
+            aggregate = HitRateAggregate
+            cutoff_date = (datetime.now(UTC) - timedelta(days=games_back * 2)).date()
+            query = self.db.query(
+                aggregate.player_id,
+                aggregate.stat_type,
+                aggregate.bucket_date,
+                func.sum(aggregate.over_hits),
+                func.sum(aggregate.under_hits),
+                func.sum(aggregate.pushes)
+            ).filter(
+                aggregate.player_id.in_(list(dict.fromkeys(player_ids))),
+                aggregate.stat_type.in_(list(dict.fromkeys(stat_types))),
+                aggregate.bucket_date >= cutoff_date
+            )
+            if starters_only:
+                query = query.filter(aggregate.was_starter == True)
+            query = query.group_by(
+                aggregate.player_id, aggregate.stat_type, aggregate.bucket_date
+            ).order_by(aggregate.bucket_date.desc())
+
+            for player_id, stat_type, _, over_hits, under_hits, pushes in query:
+                totals = counts[(player_id, stat_type)]
+                if sum(totals) >= games_back:
+                    continue
+                totals[0] += over_hits
+                totals[1] += under_hits
+                totals[2] += pushes
+
+        results = {}
+        for (player_id, stat_type), (over_hits, under_hits, pushes) in counts.items():
+            results.setdefault(player_id, {})[stat_type] = self._hit_rate_stats(
+                over_hits, under_hits, pushes
+            )
 
         return results
 
@@ -576,30 +837,44 @@ class HistoricalOddsService:
         resolved_total = 0
         errors = []
 
-        for game in games_without_snapshots:
-            try:
-                logger.info(
-                    f"Processing game {game.external_id}: "
-                    f"{game.away_team} @ {game.home_team}"
-                )
-
-                # Capture odds (using current API for historical event odds)
-                capture_result = await self.batch_capture_game_odds(
-                    game_id=str(game.id),
-                    starters_only=starters_only
-                )
-                captured_total += capture_result.get("captured", 0)
-
-                # Resolve with actual results
-                resolve_result = self.resolve_snapshots_for_game(str(game.id))
-                resolved_total += resolve_result.get("resolved", 0)
-
-                if resolve_result.get("errors", 0) > 0:
-                    errors.append(f"{game.external_id}: {resolve_result['errors']} errors")
-
-            except Exception as e:
-                errors.append(f"{game.external_id}: {str(e)}")
-                logger.error(f"Error processing game {game.external_id}: {e}")
+        # Only games with Odds API format IDs (32 character hex) have event props
+        games_by_event = {
+            game.external_id: game for game in games_without_snapshots
+            if game.external_id and len(game.external_id) == 32
+        }
+        if games_by_event and not self.odds_api:
+            logger.error("Odds API service not available (missing API key)")
+            errors.append("Odds API service not available (missing API key)")
+            games_by_event = {}
+
+        # Fetch every game's props concurrently; capture and resolve each
+        # one as its response arrives
+        if games_by_event:
+            async for event_id, props_data in self.odds_api.stream_event_player_props(games_by_event):
+                game = games_by_event[event_id]
+                try:
+                    logger.info(
+                        f"Processing game {game.external_id}: "
+                        f"{game.away_team} @ {game.home_team}"
+                    )
+
+                    # Capture odds (using current API for historical event odds)
+                    capture_result = self.ingest_event_props(
+                        game, props_data, starters_only=starters_only
+                    )
+                    captured_total += capture_result.get("captured", 0)
+
+                    # Resolve with actual results
+                    resolve_result = self.resolve_snapshots_for_game(str(game.id))
+                    resolved_total += resolve_result.get("resolved", 0)
+
+                    if resolve_result.get("errors", 0) > 0:
+                        errors.append(f"{game.external_id}: {resolve_result['errors']} errors")
+
+                except Exception as e:
+                    self.db.rollback()
+                    errors.append(f"{game.external_id}: {str(e)}")
+                    logger.error(f"Error processing game {game.external_id}: {e}")
 
         return {
             "processed": len(games_without_snapshots),
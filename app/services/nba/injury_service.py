@@ -16,7 +16,6 @@ Research-backed approach:
 - Source: https://www.jssm.org/volume24/iss2/cap/jssm-24-363.pdf
 - Minutes restrictions typically 15-25 minutes initially
 """
-import asyncio
 import re
 import httpx
 from datetime import date, datetime, timedelta
@@ -28,6 +27,7 @@ import uuid
 from pydantic import BaseModel
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from app.core.cache import get_cache
 from app.models import PlayerInjury, Player, Game
 
 logger = logging.getLogger(__name__)
@@ -62,17 +62,6 @@ INJURY_KEYWORDS = [
 ]
 
 
-class CacheEntry:
-    """Simple cache entry with TTL."""
-    def __init__(self, data: any, valid_until: datetime):
-        self.data = data
-        self.valid_until = valid_until
-
-    def is_valid(self) -> bool:
-        """Check if cache entry is still valid."""
-        return datetime.now() < self.valid_until
-
-
 class InjuryContext(BaseModel):
     """Injury context for a player."""
     self_injury: Optional[Dict] = None  # Player's own injury status
@@ -100,8 +89,8 @@ class InjuryService:
         """
         self.db = db
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = asyncio.Lock()
+        # Shared bounded cache (app.core.cache) for every instance
+        self._cache = get_cache("injuries", max_size=256, default_ttl=cache_ttl)
 
     def _get_cache_key(self, endpoint: str, **kwargs) -> str:
         """Generate cache key from endpoint name and parameters."""
@@ -110,18 +99,11 @@ class InjuryService:
 
     async def _get_cached(self, key: str) -> Optional[any]:
         """Get data from cache if valid."""
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry and entry.is_valid():
-                return entry.data
-        return None
+        return self._cache.get(key)
 
     async def _set_cache(self, key: str, data: any, ttl: Optional[int] = None):
         """Set data in cache with TTL."""
-        ttl = ttl or self.cache_ttl
-        valid_until = datetime.now() + timedelta(seconds=ttl)
-        async with self._lock:
-            self._cache[key] = CacheEntry(data, valid_until)
+        self._cache.set(key, data, ttl or self.cache_ttl)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -15,9 +15,8 @@ Example - Jay Huff:
 - Actual: Bench role, 10 minutes → 2.0 points actual (83% error)
 - New approach: Bench projection (10-15 min) → ~4 points predicted (much closer!)
 """
-import asyncio
 import httpx
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
@@ -25,6 +24,8 @@ import logging
 import uuid
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from app.core.cache import get_cache
+
 logger = logging.getLogger(__name__)
 
 # Firecrawl configuration
@@ -46,17 +47,6 @@ DEFAULT_MINUTES = {
 }
 
 
-class CacheEntry:
-    """Simple cache entry with TTL."""
-    def __init__(self, data: any, valid_until: datetime):
-        self.data = data
-        self.valid_until = valid_until
-
-    def is_valid(self) -> bool:
-        """Check if cache entry is still valid."""
-        return datetime.now() < self.valid_until
-
-
 class LineupService:
     """
     Lineup tracking and projection service.
@@ -75,8 +65,8 @@ class LineupService:
         """
         self.db = db
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = asyncio.Lock()
+        # Shared bounded cache (app.core.cache) for every instance
+        self._cache = get_cache("lineups", max_size=256, default_ttl=cache_ttl)
 
     def _get_cache_key(self, endpoint: str, **kwargs) -> str:
         """Generate cache key from endpoint name and parameters."""
@@ -85,18 +75,11 @@ class LineupService:
 
     async def _get_cached(self, key: str) -> Optional[any]:
         """Get data from cache if valid."""
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry and entry.is_valid():
-                return entry.data
-        return None
+        return self._cache.get(key)
 
     async def _set_cache(self, key: str, data: any, ttl: Optional[int] = None):
         """Set data in cache with TTL."""
-        ttl = ttl or self.cache_ttl
-        valid_until = datetime.now() + timedelta(seconds=ttl)
-        async with self._lock:
-            self._cache[key] = CacheEntry(data, valid_until)
+        self._cache.set(key, data, ttl or self.cache_ttl)
 
     @retry(
         stop=stop_after_attempt(3),
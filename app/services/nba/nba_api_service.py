@@ -18,22 +18,60 @@ import asyncio
 import logging
 import time
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
 import uuid
 
-from app.models import Player, PlayerSeasonStats
+import pandas as pd
+from sqlalchemy import or_
+
+from app.core.blocking import run_blocking
+from app.models import Game, Player, PlayerSeasonStats, PlayerStats, SyncMetadata
 
 logger = logging.getLogger(__name__)
 
 # Default season (adjust based on current date)
 DEFAULT_SEASON = "2025-26"
 
-# Rate limiting settings
-REQUEST_DELAY_SECONDS = 1.0  # Delay between requests to avoid rate limiting
+# Rate limiting settings (request spacing: NBA_API_REQUEST_DELAY in app.core.blocking)
 MAX_RETRIES = 3  # Maximum number of retries for timeout errors
 RETRY_DELAY_SECONDS = 2.0  # Initial retry delay (doubles each retry)
 
+# League-wide game log ingestion (leaguegamelog → player_stats)
+GAME_LOG_SYNC_SOURCE = "nba_api"
+GAME_LOG_SYNC_DATA_TYPE = "player_game_logs"
+GAME_LOG_STAT_COLUMNS = {  # nba_api column -> PlayerStats column
+    'PTS': 'points',
+    'REB': 'rebounds',
+    'AST': 'assists',
+    'FG3M': 'threes',
+    'PLUS_MINUS': 'plus_minus',
+}
+
+
+def configure_nba_stats_base_url(base_url: Optional[str] = None) -> None:
+    """
+    Point nba_api's stats.nba.com requests at another host.
+
+    nba_api builds every stats URL from NBAStatsHTTP.base_url, so this
+    redirects all endpoints (playergamelog, leaguedashteamstats, ...) at
+    once, e.g. to the local stand-in server used for load tests.
+
+    Args:
+        base_url: Stats root such as "http://localhost:8900/stats"
+                  (default: settings.NBA_STATS_BASE_URL; None leaves nba_api unchanged)
+    """
+    from app.core.config import settings
+
+    base_url = base_url or settings.NBA_STATS_BASE_URL
+    if not base_url:
+        return
+
+    from nba_api.stats.library.http import NBAStatsHTTP
+
+    NBAStatsHTTP.base_url = base_url.rstrip("/") + "/{endpoint}"
+    logger.info(f"nba_api stats requests redirected to {base_url}")
+
 
 class NbaApiService:
     """
@@ -64,6 +102,7 @@ class NbaApiService:
             try:
                 from nba_api.stats.static import players
                 from nba_api.stats.endpoints import playergamelog, leaguedashteamstats
+                configure_nba_stats_base_url()
                 self._nba_api = {
                     'players': players,
                     'playergamelog': playergamelog,
@@ -99,21 +138,20 @@ class NbaApiService:
             logger.error("nba_api package not available")
             return None
 
-        # Add delay before request to avoid rate limiting
-        await asyncio.sleep(REQUEST_DELAY_SECONDS)
-
-        try:
+        def fetch():
             from nba_api.stats.endpoints import playergamelog
 
             # Fetch game logs using numeric nba_api_id
-            gamelog = playergamelog.PlayerGameLog(
+            frames = playergamelog.PlayerGameLog(
                 player_id=player_nba_api_id,
                 season=season,
                 season_type_all_star='Regular Season'
-            )
+            ).get_data_frames()
+            return frames[0] if frames else None
 
-            # Get data frames
-            df = gamelog.get_data_frames()[0] if gamelog.get_data_frames() else None
+        try:
+            # Rate-limited and off the event loop
+            df = await run_blocking("nba_api", fetch)
 
             if df is None or df.empty:
                 logger.warning(f"No game logs found for nba_api_id {player_nba_api_id}")
@@ -122,17 +160,22 @@ class NbaApiService:
             # Take the last N games
             recent_games = df.tail(games_limit)
 
-            # Convert to list of dictionaries
-            games = []
-            for _, row in recent_games.iterrows():
-                games.append({
-                    'game_date': datetime.strptime(row['GAME_DATE'], '%b %d, %Y').date(),
-                    'minutes': self._parse_minutes(row.get('MIN', '0')),
-                    'points': row.get('PTS', 0),
-                    'rebounds': row.get('REB', 0),
-                    'assists': row.get('AST', 0),
-                    'threes': row.get('FG3M', 0),
-                })
+            # Convert column-wise to a list of dictionaries
+            games = [
+                {
+                    'game_date': game_date,
+                    'minutes': minutes,
+                    'points': points,
+                    'rebounds': rebounds,
+                    'assists': assists,
+                    'threes': threes,
+                }
+                for game_date, minutes, points, rebounds, assists, threes in zip(
+                    pd.to_datetime(recent_games['GAME_DATE'], format='%b %d, %Y').dt.date,
+                    self._minutes_column(recent_games['MIN']).tolist(),
+                    *(self._int_column(recent_games, col).tolist() for col in ('PTS', 'REB', 'AST', 'FG3M'))
+                )
+            ]
 
             logger.debug(f"Fetched {len(games)} game logs for nba_api_id {player_nba_api_id}")
             return games
@@ -194,6 +237,33 @@ class NbaApiService:
 
         return 0.0
 
+    @staticmethod
+    def _minutes_column(minutes: pd.Series) -> pd.Series:
+        """
+        Vectorized _parse_minutes: numeric or "MM:SS" minutes as float minutes.
+
+        Args:
+            minutes: MIN column from an nba_api frame
+
+        Returns:
+            Float minutes (unparseable values become 0.0)
+        """
+        if minutes.dtype != object:
+            return pd.to_numeric(minutes, errors='coerce').fillna(0.0).astype(float)
+
+        parts = minutes.fillna('').astype(str).str.strip().str.split(':', n=1, expand=True)
+        whole = pd.to_numeric(parts[0], errors='coerce').fillna(0.0)
+        if parts.shape[1] > 1:
+            whole = whole + pd.to_numeric(parts[1], errors='coerce').fillna(0.0) / 60.0
+        return whole.astype(float)
+
+    @staticmethod
+    def _int_column(frame: pd.DataFrame, column: str) -> pd.Series:
+        """Integer stat column, 0 where missing or blank."""
+        if column not in frame:
+            return pd.Series(0, index=frame.index, dtype=int)
+        return pd.to_numeric(frame[column], errors='coerce').fillna(0).astype(int)
+
     async def get_player_season_averages(
         self,
         player_nba_api_id: int,
@@ -292,7 +362,13 @@ class NbaApiService:
         logger.debug(f"Calculated per-36 stats for nba_api_id {player_nba_api_id}: {stats}")
         return stats
 
-    def _cache_season_stats(self, player_id: str, season: str, stats: Dict) -> None:
+    def _cache_season_stats(
+        self,
+        player_id: str,
+        season: str,
+        stats: Dict,
+        commit: bool = True
+    ) -> bool:
         """
         Cache player season stats in database.
 
@@ -300,7 +376,14 @@ class NbaApiService:
             player_id: Player ID
             season: NBA season
             stats: Stats dictionary from get_player_season_averages
+            commit: Commit immediately (False lets bulk syncs commit once;
+                    the row is written in a savepoint so a failure only
+                    discards this player's changes)
+
+        Returns:
+            True if the stats were stored
         """
+        savepoint = None if commit else self.db.begin_nested()
         try:
             # Check for existing entry
             existing = self.db.query(PlayerSeasonStats).filter(
@@ -340,12 +423,20 @@ class NbaApiService:
                 )
                 self.db.add(season_stats)
 
-            self.db.commit()
+            if savepoint is None:
+                self.db.commit()
+            else:
+                savepoint.commit()
             logger.debug(f"Cached season stats for player {player_id}")
+            return True
 
         except Exception as e:
             logger.error(f"Error caching season stats: {e}")
-            self.db.rollback()
+            if savepoint is None:
+                self.db.rollback()
+            else:
+                savepoint.rollback()
+            return False
 
     async def get_team_matchup_stats(
         self,
@@ -369,7 +460,7 @@ class NbaApiService:
             from nba_api.stats.endpoints import leaguedashteamstats
 
             # Fetch team stats
-            team_stats = leaguedashteamstats.LeagueDashTeamStats(
+            team_stats = await run_blocking("nba_api", lambda: leaguedashteamstats.LeagueDashTeamStats(
                 season=season,
                 measure_type="Base",
                 per_mode="PerGame",
@@ -385,9 +476,9 @@ class NbaApiService:
                 opponent_team_id="0",
                 vs_conference="",
                 vs_division=""
-            )
+            ).get_data_frames())
 
-            df = team_stats.get_data_frames()[0] if team_stats.get_data_frames() else None
+            df = team_stats[0] if team_stats else None
 
             if df is None or df.empty:
                 return None
@@ -414,10 +505,387 @@ class NbaApiService:
             logger.error(f"Error fetching team stats for {team_abbr}: {e}")
             return None
 
+    # ==================== BULK GAME LOG INGESTION ====================
+
+    async def fetch_league_game_logs(
+        self,
+        season: str = DEFAULT_SEASON,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch every player's game logs for a date range in one nba_api call.
+
+        Uses the league-wide leaguegamelog dataset instead of one
+        playergamelog request per player.
+
+        Args:
+            season: NBA season (e.g. "2025-26")
+            date_from: First game date (inclusive, default: season start)
+            date_to: Last game date (inclusive, default: today)
+
+        Returns:
+            DataFrame with one row per player per game, or None if the fetch fails
+        """
+        if not self.nba_api:
+            logger.error("nba_api package not available")
+            return None
+
+        def fetch():
+            from nba_api.stats.endpoints import leaguegamelog
+
+            return leaguegamelog.LeagueGameLog(
+                player_or_team_abbreviation='P',
+                season=season,
+                season_type_all_star='Regular Season',
+                date_from_nullable=date_from.strftime('%m/%d/%Y') if date_from else '',
+                date_to_nullable=date_to.strftime('%m/%d/%Y') if date_to else ''
+            ).get_data_frames()[0]
+
+        try:
+            return await run_blocking("nba_api", fetch)
+        except Exception as e:
+            logger.error(f"Error fetching league game logs for {season} ({date_from} - {date_to}): {e}")
+            return None
+
+    async def ingest_league_game_logs(
+        self,
+        season: str = DEFAULT_SEASON,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        incremental: bool = True
+    ) -> Dict:
+        """
+        Upsert league-wide game logs into player_stats.
+
+        One leaguegamelog call covers the whole date range. The frame is
+        converted column-wise, games missing from the games table are
+        created from GAME_ID/MATCHUP, and every stat line is written in one
+        batched INSERT ... ON CONFLICT (player_id, game_id) statement.
+
+        With incremental=True and no date_from, the fetch starts at the
+        watermark stored in sync_metadata (nba_api / player_game_logs). The
+        watermark date itself is fetched again so games that finished after
+        the previous run are picked up; the upsert keeps that idempotent.
+
+        Args:
+            season: NBA season (e.g. "2025-26")
+            date_from: First game date (default: watermark, else season start)
+            date_to: Last game date (default: today)
+            incremental: Resume from and advance the stored watermark
+
+        Returns:
+            Dict with date range, rows fetched, games created, stats upserted,
+            unmatched players and the new watermark
+        """
+        started = datetime.utcnow()
+        metadata = self._get_game_log_metadata() if incremental else None
+        if date_from is None and metadata is not None and metadata.watermark:
+            date_from = metadata.watermark.date()
+
+        result = {
+            'season': season,
+            'date_from': date_from.isoformat() if date_from else None,
+            'date_to': date_to.isoformat() if date_to else None,
+            'rows_fetched': 0,
+            'games_created': 0,
+            'stats_upserted': 0,
+            'unmatched_players': 0,
+            'watermark': metadata.watermark.date().isoformat() if metadata and metadata.watermark else None,
+        }
+
+        if metadata is not None:
+            metadata.last_sync_started_at = started
+            self.db.commit()
+
+        frame = await self.fetch_league_game_logs(season, date_from, date_to)
+        if frame is None:
+            if metadata is not None:
+                metadata.last_sync_status = 'failed'
+                metadata.error_message = 'leaguegamelog fetch failed'
+                self.db.commit()
+            return result
+
+        result['rows_fetched'] = len(frame)
+        if frame.empty:
+            logger.info(f"No new game logs for {season} since {date_from}")
+        else:
+            try:
+                game_ids, result['games_created'] = self._ensure_games(frame, season)
+                player_ids = self._player_ids_by_nba_api_id(frame['PLAYER_ID'])
+                rows = self._game_log_frame_to_rows(frame, player_ids, game_ids)
+                result['unmatched_players'] = int(
+                    frame.loc[~frame['PLAYER_ID'].astype(int).isin(player_ids), 'PLAYER_ID'].nunique()
+                )
+                result['stats_upserted'] = self._upsert_player_stats(rows)
+
+                latest = pd.to_datetime(frame['GAME_DATE']).max().to_pydatetime()
+                if metadata is not None and (metadata.watermark is None or latest > metadata.watermark):
+                    metadata.watermark = latest
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                logger.error(f"Error ingesting league game logs for {season}: {e}")
+                if metadata is not None:
+                    metadata.last_sync_status = 'failed'
+                    metadata.error_message = str(e)
+                    self.db.commit()
+                raise
+
+        if metadata is not None:
+            metadata.last_sync_completed_at = datetime.utcnow()
+            metadata.last_sync_status = 'success'
+            metadata.error_message = None
+            metadata.records_processed = result['rows_fetched']
+            metadata.records_matched = result['stats_upserted']
+            metadata.records_failed = result['rows_fetched'] - result['stats_upserted']
+            metadata.sync_duration_ms = int((datetime.utcnow() - started).total_seconds() * 1000)
+            self.db.commit()
+            result['watermark'] = metadata.watermark.date().isoformat() if metadata.watermark else None
+
+        logger.info(
+            f"Ingested league game logs for {season}: {result['stats_upserted']}/{result['rows_fetched']} "
+            f"rows upserted, {result['games_created']} games created, "
+            f"{result['unmatched_players']} unmatched players (watermark {result['watermark']})"
+        )
+        return result
+
+    def _get_game_log_metadata(self) -> SyncMetadata:
+        """Get or create the sync_metadata row holding the game log watermark."""
+        metadata = self.db.query(SyncMetadata).filter(
+            SyncMetadata.source == GAME_LOG_SYNC_SOURCE,
+            SyncMetadata.data_type == GAME_LOG_SYNC_DATA_TYPE
+        ).first()
+
+        if not metadata:
+            metadata = SyncMetadata(
+                id=str(uuid.uuid4()),
+                source=GAME_LOG_SYNC_SOURCE,
+                data_type=GAME_LOG_SYNC_DATA_TYPE,
+                records_processed=0,
+                records_matched=0,
+                records_failed=0
+            )
+            self.db.add(metadata)
+            self.db.flush()
+
+        return metadata
+
+    def _ensure_games(self, frame: pd.DataFrame, season: str) -> Tuple[Dict[str, str], int]:
+        """
+        Map nba_api GAME_IDs to games.id, creating games that are missing.
+
+        Args:
+            frame: leaguegamelog frame (GAME_ID, GAME_DATE, MATCHUP columns)
+            season: NBA season (e.g. "2025-26")
+
+        Returns:
+            Tuple of ({nba game id: games.id}, number of games created)
+        """
+        games = frame.drop_duplicates('GAME_ID')[['GAME_ID', 'GAME_DATE', 'MATCHUP']].copy()
+        games['GAME_ID'] = games['GAME_ID'].astype(str)
+        nba_game_ids = games['GAME_ID'].tolist()
+
+        game_ids = {}
+        for game_id, external_id, nba_api_game_id in self.db.query(
+            Game.id, Game.external_id, Game.nba_api_game_id
+        ).filter(
+            or_(Game.external_id.in_(nba_game_ids), Game.nba_api_game_id.in_(nba_game_ids))
+        ):
+            game_ids[nba_api_game_id or external_id] = game_id
+            game_ids.setdefault(external_id, game_id)
+
+        missing = games[~games['GAME_ID'].isin(game_ids)]
+        if missing.empty:
+            return game_ids, 0
+
+        # "BOS vs. PHI" is a home game for BOS, "BOS @ PHI" an away game
+        matchup = missing['MATCHUP'].str.extract(r'^(\w+)\s+(vs\.|@)\s+(\w+)$')
+        is_home = matchup[1] == 'vs.'
+        home_teams = matchup[0].where(is_home, matchup[2]).tolist()
+        away_teams = matchup[2].where(is_home, matchup[0]).tolist()
+        game_dates = pd.to_datetime(missing['GAME_DATE']).dt.to_pydatetime().tolist()
+        season_year = int(season.split('-')[0]) if '-' in season else int(season)
+
+        now = datetime.utcnow()
+        new_games = [
+            Game(
+                id=str(uuid.uuid4()),
+                sport_id='nba',
+                external_id=nba_game_id,
+                id_source='nba',
+                nba_api_game_id=nba_game_id,
+                game_date=game_date,
+                home_team=home_team,
+                away_team=away_team,
+                season=season_year,
+                status='final',
+                created_at=now,
+                updated_at=now
+            )
+            for nba_game_id, game_date, home_team, away_team in zip(
+                missing['GAME_ID'].tolist(), game_dates, home_teams, away_teams
+            )
+            if isinstance(home_team, str) and isinstance(away_team, str)
+        ]
+        self.db.add_all(new_games)
+        self.db.flush()
+
+        game_ids.update({game.external_id: game.id for game in new_games})
+        return game_ids, len(new_games)
+
+    def _player_ids_by_nba_api_id(self, nba_api_ids: pd.Series) -> Dict[int, str]:
+        """Map nba_api player IDs to players.id in one query."""
+        unique_ids = [int(i) for i in nba_api_ids.unique()]
+        return {
+            int(nba_api_id): player_id
+            for player_id, nba_api_id in self.db.query(Player.id, Player.nba_api_id).filter(
+                Player.nba_api_id.in_(unique_ids)
+            )
+        }
+
+    def _game_log_frame_to_rows(
+        self,
+        frame: pd.DataFrame,
+        player_ids: Dict[int, str],
+        game_ids: Dict[str, str]
+    ) -> List[Dict]:
+        """
+        Convert a leaguegamelog frame to player_stats rows column-wise.
+
+        Rows whose player or game is unknown are dropped; a player's line is
+        kept once per game (the last one wins).
+
+        Args:
+            frame: leaguegamelog frame
+            player_ids: nba_api player ID -> players.id
+            game_ids: nba_api GAME_ID -> games.id
+
+        Returns:
+            List of player_stats column dicts for the bulk upsert
+        """
+        frame = frame.drop_duplicates(['PLAYER_ID', 'GAME_ID'], keep='last')
+        player_col = frame['PLAYER_ID'].astype(int).map(player_ids)
+        game_col = frame['GAME_ID'].astype(str).map(game_ids)
+        matched = player_col.notna() & game_col.notna()
+        frame = frame[matched]
+
+        rows = pd.DataFrame({
+            'player_id': player_col[matched],
+            'game_id': game_col[matched],
+            'minutes': self._minutes_column(frame['MIN']).round().astype(int),
+            **{column: self._int_column(frame, api_column) for api_column, column in GAME_LOG_STAT_COLUMNS.items()},
+        })
+        rows.insert(0, 'id', [str(uuid.uuid4()) for _ in range(len(rows))])
+        rows['created_at'] = datetime.utcnow()
+        return rows.to_dict('records')
+
+    def _upsert_player_stats(self, rows: List[Dict]) -> int:
+        """
+        Insert or update player_stats rows in one batched statement.
+
+        Conflicts on (player_id, game_id) update the stat columns and keep
+        the original id and created_at.
+
+        Args:
+            rows: player_stats column dicts
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        if self.db.get_bind().dialect.name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(PlayerStats)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PlayerStats.player_id, PlayerStats.game_id],
+            set_={
+                column: stmt.excluded[column]
+                for column in ('minutes', *GAME_LOG_STAT_COLUMNS.values())
+            }
+        )
+        self.db.execute(stmt, rows)
+        return len(rows)
+
+    def _season_averages_from_player_stats(
+        self,
+        players: List[Player],
+        games_limit: int,
+        season: str
+    ) -> Dict[str, Dict]:
+        """
+        Per-36 averages for many players from stored player_stats in one query.
+
+        Same figures as get_player_season_averages, computed from the last
+        games_limit games of each player's stored stat lines for the season.
+
+        Args:
+            players: Players to average
+            games_limit: Number of recent games to average
+            season: NBA season (e.g. "2025-26")
+
+        Returns:
+            Dict of players.id -> stats dict (players without games are omitted)
+        """
+        start_year = int(season.split('-')[0]) if '-' in season else int(season)
+        rows = self.db.query(
+            PlayerStats.player_id, Game.game_date, PlayerStats.minutes, PlayerStats.points,
+            PlayerStats.rebounds, PlayerStats.assists, PlayerStats.threes
+        ).join(Game, Game.id == PlayerStats.game_id).filter(
+            PlayerStats.player_id.in_([p.id for p in players]),
+            Game.game_date >= datetime(start_year, 7, 1),
+            Game.game_date < datetime(start_year + 1, 7, 1)
+        ).all()
+        if not rows:
+            return {}
+
+        frame = pd.DataFrame(
+            rows, columns=['player_id', 'game_date', 'minutes', 'points', 'rebounds', 'assists', 'threes']
+        ).fillna(0)
+        frame = frame.sort_values('game_date').groupby('player_id').tail(games_limit)
+
+        totals = frame.groupby('player_id').agg(
+            games_count=('minutes', 'size'),
+            total_minutes=('minutes', 'sum'),
+            last_game_date=('game_date', 'max')
+        )
+        played = frame[frame['minutes'] > 0].groupby('player_id')[
+            ['minutes', 'points', 'rebounds', 'assists', 'threes']
+        ].sum()
+        totals = totals.join(played, how='inner')
+
+        per_36 = {
+            stat: (totals[stat] * 36.0 / totals['minutes']).round(2)
+            for stat in ('points', 'rebounds', 'assists', 'threes')
+        }
+        avg_minutes = (totals['total_minutes'] / totals['games_count']).round(1)
+
+        return {
+            player_id: {
+                'games_count': int(games_count),
+                'points_per_36': float(points),
+                'rebounds_per_36': float(rebounds),
+                'assists_per_36': float(assists),
+                'threes_per_36': float(threes),
+                'avg_minutes': float(minutes),
+                'last_game_date': pd.Timestamp(last_game).date()
+            }
+            for player_id, games_count, points, rebounds, assists, threes, minutes, last_game in zip(
+                totals.index, totals['games_count'], per_36['points'], per_36['rebounds'],
+                per_36['assists'], per_36['threes'], avg_minutes, totals['last_game_date']
+            )
+        }
+
     async def sync_all_active_players(
         self,
         games_limit: int = 50,
-        season: str = DEFAULT_SEASON
+        season: str = DEFAULT_SEASON,
+        bulk: bool = False
     ) -> Dict[str, int]:
         """
         Sync season stats for all active players.
@@ -425,9 +893,15 @@ class NbaApiService:
         This is used by the scheduled sync script to pre-fetch
         player stats and cache them in the database.
 
+        With bulk=True the league-wide game logs since the last watermark
+        are ingested in one nba_api call (ingest_league_game_logs) and every
+        player's per-36 averages are computed from player_stats in one
+        query, instead of one playergamelog request per player.
+
         Args:
             games_limit: Number of games to average
             season: NBA season
+            bulk: Ingest league-wide game logs instead of per-player requests
 
         Returns:
             Dict with sync results
@@ -437,6 +911,9 @@ class NbaApiService:
             Player.nba_api_id.isnot(None)  # Only sync players with nba_api_id
         ).all()
 
+        if bulk:
+            return await self._sync_all_active_players_bulk(players, games_limit, season)
+
         success_count = 0
         error_count = 0
         no_data_count = 0
@@ -464,3 +941,28 @@ class NbaApiService:
             'no_data': no_data_count,
             'errors': error_count
         }
+
+    async def _sync_all_active_players_bulk(
+        self,
+        players: List[Player],
+        games_limit: int,
+        season: str
+    ) -> Dict[str, int]:
+        """Bulk path of sync_all_active_players (see its docstring)."""
+        game_logs = await self.ingest_league_game_logs(season)
+        averages = self._season_averages_from_player_stats(players, games_limit, season)
+
+        error_count = 0
+        for player in players:
+            stats = averages.get(player.id)
+            if stats and not self._cache_season_stats(player.id, season, stats, commit=False):
+                error_count += 1
+        self.db.commit()
+
+        return {
+            'total': len(players),
+            'success': len(averages) - error_count,
+            'no_data': len(players) - len(averages),
+            'errors': error_count,
+            'game_logs': game_logs
+        }
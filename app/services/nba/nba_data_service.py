@@ -4,13 +4,13 @@ Enhanced NBA Data Service using nba_api.
 Provides comprehensive access to player stats, season averages,
 per-36 stats, game logs, and roster information.
 """
-import asyncio
 import logging
 import uuid
 from typing import Dict, List
 from sqlalchemy.orm import Session
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from app.core.blocking import run_blocking
 from app.core.config import settings
 from app.models import Player, PlayerSeasonStats
 from datetime import datetime, timezone
@@ -19,7 +19,6 @@ logger = logging.getLogger(__name__)
 
 # Convenience constants
 CURRENT_SEASON = settings.CURRENT_SEASON
-NBA_API_REQUEST_DELAY = settings.NBA_API_REQUEST_DELAY
 
 
 class NbaDataService:
@@ -53,11 +52,9 @@ class NbaDataService:
         Raises:
             Exception: If all retries are exhausted
         """
-        await asyncio.sleep(NBA_API_REQUEST_DELAY)
-
         from nba_api.stats.endpoints import leaguedashplayerstats
 
-        stats = leaguedashplayerstats.LeagueDashPlayerStats(
+        frames = await run_blocking("nba_api", lambda: leaguedashplayerstats.LeagueDashPlayerStats(
             season=season,
             season_type_all_star='Regular Season',
             measure_type_detailed_defense=measure_type,
@@ -65,9 +62,9 @@ class NbaDataService:
             plus_minus='N',
             pace_adjust='N',
             rank='N'
-        )
+        ).get_data_frames())
 
-        df = stats.get_data_frames()[0] if stats.get_data_frames() else None
+        df = frames[0] if frames else None
 
         if df is None or df.empty:
             logger.warning(f"No player stats returned for {season}")
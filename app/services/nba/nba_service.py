@@ -6,12 +6,14 @@ This service provides access to official NBA.com data including:
 
 The nba_api library is maintained and provides reliable access to NBA.com endpoints.
 """
-import asyncio
 from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional
 import logging
 from pydantic import BaseModel
 
+from app.core.blocking import run_blocking
+from app.core.cache import get_cache
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -22,17 +24,6 @@ except ImportError:
     NBA_API_AVAILABLE = False
 
 
-class CacheEntry:
-    """Simple cache entry with TTL."""
-    def __init__(self, data: any, valid_until: datetime):
-        self.data = data
-        self.valid_until = valid_until
-
-    def is_valid(self) -> bool:
-        """Check if cache entry is still valid."""
-        return datetime.now() < self.valid_until
-
-
 class NBAPlayer(BaseModel):
     """NBA player data model."""
     id: str  # NBA.com PERSON_ID
@@ -79,8 +70,8 @@ class NBAService:
             cache_ttl = get_dynamic_cache_ttl("nba")
 
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = asyncio.Lock()
+        # Shared bounded cache (app.core.cache) for every instance
+        self._cache = get_cache("nba_api", max_size=512, default_ttl=cache_ttl)
 
     def _get_cache_key(self, endpoint: str, **kwargs) -> str:
         """Generate cache key from endpoint name and parameters."""
@@ -89,34 +80,26 @@ class NBAService:
 
     async def _get_cached(self, key: str) -> Optional[any]:
         """Get data from cache if valid."""
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry and entry.is_valid():
-                return entry.data
-        return None
+        return self._cache.get(key)
 
     async def _set_cache(self, key: str, data: any, ttl: Optional[int] = None):
         """Set data in cache with TTL."""
-        ttl = ttl or self.cache_ttl
-        valid_until = datetime.now() + timedelta(seconds=ttl)
-        async with self._lock:
-            self._cache[key] = CacheEntry(data, valid_until)
+        self._cache.set(key, data, ttl or self.cache_ttl)
 
     async def clear_cache(self):
         """Clear all cached data."""
-        async with self._lock:
-            self._cache.clear()
+        self._cache.clear()
 
     async def get_cache_stats(self) -> Dict[str, any]:
         """Get cache statistics."""
-        async with self._lock:
-            total = len(self._cache)
-            valid = sum(1 for e in self._cache.values() if e.is_valid())
-            return {
-                "total_entries": total,
-                "valid_entries": valid,
-                "expired_entries": total - valid
-            }
+        self._cache.sweep()
+        stats = self._cache.stats()
+        return {
+            "total_entries": stats["entries"],
+            "valid_entries": stats["entries"],
+            "expired_entries": 0,
+            **stats
+        }
 
     async def get_all_players(self, season: str = "2024-25") -> List[Dict]:
         """
@@ -146,10 +129,9 @@ class NBAService:
             return cached
 
         try:
-            # Run blocking call in thread pool
-            loop = asyncio.get_event_loop()
-            players_data = await loop.run_in_executor(
-                None,
+            # Rate-limited blocking call on the shared executor
+            players_data = await run_blocking(
+                "nba_api",
                 lambda: commonallplayers.CommonAllPlayers(
                     league_id='00',
                     season=season,
@@ -214,10 +196,9 @@ class NBAService:
             return cached
 
         try:
-            # Run blocking call in thread pool
-            loop = asyncio.get_event_loop()
-            scoreboard_data = await loop.run_in_executor(
-                None,
+            # Rate-limited blocking call on the shared executor
+            scoreboard_data = await run_blocking(
+                "nba_api",
                 lambda: scoreboardv2.ScoreboardV2(
                     game_date=game_date_str,
                     league_id="00",
@@ -358,10 +339,9 @@ class NBAService:
             return cached
 
         try:
-            # Run blocking call in thread pool
-            loop = asyncio.get_event_loop()
-            boxscore_data = await loop.run_in_executor(
-                None,
+            # Rate-limited blocking call on the shared executor
+            boxscore_data = await run_blocking(
+                "nba_api",
                 lambda: boxscoretraditionalv2.BoxScoreTraditionalV2(
                     game_id=game_id,
                     league_id="00"
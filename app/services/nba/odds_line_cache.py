@@ -0,0 +1,137 @@
+"""
+Compact odds line cache for prediction runs.
+
+The Odds API returns every player prop market for an event in one response.
+Caching that raw response per (game, stat type) stored the same large JSON
+several times per game for the life of the service. This cache stores one
+compiled PropLineIndex per odds event instead:
+
+    - Keyed by (event_id, snapshot_version); a newer snapshot of an event
+      replaces the older one, so each event holds a single compact entry
+    - Bounded: least recently used events are evicted past max_entries
+    - Entries older than ttl_seconds are treated as misses and dropped
+    - Hit/miss/eviction counters are exposed through stats()
+
+Usage:
+    from app.services.nba.odds_line_cache import OddsLineCache
+
+    cache = OddsLineCache(max_entries=64, ttl_seconds=300)
+    cache.put(index)                 # index.event_id / index.snapshot_version
+    index = cache.get(event_id)      # latest snapshot or None
+    cache.stats()
+"""
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.services.nba.player_props_parser import PropLineIndex
+
+
+class OddsLineCache:
+    """Bounded TTL/LRU cache of compiled prop line indexes per odds event."""
+
+    def __init__(self, max_entries: int = 64, ttl_seconds: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of events held
+            ttl_seconds: Seconds an entry stays fresh
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        # (event_id, snapshot_version) -> (index, stored_at), LRU order
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[PropLineIndex, float]]" = OrderedDict()
+        # event_id -> snapshot_version currently cached
+        self._versions: Dict[str, str] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.replaced_snapshots = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._versions
+
+    def get(self, event_id: str) -> Optional[PropLineIndex]:
+        """
+        Latest cached snapshot for an event, or None on a miss.
+
+        Args:
+            event_id: Odds API event ID
+
+        Returns:
+            PropLineIndex or None
+        """
+        version = self._versions.get(event_id)
+        if version is None:
+            self.misses += 1
+            return None
+
+        key = (event_id, version)
+        index, stored_at = self._entries[key]
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return index
+
+    def put(self, index: PropLineIndex) -> None:
+        """
+        Store a compiled index under its event and snapshot version.
+
+        Args:
+            index: PropLineIndex with event_id set
+        """
+        if not index.event_id:
+            return
+
+        previous = self._versions.get(index.event_id)
+        if previous is not None:
+            if previous != index.snapshot_version:
+                self.replaced_snapshots += 1
+            self._remove((index.event_id, previous))
+
+        key = (index.event_id, index.snapshot_version)
+        self._entries[key] = (index, time.monotonic())
+        self._versions[index.event_id] = index.snapshot_version
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+        self._versions.clear()
+
+    def stats(self) -> Dict:
+        """Cache size and hit statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "replaced_snapshots": self.replaced_snapshots,
+            "lines": sum(len(index) for index, _ in self._entries.values()),
+        }
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+        if self._versions.get(key[0]) == key[1]:
+            del self._versions[key[0]]
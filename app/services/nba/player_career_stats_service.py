@@ -21,6 +21,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 
+from app.core.blocking import run_blocking
 from app.models import Player
 
 logger = logging.getLogger(__name__)
@@ -28,8 +29,7 @@ logger = logging.getLogger(__name__)
 # Default season
 DEFAULT_SEASON = "2025-26"
 
-# Rate limiting settings
-REQUEST_DELAY_SECONDS = 1.0
+# Rate limiting settings (request spacing: NBA_API_REQUEST_DELAY in app.core.blocking)
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 2.0
 
@@ -108,20 +108,14 @@ class PlayerCareerStatsService:
             logger.error("nba_api package not available")
             return None
 
-        # Add delay before request to avoid rate limiting
-        await asyncio.sleep(REQUEST_DELAY_SECONDS)
-
         try:
             from nba_api.stats.endpoints import playercareerstats
 
-            # Fetch career stats using numeric nba_api_id
-            career_stats = playercareerstats.PlayerCareerStats(
+            # Fetch career stats using numeric nba_api_id (rate-limited, off the event loop)
+            data_frames = await run_blocking("nba_api", lambda: playercareerstats.PlayerCareerStats(
                 player_id=player_nba_api_id,
                 per_mode36='PerGame'
-            )
-
-            # Get data frames
-            data_frames = career_stats.get_data_frames()
+            ).get_data_frames())
 
             if not data_frames or len(data_frames) == 0:
                 logger.warning(f"No career stats found for nba_api_id {player_nba_api_id}")
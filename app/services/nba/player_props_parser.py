@@ -28,9 +28,15 @@ The Odds API returns player props in a nested structure:
         ]
     }
 }
+
+Lookups are served from a PropLineIndex compiled once per event response
+(one pass over bookmakers × markets × outcomes), keyed by normalized player
+name, stat type and bookmaker. Repeated lookups against the same response
+reuse the compiled index.
 """
 import logging
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from app.core.logging import get_logger
@@ -38,6 +44,35 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+@dataclass
+class PropLineIndex:
+    """
+    Compiled prop lines for one event response.
+
+    lines maps (normalized player name, stat type) to the line from every
+    bookmaker offering it; best holds the highest-priority line per key.
+    """
+    lines: Dict[Tuple[str, str], Dict[str, Dict]] = field(default_factory=dict)
+    best: Dict[Tuple[str, str], Dict] = field(default_factory=dict)
+    display_names: Dict[str, str] = field(default_factory=dict)
+    compiled_at: str = ""
+    event_id: Optional[str] = None
+    snapshot_version: str = ""
+
+    def __len__(self) -> int:
+        return len(self.best)
+
+    def get(self, normalized_name: str, stat_type: str, bookmaker: Optional[str] = None) -> Optional[Dict]:
+        """Best line for a player/stat, or the line from a specific bookmaker."""
+        if bookmaker:
+            return self.lines.get((normalized_name, stat_type), {}).get(bookmaker.lower())
+        return self.best.get((normalized_name, stat_type))
+
+    def player_names(self, stat_type: str) -> List[str]:
+        """Normalized names of players with a line for the stat type."""
+        return [name for (name, stat) in self.best if stat == stat_type]
+
+
 class PlayerPropsParser:
     """
     Parse player props from Odds API response.
@@ -96,6 +131,10 @@ class PlayerPropsParser:
         """
         self.bookmaker_priority = bookmaker_priority or self.DEFAULT_BOOKMAKER_PRIORITY
 
+        # Last compiled (odds_response, PropLineIndex), reused while callers
+        # keep passing the same response object
+        self._compiled: Optional[Tuple[Dict, PropLineIndex]] = None
+
     def extract_player_lines(
         self,
         odds_response: Dict,
@@ -132,83 +171,20 @@ class PlayerPropsParser:
             logger.warning("Empty odds response provided")
             return None
 
-        market_key = self.MARKET_MAP.get(stat_type)
-        if not market_key:
+        if stat_type not in self.MARKET_MAP:
             logger.warning(f"Unknown stat type: {stat_type}")
             return None
 
-        game_data = odds_response["data"]
-        bookmakers = game_data.get("bookmakers", [])
-
-        if not bookmakers:
-            logger.warning("No bookmakers found in odds response")
-            return None
-
-        # Normalize player name for matching
-        normalized_search_name = self._normalize_player_name(player_name)
-
-        # Collect all available lines from all bookmakers
-        all_lines = []
-
-        for bookmaker in bookmakers:
-            bookmaker_key = bookmaker.get("key", "")
-            bookmaker_title = bookmaker.get("title", bookmaker_key)
-
-            # Find the market for this stat type
-            markets = bookmaker.get("markets", [])
-            target_market = None
-
-            for market in markets:
-                if market.get("key") == market_key:
-                    target_market = market
-                    break
-
-            if not target_market:
-                continue
-
-            # Extract outcomes (OVER/UNDER) for this market
-            outcomes = target_market.get("outcomes", [])
-
-            over_outcome = None
-            under_outcome = None
-
-            for outcome in outcomes:
-                outcome_name = outcome.get("name", "")
-                outcome_description = outcome.get("description", "")
-
-                # Check if this outcome matches our player
-                if self._player_matches(outcome_name, outcome_description, normalized_search_name):
-                    # Determine if it's OVER or UNDER
-                    if "over" in outcome_name.lower():
-                        over_outcome = outcome
-                    elif "under" in outcome_name.lower():
-                        under_outcome = outcome
-
-            # If we found both OVER and UNDER, extract the line
-            if over_outcome and under_outcome:
-                line_data = self._extract_line_from_outcomes(
-                    over_outcome,
-                    under_outcome,
-                    bookmaker_key,
-                    bookmaker_title
-                )
-                if line_data:
-                    # Add priority based on bookmaker preference
-                    priority = self._get_bookmaker_priority(bookmaker_key)
-                    line_data["priority"] = priority
-                    all_lines.append(line_data)
+        best_line = self.extract_from_index(
+            self.get_line_index(odds_response), player_name, stat_type
+        )
 
-        if not all_lines:
+        if best_line is None:
             logger.debug(
                 f"No lines found for player={player_name}, stat_type={stat_type}"
             )
             return None
 
-        # Sort by priority (lower number = higher priority)
-        all_lines.sort(key=lambda x: x.get("priority", 999))
-
-        # Return the highest priority line
-        best_line = all_lines[0]
         logger.info(
             f"Found line for {player_name} {stat_type}: {best_line['line']} "
             f"({best_line['bookmaker']})"
@@ -224,7 +200,8 @@ class PlayerPropsParser:
         """
         Extract all player lines for a specific stat type from a game.
 
-        Useful for bulk fetching all lines for a game at once.
+        Useful for bulk fetching all lines for a game at once. Reads from the
+        compiled PlayerPropsParser.get_line_index() result.
 
         Args:
             odds_response: The full response from Odds API's get_event_player_props()
@@ -245,74 +222,200 @@ class PlayerPropsParser:
         if not odds_response or not odds_response.get("data"):
             return {}
 
-        market_key = self.MARKET_MAP.get(stat_type)
-        if not market_key:
+        if stat_type not in self.MARKET_MAP:
             return {}
 
-        game_data = odds_response["data"]
-        bookmakers = game_data.get("bookmakers", [])
+        index = self.get_line_index(odds_response)
+        return {
+            index.display_names[name]: index.best[(name, stat_type)]
+            for name in index.player_names(stat_type)
+        }
 
-        if not bookmakers:
-            return {}
+    def extract_from_index(
+        self,
+        index: PropLineIndex,
+        player_name: str,
+        stat_type: str
+    ) -> Optional[Dict]:
+        """
+        Best line for a player/stat from a compiled index.
+
+        Bookmakers are ranked by this parser's bookmaker_priority (ties go to
+        the bookmaker listed first in the response), so an index compiled by
+        one parser can be shared by parsers with different priorities.
+
+        Args:
+            index: Compiled PropLineIndex
+            player_name: Player name to search for (e.g., "LeBron James")
+            stat_type: Stat type (points, rebounds, assists, threes)
+
+        Returns:
+            Line data dict or None if no line found
+        """
+        normalized_search_name = self._normalize_player_name(player_name)
+        per_book = index.lines.get((normalized_search_name, stat_type))
+        if not per_book:
+            return self._fuzzy_lookup(index, normalized_search_name, stat_type)
+
+        best_key = min(per_book, key=self._get_bookmaker_priority)
+        return {**per_book[best_key], "priority": self._get_bookmaker_priority(best_key)}
+
+    def get_line_index(self, odds_response: Dict) -> PropLineIndex:
+        """
+        Get the compiled line index for an event response.
 
-        all_player_lines = {}
+        The index is compiled on first use and reused for every later
+        lookup against the same response object.
 
-        # Process each bookmaker in priority order
-        for bookmaker in bookmakers:
+        Args:
+            odds_response: The full response from Odds API's get_event_player_props()
+
+        Returns:
+            PropLineIndex for the response
+        """
+        if self._compiled is not None and self._compiled[0] is odds_response:
+            return self._compiled[1]
+
+        index = self.build_line_index(odds_response)
+        self._compiled = (odds_response, index)
+        return index
+
+    def build_line_index(self, odds_response: Dict) -> PropLineIndex:
+        """
+        Compile every player prop line in an event response in one pass.
+
+        Each (player, stat type, bookmaker) keeps the line built from its
+        OVER/UNDER outcomes; the best line per (player, stat type) follows
+        bookmaker_priority, with ties going to the bookmaker listed first.
+
+        Args:
+            odds_response: The full response from Odds API's get_event_player_props()
+
+        Returns:
+            PropLineIndex
+        """
+        index = PropLineIndex(compiled_at=datetime.utcnow().isoformat())
+        if not odds_response or not odds_response.get("data"):
+            return index
+
+        index.event_id = odds_response.get("event_id") or odds_response["data"].get("id")
+        index.snapshot_version = self.snapshot_version(odds_response)
+
+        stat_by_market = {market: stat for stat, market in self.MARKET_MAP.items()}
+
+        for bookmaker in odds_response["data"].get("bookmakers", []):
             bookmaker_key = bookmaker.get("key", "")
             bookmaker_title = bookmaker.get("title", bookmaker_key)
+            priority = self._get_bookmaker_priority(bookmaker_key)
 
-            # Skip if we've already found lines from a higher-priority bookmaker
-            # for players we're tracking
-            markets = bookmaker.get("markets", [])
-
-            for market in markets:
-                if market.get("key") != market_key:
+            for market in bookmaker.get("markets", []):
+                stat_type = stat_by_market.get(market.get("key"))
+                if stat_type is None:
                     continue
 
-                outcomes = market.get("outcomes", [])
-
-                # Group outcomes by player
+                # Group OVER/UNDER outcomes by player
                 player_outcomes: Dict[str, Dict] = {}
+                for outcome in market.get("outcomes", []):
+                    display_name = self._outcome_player_name(outcome)
+                    if not display_name:
+                        continue
+
+                    side = outcome.get("name", "").lower()
+                    if "over" in side:
+                        side = "over"
+                    elif "under" in side:
+                        side = "under"
+                    else:
+                        continue
 
-                for outcome in outcomes:
-                    outcome_name = outcome.get("name", "")
-                    outcome_description = outcome.get("description", "")
+                    normalized = self._normalize_player_name(display_name)
+                    index.display_names.setdefault(normalized, display_name)
+                    player_outcomes.setdefault(normalized, {})[side] = outcome
 
-                    # Extract player name from description
-                    # Format: "Player Name - Points" or similar
-                    player_name = self._extract_player_name_from_description(
-                        outcome_description
-                    )
+                last_update = market.get("last_update") or bookmaker.get("last_update")
 
-                    if not player_name:
+                for normalized, sides in player_outcomes.items():
+                    if "over" not in sides or "under" not in sides:
                         continue
 
-                    # Skip if we already have this player from a higher-priority bookmaker
-                    if player_name in all_player_lines:
+                    line_data = self._extract_line_from_outcomes(
+                        sides["over"],
+                        sides["under"],
+                        bookmaker_key,
+                        bookmaker_title
+                    )
+                    if not line_data:
                         continue
 
-                    if player_name not in player_outcomes:
-                        player_outcomes[player_name] = {}
-
-                    if "over" in outcome_name.lower():
-                        player_outcomes[player_name]["over"] = outcome
-                    elif "under" in outcome_name.lower():
-                        player_outcomes[player_name]["under"] = outcome
-
-                # Create line data for each player
-                for player_name, outcomes_dict in player_outcomes.items():
-                    if "over" in outcomes_dict and "under" in outcomes_dict:
-                        line_data = self._extract_line_from_outcomes(
-                            outcomes_dict["over"],
-                            outcomes_dict["under"],
-                            bookmaker_key,
-                            bookmaker_title
-                        )
-                        if line_data:
-                            all_player_lines[player_name] = line_data
-
-        return all_player_lines
+                    line_data["priority"] = priority
+                    line_data["fetched_at"] = index.compiled_at
+                    if last_update:
+                        line_data["last_update"] = last_update
+
+                    key = (normalized, stat_type)
+                    index.lines.setdefault(key, {})[bookmaker_key.lower()] = line_data
+
+                    current = index.best.get(key)
+                    if current is None or priority < current["priority"]:
+                        index.best[key] = line_data
+
+        return index
+
+    @staticmethod
+    def snapshot_version(odds_response: Dict) -> str:
+        """
+        Version of an event props snapshot: the newest bookmaker/market
+        last_update in the response (empty string when none are present).
+        """
+        if not odds_response or not odds_response.get("data"):
+            return ""
+        stamps = []
+        for bookmaker in odds_response["data"].get("bookmakers", []):
+            if bookmaker.get("last_update"):
+                stamps.append(bookmaker["last_update"])
+            stamps.extend(
+                market["last_update"]
+                for market in bookmaker.get("markets", [])
+                if market.get("last_update")
+            )
+        return max(stamps, default="")
+
+    def _fuzzy_lookup(
+        self,
+        index: PropLineIndex,
+        normalized_search_name: str,
+        stat_type: str
+    ) -> Optional[Dict]:
+        """
+        Fall back to partial name matching when there is no exact index key.
+
+        Only scans the player names compiled for the stat type, not the raw
+        outcomes.
+        """
+        candidates = [
+            {**line, "priority": self._get_bookmaker_priority(book)}
+            for name in index.player_names(stat_type)
+            if self._player_matches(name, "", normalized_search_name)
+            for book, line in index.lines[(name, stat_type)].items()
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda line: line["priority"])
+
+    def _outcome_player_name(self, outcome: Dict) -> Optional[str]:
+        """
+        Player name for an outcome.
+
+        The Odds API puts the player in "description" ("LeBron James"); some
+        feeds append the stat ("LeBron James - Points").
+        """
+        description = (outcome.get("description") or "").strip()
+        if description:
+            for delimiter in (" - ", " | "):
+                if delimiter in description:
+                    return description.split(delimiter)[0].strip() or None
+            return description
+        return self._extract_player_name_from_description(outcome.get("name", ""))
 
     def _extract_line_from_outcomes(
         self,
@@ -8,7 +8,6 @@ This service provides access to NFL data including:
 
 Uses nfl_data_py library for reliable NFL data access.
 """
-import asyncio
 from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional
 import logging
@@ -16,6 +15,9 @@ from pydantic import BaseModel
 import random
 from datetime import datetime, timedelta
 
+from app.core.blocking import run_blocking
+from app.core.cache import get_cache
+
 try:
     import pandas as pd
     PANDAS_AVAILABLE = True
@@ -34,17 +36,6 @@ except ImportError:
     NFL_API_AVAILABLE = False
 
 
-class CacheEntry:
-    """Simple cache entry with TTL."""
-    def __init__(self, data: any, valid_until: datetime):
-        self.data = data
-        self.valid_until = valid_until
-
-    def is_valid(self) -> bool:
-        """Check if cache entry is still valid."""
-        return datetime.now() < self.valid_until
-
-
 class NFLPlayer(BaseModel):
     """NFL player data model."""
     id: str  # NFL.com player ID or GSIS ID
@@ -82,8 +73,8 @@ class NFLService:
             cache_ttl: Default cache TTL in seconds (default: 5 minutes)
         """
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = asyncio.Lock()
+        # Shared bounded cache (app.core.cache) for every instance
+        self._cache = get_cache("nfl", max_size=512, default_ttl=cache_ttl)
 
     def _get_cache_key(self, endpoint: str, **kwargs) -> str:
         """Generate cache key from endpoint name and parameters."""
@@ -92,34 +83,26 @@ class NFLService:
 
     async def _get_cached(self, key: str) -> Optional[any]:
         """Get data from cache if valid."""
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry and entry.is_valid():
-                return entry.data
-        return None
+        return self._cache.get(key)
 
     async def _set_cache(self, key: str, data: any, ttl: Optional[int] = None):
         """Set data in cache with TTL."""
-        ttl = ttl or self.cache_ttl
-        valid_until = datetime.now() + timedelta(seconds=ttl)
-        async with self._lock:
-            self._cache[key] = CacheEntry(data, valid_until)
+        self._cache.set(key, data, ttl or self.cache_ttl)
 
     async def clear_cache(self):
         """Clear all cached data."""
-        async with self._lock:
-            self._cache.clear()
+        self._cache.clear()
 
     async def get_cache_stats(self) -> Dict[str, any]:
         """Get cache statistics."""
-        async with self._lock:
-            total = len(self._cache)
-            valid = sum(1 for e in self._cache.values() if e.is_valid())
-            return {
-                "total_entries": total,
-                "valid_entries": valid,
-                "expired_entries": total - valid
-            }
+        self._cache.sweep()
+        stats = self._cache.stats()
+        return {
+            "total_entries": stats["entries"],
+            "valid_entries": stats["entries"],
+            "expired_entries": 0,
+            **stats
+        }
 
     async def get_all_players(self, season: int = 2024) -> List[Dict]:
         """
@@ -149,12 +132,8 @@ class NFLService:
             return cached
 
         try:
-            # Run blocking call in thread pool
-            loop = asyncio.get_event_loop()
-            df = await loop.run_in_executor(
-                None,
-                lambda: nfl.import_weekly_rosters([season])
-            )
+            # Rate-limited blocking call on the shared executor
+            df = await run_blocking("nfl_data_py", nfl.import_weekly_rosters, [season])
 
             if df.empty:
                 logger.warning(f"No NFL players found for season {season}")
@@ -205,11 +184,7 @@ class NFLService:
             return cached
 
         try:
-            loop = asyncio.get_event_loop()
-            df = await loop.run_in_executor(
-                None,
-                lambda: nfl.import_schedules([season])
-            )
+            df = await run_blocking("nfl_data_py", nfl.import_schedules, [season])
 
             if df.empty:
                 logger.warning(f"No NFL schedule found for season {season}")
@@ -40,7 +40,7 @@ Usage:
 
     odds_service = get_odds_service(api_key="your_key", sport="nhl")
     service = EnhancedNHLPredictionService(db, odds_api_service=odds_service)
-    predictions = service.generate_prop_predictions(game_id, stat_types)
+    predictions = await service.generate_prop_predictions_async(game_id, stat_types)
 
 NHL-SPECIFIC CONSIDERATIONS:
 - Time on Ice (TOI) instead of minutes (NHL players avg 15-22 min)
@@ -58,6 +58,8 @@ import numpy as np
 
 from app.models.nhl.models import Player, Game, Prediction, PlayerSeasonStats
 from app.core.logging import get_logger
+from app.utils.async_utils import run_sync
+from app.services.core import projection_kernel
 
 logger = get_logger(__name__)
 
@@ -225,10 +227,14 @@ class EnhancedNHLPredictionService:
         self._player_props_parser = None
 
         # Odds cache to prevent redundant API calls within same prediction run
-        self._odds_cache: Dict[tuple, tuple] = {}
+        # Key: game_id, Value: (odds_response, fetched_at)
+        self._odds_cache: Dict[str, tuple] = {}
         self._cache_ttl_seconds = 300  # 5 minutes cache
 
-    def generate_prop_predictions(
+        # Base projections for the game being generated: (game_id, projections)
+        self._game_projections: Tuple[Optional[str], Dict] = (None, {})
+
+    async def generate_prop_predictions_async(
         self,
         game_id: str,
         stat_types: Optional[List[str]] = None,
@@ -237,6 +243,10 @@ class EnhancedNHLPredictionService:
         """
         Generate prop predictions for a game with line comparisons.
 
+        The game's Odds API event is resolved once and its player props are
+        fetched in a single awaited call; every player/stat line is then
+        served from that response.
+
         Args:
             game_id: Game UUID
             stat_types: Stats to predict (default: goals, assists, points, shots)
@@ -257,6 +267,13 @@ class EnhancedNHLPredictionService:
         # Get active players (skaters only, no goalies)
         players = self._get_active_players(game)
 
+        # Project every player × stat type with one kernel pass
+        self._game_projections = (game.id, self._project_game(players, game, stat_types))
+
+        # One event lookup + one props fetch for the whole game
+        if self._odds_api_service:
+            await self._prefetch_event_odds(game)
+
         predictions = []
         for player in players:
             for stat_type in stat_types:
@@ -269,6 +286,17 @@ class EnhancedNHLPredictionService:
 
         return predictions
 
+    def generate_prop_predictions(
+        self,
+        game_id: str,
+        stat_types: Optional[List[str]] = None,
+        bookmaker: str = "draftkings"
+    ) -> List[Dict]:
+        """Sync adapter for generate_prop_predictions_async (scripts, scheduler)."""
+        return run_sync(
+            self.generate_prop_predictions_async(game_id, stat_types, bookmaker)
+        )
+
     def _get_active_players(self, game: Game) -> List[Player]:
         """
         Get active players for both teams in the game.
@@ -393,115 +421,130 @@ class EnhancedNHLPredictionService:
         stat_type: str
     ) -> Optional[Dict]:
         """Calculate base projection with all contextual adjustments."""
-        # Get recent form (EWMA-weighted)
-        recent_form = self._get_recent_form(player, stat_type)
+        game_id, projections = self._game_projections
+        if game_id != game.id or (player.id, stat_type) not in projections:
+            projections = self._project_game([player], game, [stat_type])
 
-        if not recent_form:
+        projection_data = projections[(player.id, stat_type)]
+        if not projection_data:
             # No data for this player
             return None
 
-        factors = {}
-
-        # Base per-game value (EWMA weighted)
-        per_game_value = recent_form["ewma_per_game"]
-        base_toi = recent_form.get("avg_tooi", BASE_TOI.get(player.position, 17.0))
-
-        # Get projected TOI
-        projected_toi = self._get_projected_toi(player, game, base_toi)
-
-        # Scale projection based on TOI
-        toi_ratio = projected_toi / base_toi if base_toi > 0 else 1.0
-        projection = per_game_value * toi_ratio
-
-        factors["base_per_game"] = round(per_game_value, 2)
-        factors["projected_toi"] = round(projected_toi, 1)
-        factors["toi_ratio"] = round(toi_ratio, 2)
-        factors["sample_size"] = recent_form.get("sample_size", 0)
-
-        # Apply adjustments
-        projection, adj_factors = self._apply_adjustments(
-            projection, player, game, stat_type
-        )
-        factors.update(adj_factors)
-
         # Small variance for consistency
         variance = random.uniform(-0.01, 0.01)
-        projection *= (1 + variance)
+        projection = projection_data["projected"] * (1 + variance)
 
         return {
             "projected": max(0, round(projection, 2)),
-            "factors": factors
+            "factors": dict(projection_data["factors"])
         }
 
-    def _get_recent_form(
+    def _project_game(
         self,
-        player: Player,
-        stat_type: str,
-        games_back: int = 10
-    ) -> Optional[Dict]:
+        players: List[Player],
+        game: Game,
+        stat_types: List[str]
+    ) -> Dict[Tuple[str, str], Optional[Dict]]:
         """
-        Calculate EWMA-weighted recent form for a player.
+        Project players × stat types for a game with the projection kernel.
 
-        NHL Note: Uses PlayerSeasonStats for per-game averages
-        since game-by-game stats may not be available.
+        Per-60 rates are scaled to each player's projected TOI and the
+        opponent and travel adjustments are applied to the whole
+        players × stats matrix at once.
 
-        Returns dict with ewma_per_game, avg_toi, sample_size, std_dev
+        Returns:
+            Dict keyed by (player_id, stat_type) with the projection before
+            variance and its factors (None when the player has no data)
         """
-        # Get season stats
-        season_stats = self.db.query(PlayerSeasonStats).filter(
-            PlayerSeasonStats.player_id == player.id,
-            PlayerSeasonStats.season_type == "REG",
-            PlayerSeasonStats.season == int(self.season.split("-")[0])
-        ).first()
+        if not players or not stat_types:
+            return {}
 
-        if not season_stats:
-            return None
+        form = self._get_recent_forms(players, stat_types)
+        avg_toi = form["avg_toi"]
 
-        games_played = getattr(season_stats, 'games_played', 0)
-        if games_played == 0:
-            return None
+        # Get projected TOI
+        projected_toi = np.array([
+            self._get_projected_toi(player, game, avg_toi[i])
+            for i, player in enumerate(players)
+        ])
 
-        # Get the stat value
-        stat_value = getattr(season_stats, stat_type, None)
-        if stat_value is None:
-            return None
+        # Per-60 rate over the projected TOI (per-game value × TOI ratio)
+        base = form["per_60"] * (projected_toi / projection_kernel.PER_60)[:, np.newaxis]
 
-        # Calculate per-game average
-        per_game = stat_value / games_played
+        # Apply adjustments
+        projected, def_adj, travel = self._apply_adjustments(base, players, game, stat_types)
+
+        results: Dict[Tuple[str, str], Optional[Dict]] = {}
+        for i, player in enumerate(players):
+            for k, stat_type in enumerate(stat_types):
+                if np.isnan(projected[i, k]):
+                    results[(player.id, stat_type)] = None
+                    continue
+                results[(player.id, stat_type)] = {
+                    "projected": float(projected[i, k]),
+                    "factors": {
+                        "base_per_game": round(float(form["per_game"][i, k]), 2),
+                        "projected_toi": round(float(projected_toi[i]), 1),
+                        "toi_ratio": round(float(projected_toi[i] / avg_toi[i]), 2),
+                        "sample_size": int(form["sample_size"][i]),
+                        "opponent_defense": round(float(def_adj[i, k]), 3),
+                        "travel_fatigue": round(float(travel[i]), 3),
+                    }
+                }
+        return results
 
-        # Estimate TOI from season stats or use position baseline
-        avg_toi = BASE_TOI.get(player.position, 17.0)
+    def _get_recent_forms(
+        self,
+        players: List[Player],
+        stat_types: List[str]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate per-game and per-60 rates for players × stat types.
+
+        NHL Note: Uses PlayerSeasonStats for per-game averages
+        since game-by-game stats may not be available. Season stats for
+        every player are loaded in one query and normalized with one
+        projection kernel call.
+
+        Returns:
+            Dict with per_game and per_60 (P, S) arrays, NaN where a player
+            has no usable data, and avg_toi and sample_size (P,) arrays
+        """
+        season_rows = {}
+        for season_stats in self.db.query(PlayerSeasonStats).filter(
+            PlayerSeasonStats.player_id.in_([p.id for p in players]),
+            PlayerSeasonStats.season_type == "REG",
+            PlayerSeasonStats.season == int(self.season.split("-")[0])
+        ):
+            season_rows.setdefault(season_stats.player_id, season_stats)
+
+        totals = np.full((len(players), len(stat_types)), np.nan)
+        games_played = np.zeros(len(players))
+        for i, player in enumerate(players):
+            season_stats = season_rows.get(player.id)
+            if not season_stats:
+                continue
+            games_played[i] = getattr(season_stats, 'games_played', 0) or 0
+            for k, stat_type in enumerate(stat_types):
+                stat_value = getattr(season_stats, stat_type, None)
+                if stat_value is not None:
+                    totals[i, k] = stat_value
+
+        # Season stats carry no TOI totals; use the position baseline
+        avg_toi = np.array(
+            [BASE_TOI.get(player.position, 17.0) for player in players], dtype=float
+        )
+
+        per_game = projection_kernel.per_game_rates(totals, games_played)
+        per_60 = per_game * (projection_kernel.PER_60 / avg_toi)[:, np.newaxis]
 
         return {
-            "ewma_per_game": per_game,
+            "per_game": per_game,
+            "per_60": per_60,
             "avg_toi": avg_toi,
-            "sample_size": games_played,
-            "std_dev": self._estimate_std_dev(stat_type, per_game, player.position),
+            "sample_size": games_played.astype(int),
         }
 
-    def _estimate_std_dev(self, stat_type: str, per_game: float, position: str) -> float:
-        """Estimate standard deviation for NHL stats."""
-        # NHL stats have different variance profiles than NBA
-        # Goals: Poisson-like variance
-        # Assists: Higher variance than goals
-        # Points: Sum of goals + assists
-        # Shots: Relatively consistent
-
-        if stat_type == "goals":
-            # Goals follow roughly Poisson distribution
-            return max(0.5, (per_game * 0.8) ** 0.5)
-        elif stat_type == "assists":
-            # Assists have higher variance
-            return per_game * 0.6
-        elif stat_type == "points":
-            # Points = goals + assists, combine variance
-            return per_game * 0.5
-        elif stat_type == "shots":
-            # Shots are most consistent
-            return per_game * 0.3
-        else:
-            return per_game * 0.4
-
     def _get_projected_toi(
         self,
         player: Player,
@@ -525,26 +568,33 @@ class EnhancedNHLPredictionService:
 
     def _apply_adjustments(
         self,
-        projection: float,
-        player: Player,
+        base: np.ndarray,
+        players: List[Player],
         game: Game,
-        stat_type: str
-    ) -> Tuple[float, Dict[str, float]]:
-        """Apply all contextual adjustments to projection."""
-        factors = {}
+        stat_types: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Apply all contextual adjustments to a players × stats projection.
 
-        # 1. Opponent defensive adjustment
-        opponent = self._get_opponent(player, game)
-        def_adj = self._get_opponent_defensive_adjustment(opponent, stat_type)
-        projection *= (1 + def_adj)
-        factors["opponent_defense"] = round(def_adj, 3)
+        Returns:
+            (projected, opponent_defense, travel_fatigue) - projected and
+            opponent_defense are (P, S), travel_fatigue is (P,)
+        """
+        # 1. Opponent defensive adjustment (one lookup per opponent × stat)
+        opponents = [self._get_opponent(player, game) for player in players]
+        by_opponent = {
+            opponent: [self._get_opponent_defensive_adjustment(opponent, st) for st in stat_types]
+            for opponent in set(opponents)
+        }
+        def_adj = np.array([by_opponent[opponent] for opponent in opponents], dtype=float)
 
         # 2. Travel fatigue adjustment
-        travel_penalty = self._calculate_travel_fatigue(player, game)
-        projection *= (1 + travel_penalty)
-        factors["travel_fatigue"] = round(travel_penalty, 3)
+        travel = np.array(
+            [self._calculate_travel_fatigue(player, game) for player in players], dtype=float
+        )
 
-        return max(0, projection), factors
+        projected = projection_kernel.apply_multipliers(base, [def_adj, travel[:, np.newaxis]])
+        return projected, def_adj, travel
 
     def _get_opponent_defensive_adjustment(
         self,
@@ -586,11 +636,11 @@ class EnhancedNHLPredictionService:
                 return 0.10
         elif stat_type == "assists":
             # Assists less affected by defense
-            adj = _get_opponent_defensive_adjustment(opponent, "goals") * 0.7
+            adj = self._get_opponent_defensive_adjustment(opponent, "goals") * 0.7
             return adj
         elif stat_type == "points":
             # Points = goals + assists
-            return _get_opponent_defensive_adjustment(opponent, "goals") * 0.85
+            return self._get_opponent_defensive_adjustment(opponent, "goals") * 0.85
         else:  # shots
             # Shots are less affected by defense quality
             if def_rank <= 10:
@@ -659,10 +709,10 @@ class EnhancedNHLPredictionService:
         stat_type: str,
         bookmaker: str
     ) -> Dict:
-        """Get bookmaker line from Odds API or estimate."""
-        # Try to fetch real odds
+        """Get bookmaker line from the game's prefetched props or estimate."""
+        # Try the real line
         if self._odds_api_service:
-            real_line = self._fetch_real_odds_line_sync(
+            real_line = self._lookup_odds_line(
                 player, game, stat_type, bookmaker
             )
             if real_line:
@@ -671,59 +721,17 @@ class EnhancedNHLPredictionService:
         # Fall back to estimation
         return self._estimate_line_from_season_stats(player, stat_type)
 
-    def _fetch_real_odds_line_sync(
-        self,
-        player: Player,
-        game: Game,
-        stat_type: str,
-        bookmaker: str
-    ) -> Optional[Dict]:
-        """Fetch real odds line from Odds API (sync wrapper)."""
-        import asyncio
+    async def _prefetch_event_odds(self, game: Game) -> Optional[Dict]:
+        """Resolve the game's odds event and fetch its player props once (cached per game)."""
+        current_time = datetime.utcnow()
 
-        async def _fetch():
-            return await self._fetch_real_odds_line_async(
-                player, game, stat_type, bookmaker
-            )
-
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                import threading
-
-                result = [None]
-
-                def run_in_new_loop():
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        result[0] = new_loop.run_until_complete(_fetch())
-                    finally:
-                        new_loop.close()
-
-                thread = threading.Thread(target=run_in_new_loop)
-                thread.start()
-                thread.join(timeout=10)
-                return result[0]
-            else:
-                return loop.run_until_complete(_fetch())
-        except RuntimeError:
-            return asyncio.run(_fetch())
-
-    async def _fetch_real_odds_line_async(
-        self,
-        player: Player,
-        game: Game,
-        stat_type: str,
-        bookmaker: str
-    ) -> Optional[Dict]:
-        """Fetch real odds line from Odds API (async implementation)."""
-        from datetime import datetime
+        cached = self._odds_cache.get(game.id)
+        if cached and (current_time - cached[1]).total_seconds() < self._cache_ttl_seconds:
+            return cached[0]
 
+        odds_response = None
         try:
             from app.services.nhl.game_odds_mapper import NHLGameOddsMapper
-            from app.services.nhl.player_props_parser import NHLPlayerPropsParser
 
             if self._game_odds_mapper is None:
                 self._game_odds_mapper = NHLGameOddsMapper(
@@ -731,81 +739,69 @@ class EnhancedNHLPredictionService:
                     self._odds_api_service
                 )
 
-            if self._player_props_parser is None:
-                self._player_props_parser = NHLPlayerPropsParser(
-                    bookmaker_priority=[bookmaker.lower()]
-                )
-
             # Get Odds API event ID
             odds_event_id = await self._game_odds_mapper.get_odds_event_id(game)
 
-            if not odds_event_id:
+            if odds_event_id:
+                odds_response = await self._odds_api_service.get_event_player_props(
+                    odds_event_id, sport="nhl"
+                )
+            else:
                 logger.debug(f"No odds_event_id for game {game.id}")
-                return None
+        except Exception as e:
+            logger.error(f"Error fetching real odds for game {game.id}: {e}")
 
-            # Check cache
-            cache_key = (game.id, stat_type)
-            current_time = datetime.utcnow()
+        # Cache misses too, so the game's remaining lookups don't retry the API
+        self._odds_cache[game.id] = (odds_response, current_time)
+        return odds_response
 
-            if cache_key in self._odds_cache:
-                cached_response, cached_at = self._odds_cache[cache_key]
-                cache_age = (current_time - cached_at).total_seconds()
+    def _lookup_odds_line(
+        self,
+        player: Player,
+        game: Game,
+        stat_type: str,
+        bookmaker: str
+    ) -> Optional[Dict]:
+        """Extract a player's line from the game's prefetched props response."""
+        from app.services.nhl.player_props_parser import NHLPlayerPropsParser
 
-                if cache_age < self._cache_ttl_seconds:
-                    odds_response = cached_response
-                else:
-                    odds_response = await self._fetch_and_cache_odds(
-                        odds_event_id, cache_key, current_time
-                    )
-            else:
-                odds_response = await self._fetch_and_cache_odds(
-                    odds_event_id, cache_key, current_time
-                )
+        if game.id not in self._odds_cache:
+            run_sync(self._prefetch_event_odds(game))
+        odds_response, fetched_at = self._odds_cache[game.id]
 
-            if not odds_response or not odds_response.get("data"):
-                return None
+        if not odds_response or not odds_response.get("data"):
+            return None
 
+        if self._player_props_parser is None:
+            self._player_props_parser = NHLPlayerPropsParser(
+                bookmaker_priority=[bookmaker.lower()]
+            )
+
+        try:
             # Extract player line
             line_data = self._player_props_parser.extract_player_lines(
                 odds_response=odds_response,
                 player_name=player.name,
                 stat_type=stat_type
             )
-
-            if line_data:
-                return {
-                    "line": line_data["line"],
-                    "line_open": line_data["line"],
-                    "over_price": line_data.get("over_price", -110),
-                    "under_price": line_data.get("under_price", -110),
-                    "bookmaker": line_data.get("bookmaker", bookmaker),
-                    "line_source": line_data.get("bookmaker"),
-                    "fetched_at": line_data.get("fetched_at", current_time.isoformat()),
-                    "odds_fetched_at": current_time,
-                    "odds_last_updated": current_time
-                }
-
-            return None
-
         except Exception as e:
-            logger.error(f"Error fetching real odds for {player.name}: {e}")
+            logger.error(f"Error parsing odds for {player.name}: {e}")
             return None
 
-    async def _fetch_and_cache_odds(
-        self,
-        odds_event_id: str,
-        cache_key: tuple,
-        current_time: datetime
-    ) -> Optional[Dict]:
-        """Fetch odds from API and cache."""
-        odds_response = await self._odds_api_service.get_event_player_props(
-            odds_event_id, sport="nhl"
-        )
-
-        if odds_response is not None:
-            self._odds_cache[cache_key] = (odds_response, current_time)
-
-        return odds_response
+        if line_data:
+            return {
+                "line": line_data["line"],
+                "line_open": line_data["line"],
+                "over_price": line_data.get("over_price", -110),
+                "under_price": line_data.get("under_price", -110),
+                "bookmaker": line_data.get("bookmaker", bookmaker),
+                "line_source": line_data.get("bookmaker"),
+                "fetched_at": line_data.get("fetched_at", fetched_at.isoformat()),
+                "odds_fetched_at": fetched_at,
+                "odds_last_updated": fetched_at
+            }
+
+        return None
 
     def _estimate_line_from_season_stats(
         self,
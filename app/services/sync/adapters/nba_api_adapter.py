@@ -19,6 +19,7 @@ from sqlalchemy.orm import Session
 import uuid
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from app.core.config import settings
 from app.services.nba.nba_api_service import NbaApiService
 from app.models import Player, Game as NBAGame, TeamMapping
 
@@ -88,7 +89,10 @@ class NbaApiAdapter:
             List of normalized game dicts
         """
         all_games = []
-        base_url = "https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+        base_url = (
+            f"{settings.NBA_CDN_BASE_URL.rstrip('/')}"
+            "/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+        )
 
         try:
             async with httpx.AsyncClient(timeout=30.0) as client:
@@ -142,9 +146,10 @@ class NbaApiAdapter:
 
         logger.info(f"Fetched {len(all_games)} total games from NBA.com todaysScoreboard")
 
-        # Create or update Game records in database
+        # Create or update Game records in database; 'changed' marks games
+        # that are new or whose status moved (incremental syncs)
         for game_data in all_games:
-            self._upsert_game(game_data)
+            game_data['changed'] = self._upsert_game(game_data)
 
         self.db.commit()
 
@@ -172,12 +177,18 @@ class NbaApiAdapter:
         else:
             return "finished"
 
-    def _upsert_game(self, game_data: Dict[str, Any]) -> None:
+    def _upsert_game(self, game_data: Dict[str, Any]) -> bool:
         """
         Create or update a Game record in the database.
 
+        Existing games are only touched (status, updated_at) when the
+        status changed, so updated_at tracks real changes.
+
         Args:
             game_data: Normalized game data dict
+
+        Returns:
+            True if the game was created or its status changed
         """
         # Check if game exists
         existing = self.db.query(NBAGame).filter(
@@ -190,6 +201,8 @@ class NbaApiAdapter:
         now = datetime.utcnow()
 
         if existing:
+            if existing.status == game_data['status']:
+                return False
             # Update existing game
             existing.status = game_data['status']
             existing.updated_at = now
@@ -211,6 +224,8 @@ class NbaApiAdapter:
             self.db.add(new_game)
             logger.info(f"Created game {game_data['id']}: {game_data['away_team']} @ {game_data['home_team']} on {game_data['game_date']}")
 
+        return True
+
     def _map_game_status(self, nba_status: int) -> str:
         """Map NBA game status to our status values."""
         status_map = {
@@ -281,7 +296,8 @@ class NbaApiAdapter:
     async def sync_all_player_stats(
         self,
         games_limit: int = 50,
-        season: str = "2025-26"
+        season: str = "2025-26",
+        bulk: bool = False
     ) -> Dict[str, int]:
         """
         Sync all active player stats.
@@ -289,13 +305,16 @@ class NbaApiAdapter:
         Args:
             games_limit: Number of games to average
             season: NBA season
+            bulk: Ingest league-wide game logs in one call instead of
+                  one request per player
 
         Returns:
             Sync results dict
         """
         return await self.nba_service.sync_all_active_players(
             games_limit=games_limit,
-            season=season
+            season=season,
+            bulk=bulk
         )
 
     def get_player_by_nba_id(self, nba_player_id: int) -> Optional[Player]:
@@ -10,7 +10,7 @@ Data transformation:
 """
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -106,6 +106,26 @@ class OddsApiAdapter:
             logger.error(f"Error fetching player props for {odds_event_id}: {e}")
             return None
 
+    async def stream_player_props(
+        self,
+        odds_event_ids: List[str],
+        max_concurrency: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Fetch player props for many games concurrently.
+
+        Args:
+            odds_event_ids: The Odds API event IDs
+            max_concurrency: Requests in flight at once (default: ODDS_API_MAX_CONCURRENCY)
+
+        Yields:
+            (odds_event_id, player props data) as each response arrives
+        """
+        async for item in self.odds_service.stream_event_player_props(
+            odds_event_ids, max_concurrency=max_concurrency
+        ):
+            yield item
+
     async def normalize_player_props(
         self,
         props_data: Dict[str, Any]
@@ -11,20 +11,46 @@ Race Condition Prevention:
 All insert operations use PostgreSQL's ON CONFLICT clause (upsert) to ensure
 atomicity and prevent duplicate game mappings, even when multiple processes
 run simultaneously.
+
+Batch matching (batch_match_games) prefetches existing mappings and
+team_mappings once, indexes the odds events by (date, home team, away team)
+and writes all mappings in one bulk upsert, so a full season (~1,230 games
+against ~1,300 events) takes a handful of queries instead of N × M scoring
+passes with a query per game.
+
+Audit entries go to the write-behind audit sink (app.core.audit_sink), so
+matching does not wait on match_audit_log inserts.
 """
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from collections import defaultdict
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete as sql_delete
-
-from app.services.sync.utils.confidence_scorer import calculate_game_match_confidence, get_match_method_description
-from app.models import GameMapping, MatchAuditLog
+from sqlalchemy import func, or_, select, update, delete as sql_delete
+
+from app.services.sync.utils.confidence_scorer import (
+    AUTO_ACCEPT_THRESHOLD,
+    calculate_game_match_confidence,
+    get_match_method_description,
+    score_team_name,
+)
+from app.core.audit_sink import AuditEvent, get_audit_sink
+from app.models import GameMapping, TeamMapping
 import uuid
-import json
 
 logger = logging.getLogger(__name__)
 
+# batch_match_games also considers odds events this many days either side of
+# the NBA game date (The Odds API commence_time is UTC)
+DATE_TOLERANCE_DAYS = 1
+
+
+def _minutes_apart(nba_time: Any, odds_time: Any) -> Optional[float]:
+    """Minutes between two tip-off datetimes (timezone info ignored), or None without times."""
+    if not isinstance(nba_time, datetime) or not isinstance(odds_time, datetime):
+        return None
+    return abs((nba_time.replace(tzinfo=None) - odds_time.replace(tzinfo=None)).total_seconds()) / 60
+
 
 class GameMatcher:
     """
@@ -316,6 +342,16 @@ class GameMatcher:
                 logger.debug(f"Pending mapping for {nba_game_id} created by another process")
             return mapping
 
+    @staticmethod
+    def _mapping_state(mapping: GameMapping) -> Dict[str, Any]:
+        """Audit snapshot of a mapping's match fields."""
+        return {
+            'odds_event_id': mapping.odds_event_id,
+            'match_confidence': float(mapping.match_confidence),
+            'match_method': mapping.match_method,
+            'status': mapping.status
+        }
+
     async def _log_audit(
         self,
         entity_type: str,
@@ -325,32 +361,12 @@ class GameMatcher:
         new_state: Dict[str, Any],
         match_details: Optional[Dict[str, Any]] = None
     ):
-        """Log match to audit trail."""
-
-        def _serialize_datetime(obj: Any) -> Any:
-            """Convert datetime objects to ISO strings for JSON serialization."""
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            elif isinstance(obj, dict):
-                return {k: _serialize_datetime(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [_serialize_datetime(item) for item in obj]
-            return obj
-
+        """Queue a match for the audit trail (write-behind, see app.core.audit_sink)."""
         try:
-            audit_log = MatchAuditLog(
-                id=str(uuid.uuid4()),
-                entity_type=entity_type,
-                entity_id=entity_id,
-                action=action,
-                previous_state=json.dumps(_serialize_datetime(previous_state)) if previous_state else None,
-                new_state=json.dumps(_serialize_datetime(new_state)),
-                match_details=json.dumps(_serialize_datetime(match_details)) if match_details else None,
-                performed_by='system',
-                created_at=datetime.utcnow()
+            get_audit_sink().record(
+                AuditEvent(entity_type, entity_id, action, previous_state, new_state, match_details),
+                db=self.db
             )
-            self.db.add(audit_log)
-            self.db.commit()
         except Exception as e:
             logger.error(f"Failed to log audit entry: {e}")
 
@@ -385,14 +401,28 @@ class GameMatcher:
     async def batch_match_games(
         self,
         nba_games: List[Dict[str, Any]],
-        odds_games: List[Dict[str, Any]]
+        odds_games: List[Dict[str, Any]],
+        date_tolerance_days: int = DATE_TOLERANCE_DAYS
     ) -> Dict[str, Any]:
         """
         Match multiple games in batch.
 
+        Prefetches existing mappings and team_mappings in one query each,
+        indexes the odds games by (date, home team, away team) so every NBA
+        game is scored only against events for the same matchup within
+        date_tolerance_days, and writes new, updated and pending mappings
+        plus their audit entries in one bulk upsert and one commit.
+
+        Confidence rules are those of find_match; an odds event is assigned
+        to at most one game.
+
         Args:
             nba_games: List of NBA games from nba_api
             odds_games: List of odds games from The Odds API
+            date_tolerance_days: Also consider events this many days either
+                                 side of the NBA game date (UTC commence
+                                 times roll over to the next day for
+                                 evening tip-offs)
 
         Returns:
             Summary dict with:
@@ -407,33 +437,51 @@ class GameMatcher:
             'unmatched': 0,
             'matches': []
         }
+        if not nba_games:
+            return results
+
+        existing = self._prefetch_mappings(nba_games, odds_games)
+        claimed = {m.odds_event_id for m in existing.values() if m.odds_event_id}
+        index = self._index_odds_games(odds_games)
+
+        now = datetime.utcnow()
+        matched_rows = []
+        pending_rows = []
+        audit_events = []
 
         for nba_game in nba_games:
-            # Check for existing mapping first
-            existing = self.get_existing_mapping(nba_game['id'])
+            mapping = existing.get(nba_game['id'])
 
-            if existing and existing.status == 'matched':
+            if mapping and mapping.status == 'matched':
                 results['matched'] += 1
                 results['matches'].append({
                     'nba_game_id': nba_game['id'],
-                    'odds_event_id': existing.odds_event_id,
-                    'match_confidence': float(existing.match_confidence),
-                    'match_method': existing.match_method,
+                    'odds_event_id': mapping.odds_event_id,
+                    'match_confidence': float(mapping.match_confidence),
+                    'match_method': mapping.match_method,
                     'cached': True
                 })
                 continue
 
-            # Try to find new match
-            match = await self.find_match(nba_game, odds_games)
+            match = self._best_indexed_match(nba_game, index, claimed, date_tolerance_days)
 
             if match:
-                await self.create_or_update_mapping(
-                    nba_game_id=nba_game['id'],
-                    nba_home_team_id=nba_game['home_team_id'],
-                    nba_away_team_id=nba_game['away_team_id'],
-                    match=match,
-                    game_date=nba_game['game_date']
-                )
+                claimed.add(match['odds_event_id'])
+                matched_rows.append(self._mapping_row(nba_game, now, match=match))
+                audit_events.append(AuditEvent(
+                    entity_type='game',
+                    entity_id=nba_game['id'],
+                    action='matched',
+                    previous_state=self._mapping_state(mapping) if mapping else None,
+                    new_state={
+                        'odds_event_id': match['odds_event_id'],
+                        'match_confidence': match['match_confidence'],
+                        'match_method': match['match_method'],
+                        'status': 'matched'
+                    },
+                    match_details=match,
+                    created_at=now
+                ))
                 results['matched'] += 1
                 results['matches'].append({
                     'nba_game_id': nba_game['id'],
@@ -443,24 +491,215 @@ class GameMatcher:
                     'cached': False
                 })
             else:
-                # Create pending mapping for manual review using atomic operation
-                # This prevents race conditions where multiple processes might
-                # try to create the same pending mapping simultaneously
-                await self.create_pending_mapping_atomic(
-                    nba_game_id=nba_game['id'],
-                    nba_home_team_id=nba_game['home_team_id'],
-                    nba_away_team_id=nba_game['away_team_id'],
-                    game_date=nba_game['game_date']
-                )
+                # Pending mapping for manual review (existing rows are kept as-is)
+                if not mapping:
+                    pending_rows.append(self._mapping_row(nba_game, now))
                 results['unmatched'] += 1
 
+        self._upsert_mappings(matched_rows, pending_rows)
+        self.db.commit()
+        get_audit_sink().record_many(audit_events, db=self.db)
+
         logger.info(
             f"Batch game matching complete: {results['matched']}/{results['total']} matched, "
-            f"{results['unmatched']} unmatched"
+            f"{results['unmatched']} unmatched ({len(matched_rows)} new matches, "
+            f"{len(pending_rows)} pending)"
         )
 
         return results
 
+    def _prefetch_mappings(
+        self,
+        nba_games: List[Dict[str, Any]],
+        odds_games: List[Dict[str, Any]]
+    ) -> Dict[str, GameMapping]:
+        """
+        Load the batch's existing mappings in one query.
+
+        Also loads mappings that already hold one of the odds events so
+        those events are not assigned twice.
+
+        Returns:
+            Dict of nba_game_id -> GameMapping
+        """
+        nba_game_ids = [game['id'] for game in nba_games]
+        odds_event_ids = [game['id'] for game in odds_games if game.get('id')]
+
+        condition = GameMapping.nba_game_id.in_(nba_game_ids)
+        if odds_event_ids:
+            condition = or_(condition, GameMapping.odds_event_id.in_(odds_event_ids))
+
+        return {
+            mapping.nba_game_id: mapping
+            for mapping in self.db.query(GameMapping).filter(condition).all()
+        }
+
+    def _index_odds_games(
+        self,
+        odds_games: List[Dict[str, Any]]
+    ) -> Dict[Tuple[date, int, int], List[Tuple[Dict[str, Any], Tuple[bool, float], Tuple[bool, float]]]]:
+        """
+        Index odds games by (commence date, home team ID, away team ID).
+
+        Each Odds API team name is resolved once against the prefetched
+        team_mappings to every nba_team_id it could match: an exact
+        odds_api_name hit and/or a score_team_name() score >= 0.85. An event
+        is filed under every (home, away) combination, keeping the per-side
+        (exact, score) pair for confidence scoring.
+
+        Returns:
+            Dict of key -> [(odds_game, home_match, away_match), ...] in
+            odds_games order
+        """
+        team_mappings = self.db.query(TeamMapping).all()
+        resolved: Dict[str, Dict[int, Tuple[bool, float]]] = {}
+
+        def resolve(name: str) -> Dict[int, Tuple[bool, float]]:
+            if name not in resolved:
+                candidates = {}
+                for mapping in team_mappings:
+                    exact = mapping.odds_api_name == name
+                    score = score_team_name(mapping, name)
+                    if exact or score >= AUTO_ACCEPT_THRESHOLD:
+                        candidates[mapping.nba_team_id] = (exact, score)
+                resolved[name] = candidates
+            return resolved[name]
+
+        index = defaultdict(list)
+        seen = set()
+        for odds_game in odds_games:
+            commence_time = odds_game.get('commence_time')
+            if not commence_time or odds_game.get('id') in seen:
+                continue
+            seen.add(odds_game.get('id'))
+            odds_date = commence_time.date() if isinstance(commence_time, datetime) else commence_time
+
+            home_candidates = resolve(odds_game.get('home_team') or '')
+            away_candidates = resolve(odds_game.get('away_team') or '')
+            for home_id, home_match in home_candidates.items():
+                for away_id, away_match in away_candidates.items():
+                    index[(odds_date, home_id, away_id)].append((odds_game, home_match, away_match))
+
+        return index
+
+    def _best_indexed_match(
+        self,
+        nba_game: Dict[str, Any],
+        index: Dict[Tuple[date, int, int], List],
+        claimed: set,
+        date_tolerance_days: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Score the indexed candidates for one NBA game.
+
+        Same confidence rules as calculate_game_match_confidence: both teams
+        exact via team_mappings -> 1.0 within 2 hours of tip-off, else 0.95;
+        otherwise the average of the per-team fuzzy scores when both are
+        >= 0.85. Events already claimed are skipped.
+
+        Returns:
+            Match dict as returned by find_match(), or None
+        """
+        game_date = nba_game['game_date']
+        nba_date = game_date.date() if isinstance(game_date, datetime) else game_date
+        offsets = sorted(range(-date_tolerance_days, date_tolerance_days + 1), key=abs)
+
+        best_match = None
+        best_confidence = 0.0
+
+        for offset in offsets:
+            key = (nba_date + timedelta(days=offset), nba_game['home_team_id'], nba_game['away_team_id'])
+            for odds_game, (home_exact, home_score), (away_exact, away_score) in index.get(key, ()):
+                if odds_game.get('id') in claimed:
+                    continue
+
+                if home_exact and away_exact:
+                    minutes = _minutes_apart(game_date, odds_game['commence_time'])
+                    confidence = 1.0 if minutes is not None and minutes <= 120 else 0.95
+                elif home_score >= AUTO_ACCEPT_THRESHOLD and away_score >= AUTO_ACCEPT_THRESHOLD:
+                    confidence = (home_score + away_score) / 2
+                else:
+                    continue
+
+                if confidence > best_confidence:
+                    best_confidence = confidence
+                    best_match = {
+                        'odds_event_id': odds_game.get('id'),
+                        'match_confidence': confidence,
+                        'match_method': self._get_method_from_confidence(confidence),
+                        'odds_game_data': odds_game
+                    }
+
+        if best_match and best_match['match_confidence'] >= AUTO_ACCEPT_THRESHOLD:
+            return best_match
+
+        return None
+
+    @staticmethod
+    def _mapping_row(
+        nba_game: Dict[str, Any],
+        now: datetime,
+        match: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """game_mappings column dict for a matched or pending (manual_review) game."""
+        game_date = nba_game['game_date']
+        return {
+            'id': str(uuid.uuid4()),
+            'nba_game_id': nba_game['id'],
+            'nba_home_team_id': nba_game['home_team_id'],
+            'nba_away_team_id': nba_game['away_team_id'],
+            'odds_event_id': match['odds_event_id'] if match else None,
+            'odds_sport_key': 'basketball_nba',
+            'game_date': game_date.date() if isinstance(game_date, datetime) else game_date,
+            'game_time': game_date if isinstance(game_date, datetime) else None,
+            'match_confidence': match['match_confidence'] if match else 0.0,
+            'match_method': match['match_method'] if match else 'none',
+            'status': 'matched' if match else 'manual_review',
+            'last_validated_at': now if match else None,
+            'created_at': now,
+            'updated_at': now
+        }
+
+    def _upsert_mappings(self, matched_rows: List[Dict[str, Any]], pending_rows: List[Dict[str, Any]]) -> None:
+        """
+        Write matched and pending mappings with batched ON CONFLICT statements.
+
+        Matched rows update an existing unmatched mapping for the same
+        nba_game_id (keeping its id, created_at and any known date/time) but
+        never overwrite one that was matched in the meantime; pending rows
+        leave existing mappings alone.
+        """
+        if self.db.get_bind().dialect.name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        if matched_rows:
+            stmt = dialect_insert(GameMapping)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[GameMapping.nba_game_id],
+                set_={
+                    'nba_home_team_id': stmt.excluded.nba_home_team_id,
+                    'nba_away_team_id': stmt.excluded.nba_away_team_id,
+                    'odds_event_id': stmt.excluded.odds_event_id,
+                    'match_confidence': stmt.excluded.match_confidence,
+                    'match_method': stmt.excluded.match_method,
+                    'status': stmt.excluded.status,
+                    'last_validated_at': stmt.excluded.last_validated_at,
+                    'updated_at': stmt.excluded.updated_at,
+                    'game_date': func.coalesce(GameMapping.game_date, stmt.excluded.game_date),
+                    'game_time': func.coalesce(GameMapping.game_time, stmt.excluded.game_time),
+                },
+                where=GameMapping.status != 'matched'
+            )
+            self.db.execute(stmt, matched_rows)
+
+        if pending_rows:
+            stmt = dialect_insert(GameMapping).on_conflict_do_nothing(
+                index_elements=[GameMapping.nba_game_id]
+            )
+            self.db.execute(stmt, pending_rows)
+
     def get_unmatched_games(self, limit: int = 100) -> List[GameMapping]:
         """
         Get games that haven't been matched yet.
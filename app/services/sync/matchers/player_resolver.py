@@ -18,19 +18,40 @@ Improvements (P1 #11):
 - Added suffix preservation to prevent Jr/Sr confusion
 - Added verification_required flag for low-confidence matches
 - Added position verification when available
+
+Alias index:
+Each source's player_aliases rows are held in a process-level AliasIndex
+(app.core.cache namespace "player_aliases", TTL ALIAS_INDEX_TTL_SECONDS)
+with exact and normalized-name dicts and the name list for RapidFuzz.
+Steps 1-3 run in memory; create_or_update_alias updates the cached index
+in place. batch_resolve_players scores every name left after steps 1-2
+in one process.cdist pass, so resolving a 500-name props payload reads
+the alias table once.
+
+Until a source's index is loaded (the fuzzy step or a batch loads it),
+steps 1-2 are single equality queries on the (alias_source, alias_name)
+unique key and the indexed player_aliases.normalized_name column, which
+the model keeps equal to normalize(alias_name).
+
+Alias writes are audited through the write-behind audit sink
+(app.core.audit_sink).
 """
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from datetime import datetime
+
+import numpy as np
 from sqlalchemy.orm import Session
 
 from app.services.sync.utils.name_normalizer import (
     normalize, extract_player_name_parts, are_names_equal, extract_suffix
 )
 from app.services.sync.utils.confidence_scorer import calculate_player_match_confidence
-from app.models import PlayerAlias, MatchAuditLog
+from app.core.audit_sink import AuditEvent, get_audit_sink
+from app.core.cache import get_cache
+from app.models import PlayerAlias
 import uuid
-import json
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +63,110 @@ POSITION_MATCH_BOOST = 0.03    # Boost when position also matches
 AUTO_ACCEPT_THRESHOLD = 0.85   # Auto-accept matches at or above this
 MANUAL_REVIEW_THRESHOLD = 0.70 # Require review below this
 
+# Seconds a source's alias index is reused before re-reading player_aliases
+# (picks up aliases written by other processes)
+ALIAS_INDEX_TTL_SECONDS = 300
+
+
+class _Alias(NamedTuple):
+    """The player_aliases columns the resolver needs."""
+    alias_name: str
+    nba_player_id: int
+    canonical_name: str
+    match_confidence: float
+    normalized_name: Optional[str] = None
+
+
+_ALIAS_COLUMNS = (
+    PlayerAlias.alias_name,
+    PlayerAlias.nba_player_id,
+    PlayerAlias.canonical_name,
+    PlayerAlias.match_confidence,
+    PlayerAlias.normalized_name,
+)
+
+
+class AliasIndex:
+    """
+    In-memory view of one source's player_aliases rows.
+
+    Exact and normalized lookups are dict hits (first row wins, as with the
+    previous first()/scan queries); names holds alias_name per entry for
+    RapidFuzz scoring.
+    """
+
+    def __init__(self, source: str, aliases: List[_Alias]):
+        self.source = source
+        self.entries: List[_Alias] = []
+        self.names: List[str] = []
+        self._by_name: Dict[str, int] = {}
+        self._by_normalized: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for alias in aliases:
+            self._append(alias)
+
+    @classmethod
+    def load(cls, db: Session, source: str) -> "AliasIndex":
+        """Read every alias for a source in one query."""
+        rows = db.query(*_ALIAS_COLUMNS).filter(
+            PlayerAlias.alias_source == source
+        ).all()
+        return cls(source, [_Alias(*row) for row in rows])
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _append(self, alias: _Alias) -> None:
+        position = len(self.entries)
+        self.entries.append(alias)
+        self.names.append(alias.alias_name)
+        self._by_name.setdefault(alias.alias_name, position)
+        self._by_normalized.setdefault(alias.normalized_name or normalize(alias.alias_name), position)
+
+    def exact(self, name: str) -> Optional[_Alias]:
+        """Alias stored under exactly this name."""
+        position = self._by_name.get(name)
+        return self.entries[position] if position is not None else None
+
+    def normalized(self, name: str) -> Optional[_Alias]:
+        """First alias whose normalized name equals the normalized input."""
+        position = self._by_normalized.get(normalize(name))
+        return self.entries[position] if position is not None else None
+
+    def upsert(self, alias: _Alias) -> None:
+        """Add an alias or replace the one stored under the same name."""
+        with self._lock:
+            position = self._by_name.get(alias.alias_name)
+            if position is None:
+                self._append(alias)
+            else:
+                self.entries[position] = alias
+
+    def snapshot(self) -> Tuple[List[str], List[_Alias]]:
+        """Consistent copies of (names, entries) for scoring."""
+        with self._lock:
+            return list(self.names), list(self.entries)
+
+
+def _alias_index_cache():
+    return get_cache("player_aliases", max_size=64, default_ttl=ALIAS_INDEX_TTL_SECONDS)
+
+
+def invalidate_alias_index(source: Optional[str] = None) -> None:
+    """
+    Drop cached alias indexes so the next lookup re-reads player_aliases.
+
+    Needed only after writing aliases outside create_or_update_alias.
+
+    Args:
+        source: Source to drop (default: all sources)
+    """
+    cache = _alias_index_cache()
+    if source is None:
+        cache.clear()
+    else:
+        cache.delete(source)
+
 
 class PlayerResolver:
     """
@@ -60,6 +185,28 @@ class PlayerResolver:
         """
         self.db = db
 
+    @staticmethod
+    def _cached_index(source: str) -> Optional[AliasIndex]:
+        """This source's alias index if already loaded (never loads it)."""
+        return _alias_index_cache().get(source)
+
+    def _query_alias(self, source: str, *criteria) -> Optional[_Alias]:
+        """First alias for a source matching an indexed equality filter."""
+        row = self.db.query(*_ALIAS_COLUMNS).filter(
+            PlayerAlias.alias_source == source, *criteria
+        ).first()
+        return _Alias(*row) if row else None
+
+    def _alias_index(self, source: str) -> AliasIndex:
+        """This source's cached alias index, loaded on first use."""
+        cache = _alias_index_cache()
+        index = cache.get(source)
+        if index is None:
+            index = AliasIndex.load(self.db, source)
+            cache.set(source, index)
+            logger.debug(f"Loaded {len(index)} {source} aliases into the alias index")
+        return index
+
     async def resolve_player(
         self,
         player_name: str,
@@ -136,10 +283,11 @@ class PlayerResolver:
         Returns:
             Resolution dict or None
         """
-        alias = self.db.query(PlayerAlias).filter(
-            PlayerAlias.alias_name == player_name,
-            PlayerAlias.alias_source == source
-        ).first()
+        index = self._cached_index(source)
+        if index is not None:
+            alias = index.exact(player_name)
+        else:
+            alias = self._query_alias(source, PlayerAlias.alias_name == player_name)
 
         if alias:
             return {
@@ -159,7 +307,7 @@ class PlayerResolver:
         """
         Step 2: Normalized comparison.
 
-        Normalizes both input and stored aliases, then compares.
+        Compares the normalized input with player_aliases.normalized_name.
         Handles suffixes, punctuation, case differences.
 
         Args:
@@ -169,21 +317,20 @@ class PlayerResolver:
         Returns:
             Resolution dict or None
         """
-        normalized_input = normalize(player_name)
-
-        # Get all aliases from this source
-        aliases = self.db.query(PlayerAlias).filter(
-            PlayerAlias.alias_source == source
-        ).all()
+        index = self._cached_index(source)
+        if index is not None:
+            alias = index.normalized(player_name)
+        else:
+            normalized = normalize(player_name)
+            alias = self._query_alias(source, PlayerAlias.normalized_name == normalized) if normalized else None
 
-        for alias in aliases:
-            if normalize(alias.alias_name) == normalized_input:
-                return {
-                    'nba_player_id': alias.nba_player_id,
-                    'canonical_name': alias.canonical_name,
-                    'match_confidence': 0.95,
-                    'match_method': 'normalized'
-                }
+        if alias:
+            return {
+                'nba_player_id': alias.nba_player_id,
+                'canonical_name': alias.canonical_name,
+                'match_confidence': 0.95,
+                'match_method': 'normalized'
+            }
 
         return None
 
@@ -209,50 +356,90 @@ class PlayerResolver:
         """
         from rapidfuzz import fuzz, process
 
-        # Get all aliases
-        aliases = self.db.query(PlayerAlias).filter(
-            PlayerAlias.alias_source == source
-            ).all()
+        names, entries = self._alias_index(source).snapshot()
 
-        if not aliases:
+        if not names:
             return None
 
-        # Create list of (alias_name, alias_obj) tuples
-        alias_choices = [(alias.alias_name, alias) for alias in aliases]
-
         # Find best match
         best_match = process.extractOne(
             player_name,
-            alias_choices,
+            names,
             scorer=fuzz.WRatio,
             score_cutoff=FUZZY_MATCH_THRESHOLD  # Minimum 85% similarity
         )
 
         if best_match:
-            alias_name, alias_obj = best_match[0]
-            score = best_match[1]
+            _, score, position = best_match
+            return self._fuzzy_result(entries[position], score, context)
 
-            # Calculate confidence based on score
-            confidence = score / 100.0
+        return None
 
-            # Apply conservative boosts
-            if context.get('team_match'):
-                confidence = min(confidence + TEAM_MATCH_BOOST, 1.0)
-            if context.get('position_match'):
-                confidence = min(confidence + POSITION_MATCH_BOOST, 1.0)
+    def _fuzzy_result(self, alias: _Alias, score: float, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolution dict for a fuzzy alias hit with WRatio score (0-100)."""
+        # Calculate confidence based on score
+        confidence = score / 100.0
 
-            # Determine if verification is required
-            verification_required = confidence < AUTO_ACCEPT_THRESHOLD
+        # Apply conservative boosts
+        if context.get('team_match'):
+            confidence = min(confidence + TEAM_MATCH_BOOST, 1.0)
+        if context.get('position_match'):
+            confidence = min(confidence + POSITION_MATCH_BOOST, 1.0)
 
-            return {
-                'nba_player_id': alias_obj.nba_player_id,
-                'canonical_name': alias_obj.canonical_name,
-                'match_confidence': confidence,
-                'match_method': 'fuzzy',
-                'verification_required': verification_required
-            }
+        # Determine if verification is required
+        verification_required = confidence < AUTO_ACCEPT_THRESHOLD
 
-        return None
+        return {
+            'nba_player_id': alias.nba_player_id,
+            'canonical_name': alias.canonical_name,
+            'match_confidence': confidence,
+            'match_method': 'fuzzy',
+            'verification_required': verification_required
+        }
+
+    def _batch_fuzzy_lookup(
+        self,
+        player_names: List[str],
+        source: str,
+        context: Dict[str, Any]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Step 3 for many names in one RapidFuzz cdist pass.
+
+        Same result per name as _fuzzy_lookup (best WRatio >= threshold,
+        first alias on ties).
+
+        Args:
+            player_names: Names left unresolved by steps 1-2
+            source: Source of the names
+            context: Context dict for boosting confidence
+
+        Returns:
+            Resolution dict or None per name
+        """
+        from rapidfuzz import fuzz, process
+
+        names, entries = self._alias_index(source).snapshot()
+
+        if not names or not player_names:
+            return [None] * len(player_names)
+
+        scores = process.cdist(
+            player_names,
+            names,
+            scorer=fuzz.WRatio,
+            score_cutoff=FUZZY_MATCH_THRESHOLD,
+            dtype=np.float64,
+            workers=-1
+        )
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(player_names)), best]
+
+        return [
+            self._fuzzy_result(entries[position], float(score), context)
+            if score >= FUZZY_MATCH_THRESHOLD else None
+            for position, score in zip(best.tolist(), best_scores.tolist())
+        ]
 
     async def _context_lookup(
         self,
@@ -453,6 +640,14 @@ class PlayerResolver:
         self.db.commit()
         self.db.refresh(alias)
 
+        # Keep the cached alias index in step (no reload)
+        index = _alias_index_cache().get(alias_source)
+        if index is not None:
+            index.upsert(_Alias(
+                alias.alias_name, alias.nba_player_id, alias.canonical_name,
+                float(alias.match_confidence), alias.normalized_name
+            ))
+
         # Log to audit trail
         new_state = {
             'nba_player_id': alias.nba_player_id,
@@ -490,21 +685,12 @@ class PlayerResolver:
         new_state: Dict[str, Any],
         match_details: Optional[Dict[str, Any]] = None
     ):
-        """Log match to audit trail."""
+        """Queue a match for the audit trail (write-behind, see app.core.audit_sink)."""
         try:
-            audit_log = MatchAuditLog(
-                id=str(uuid.uuid4()),
-                entity_type=entity_type,
-                entity_id=entity_id,
-                action=action,
-                previous_state=json.dumps(previous_state) if previous_state else None,
-                new_state=json.dumps(new_state),
-                match_details=json.dumps(match_details) if match_details else None,
-                performed_by='system',
-                created_at=datetime.utcnow()
+            get_audit_sink().record(
+                AuditEvent(entity_type, entity_id, action, previous_state, new_state, match_details),
+                db=self.db
             )
-            self.db.add(audit_log)
-            self.db.commit()
         except Exception as e:
             logger.error(f"Failed to log audit entry: {e}")
 
@@ -547,6 +733,11 @@ class PlayerResolver:
         """
         Resolve multiple players in batch.
 
+        Runs the resolve_player pipeline for every name against one alias
+        index read: exact and normalized hits from its dicts, then one
+        vectorized fuzzy pass over all remaining names, then team context
+        lookups for whatever is still unresolved.
+
         Args:
             player_names: List of player names to resolve
             source: Source of the names (odds_api, espn, etc.)
@@ -555,8 +746,30 @@ class PlayerResolver:
         Returns:
             List of resolution dicts (same length as input), with None for unresolved players
         """
-        results = []
-        for player_name in player_names:
-            result = await self.resolve_player(player_name, source, context)
-            results.append(result)
+        context = context or {}
+        results: list[Optional[Dict[str, Any]]] = [None] * len(player_names)
+        unresolved = []
+        self._alias_index(source)
+
+        for position, player_name in enumerate(player_names):
+            result = await self._exact_lookup(player_name, source)
+            if not result:
+                result = await self._normalized_lookup(player_name, source)
+            if result:
+                results[position] = result
+            else:
+                unresolved.append(position)
+
+        fuzzy_results = self._batch_fuzzy_lookup(
+            [player_names[position] for position in unresolved], source, context
+        )
+
+        for position, result in zip(unresolved, fuzzy_results):
+            player_name = player_names[position]
+            if not result and (context.get('team_id') or context.get('team_abbr')):
+                result = await self._context_lookup(player_name, source, context)
+            if not result:
+                logger.warning(f"No match found for player: {player_name} (source: {source})")
+            results[position] = result
+
         return results
@@ -7,7 +7,20 @@ This orchestrator coordinates:
 - Sync metadata tracking
 - Health monitoring
 
+Incremental sync (run_incremental_sync):
+Runs games -> match <- odds and games -> stats as a dependency DAG
+(app.services.sync.dag). The nba_api and Odds API fetches run
+concurrently; matching waits for both, player stats wait for games. Each
+stage records its run and watermark in sync_metadata and only works on
+what changed: games are written only when new or re-statused, matching
+covers games and odds events not yet in a matched mapping, and game logs
+are ingested only when games went final after the stats watermark. Stage
+durations go to sync_metadata.sync_duration_ms and the
+sync_stage_duration_seconds metric. Stages run concurrently, so each one
+gets its own session: a failing stage rolls back only its own work.
+
 Sync Schedule (recommended cron):
+- incremental: "15 0,6,12,18 * * *" (every 6 hours)
 - nba_games_full: "0 6,18 * * *" (twice daily at 6am/6pm UTC)
 - odds_current: "*/5 10-23 * * *" (every 5 min during games)
 - nba_player_stats: "0 * * * *" (hourly)
@@ -15,22 +28,33 @@ Sync Schedule (recommended cron):
 - cleanup: "0 4 * * *" (daily at 4am UTC)
 """
 import logging
-from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, date, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from sqlalchemy.orm import Session, sessionmaker
 import uuid
 import json
 
+from app.services.sync.dag import SyncStage, run_stages
 from app.services.sync.matchers.game_matcher import GameMatcher
 from app.services.sync.matchers.player_resolver import PlayerResolver
 from app.services.sync.adapters.nba_api_adapter import NbaApiAdapter
 from app.services.sync.adapters.odds_api_adapter import OddsApiAdapter
 from app.models import (
-    GameMapping, PlayerAlias, TeamMapping, SyncMetadata, MatchAuditLog
+    Game, GameMapping, PlayerAlias, TeamMapping, SyncMetadata, MatchAuditLog
 )
 
 logger = logging.getLogger(__name__)
 
+# Game.status values that mean the boxscore is final
+FINAL_GAME_STATUSES = ('final', 'finished')
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Timezone-aware datetimes as naive UTC (sync_metadata stores naive)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 
 class SyncOrchestrator:
     """
@@ -40,14 +64,17 @@ class SyncOrchestrator:
     All sync operations should go through this orchestrator.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, session_factory: Optional[Callable[[], Session]] = None):
         """
         Initialize the sync orchestrator.
 
         Args:
             db: SQLAlchemy database session
+            session_factory: Creates the per-stage sessions run_incremental_sync
+                             uses (default: sessions bound like db)
         """
         self.db = db
+        self._session_factory = session_factory
         self.game_matcher = GameMatcher(db)
         self.player_resolver = PlayerResolver(db)
         self.nba_adapter = NbaApiAdapter(db)
@@ -173,7 +200,9 @@ class SyncOrchestrator:
     async def sync_odds(
         self,
         upcoming_only: bool = True,
-        days: int = 7
+        days: int = 7,
+        include_props: bool = False,
+        max_concurrency: Optional[int] = None
     ) -> Dict:
         """
         Sync odds from odds_api.
@@ -181,15 +210,26 @@ class SyncOrchestrator:
         Fetches current odds and caches them. This is a lightweight
         operation that should run frequently during games.
 
+        With include_props, player props for every event on the slate are
+        fetched concurrently (bounded by max_concurrency and the Odds API
+        rate limiter) and each event's lines are stored as odds snapshots
+        as soon as its response arrives.
+
         Args:
             upcoming_only: Only fetch upcoming games
             days: Number of days ahead to fetch
+            include_props: Also fetch and store player props for the slate
+            max_concurrency: Props requests in flight at once
+                             (default: ODDS_API_MAX_CONCURRENCY)
 
         Returns:
             Sync results
         """
         start_time = datetime.utcnow()
-        logger.info(f"Starting odds sync (upcoming_only={upcoming_only}, days={days})")
+        logger.info(
+            f"Starting odds sync (upcoming_only={upcoming_only}, days={days}, "
+            f"include_props={include_props})"
+        )
 
         # Get or create sync metadata
         metadata = self._get_or_create_metadata('odds_api', 'odds')
@@ -203,6 +243,13 @@ class SyncOrchestrator:
                 days=days
             )
 
+            props_result = None
+            if include_props:
+                props_result = await self._sync_slate_props(
+                    [g['id'] for g in odds_games if g.get('id')],
+                    max_concurrency=max_concurrency
+                )
+
             duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
             # Update metadata
@@ -214,11 +261,14 @@ class SyncOrchestrator:
 
             logger.info(f"Odds sync complete: {len(odds_games)} games fetched ({duration_ms}ms)")
 
-            return {
+            result = {
                 'success': True,
                 'processed': len(odds_games),
                 'duration_ms': duration_ms
             }
+            if props_result is not None:
+                result['props'] = props_result
+            return result
 
         except Exception as e:
             logger.error(f"Odds sync failed: {e}")
@@ -231,10 +281,127 @@ class SyncOrchestrator:
 
             raise
 
+    async def sync_planned_odds(self, planner=None, odds_service=None) -> Dict:
+        """
+        Run one odds fetch planner tick and record it in sync_metadata.
+
+        Ticks that fetch nothing (nothing due) leave sync_metadata alone.
+        Otherwise the odds_api/odds row is updated as sync_odds did: a tick
+        whose every fetch failed is recorded as failed, partial failures as
+        success with the errors in error_message.
+
+        Args:
+            planner: Odds fetch planner (default: the process-wide planner)
+            odds_service: Odds API service (default: the shared service)
+
+        Returns:
+            The planner's tick result (see OddsFetchPlanner.run_due)
+        """
+        from app.core.config import settings
+        from app.services.core.odds_api_service import get_odds_service
+        from app.services.core.odds_fetch_planner import get_odds_fetch_planner
+
+        planner = planner or get_odds_fetch_planner()
+        odds_service = odds_service or get_odds_service(settings.THE_ODDS_API_KEY)
+
+        start_time = datetime.utcnow()
+        result = await planner.run_due(odds_service)
+
+        fetched = len(result['events_fetched']) + (1 if result['slate_fetched'] else 0)
+        if not fetched and not result['errors']:
+            return result
+
+        metadata = self._get_or_create_metadata('odds_api', 'odds')
+        metadata.last_sync_started_at = start_time
+        metadata.sync_duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        metadata.records_processed = (result['slate_games'] or 0) + len(result['events_fetched'])
+        metadata.records_failed = len(result['errors'])
+        metadata.error_message = "; ".join(result['errors']) or None
+        if fetched:
+            metadata.last_sync_completed_at = datetime.utcnow()
+            metadata.last_sync_status = 'success'
+        else:
+            metadata.last_sync_status = 'failed'
+        self.db.commit()
+
+        return result
+
+    async def _sync_slate_props(
+        self,
+        odds_event_ids: List[str],
+        max_concurrency: Optional[int] = None
+    ) -> Dict:
+        """
+        Fetch player props for a slate concurrently and store them as they arrive.
+
+        Odds events are matched to games by Game.external_id (Odds API
+        event ID) or through GameMapping to the nba_api game ID. Each event
+        is ingested and committed on its own so one bad response does not
+        lose the rest of the slate.
+
+        Args:
+            odds_event_ids: The Odds API event IDs on the slate
+            max_concurrency: Requests in flight at once
+
+        Returns:
+            Dict with events, games_matched, snapshots_written, lines_moved,
+            lines_unchanged and errors
+        """
+        from app.models import Game
+        from app.services.nba.historical_odds_service import HistoricalOddsService
+
+        games_by_event = {}
+        if odds_event_ids:
+            for game in self.db.query(Game).filter(Game.external_id.in_(odds_event_ids)):
+                games_by_event[game.external_id] = game
+
+            unmatched = [e for e in odds_event_ids if e not in games_by_event]
+            if unmatched:
+                mapped = self.db.query(GameMapping.odds_event_id, Game).join(
+                    Game, Game.external_id == GameMapping.nba_game_id
+                ).filter(GameMapping.odds_event_id.in_(unmatched)).all()
+                for odds_event_id, game in mapped:
+                    games_by_event[odds_event_id] = game
+
+        result = {
+            'events': len(odds_event_ids),
+            'games_matched': len(games_by_event),
+            'snapshots_written': 0,
+            'lines_moved': 0,
+            'lines_unchanged': 0,
+            'errors': 0
+        }
+        if not games_by_event:
+            return result
+
+        odds_history = HistoricalOddsService(self.db)
+        async for odds_event_id, props_data in self.odds_adapter.stream_player_props(
+            list(games_by_event), max_concurrency=max_concurrency
+        ):
+            try:
+                captured = odds_history.ingest_event_props(
+                    games_by_event[odds_event_id], props_data, starters_only=False
+                )
+                result['snapshots_written'] += captured['captured']
+                result['lines_moved'] += captured['moved']
+                result['lines_unchanged'] += captured['unchanged']
+                result['errors'] += captured['errors']
+            except Exception as e:
+                self.db.rollback()
+                result['errors'] += 1
+                logger.error(f"Error storing player props for {odds_event_id}: {e}")
+
+        logger.info(
+            f"Slate props synced: {result['games_matched']}/{result['events']} events, "
+            f"{result['snapshots_written']} snapshots written"
+        )
+        return result
+
     async def sync_player_stats(
         self,
         games_limit: int = 50,
-        season: str = "2025-26"
+        season: str = "2025-26",
+        bulk: bool = False
     ) -> Dict:
         """
         Sync player boxscores from nba_api.
@@ -245,6 +412,8 @@ class SyncOrchestrator:
         Args:
             games_limit: Number of games to average
             season: NBA season
+            bulk: Ingest league-wide game logs since the last watermark in
+                  one call instead of one request per player
 
         Returns:
             Sync results
@@ -261,7 +430,8 @@ class SyncOrchestrator:
             # Sync via nba_adapter
             results = await self.nba_adapter.sync_all_player_stats(
                 games_limit=games_limit,
-                season=season
+                season=season,
+                bulk=bulk
             )
 
             duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
@@ -293,6 +463,238 @@ class SyncOrchestrator:
 
             raise
 
+    async def run_incremental_sync(
+        self,
+        lookahead_days: int = 14,
+        season: str = "2025-26",
+        include_stats: bool = True,
+        games_limit: int = 50
+    ) -> Dict:
+        """
+        Sync games, odds, matching and player stats as a dependency DAG.
+
+        Stages:
+        - games: nba_api scoreboard; only new or re-statused games are
+          written (and so move Game.updated_at)
+        - odds: Odds API events; events already held by a matched mapping
+          are dropped
+        - match (games, odds): batch_match_games over fetched games
+          without a matched mapping and the remaining events
+        - stats (games): league game log ingest from its watermark, only
+          when games went final since the last stats run
+
+        games and odds run concurrently, then match and stats. Each stage
+        runs in its own session and commits or rolls back on its own. A
+        failed stage skips the stages that depend on it; the others still
+        run.
+
+        Args:
+            lookahead_days: Days of Odds API events to fetch
+            season: NBA season
+            include_stats: Run the stats stage
+            games_limit: Number of games to average (stats stage)
+
+        Returns:
+            Dict with success, duration_ms and per-stage status, duration_ms
+            and result (see run_stages)
+        """
+        logger.info(f"Starting incremental sync (season={season}, lookahead_days={lookahead_days})")
+
+        stages = [
+            SyncStage('games', lambda deps: self._isolated_stage(
+                'nba_api', 'games',
+                lambda stage, metadata: stage._games_stage(metadata, lookahead_days, season)
+            )),
+            SyncStage('odds', lambda deps: self._isolated_stage(
+                'odds_api', 'odds', lambda stage, metadata: stage._odds_stage(metadata, lookahead_days)
+            )),
+            SyncStage('match', lambda deps: self._isolated_stage(
+                'sync', 'game_matching',
+                lambda stage, metadata: stage._match_stage(deps['games'], deps['odds'])
+            ), depends_on=('games', 'odds')),
+        ]
+        if include_stats:
+            stages.append(SyncStage('stats', lambda deps: self._isolated_stage(
+                'nba_api', 'player_stats',
+                lambda stage, metadata: stage._stats_stage(metadata, games_limit, season)
+            ), depends_on=('games',)))
+
+        run = await run_stages(stages)
+
+        # Game and event lists only feed downstream stages
+        for entry in run['stages'].values():
+            for key in ('games', 'new_events'):
+                entry.get('result', {}).pop(key, None)
+
+        logger.info(
+            f"Incremental sync {'complete' if run['success'] else 'finished with errors'} "
+            f"({run['duration_ms']}ms): " + ", ".join(
+                f"{name} {entry['status']} {entry['duration_ms']}ms"
+                for name, entry in run['stages'].items()
+            )
+        )
+        return run
+
+    def _new_session(self) -> Session:
+        if self._session_factory is not None:
+            return self._session_factory()
+        return sessionmaker(bind=self.db.get_bind())()
+
+    async def _isolated_stage(
+        self,
+        source: str,
+        data_type: str,
+        work: Callable[['SyncOrchestrator', SyncMetadata], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Run one DAG stage in a session of its own.
+
+        A Session is not safe to share between concurrently running stages:
+        one stage's rollback would discard another's pending work and expire
+        its objects. work receives an orchestrator whose matcher and adapters
+        are bound to the stage session (the Odds API client is shared; event
+        fetches do not touch the database) and the stage's metadata row.
+        """
+        db = self._new_session()
+        try:
+            stage = SyncOrchestrator(db, session_factory=self._session_factory)
+            stage._odds_adapter = self.odds_adapter
+            return await stage._tracked_stage(source, data_type, lambda metadata: work(stage, metadata))
+        finally:
+            db.close()
+
+    async def _tracked_stage(
+        self,
+        source: str,
+        data_type: str,
+        work: Callable[[SyncMetadata], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Run one DAG stage and record it in sync_metadata.
+
+        work receives the stage's metadata row (for its watermark) and
+        returns a dict with processed and optionally matched/failed counts.
+        On failure self.db is rolled back, so self.db must belong to this
+        stage alone (see _isolated_stage).
+        """
+        start_time = datetime.utcnow()
+        metadata = self._get_or_create_metadata(source, data_type)
+        metadata.last_sync_started_at = start_time
+        self.db.commit()
+
+        try:
+            result = await work(metadata)
+        except Exception as e:
+            self.db.rollback()
+            metadata.last_sync_status = 'failed'
+            metadata.error_message = str(e)
+            metadata.sync_duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            self.db.commit()
+            raise
+
+        metadata.last_sync_completed_at = datetime.utcnow()
+        metadata.last_sync_status = 'success'
+        metadata.error_message = None
+        metadata.records_processed = result['processed']
+        metadata.records_matched = result.get('matched', 0)
+        metadata.records_failed = result.get('failed', 0)
+        metadata.sync_duration_ms = int((metadata.last_sync_completed_at - start_time).total_seconds() * 1000)
+        self.db.commit()
+        return result
+
+    async def _games_stage(self, metadata: SyncMetadata, lookahead_days: int, season: str) -> Dict[str, Any]:
+        """Fetch the scoreboard; the adapter writes only new or re-statused games."""
+        nba_games = await self.nba_adapter.fetch_games(lookahead_days=lookahead_days, season=season)
+        changed = [g for g in nba_games if g.get('changed')]
+
+        if nba_games:
+            latest = max(_naive_utc(g['game_date']) for g in nba_games)
+            if metadata.watermark is None or latest > metadata.watermark:
+                metadata.watermark = latest
+
+        return {
+            'processed': len(nba_games),
+            'matched': len(changed),
+            'games': nba_games,
+            'changed': len(changed),
+        }
+
+    async def _odds_stage(self, metadata: SyncMetadata, lookahead_days: int) -> Dict[str, Any]:
+        """Fetch odds events; drop those already held by a matched mapping."""
+        odds_games = await self.odds_adapter.fetch_odds(upcoming_only=False, days=lookahead_days)
+        event_ids = [g['id'] for g in odds_games if g.get('id')]
+
+        claimed = set()
+        if event_ids:
+            claimed = {
+                event_id for (event_id,) in self.db.query(GameMapping.odds_event_id).filter(
+                    GameMapping.odds_event_id.in_(event_ids),
+                    GameMapping.status == 'matched'
+                )
+            }
+        new_events = [g for g in odds_games if g.get('id') and g['id'] not in claimed]
+
+        commence_times = [_naive_utc(g['commence_time']) for g in odds_games if g.get('commence_time')]
+        if commence_times and (metadata.watermark is None or max(commence_times) > metadata.watermark):
+            metadata.watermark = max(commence_times)
+
+        return {
+            'processed': len(odds_games),
+            'matched': len(new_events),
+            'new_events': new_events,
+        }
+
+    async def _match_stage(self, games: Dict[str, Any], odds: Dict[str, Any]) -> Dict[str, Any]:
+        """Match fetched games without a matched mapping against unclaimed events."""
+        nba_games = games['games']
+        game_ids = [g['id'] for g in nba_games]
+        if game_ids:
+            matched = {
+                game_id for (game_id,) in self.db.query(GameMapping.nba_game_id).filter(
+                    GameMapping.nba_game_id.in_(game_ids),
+                    GameMapping.status == 'matched'
+                )
+            }
+            nba_games = [g for g in nba_games if g['id'] not in matched]
+
+        if not nba_games or not odds['new_events']:
+            return {'processed': 0, 'matched': 0, 'failed': 0}
+
+        results = await self.game_matcher.batch_match_games(
+            nba_games=nba_games,
+            odds_games=odds['new_events']
+        )
+        return {
+            'processed': results['total'],
+            'matched': results['matched'],
+            'failed': results['unmatched'],
+        }
+
+    async def _stats_stage(self, metadata: SyncMetadata, games_limit: int, season: str) -> Dict[str, Any]:
+        """Ingest game logs when games went final since the stats watermark."""
+        finals = self.db.query(Game.updated_at).filter(
+            Game.status.in_(FINAL_GAME_STATUSES)
+        )
+        if metadata.watermark is not None:
+            finals = finals.filter(Game.updated_at > metadata.watermark)
+        latest_final = finals.order_by(Game.updated_at.desc()).limit(1).scalar()
+
+        if latest_final is None:
+            logger.info("No games went final since the last stats sync; skipping game log ingest")
+            return {'processed': 0, 'matched': 0, 'failed': 0, 'new_final_games': False}
+
+        results = await self.nba_adapter.sync_all_player_stats(
+            games_limit=games_limit, season=season, bulk=True
+        )
+        metadata.watermark = latest_final
+        return {
+            'processed': results['total'],
+            'matched': results['success'],
+            'failed': results['errors'] + results['no_data'],
+            'new_final_games': True,
+            'game_logs': results.get('game_logs'),
+        }
+
     async def reconcile_matches(
         self,
         limit: int = 100
@@ -167,6 +167,23 @@ def _fuzzy_team_match(nba_team_id: int, odds_team_name: str, db: Session) -> flo
     if not mapping:
         return 0.0
 
+    return score_team_name(mapping, odds_team_name)
+
+
+def score_team_name(mapping, odds_team_name: str) -> float:
+    """
+    Score an Odds API team name against one team_mappings row.
+
+    Pure function (no queries) so batch matchers can score prefetched
+    mappings; _fuzzy_team_match uses it after loading the row.
+
+    Args:
+        mapping: TeamMapping row
+        odds_team_name: Team name from The Odds API
+
+    Returns:
+        Confidence score 0.0 to 1.0
+    """
     # Check if odds name matches
     if are_names_equal(mapping.odds_api_name or "", odds_team_name):
         return 1.0
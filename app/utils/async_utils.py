@@ -0,0 +1,155 @@
+"""
+Helpers for calling async service code from synchronous code.
+
+Prediction services expose async-native methods (awaited by the FastAPI
+routes) plus thin sync adapters for scripts, the scheduler's thread pool
+and tests. The adapters go through run_sync() so there is exactly one
+place that decides how to drive the coroutine.
+
+SingleFlight coalesces concurrent async calls for the same key so that
+only one of them reaches the upstream API; AsyncRateLimiter spaces out
+request starts when many run concurrently.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion and return its result.
+
+    Uses asyncio.run() when no event loop is running in this thread. When
+    called from inside a running loop (sync code invoked from async code) the
+    loop cannot be blocked on, so the coroutine runs on a short-lived worker
+    thread instead. Exceptions propagate to the caller; there is no timeout.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+class SingleFlight:
+    """
+    Per-key coalescing of concurrent async calls.
+
+    The first caller for a key (the leader) runs the call; callers arriving
+    while it is in flight await the same result or exception instead of
+    starting their own. The key is released as soon as the call finishes,
+    so later callers (and retries after an error) start a fresh call.
+
+    In-flight calls are tracked per event loop, so a service singleton can
+    be shared between the API's loop and run_sync() loops in other threads.
+
+    Usage:
+        flight = SingleFlight()
+        data = await flight.do(cache_key, lambda: fetch(url))
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run func() once for all concurrent callers of key.
+
+        Args:
+            key: Coalescing key (usually the cache key)
+            func: Zero-argument callable returning the awaitable to run
+
+        Returns:
+            The shared result; the shared exception is raised to every caller
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        future = self._inflight.get(flight_key)
+        if future is not None:
+            self.coalesced += 1
+            # shield: a cancelled follower must not cancel the shared call
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        self._inflight[flight_key] = future
+        self.calls += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when there are no followers
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(flight_key, None)
+
+    def in_flight(self) -> int:
+        """Number of calls currently in flight."""
+        return len(self._inflight)
+
+
+class AsyncRateLimiter:
+    """
+    Spaces request starts to at most rate_per_second, allowing short bursts.
+
+    Each acquire() reserves the next start slot and sleeps until it; up to
+    burst requests may start back to back after an idle period. Slots are
+    reserved under a thread lock, so one limiter can be shared by a service
+    singleton used from several event loops.
+
+    Usage:
+        limiter = AsyncRateLimiter(rate_per_second=5, burst=5)
+        await limiter.acquire()
+        response = await client.get(url)
+    """
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate_per_second: Sustained request starts per second (<= 0 disables)
+            burst: Requests allowed to start together after an idle period
+        """
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self.burst = max(1, burst)
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.total_wait_seconds = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until the next request may start."""
+        if self.interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now - (self.burst - 1) * self.interval)
+            self._next_slot = slot + self.interval
+            self.total_wait_seconds += max(slot - now, 0.0)
+            if slot > now:
+                self.waits += 1
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
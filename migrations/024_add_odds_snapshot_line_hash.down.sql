@@ -0,0 +1,9 @@
+-- =============================================================================
+-- Rollback Migration 024: Remove Line Fingerprints
+-- =============================================================================
+
+BEGIN;
+
+ALTER TABLE historical_odds_snapshots DROP COLUMN IF EXISTS line_hash;
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- =============================================================================
+-- Migration 024: Line Fingerprints for Change-Only Odds Snapshot Ingestion
+-- =============================================================================
+-- HistoricalOddsService.batch_capture_game_odds fingerprints each
+-- (game, player, stat, bookmaker) line and its prices and only writes a new
+-- snapshot when the fingerprint differs from the last stored one.
+-- Existing rows keep a NULL line_hash; their fingerprint is derived from the
+-- stored line and prices on the next capture.
+
+BEGIN;
+
+ALTER TABLE historical_odds_snapshots
+    ADD COLUMN IF NOT EXISTS line_hash VARCHAR(16);
+
+-- Latest-snapshot lookup per game/player/stat/bookmaker
+CREATE INDEX IF NOT EXISTS ix_historical_odds_opening_comparison
+    ON historical_odds_snapshots(game_id, player_id, stat_type, bookmaker_name, snapshot_time);
+
+COMMENT ON COLUMN historical_odds_snapshots.line_hash IS 'Fingerprint of (game, player, stat, bookmaker, line, over_price, under_price); a new row is only written when it changes.';
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- =============================================================================
+-- Rollback Migration 025: Bulk Game Log Upserts and Incremental Sync Watermarks
+-- =============================================================================
+
+BEGIN;
+
+ALTER TABLE sync_metadata DROP COLUMN IF EXISTS watermark;
+
+DROP INDEX IF EXISTS uq_player_stats_player_game;
+
+COMMIT;
@@ -0,0 +1,29 @@
+-- =============================================================================
+-- Migration 025: Bulk Game Log Upserts and Incremental Sync Watermarks
+-- =============================================================================
+-- NbaApiService.ingest_league_game_logs pulls league-wide game logs for a
+-- date range in one nba_api call and upserts every player_stats row in one
+-- batched INSERT ... ON CONFLICT (player_id, game_id) statement, which needs
+-- a unique key. Duplicate stat lines (same player and game) are collapsed to
+-- the earliest row first.
+--
+-- sync_metadata.watermark records the latest source date a sync ingested so
+-- the nightly run only fetches game dates from the watermark onwards.
+
+BEGIN;
+
+DELETE FROM player_stats ps
+USING player_stats newer
+WHERE ps.player_id = newer.player_id
+  AND ps.game_id = newer.game_id
+  AND (ps.created_at, ps.id) > (newer.created_at, newer.id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_player_stats_player_game
+    ON player_stats(player_id, game_id);
+
+ALTER TABLE sync_metadata
+    ADD COLUMN IF NOT EXISTS watermark TIMESTAMP;
+
+COMMENT ON COLUMN sync_metadata.watermark IS 'Latest source date ingested; incremental syncs resume from here.';
+
+COMMIT;
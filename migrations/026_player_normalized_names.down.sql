@@ -0,0 +1,13 @@
+-- =============================================================================
+-- Rollback Migration 026: Indexed Normalized Player Names
+-- =============================================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS ix_player_aliases_source_normalized;
+DROP INDEX IF EXISTS ix_players_sport_normalized_name;
+
+ALTER TABLE player_aliases DROP COLUMN IF EXISTS normalized_name;
+ALTER TABLE players DROP COLUMN IF EXISTS normalized_name;
+
+COMMIT;
@@ -0,0 +1,33 @@
+-- =============================================================================
+-- Migration 026: Indexed Normalized Player Names
+-- =============================================================================
+-- players.normalized_name and player_aliases.normalized_name hold
+-- name_normalizer.normalize(name / alias_name): lowercase, no accents,
+-- punctuation or generational suffixes. The models set them on every write,
+-- so PlayerResolver's normalized lookup and PlayerIdentityResolver's
+-- canonical-name lookup are single equality queries on these indexes
+-- instead of scans that normalize every candidate row in Python.
+--
+-- The normalizer is Python (unicode folding, suffix rules), so existing
+-- rows are backfilled after this migration with:
+--     python scripts/backfill_normalized_names.py --force
+-- Rows left NULL are simply not found by the normalized lookups until then.
+
+BEGIN;
+
+ALTER TABLE players
+    ADD COLUMN IF NOT EXISTS normalized_name VARCHAR(255);
+
+ALTER TABLE player_aliases
+    ADD COLUMN IF NOT EXISTS normalized_name VARCHAR(128);
+
+CREATE INDEX IF NOT EXISTS ix_players_sport_normalized_name
+    ON players(sport_id, normalized_name);
+
+CREATE INDEX IF NOT EXISTS ix_player_aliases_source_normalized
+    ON player_aliases(alias_source, normalized_name);
+
+COMMENT ON COLUMN players.normalized_name IS 'name_normalizer.normalize(name); set on write.';
+COMMENT ON COLUMN player_aliases.normalized_name IS 'name_normalizer.normalize(alias_name); set on write.';
+
+COMMIT;
@@ -0,0 +1,9 @@
+-- =============================================================================
+-- Rollback Migration 027: Precomputed Hit Rate Aggregates
+-- =============================================================================
+
+BEGIN;
+
+DROP TABLE IF EXISTS hit_rate_aggregates;
+
+COMMIT;
@@ -0,0 +1,48 @@
+-- =============================================================================
+-- Migration 027: Precomputed Hit Rate Aggregates
+-- =============================================================================
+-- hit_rate_aggregates holds OVER/UNDER/PUSH counts of resolved
+-- historical_odds_snapshots per (player, stat type, bookmaker, starter flag,
+-- snapshot day). HistoricalOddsService adds to it in the same transaction
+-- that resolves snapshots, and get_batch_hit_rates reads a whole slate from
+-- it in one indexed query instead of loading snapshots per player and stat.
+--
+-- Existing resolved snapshots are aggregated below; to recompute later use
+-- HistoricalOddsService.rebuild_hit_rate_aggregates().
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS hit_rate_aggregates (
+    player_id VARCHAR(36) NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    stat_type VARCHAR(50) NOT NULL,
+    bookmaker_name VARCHAR(100) NOT NULL,
+    was_starter BOOLEAN NOT NULL,
+    bucket_date DATE NOT NULL,
+    over_hits INTEGER NOT NULL DEFAULT 0,
+    under_hits INTEGER NOT NULL DEFAULT 0,
+    pushes INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (player_id, stat_type, bookmaker_name, was_starter, bucket_date)
+);
+
+CREATE INDEX IF NOT EXISTS ix_hit_rate_aggregates_stat_bucket
+    ON hit_rate_aggregates(stat_type, bucket_date);
+
+INSERT INTO hit_rate_aggregates (
+    player_id, stat_type, bookmaker_name, was_starter, bucket_date,
+    over_hits, under_hits, pushes, updated_at
+)
+SELECT
+    player_id, stat_type, bookmaker_name, was_starter, DATE(snapshot_time),
+    SUM(CASE WHEN hit_result = 'OVER' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN hit_result = 'UNDER' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN hit_result = 'PUSH' THEN 1 ELSE 0 END),
+    NOW()
+FROM historical_odds_snapshots
+WHERE hit_result IS NOT NULL
+GROUP BY player_id, stat_type, bookmaker_name, was_starter, DATE(snapshot_time)
+ON CONFLICT (player_id, stat_type, bookmaker_name, was_starter, bucket_date) DO NOTHING;
+
+COMMENT ON TABLE hit_rate_aggregates IS 'Resolved snapshot hit counts per player/stat/bookmaker/starter/day; maintained on resolve.';
+
+COMMIT;
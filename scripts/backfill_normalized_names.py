@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Backfill players.normalized_name and player_aliases.normalized_name.
+
+Run once after migration 026. New and renamed rows get normalized_name from
+the models on write; this fills rows written before the column existed
+(or every row with --all, e.g. after a name_normalizer change).
+
+Rows are read as (id, name) in batches and written back with one bulk
+UPDATE per batch.
+
+Usage:
+    python scripts/backfill_normalized_names.py            # dry run
+    python scripts/backfill_normalized_names.py --force
+    python scripts/backfill_normalized_names.py --force --all
+"""
+import sys
+import logging
+from pathlib import Path
+
+from sqlalchemy import update
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.models import Player, PlayerAlias
+from app.services.sync.utils.name_normalizer import normalize
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+# (model, source name column)
+TARGETS = [
+    (Player, Player.name),
+    (PlayerAlias, PlayerAlias.alias_name),
+]
+
+
+def backfill_table(db, model, name_column, only_missing=True, batch_size=BATCH_SIZE, dry_run=True):
+    """
+    Set normalized_name for one table.
+
+    Args:
+        db: SQLAlchemy session
+        model: Player or PlayerAlias
+        name_column: Column normalized_name is derived from
+        only_missing: Only rows where normalized_name is NULL
+        batch_size: Rows per read and bulk UPDATE
+        dry_run: If True, roll back instead of committing
+
+    Returns:
+        Number of rows whose normalized_name changed
+    """
+    query = db.query(model.id, name_column, model.normalized_name).order_by(model.id)
+    if only_missing:
+        query = query.filter(model.normalized_name.is_(None))
+
+    changed = 0
+    last_id = None
+    while True:
+        page = query if last_id is None else query.filter(model.id > last_id)
+        rows = page.limit(batch_size).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        updates = [
+            {'id': row_id, 'normalized_name': normalize(name) if name else None}
+            for row_id, name, current in rows
+            if (normalize(name) if name else None) != current
+        ]
+        if updates:
+            db.execute(update(model), updates)
+            changed += len(updates)
+
+    if dry_run:
+        db.rollback()
+    else:
+        db.commit()
+
+    logger.info(f"  {model.__tablename__}: {changed} rows {'would be ' if dry_run else ''}updated")
+    return changed
+
+
+def backfill_normalized_names(only_missing=True, dry_run=True):
+    """
+    Backfill normalized_name on players and player_aliases.
+
+    Returns:
+        Dictionary of table name -> rows updated
+    """
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+
+    try:
+        return {
+            model.__tablename__: backfill_table(
+                db, model, name_column, only_missing=only_missing, dry_run=dry_run
+            )
+            for model, name_column in TARGETS
+        }
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Error: {e}")
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Backfill normalized_name on players and player_aliases"
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Actually commit changes (default is a dry run)'
+    )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Recompute every row, not only rows where normalized_name is NULL'
+    )
+
+    args = parser.parse_args()
+
+    if not args.force:
+        logger.info("🔍 DRY RUN MODE - No changes will be made")
+        logger.info("Use --force to actually update the tables\n")
+
+    backfill_normalized_names(only_missing=not args.all, dry_run=not args.force)
@@ -111,6 +111,7 @@ async def main():
 
         # Process each game
         captured_total = 0
+        unchanged_total = 0
         skipped_fresh = 0
         skipped_no_id = 0
         errors = []
@@ -159,9 +160,15 @@ async def main():
                 captured = result.get("captured", 0)
                 errs = result.get("errors", 0)
                 captured_total += captured
+                unchanged_total += result.get("unchanged", 0)
 
                 if captured > 0:
-                    logger.info(f"  Captured: {captured} snapshots")
+                    logger.info(
+                        f"  Captured: {captured} snapshots "
+                        f"({result.get('moved', 0)} moved, {result.get('unchanged', 0)} unchanged)"
+                    )
+                elif result.get("unchanged", 0) > 0:
+                    logger.info(f"  No line changes ({result['unchanged']} unchanged)")
                 else:
                     logger.info(f"  No odds available (may not be posted yet)")
 
@@ -179,6 +186,7 @@ async def main():
         logger.info("=" * 60)
         logger.info(f"Games checked: {len(games)}")
         logger.info(f"Snapshots captured: {captured_total}")
+        logger.info(f"Lines unchanged: {unchanged_total}")
         logger.info(f"Skipped (fresh data): {skipped_fresh}")
         logger.info(f"Skipped (no Odds API ID): {skipped_no_id}")
 
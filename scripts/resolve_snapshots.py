@@ -11,6 +11,8 @@ This should run after games complete to:
 
 Usage:
     python scripts/resolve_snapshots.py [--hours-back HOURS]
+    python scripts/resolve_snapshots.py --season 2026   # backfill a whole season
+    python scripts/resolve_snapshots.py --all           # every unresolved snapshot
 
 Cron (daily at 3 AM CST, after all games finish):
     0 3 * * * cd /opt/sports-bet-ai-api && venv/bin/python scripts/resolve_snapshots.py
@@ -67,6 +69,16 @@ def main():
         type=str,
         help="Process specific game ID only"
     )
+    parser.add_argument(
+        "--season",
+        type=int,
+        help="Resolve every unresolved snapshot of this season in one statement"
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Resolve every unresolved snapshot (all seasons) in one statement"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -82,6 +94,13 @@ def main():
     service = HistoricalOddsService(db)
 
     try:
+        if (args.season or args.all) and not args.dry_run:
+            # Season backfill: one set-based UPDATE instead of a loop over games
+            result = service.resolve_unresolved_snapshots(season=args.season)
+            logger.info(f"Snapshots resolved: {result['resolved']}")
+            logger.info(f"Left unresolved (no stats): {result['errors']}")
+            return
+
         if args.game_id:
             # Process specific game
             game = db.query(Game).filter(Game.id == args.game_id).first()
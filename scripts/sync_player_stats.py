@@ -8,6 +8,7 @@ instead of position averages.
 
 Usage:
     python scripts/sync_player_stats.py
+    python scripts/sync_player_stats.py --bulk   # one league-wide game log call
 
 Cron scheduling (every 6 hours):
     0 */6 * * * cd /opt/sports-bet-ai-api && /opt/sports-bet-ai-api/venv/bin/python scripts/sync_player_stats.py >> /tmp/sync_player_stats.log 2>&1
@@ -42,7 +43,8 @@ DEFAULT_GAMES_LIMIT = 50
 
 async def sync_player_stats(
     season: str = DEFAULT_SEASON,
-    games_limit: int = DEFAULT_GAMES_LIMIT
+    games_limit: int = DEFAULT_GAMES_LIMIT,
+    bulk: bool = False
 ) -> dict:
     """
     Sync all active players' season stats from nba_api.
@@ -50,6 +52,8 @@ async def sync_player_stats(
     Args:
         season: NBA season (e.g., "2024-25")
         games_limit: Number of recent games to average
+        bulk: Ingest league-wide game logs since the last watermark in one
+              call instead of one request per player
 
     Returns:
         dict with sync results
@@ -63,6 +67,7 @@ async def sync_player_stats(
         logger.info("=" * 60)
         logger.info(f"Season: {season}")
         logger.info(f"Games limit: {games_limit}")
+        logger.info(f"Mode: {'bulk league game logs' if bulk else 'per player'}")
 
         start_time = datetime.now()
 
@@ -78,7 +83,8 @@ async def sync_player_stats(
         # Sync all active players
         result = await nba_service.sync_all_active_players(
             games_limit=games_limit,
-            season=season
+            season=season,
+            bulk=bulk
         )
 
         end_time = datetime.now()
@@ -199,6 +205,11 @@ def main():
         default=DEFAULT_GAMES_LIMIT,
         help=f"Number of recent games to average (default: {DEFAULT_GAMES_LIMIT})"
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Ingest league-wide game logs since the last sync in one request"
+    )
     parser.add_argument(
         "--force",
         action="store_true",
@@ -226,7 +237,8 @@ def main():
         # Sync all active players
         result = asyncio.run(sync_player_stats(
             args.season,
-            args.games_limit
+            args.games_limit,
+            args.bulk
         ))
 
         if result.get("status") == "success":
@@ -16,6 +16,63 @@ from httpx import AsyncClient, ASGITransport
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# Keep Odds API responses out of the on-disk shared cache between test runs
+os.environ.setdefault("ODDS_API_CACHE_BACKEND", "memory")
+
+
+@pytest.fixture(autouse=True)
+def _clear_service_caches():
+    """Start every test with empty shared service caches (app.core.cache)."""
+    from app.core.cache import clear_all_caches
+
+    clear_all_caches()
+    yield
+
+
+@pytest.fixture
+def upstream_stub():
+    """
+    Offline stand-in for The Odds API, ESPN and nba_api on a free local port.
+
+    Yields the running tests.performance.upstream_stub.UpstreamStub; pass
+    its odds_api_url / espn_url / nba_stats_url / nba_cdn_url to the
+    services and use configure() to add latency, errors or a tight quota.
+    """
+    from tests.performance.upstream_stub import UpstreamStub
+
+    stub = UpstreamStub()
+    stub.start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture(scope="function")
+def sqlite_session() -> Generator[Session, None, None]:
+    """
+    Isolated in-memory SQLite session with every unified table.
+
+    Some models declare both index=True and an explicit Index with the same
+    name, which makes metadata.create_all() fail on SQLite; tables are
+    created directly and duplicate index names are skipped.
+    """
+    from sqlalchemy.schema import CreateIndex, CreateTable
+    from app.models.unified import Base
+
+    engine = create_engine("sqlite://")
+    created_indexes = set()
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+            for index in table.indexes:
+                if index.name not in created_indexes:
+                    created_indexes.add(index.name)
+                    conn.execute(CreateIndex(index))
+
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
 
 @pytest.fixture(scope="function")
 def db_session() -> Generator[Session, None, None]:
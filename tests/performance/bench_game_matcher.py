@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark: indexed GameMatcher.batch_match_games vs. the per-game loop.
+
+Matches a full generated season (1,230 NBA games against 1,300 Odds API
+events) into an empty in-memory SQLite database both ways:
+
+- per-game: get_existing_mapping + find_match over every event +
+  create_or_update_mapping / create_pending_mapping_atomic per game
+  (the previous batch_match_games)
+- indexed: batch_match_games (prefetch, (date, team pair) index, bulk upsert)
+
+and reports wall time, SQL statements and the speedup.
+
+Usage:
+    python tests/performance/bench_game_matcher.py
+    python tests/performance/bench_game_matcher.py --games 300 --events 320
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "tests"))
+
+from app.models.unified import Base  # noqa: E402
+from app.services.sync.matchers.game_matcher import GameMatcher  # noqa: E402
+from test_batch_game_matcher import add_team_mappings, season_schedule  # noqa: E402
+
+
+def make_session():
+    """In-memory SQLite with every unified table and 30 team mappings."""
+    engine = create_engine("sqlite://")
+    created_indexes = set()
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+            for index in table.indexes:
+                if index.name not in created_indexes:
+                    created_indexes.add(index.name)
+                    conn.execute(CreateIndex(index))
+    session = sessionmaker(bind=engine)()
+    add_team_mappings(session)
+    return session
+
+
+async def per_game_match(matcher, nba_games, odds_games):
+    matched = 0
+    for nba_game in nba_games:
+        existing = matcher.get_existing_mapping(nba_game['id'])
+        if existing and existing.status == 'matched':
+            matched += 1
+            continue
+        match = await matcher.find_match(nba_game, odds_games)
+        if match:
+            await matcher.create_or_update_mapping(
+                nba_game_id=nba_game['id'],
+                nba_home_team_id=nba_game['home_team_id'],
+                nba_away_team_id=nba_game['away_team_id'],
+                match=match,
+                game_date=nba_game['game_date']
+            )
+            matched += 1
+        else:
+            await matcher.create_pending_mapping_atomic(
+                nba_game_id=nba_game['id'],
+                nba_home_team_id=nba_game['home_team_id'],
+                nba_away_team_id=nba_game['away_team_id'],
+                game_date=nba_game['game_date']
+            )
+    matcher.db.commit()
+    return matched
+
+
+async def indexed_match(matcher, nba_games, odds_games):
+    results = await matcher.batch_match_games(nba_games, odds_games, date_tolerance_days=0)
+    return results['matched']
+
+
+def timed(runner, nba_games, odds_games):
+    session = make_session()
+    statements = []
+    event.listen(session.get_bind(), "before_cursor_execute", lambda *args: statements.append(1))
+    start = time.perf_counter()
+    matched = asyncio.run(runner(GameMatcher(session), nba_games, odds_games))
+    elapsed = time.perf_counter() - start
+    session.close()
+    return elapsed, len(statements), matched
+
+
+def main():
+    import logging
+
+    logging.disable(logging.INFO)
+
+    parser = argparse.ArgumentParser(description="GameMatcher batch matching benchmark")
+    parser.add_argument("--games", type=int, default=1230)
+    parser.add_argument("--events", type=int, default=1300)
+    args = parser.parse_args()
+
+    nba_games, odds_games = season_schedule(args.games, args.events)
+
+    loop_time, loop_queries, loop_matched = timed(per_game_match, nba_games, odds_games)
+    index_time, index_queries, index_matched = timed(indexed_match, nba_games, odds_games)
+
+    print(f"Games × events:  {len(nba_games)} × {len(odds_games)}")
+    print(f"Per-game loop:   {loop_time * 1000:10.1f} ms  {loop_queries:7d} SQL  {loop_matched} matched")
+    print(f"Indexed batch:   {index_time * 1000:10.1f} ms  {index_queries:7d} SQL  {index_matched} matched")
+    print(f"Speedup:         {loop_time / index_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compiled prop line index vs. the full-scan lookup.
+
+Looks up every player × stat type in a recorded 10-bookmaker event props
+payload (tests/fixtures/odds_api) both ways: the original scan of every
+bookmaker/market/outcome per lookup, and PlayerPropsParser's index compiled
+once per response.
+
+Usage:
+    python tests/performance/bench_player_props_parser.py
+    python tests/performance/bench_player_props_parser.py --repeat 20
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "tests"))
+
+from app.services.nba.player_props_parser import PlayerPropsParser  # noqa: E402
+from test_player_props_parser import (  # noqa: E402
+    STAT_TYPES, legacy_extract_player_lines, load_payload, payload_player_names
+)
+
+
+def run_scan(parser, payload, names):
+    for name in names:
+        for stat_type in STAT_TYPES:
+            legacy_extract_player_lines(parser, payload, name, stat_type)
+
+
+def run_index(parser, payload, names):
+    parser._compiled = None  # include the compile in every timed run
+    for name in names:
+        for stat_type in STAT_TYPES:
+            parser.extract_player_lines(payload, name, stat_type)
+
+
+def best_of(func, repeat, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Player props parser benchmark")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", DeprecationWarning)
+    props_parser = PlayerPropsParser()
+    payload = load_payload()
+    names = payload_player_names(payload)
+    bookmakers = payload["data"]["bookmakers"]
+    outcomes = sum(len(m["outcomes"]) for b in bookmakers for m in b["markets"])
+
+    scan_time = best_of(run_scan, args.repeat, props_parser, payload, names)
+    index_time = best_of(run_index, args.repeat, props_parser, payload, names)
+
+    print(f"Payload:    {len(bookmakers)} bookmakers, {outcomes} outcomes")
+    print(f"Lookups:    {len(names)} players × {len(STAT_TYPES)} stats")
+    print(f"Full scan:  {scan_time * 1000:8.2f} ms")
+    print(f"Index:      {index_time * 1000:8.2f} ms (includes one compile)")
+    print(f"Speedup:    {scan_time / index_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized projection kernel vs. the scalar recent-form loop.
+
+Projects recent form (per-36, MAD outlier capping, adaptive alpha EWMA,
+variance) for a slate of players × 4 stat types both ways and reports
+the speedup.
+
+Usage:
+    python tests/performance/bench_projection_kernel.py
+    python tests/performance/bench_projection_kernel.py --players 500 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "tests"))
+
+from app.services.core import projection_kernel as kernel  # noqa: E402
+from test_projection_kernel import random_slate, scalar_recent_form  # noqa: E402
+
+
+def run_scalar(stats, minutes, new_team):
+    mins_lists = [[None if np.isnan(m) else m for m in row] for row in minutes]
+    for p in range(stats.shape[0]):
+        for s in range(stats.shape[2]):
+            scalar_recent_form(list(stats[p, :, s]), mins_lists[p], bool(new_team[p]))
+
+
+def run_kernel(stats, minutes, new_team):
+    kernel.project_recent_form(stats, minutes, new_team=new_team)
+
+
+def best_of(func, repeat, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Projection kernel benchmark")
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stats, minutes, new_team = random_slate(args.players, args.games)
+
+    scalar_time = best_of(run_scalar, args.repeat, stats, minutes, new_team)
+    kernel_time = best_of(run_kernel, args.repeat, stats, minutes, new_team)
+
+    print(f"Players × stats: {args.players} × {stats.shape[2]} ({args.games} games each)")
+    print(f"Scalar loop:     {scalar_time * 1000:8.1f} ms")
+    print(f"Kernel:          {kernel_time * 1000:8.1f} ms")
+    print(f"Speedup:         {scalar_time / kernel_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
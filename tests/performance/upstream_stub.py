@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in server for The Odds API, ESPN and nba_api upstreams.
+
+Serves the recorded payloads in tests/fixtures so load tests, benchmarks and
+integration tests can exercise the real HTTP clients (OddsApiService,
+ESPNApiService, nba_api, the NBA.com CDN scoreboard) without network access
+or spending Odds API quota. Latency, error rate and quota are configurable
+so backoff, circuit breakers and quota planning can be exercised too.
+
+Routes:
+    /v4/sports                                      Odds API sports list (free)
+    /v4/sports/{sport}/odds                         Slate of N events, 10 books
+    /v4/sports/{sport}/events/{event_id}/odds       Player props, 10 books
+    /v4/sports/{sport}/scores                       Completed/upcoming scores
+    /apis/site/v2/sports/{sport}/{league}/...       ESPN scoreboard, summary,
+                                                    teams, news
+    /stats/{endpoint}                               nba_api playergamelog,
+                                                    leaguegamelog,
+                                                    leaguedashteamstats
+    /static/json/liveData/scoreboard/todaysScoreboard_00.json
+    /_stub/config (POST), /_stub/stats, /_stub/reset (POST)
+
+Odds API requests cost markets × regions quota like the real API and carry
+x-requests-remaining / x-requests-used / x-requests-last headers; once the
+quota is spent they fail with 401 OUT_OF_USAGE_CREDITS. Props are served for
+any event ID so callers can use their own Game.external_id values.
+
+Point the services at the stub with the base-URL settings:
+
+    ODDS_API_BASE_URL=http://127.0.0.1:8900/v4
+    ESPN_API_BASE_URL=http://127.0.0.1:8900/apis/site/v2/sports
+    NBA_STATS_BASE_URL=http://127.0.0.1:8900/stats
+    NBA_CDN_BASE_URL=http://127.0.0.1:8900
+
+Usage:
+    # Standalone (prints the env lines above)
+    python tests/performance/upstream_stub.py --port 8900 --latency-ms 150 --error-rate 0.02
+
+    # Refresh the fixtures from the live upstreams
+    python tests/performance/upstream_stub.py record --odds-api-key $THE_ODDS_API_KEY
+
+    # pytest (tests/conftest.py)
+    def test_slate(upstream_stub):
+        service = OddsApiService(api_key="stub", base_url=upstream_stub.odds_api_url)
+"""
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import random
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+ODDS_EVENTS_FIXTURE = "odds_api/nba_odds_events.json"
+ODDS_PROPS_FIXTURE = "odds_api/nba_event_player_props_10_books.json"
+ODDS_SCORES_FIXTURE = "odds_api/nba_scores.json"
+ESPN_SCOREBOARD_FIXTURE = "espn/nba_scoreboard.json"
+ESPN_SUMMARY_FIXTURE = "espn/nba_summary.json"
+CDN_SCOREBOARD_FIXTURE = "nba_cdn/todays_scoreboard.json"
+NBA_STATS_FIXTURES = {
+    "playergamelog": "nba_api/playergamelog.json",
+    "leaguegamelog": "nba_api/leaguegamelog.json",
+    "leaguedashteamstats": "nba_api/leaguedashteamstats.json",
+}
+
+ODDS_API_SPORTS = [
+    {"key": "americanfootball_nfl", "group": "American Football", "title": "NFL",
+     "description": "US Football", "active": True, "has_outrights": False},
+    {"key": "basketball_nba", "group": "Basketball", "title": "NBA",
+     "description": "US Basketball", "active": True, "has_outrights": False},
+]
+
+
+@dataclass
+class StubConfig:
+    """Runtime behaviour of the stand-in server (changeable via /_stub/config)."""
+
+    latency_ms: float = 0.0  # Added to every upstream response
+    jitter_ms: float = 0.0  # Uniform +/- jitter around latency_ms
+    error_rate: float = 0.0  # Fraction of upstream requests failed with error_status
+    error_status: int = 503
+    quota: int = 20000  # Odds API credits available before 401s
+    events: int = 10  # Events on the Odds API slate (fixture events are cycled)
+    seed: int = 0  # Seeds latency jitter and error injection
+
+
+def _load(name: str) -> Any:
+    with open(FIXTURES_DIR / name) as f:
+        return json.load(f)
+
+
+def _stub_event_id(base_id: str, index: int) -> str:
+    """Deterministic 32-hex event ID for slate entries beyond the recording."""
+    return hashlib.md5(f"{base_id}:{index}".encode()).hexdigest()
+
+
+class UpstreamStub:
+    """
+    FastAPI app serving recorded upstream payloads, runnable in a thread.
+
+    Attributes:
+        config: Current StubConfig
+        requests: Request counts per route name
+        errors_injected: Requests failed by error_rate
+        quota_used: Odds API credits spent
+    """
+
+    def __init__(self, config: Optional[StubConfig] = None):
+        self.config = config or StubConfig()
+        self.requests: Counter = Counter()
+        self.errors_injected = 0
+        self.quota_used = 0
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self.url: Optional[str] = None
+
+        self._events = _load(ODDS_EVENTS_FIXTURE)
+        self._props = _load(ODDS_PROPS_FIXTURE)
+        self._scores = _load(ODDS_SCORES_FIXTURE)
+        self._espn_scoreboard = _load(ESPN_SCOREBOARD_FIXTURE)
+        self._espn_summary = _load(ESPN_SUMMARY_FIXTURE)
+        self._cdn_scoreboard = _load(CDN_SCOREBOARD_FIXTURE)
+        self._nba_stats = {name: _load(path) for name, path in NBA_STATS_FIXTURES.items()}
+
+        self.app = self._build_app()
+
+    # ------------------------------------------------------------------
+    # Base URLs for the service settings
+    # ------------------------------------------------------------------
+
+    @property
+    def odds_api_url(self) -> str:
+        return f"{self.url}/v4"
+
+    @property
+    def espn_url(self) -> str:
+        return f"{self.url}/apis/site/v2/sports"
+
+    @property
+    def nba_stats_url(self) -> str:
+        return f"{self.url}/stats"
+
+    @property
+    def nba_cdn_url(self) -> str:
+        return self.url
+
+    def env(self) -> Dict[str, str]:
+        """Settings that point the services at this server."""
+        return {
+            "ODDS_API_BASE_URL": self.odds_api_url,
+            "ESPN_API_BASE_URL": self.espn_url,
+            "NBA_STATS_BASE_URL": self.nba_stats_url,
+            "NBA_CDN_BASE_URL": self.nba_cdn_url,
+        }
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+
+    def configure(self, **changes) -> StubConfig:
+        """Update config fields in place (unknown keys raise ValueError)."""
+        names = {f.name for f in fields(StubConfig)}
+        unknown = set(changes) - names
+        if unknown:
+            raise ValueError(f"Unknown stub settings: {sorted(unknown)}")
+        for name, value in changes.items():
+            setattr(self.config, name, value)
+        if "seed" in changes:
+            self._rng = random.Random(self.config.seed)
+        return self.config
+
+    def reset(self) -> None:
+        """Clear counters and restore the quota."""
+        with self._lock:
+            self.requests.clear()
+            self.errors_injected = 0
+            self.quota_used = 0
+            self._rng = random.Random(self.config.seed)
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counts, injected errors and quota usage."""
+        return {
+            "requests": dict(self.requests),
+            "total_requests": sum(self.requests.values()),
+            "errors_injected": self.errors_injected,
+            "quota_used": self.quota_used,
+            "quota_remaining": max(0, self.config.quota - self.quota_used),
+            "config": asdict(self.config),
+        }
+
+    # ------------------------------------------------------------------
+    # Payloads
+    # ------------------------------------------------------------------
+
+    def slate(self) -> List[Dict]:
+        """The configured number of events, cycling the recorded slate a day apart."""
+        events = []
+        for i in range(self.config.events):
+            base = self._events[i % len(self._events)]
+            event = copy.deepcopy(base)
+            cycle = i // len(self._events)
+            if cycle:
+                event["id"] = _stub_event_id(base["id"], i)
+                commence = datetime.strptime(base["commence_time"], "%Y-%m-%dT%H:%M:%SZ")
+                event["commence_time"] = (commence + timedelta(days=cycle)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            events.append(event)
+        return events
+
+    def event_props(self, event_id: str, markets: List[str]) -> Dict:
+        """Recorded 10-book props relabelled for event_id and filtered to markets."""
+        data = copy.deepcopy(self._props["data"])
+        data["id"] = event_id
+        for event in self.slate():
+            if event["id"] == event_id:
+                for key in ("commence_time", "home_team", "away_team"):
+                    data[key] = event[key]
+                break
+        if markets:
+            for bookmaker in data["bookmakers"]:
+                bookmaker["markets"] = [m for m in bookmaker["markets"] if m["key"] in markets]
+        return data
+
+    def nba_stats(self, endpoint: str, params: Dict[str, str]) -> Optional[Dict]:
+        """nba_api resultSets payload for endpoint, honouring the common filters."""
+        payload = self._nba_stats.get(endpoint.lower())
+        if payload is None:
+            return None
+        payload = copy.deepcopy(payload)
+        result_set = payload["resultSets"][0]
+        headers = result_set["headers"]
+
+        if endpoint.lower() == "playergamelog" and params.get("PlayerID"):
+            column = headers.index("Player_ID")
+            for row in result_set["rowSet"]:
+                row[column] = int(params["PlayerID"])
+
+        if endpoint.lower() == "leaguegamelog":
+            column = headers.index("GAME_DATE")
+            date_from = _parse_stats_date(params.get("DateFrom"))
+            date_to = _parse_stats_date(params.get("DateTo"))
+            result_set["rowSet"] = [
+                row for row in result_set["rowSet"]
+                if (not date_from or row[column] >= date_from)
+                and (not date_to or row[column] <= date_to)
+            ]
+
+        payload["parameters"].update({k: v for k, v in params.items() if k in payload["parameters"]})
+        return payload
+
+    # ------------------------------------------------------------------
+    # App
+    # ------------------------------------------------------------------
+
+    def _odds_quota(self, cost: int) -> Optional[Dict[str, str]]:
+        """Spend cost credits; None when the quota is exhausted."""
+        with self._lock:
+            if self.quota_used + cost > self.config.quota:
+                return None
+            self.quota_used += cost
+            return {
+                "x-requests-remaining": str(self.config.quota - self.quota_used),
+                "x-requests-used": str(self.quota_used),
+                "x-requests-last": str(cost),
+            }
+
+    def _odds_response(self, request: Request, payload: Any, cost: int) -> JSONResponse:
+        if not request.query_params.get("apiKey"):
+            return JSONResponse(
+                {"message": "API key is missing.", "error_code": "MISSING_KEY"}, status_code=401
+            )
+        headers = self._odds_quota(cost)
+        if headers is None:
+            return JSONResponse(
+                {
+                    "message": "Usage quota has been reached.",
+                    "error_code": "OUT_OF_USAGE_CREDITS",
+                },
+                status_code=401,
+                headers={
+                    "x-requests-remaining": "0",
+                    "x-requests-used": str(self.quota_used),
+                    "x-requests-last": "0",
+                },
+            )
+        return JSONResponse(payload, headers=headers)
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI(title="Upstream stand-in", docs_url=None, redoc_url=None, openapi_url=None)
+
+        @app.middleware("http")
+        async def inject_latency_and_errors(request: Request, call_next):
+            if request.url.path.startswith("/_stub"):
+                return await call_next(request)
+
+            config = self.config
+            with self._lock:
+                delay = config.latency_ms + self._rng.uniform(-config.jitter_ms, config.jitter_ms)
+                fail = self._rng.random() < config.error_rate
+            if delay > 0:
+                await asyncio.sleep(delay / 1000)
+            if fail:
+                with self._lock:
+                    self.errors_injected += 1
+                return JSONResponse(
+                    {"message": "Injected upstream error"}, status_code=config.error_status
+                )
+            return await call_next(request)
+
+        def count(route: str) -> None:
+            with self._lock:
+                self.requests[route] += 1
+
+        # The Odds API ---------------------------------------------------
+
+        @app.get("/v4/sports")
+        async def odds_sports(request: Request):
+            count("odds_api.sports")
+            return self._odds_response(request, ODDS_API_SPORTS, cost=0)
+
+        @app.get("/v4/sports/{sport}/odds")
+        async def odds_slate(sport: str, request: Request):
+            count("odds_api.odds")
+            markets = request.query_params.get("markets", "h2h").split(",")
+            regions = request.query_params.get("regions", "us").split(",")
+            slate = self.slate() if sport == "basketball_nba" else []
+            for event in slate:
+                for bookmaker in event["bookmakers"]:
+                    bookmaker["markets"] = [m for m in bookmaker["markets"] if m["key"] in markets]
+            return self._odds_response(request, slate, cost=len(markets) * len(regions))
+
+        @app.get("/v4/sports/{sport}/events/{event_id}/odds")
+        async def odds_event_props(sport: str, event_id: str, request: Request):
+            count("odds_api.event_odds")
+            markets = [m for m in request.query_params.get("markets", "").split(",") if m]
+            regions = request.query_params.get("regions", "us").split(",")
+            return self._odds_response(
+                request, self.event_props(event_id, markets), cost=max(1, len(markets)) * len(regions)
+            )
+
+        @app.get("/v4/sports/{sport}/scores")
+        async def odds_scores(sport: str, request: Request):
+            count("odds_api.scores")
+            cost = 2 if request.query_params.get("daysFrom") else 1
+            return self._odds_response(request, self._scores, cost=cost)
+
+        # ESPN -----------------------------------------------------------
+
+        @app.get("/apis/site/v2/sports/{sport}/{league}/scoreboard")
+        async def espn_scoreboard(sport: str, league: str, dates: Optional[str] = None):
+            count("espn.scoreboard")
+            payload = copy.deepcopy(self._espn_scoreboard)
+            if dates and len(dates) == 8:
+                payload["day"]["date"] = f"{dates[:4]}-{dates[4:6]}-{dates[6:]}"
+            return payload
+
+        @app.get("/apis/site/v2/sports/{sport}/{league}/summary")
+        async def espn_summary(sport: str, league: str, event: str):
+            count("espn.summary")
+            payload = copy.deepcopy(self._espn_summary)
+            payload["header"]["id"] = event
+            return payload
+
+        @app.get("/apis/site/v2/sports/{sport}/{league}/teams")
+        async def espn_teams(sport: str, league: str):
+            count("espn.teams")
+            teams = [
+                {"team": competitor["team"]}
+                for event in self._espn_scoreboard["events"]
+                for competitor in event["competitions"][0]["competitors"]
+            ]
+            return {"sports": [{"name": sport, "leagues": [{"abbreviation": league.upper(), "teams": teams}]}]}
+
+        @app.get("/apis/site/v2/sports/{sport}/{league}/news")
+        async def espn_news(sport: str, league: str):
+            count("espn.news")
+            return {"header": f"{league.upper()} News", "articles": []}
+
+        # nba_api / NBA.com ----------------------------------------------
+
+        @app.get("/stats/{endpoint}")
+        async def nba_stats(endpoint: str, request: Request):
+            count(f"nba_stats.{endpoint.lower()}")
+            payload = self.nba_stats(endpoint, dict(request.query_params))
+            if payload is None:
+                return JSONResponse({"message": f"Unknown endpoint {endpoint}"}, status_code=404)
+            return payload
+
+        @app.get("/static/json/liveData/scoreboard/todaysScoreboard_00.json")
+        async def cdn_scoreboard():
+            count("nba_cdn.scoreboard")
+            return self._cdn_scoreboard
+
+        # Control --------------------------------------------------------
+
+        @app.post("/_stub/config")
+        async def update_config(request: Request):
+            try:
+                config = self.configure(**(await request.json()))
+            except ValueError as e:
+                return JSONResponse({"message": str(e)}, status_code=400)
+            return asdict(config)
+
+        @app.get("/_stub/stats")
+        async def get_stats():
+            return self.stats()
+
+        @app.post("/_stub/reset")
+        async def reset():
+            self.reset()
+            return self.stats()
+
+        return app
+
+    # ------------------------------------------------------------------
+    # Server lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Serve in a background thread.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+
+        Returns:
+            Base URL of the running server
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        self.url = f"http://{host}:{sock.getsockname()[1]}"
+
+        self._server = uvicorn.Server(uvicorn.Config(self.app, log_level="warning", access_log=False))
+        self._thread = threading.Thread(
+            target=self._server.run, kwargs={"sockets": [sock]}, name="upstream-stub", daemon=True
+        )
+        self._thread.start()
+
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("Upstream stand-in server failed to start")
+            time.sleep(0.01)
+        return self.url
+
+    def stop(self) -> None:
+        """Shut the server down and wait for its thread."""
+        if self._server:
+            self._server.should_exit = True
+        if self._thread:
+            self._thread.join(timeout=10)
+        self._server = self._thread = None
+
+    def __enter__(self) -> "UpstreamStub":
+        if not self.url:
+            self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def _parse_stats_date(value: Optional[str]) -> Optional[str]:
+    """nba_api MM/DD/YYYY date parameter as the fixtures' YYYY-MM-DD."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%m/%d/%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return value
+
+
+# ----------------------------------------------------------------------
+# Recording
+# ----------------------------------------------------------------------
+
+def record_fixtures(odds_api_key: Optional[str], date: str, season: str) -> None:
+    """
+    Fetch live upstream payloads and overwrite the fixtures the stub serves.
+
+    Args:
+        odds_api_key: The Odds API key (Odds API fixtures are skipped without one;
+                      recording costs about 35 credits)
+        date: ESPN scoreboard date (YYYYMMDD)
+        season: NBA season for the nba_api endpoints (e.g. "2025-26")
+    """
+    import httpx
+    from nba_api.stats.library.http import STATS_HEADERS
+
+    def save(name: str, payload: Any) -> None:
+        path = FIXTURES_DIR / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=1) + "\n")
+        print(f"recorded {path.relative_to(FIXTURES_DIR.parent.parent)}")
+
+    with httpx.Client(timeout=30.0) as client:
+        if odds_api_key:
+            odds = "https://api.the-odds-api.com/v4/sports/basketball_nba"
+            events = client.get(f"{odds}/odds", params={
+                "apiKey": odds_api_key, "regions": "us", "markets": "h2h,spreads,totals",
+                "oddsFormat": "american",
+            }).raise_for_status().json()
+            save(ODDS_EVENTS_FIXTURE, events)
+            save(ODDS_SCORES_FIXTURE, client.get(f"{odds}/scores", params={
+                "apiKey": odds_api_key, "daysFrom": 1,
+            }).raise_for_status().json())
+            if events:
+                markets = "player_points,player_rebounds,player_assists,player_threes"
+                props = client.get(f"{odds}/events/{events[0]['id']}/odds", params={
+                    "apiKey": odds_api_key, "regions": "us", "markets": markets,
+                    "oddsFormat": "american",
+                }).raise_for_status().json()
+                save(ODDS_PROPS_FIXTURE, {"event_id": events[0]["id"], "markets": markets, "data": props})
+
+        espn = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba"
+        scoreboard = client.get(f"{espn}/scoreboard", params={"dates": date}).raise_for_status().json()
+        save(ESPN_SCOREBOARD_FIXTURE, scoreboard)
+        completed = [
+            e for e in scoreboard.get("events", [])
+            if e.get("status", {}).get("type", {}).get("completed")
+        ]
+        if completed:
+            save(ESPN_SUMMARY_FIXTURE, client.get(
+                f"{espn}/summary", params={"event": completed[0]["id"]}
+            ).raise_for_status().json())
+
+        save(CDN_SCOREBOARD_FIXTURE, client.get(
+            "https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+        ).raise_for_status().json())
+
+        stats = "https://stats.nba.com/stats"
+        stats_params = {
+            "playergamelog": {"PlayerID": 1628369, "Season": season, "SeasonType": "Regular Season"},
+            "leaguegamelog": {
+                "Counter": 0, "Direction": "ASC", "LeagueID": "00", "PlayerOrTeam": "P",
+                "Season": season, "SeasonType": "Regular Season", "Sorter": "DATE",
+            },
+            "leaguedashteamstats": {
+                "MeasureType": "Base", "PerMode": "PerGame", "Season": season,
+                "SeasonType": "Regular Season",
+            },
+        }
+        for endpoint, params in stats_params.items():
+            save(NBA_STATS_FIXTURES[endpoint], client.get(
+                f"{stats}/{endpoint}", params=params, headers=STATS_HEADERS
+            ).raise_for_status().json())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline stand-in for Odds API, ESPN and nba_api")
+    subcommands = parser.add_subparsers(dest="command")
+
+    record = subcommands.add_parser("record", help="Refresh fixtures from the live upstreams")
+    record.add_argument("--odds-api-key", default=None)
+    record.add_argument("--date", default=datetime.now().strftime("%Y%m%d"), help="ESPN date (YYYYMMDD)")
+    record.add_argument("--season", default="2025-26")
+
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--quota", type=int, default=20000)
+    parser.add_argument("--events", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record_fixtures(args.odds_api_key, args.date, args.season)
+        return
+
+    stub = UpstreamStub(StubConfig(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        error_status=args.error_status, quota=args.quota, events=args.events, seed=args.seed,
+    ))
+    stub.start(args.host, args.port)
+    print(f"Upstream stand-in listening on {stub.url}")
+    for key, value in stub.env().items():
+        print(f"{key}={value}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        stub.stop()
+        print(json.dumps(stub.stats(), indent=2), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Unit tests for the one-query accuracy timeline in AccuracyService.
+
+Test Strategy:
+1. Resolved predictions are bucketed into windows from the start of the
+   period; unresolved predictions and empty windows are left out
+2. MAE, RMSE and win rate match the per-window definitions (win rate over
+   OVER/UNDER recommendations only)
+3. The whole timeline is read in a single SQL statement
+4. Arbitrary windows (hours) and model_version filtering
+5. Breakdown by stat_type / model_version within each window; unknown
+   breakdown columns are rejected
+"""
+import math
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models import Game, Player, Prediction, Sport
+from app.services.core.accuracy_service import AccuracyService
+
+NOW = datetime.utcnow()
+
+
+@pytest.fixture
+def db(sqlite_session):
+    sqlite_session.add(Sport(id="nba", name="NBA", active=True, created_at=NOW, updated_at=NOW))
+    sqlite_session.add(Player(
+        id="player-1", sport_id="nba", external_id="2544", name="LeBron James",
+        team="LAL", active=True, created_at=NOW, updated_at=NOW
+    ))
+    sqlite_session.add(Game(
+        id="game-1", sport_id="nba", external_id="0022500101", game_date=NOW,
+        away_team="LAL", home_team="GSW", season=2026, status="final",
+        created_at=NOW, updated_at=NOW
+    ))
+    sqlite_session.commit()
+    return sqlite_session
+
+
+def add_prediction(db, age, stat_type, predicted, actual, recommendation, was_correct,
+                   model_version="1.0.0", resolved=True):
+    db.add(Prediction(
+        id=str(uuid.uuid4()), sport_id="nba", player_id="player-1", game_id="game-1",
+        stat_type=stat_type, predicted_value=predicted, recommendation=recommendation,
+        confidence=0.6, model_version=model_version, created_at=NOW - age,
+        actual_value=actual if resolved else None,
+        was_correct=was_correct if resolved else None,
+        actuals_resolved_at=NOW if resolved else None
+    ))
+    db.commit()
+
+
+@pytest.fixture
+def service(db):
+    """Three days: two resolved windows around an empty one."""
+    early = timedelta(days=2, hours=14)
+    add_prediction(db, early, "points", 27.0, 25.0, "OVER", True)
+    add_prediction(db, early, "points", 20.0, 24.0, "UNDER", False)
+    add_prediction(db, early, "rebounds", 8.0, 8.0, "PASS", None, model_version="1.1.0")
+    add_prediction(db, early, "assists", 9.0, 3.0, "OVER", True, resolved=False)
+    add_prediction(db, timedelta(hours=10), "assists", 7.0, 8.0, "OVER", True, model_version="1.1.0")
+    return AccuracyService(db)
+
+
+class TestTimeline:
+    """Windowed metrics from one grouped query."""
+
+    def test_windows_and_metrics(self, service):
+        timeline = service.get_accuracy_timeline(days_back=3)
+
+        assert len(timeline) == 2  # the middle day has nothing resolved
+        first, last = timeline
+        assert (first["total_predictions"], first["mae"], first["win_rate"]) == (3, 2.0, 0.5)
+        assert first["rmse"] == round(math.sqrt(20 / 3), 2)
+        assert (last["total_predictions"], last["mae"], last["rmse"], last["win_rate"]) == (1, 1.0, 1.0, 1.0)
+
+        first_start = datetime.fromisoformat(first["window_start"])
+        assert datetime.fromisoformat(first["window_end"]) - first_start == timedelta(days=1)
+        assert datetime.fromisoformat(last["window_start"]) - first_start == timedelta(days=2)
+        assert "breakdown" not in first
+
+    def test_single_statement(self, service, db):
+        statements = []
+        engine = db.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            timeline = service.get_accuracy_timeline(days_back=3, breakdown=["stat_type"])
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(timeline) == 2
+        assert len(statements) == 1
+
+    def test_hour_windows_and_model_filter(self, service):
+        timeline = service.get_accuracy_timeline(days_back=3, window=timedelta(hours=12))
+
+        assert [w["total_predictions"] for w in timeline] == [3, 1]
+        start = datetime.fromisoformat(timeline[0]["window_start"])
+        assert datetime.fromisoformat(timeline[0]["window_end"]) - start == timedelta(hours=12)
+        assert datetime.fromisoformat(timeline[1]["window_start"]) - start == timedelta(hours=60)
+
+        timeline = service.get_accuracy_timeline(model_version="1.1.0", days_back=3)
+        assert [(w["total_predictions"], w["win_rate"]) for w in timeline] == [(1, 0.0), (1, 1.0)]
+
+
+class TestBreakdown:
+    """Per stat_type / model_version metrics inside each window."""
+
+    def test_stat_type_breakdown(self, service):
+        first = service.get_accuracy_timeline(days_back=3, breakdown=["stat_type"])[0]
+
+        assert first["total_predictions"] == 3
+        assert first["breakdown"] == [
+            {"stat_type": "points", "total_predictions": 2, "mae": 3.0,
+             "rmse": round(math.sqrt(10), 2), "win_rate": 0.5},
+            {"stat_type": "rebounds", "total_predictions": 1, "mae": 0.0, "rmse": 0.0, "win_rate": 0.0},
+        ]
+
+    def test_two_column_breakdown(self, service):
+        timeline = service.get_accuracy_timeline(days_back=3, breakdown=["model_version", "stat_type"])
+
+        assert [(b["model_version"], b["stat_type"]) for b in timeline[0]["breakdown"]] == [
+            ("1.0.0", "points"), ("1.1.0", "rebounds")
+        ]
+        assert timeline[1]["breakdown"][0]["model_version"] == "1.1.0"
+
+    def test_unknown_breakdown_rejected(self, service):
+        with pytest.raises(ValueError, match="confidence"):
+            service.get_accuracy_timeline(breakdown=["confidence"])
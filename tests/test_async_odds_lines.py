@@ -0,0 +1,121 @@
+"""Unit tests for async-native odds line retrieval in the prediction services.
+
+Test Strategy:
+1. A game's odds event is resolved once and its props fetched once, no
+   matter how many player/stat lines are read from it
+2. Misses (no event, failed fetch) are cached per game and fall back to
+   estimation without retrying the API
+3. run_sync drives coroutines from plain sync code and from inside a
+   running event loop
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.nba.enhanced_prediction_service import EnhancedPredictionService
+from app.services.nhl.enhanced_prediction_service import EnhancedNHLPredictionService
+from app.utils.async_utils import run_sync
+
+PLAYERS = ["Jayson Tatum", "Jaylen Brown", "Joel Embiid"]
+MARKETS = {"points": "player_points", "rebounds": "player_rebounds"}
+
+
+def _props_response():
+    outcomes = {key: [] for key in MARKETS.values()}
+    for i, name in enumerate(PLAYERS):
+        for key in MARKETS.values():
+            point = 20.5 + i
+            outcomes[key] += [
+                {"name": "Over", "description": name, "point": point, "price": -115},
+                {"name": "Under", "description": name, "point": point, "price": -105},
+            ]
+    return {
+        "data": {
+            "bookmakers": [{
+                "key": "draftkings",
+                "title": "DraftKings",
+                "markets": [{"key": k, "outcomes": v} for k, v in outcomes.items()],
+            }]
+        }
+    }
+
+
+def _service(service_cls, event_id="evt-1", response=None):
+    odds_service = MagicMock()
+    odds_service.get_event_player_props = AsyncMock(return_value=response)
+    service = service_cls(MagicMock(), odds_api_service=odds_service)
+    service._game_odds_mapper = MagicMock()
+    service._game_odds_mapper.get_odds_event_id = AsyncMock(return_value=event_id)
+    return service, odds_service
+
+
+@pytest.fixture
+def game():
+    return SimpleNamespace(id="game-1", home_team="BOS", away_team="PHI")
+
+
+class TestSingleFetchPerGame:
+    """Every player/stat line comes from one awaited props fetch."""
+
+    def test_prefetch_serves_all_lines(self, game):
+        service, odds_service = _service(EnhancedPredictionService, response=_props_response())
+
+        asyncio.run(service._prefetch_event_odds(game))
+        lines = [
+            service._get_bookmaker_line(SimpleNamespace(name=name), game, stat, "draftkings")
+            for name in PLAYERS for stat in MARKETS
+        ]
+
+        assert [line["line"] for line in lines] == [20.5, 20.5, 21.5, 21.5, 22.5, 22.5]
+        assert all(line["line_source"] == "draftkings" for line in lines)
+        odds_service.get_event_player_props.assert_awaited_once_with("evt-1")
+        service._game_odds_mapper.get_odds_event_id.assert_awaited_once()
+
+    def test_sync_lookup_without_prefetch_fetches_once(self, game):
+        service, odds_service = _service(EnhancedNHLPredictionService, response=_props_response())
+        service._player_props_parser = MagicMock()
+        service._player_props_parser.extract_player_lines.return_value = {
+            "line": 0.5, "bookmaker": "draftkings"
+        }
+
+        for name in PLAYERS:
+            line = service._lookup_odds_line(SimpleNamespace(name=name), game, "goals", "draftkings")
+            assert line["line"] == 0.5
+
+        odds_service.get_event_player_props.assert_awaited_once_with("evt-1", sport="nhl")
+
+    def test_missing_event_is_cached(self, game):
+        service, odds_service = _service(EnhancedPredictionService, event_id=None)
+
+        asyncio.run(service._prefetch_event_odds(game))
+        for name in PLAYERS:
+            assert service._lookup_odds_line(SimpleNamespace(name=name), game, "points", "draftkings") is None
+
+        odds_service.get_event_player_props.assert_not_awaited()
+        service._game_odds_mapper.get_odds_event_id.assert_awaited_once()
+
+
+class TestRunSync:
+    """Sync adapters work with or without a running loop."""
+
+    async def _double(self, value):
+        await asyncio.sleep(0)
+        return value * 2
+
+    def test_without_running_loop(self):
+        assert run_sync(self._double(21)) == 42
+
+    def test_inside_running_loop(self):
+        async def caller():
+            return run_sync(self._double(5))
+
+        assert asyncio.run(caller()) == 10
+
+    def test_exceptions_propagate(self):
+        async def fail():
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError, match="bad"):
+            run_sync(fail())
@@ -0,0 +1,239 @@
+"""Unit tests for the write-behind match audit sink.
+
+Test Strategy:
+1. Before start() the sink writes through to the caller's session
+2. Once started, record() only buffers; rows are written in bulk when the
+   batch size is reached or the flush interval passes, keeping the time the
+   event was recorded rather than the flush time
+3. A full buffer writes the oldest batch at once and counts backpressure;
+   from the event loop the write runs on the blocking executor, never on
+   the loop thread; nothing is dropped
+4. stop() drains everything still buffered
+5. A failed flush puts its events back and they are written by the next one
+6. PlayerResolver alias writes are audited through the shared sink
+"""
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.core.audit_sink import AuditEvent, AuditSink, audit_row
+from app.models import MatchAuditLog
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Sessions on one SQLite file, usable from the flusher's worker threads."""
+    from app.models.unified import Base
+
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'audit.db'}", connect_args={"check_same_thread": False}
+    )
+    created_indexes = set()
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+            for index in table.indexes:
+                if index.name not in created_indexes:
+                    created_indexes.add(index.name)
+                    conn.execute(CreateIndex(index))
+
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def event(i, **kwargs):
+    return AuditEvent('game', f'game-{i}', 'matched', None, {'odds_event_id': f'evt-{i}'}, **kwargs)
+
+
+def count_rows(session_factory):
+    db = session_factory()
+    try:
+        return db.query(MatchAuditLog).count()
+    finally:
+        db.close()
+
+
+class TestWriteThrough:
+    """Sink not started (scripts, CLI tools)."""
+
+    def test_writes_to_callers_session(self, session_factory):
+        sink = AuditSink(session_factory=session_factory, batch_size=10, flush_interval=60)
+        db = session_factory()
+
+        sink.record(event(1), db=db)
+        sink.record_many([event(2), event(3)], db=db)
+
+        assert count_rows(session_factory) == 3
+        db.close()
+
+    def test_row_serializes_datetimes(self):
+        row = audit_row(AuditEvent(
+            'game', 'g1', 'matched', None, {'game_date': datetime(2025, 10, 21, 19, 30)},
+            match_details={'commence_time': datetime(2025, 10, 21, 23, 30)}
+        ))
+
+        assert row['new_state'] == '{"game_date": "2025-10-21T19:30:00"}'
+        assert row['match_details'] == '{"commence_time": "2025-10-21T23:30:00"}'
+        assert row['previous_state'] is None
+        assert row['performed_by'] == 'system'
+
+
+class TestWriteBehind:
+    """Sink started on the event loop."""
+
+    def test_record_buffers_until_interval(self, session_factory):
+        sink = AuditSink(session_factory=session_factory, batch_size=100, flush_interval=0.05)
+
+        async def run():
+            await sink.start()
+            sink.record(event(1))
+            sink.record(event(2))
+            buffered = count_rows(session_factory)
+            await asyncio.sleep(0.2)
+            written = count_rows(session_factory)
+            await sink.stop()
+            return buffered, written
+
+        buffered, written = asyncio.run(run())
+
+        assert buffered == 0
+        assert written == 2
+
+    def test_rows_keep_record_time(self, session_factory):
+        sink = AuditSink(session_factory=session_factory, batch_size=100, flush_interval=60)
+
+        async def run():
+            await sink.start()
+            before = datetime.utcnow()
+            sink.record(event(1))
+            recorded = datetime.utcnow()
+            await asyncio.sleep(0.2)
+            flushed_at = datetime.utcnow()
+            await sink.stop()
+            return before, recorded, flushed_at
+
+        before, recorded, flushed_at = asyncio.run(run())
+
+        db = session_factory()
+        created_at = db.query(MatchAuditLog.created_at).scalar()
+        db.close()
+        assert before <= created_at <= recorded
+        assert flushed_at - created_at >= timedelta(seconds=0.2)
+
+    def test_batch_size_triggers_flush(self, session_factory):
+        sink = AuditSink(session_factory=session_factory, batch_size=5, flush_interval=60)
+
+        async def run():
+            await sink.start()
+            sink.record_many([event(i) for i in range(5)])
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if count_rows(session_factory) == 5:
+                    break
+            written = count_rows(session_factory)
+            await sink.stop()
+            return written
+
+        assert asyncio.run(run()) == 5
+        assert sink.stats()['flushes'] == 1
+
+    def test_backpressure_writes_off_the_loop(self, session_factory):
+        write_threads = []
+
+        def tracking_factory():
+            write_threads.append(threading.current_thread())
+            return session_factory()
+
+        sink = AuditSink(
+            session_factory=tracking_factory, batch_size=10, flush_interval=60, max_buffered=20
+        )
+
+        async def run():
+            await sink.start()
+            # No await between records: the background flusher cannot run
+            for i in range(25):
+                sink.record(event(i))
+            inline = count_rows(session_factory)
+            await sink.stop()
+            return inline
+
+        inline = asyncio.run(run())
+
+        assert inline == 0
+        assert sink.stats()['backpressure'] == 1
+        assert count_rows(session_factory) == 25
+        assert threading.main_thread() not in write_threads
+
+    def test_stop_drains_buffer(self, session_factory):
+        sink = AuditSink(session_factory=session_factory, batch_size=7, flush_interval=60)
+
+        async def run():
+            await sink.start()
+            sink.record_many([event(i) for i in range(3)])
+            await sink.stop()
+
+        asyncio.run(run())
+
+        assert count_rows(session_factory) == 3
+        assert sink.stats() == {
+            'running': False, 'buffered': 0, 'written': 3,
+            'flushes': 1, 'failures': 0, 'backpressure': 0,
+        }
+
+    def test_failed_flush_is_requeued(self, session_factory):
+        calls = []
+
+        def flaky_factory():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("database unavailable")
+            return session_factory()
+
+        sink = AuditSink(session_factory=flaky_factory, batch_size=10, flush_interval=60)
+
+        async def run():
+            await sink.start()
+            sink.record_many([event(i) for i in range(4)])
+            first = await sink.flush()
+            buffered = sink.stats()['buffered']
+            await sink.stop()
+            return first, buffered
+
+        first, buffered = asyncio.run(run())
+
+        assert first == 0
+        assert buffered == 4
+        assert sink.stats()['failures'] == 1
+        assert count_rows(session_factory) == 4
+
+
+class TestMatcherIntegration:
+    """Matchers hand audit entries to the shared sink."""
+
+    def test_player_resolver_alias_write_is_buffered(self, session_factory, monkeypatch):
+        from app.core import audit_sink
+        from app.services.sync.matchers.player_resolver import PlayerResolver
+
+        sink = AuditSink(session_factory=session_factory, batch_size=100, flush_interval=60)
+        monkeypatch.setattr(audit_sink, '_sink', sink)
+        db = session_factory()
+
+        async def run():
+            await sink.start()
+            await PlayerResolver(db).create_or_update_alias(
+                2544, 'LeBron James', 'Lebron James', 'odds_api', 0.97
+            )
+            buffered = sink.stats()['buffered']
+            await sink.stop()
+            return buffered
+
+        assert asyncio.run(run()) == 1
+        audit = db.query(MatchAuditLog).one()
+        assert audit.entity_type == 'player'
+        assert audit.action == 'created'
+        db.close()
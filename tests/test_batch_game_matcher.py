@@ -0,0 +1,231 @@
+"""Unit tests for indexed batch game matching.
+
+Test Strategy:
+1. batch_match_games gives the same matches and confidences as per-game
+   find_match over a generated multi-day schedule (exact, time-shifted,
+   alternate-name and unmatched games)
+2. Existing mappings are prefetched in one query: matched ones are returned
+   as cached, pending ones are upgraded in place, and odds events already
+   held by another mapping are not reassigned
+3. Query count does not grow with the number of games
+4. Evening tip-offs whose UTC commence_time rolls over to the next day
+   match within the date tolerance
+5. New matches, pending rows and audit entries are written in bulk
+"""
+import asyncio
+import json
+import random
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models import GameMapping, MatchAuditLog, TeamMapping
+from app.services.sync.matchers.game_matcher import GameMatcher
+
+NBA_TEAMS = [
+    (1610612737, "ATL", "Atlanta Hawks"), (1610612738, "BOS", "Boston Celtics"),
+    (1610612739, "CLE", "Cleveland Cavaliers"), (1610612740, "NOP", "New Orleans Pelicans"),
+    (1610612741, "CHI", "Chicago Bulls"), (1610612742, "DAL", "Dallas Mavericks"),
+    (1610612743, "DEN", "Denver Nuggets"), (1610612744, "GSW", "Golden State Warriors"),
+    (1610612745, "HOU", "Houston Rockets"), (1610612746, "LAC", "Los Angeles Clippers"),
+    (1610612747, "LAL", "Los Angeles Lakers"), (1610612748, "MIA", "Miami Heat"),
+    (1610612749, "MIL", "Milwaukee Bucks"), (1610612750, "MIN", "Minnesota Timberwolves"),
+    (1610612751, "BKN", "Brooklyn Nets"), (1610612752, "NYK", "New York Knicks"),
+    (1610612753, "ORL", "Orlando Magic"), (1610612754, "IND", "Indiana Pacers"),
+    (1610612755, "PHI", "Philadelphia 76ers"), (1610612756, "PHX", "Phoenix Suns"),
+    (1610612757, "POR", "Portland Trail Blazers"), (1610612758, "SAC", "Sacramento Kings"),
+    (1610612759, "SAS", "San Antonio Spurs"), (1610612760, "OKC", "Oklahoma City Thunder"),
+    (1610612761, "TOR", "Toronto Raptors"), (1610612762, "UTA", "Utah Jazz"),
+    (1610612763, "MEM", "Memphis Grizzlies"), (1610612764, "WAS", "Washington Wizards"),
+    (1610612765, "DET", "Detroit Pistons"), (1610612766, "CHA", "Charlotte Hornets"),
+]
+
+
+def add_team_mappings(session):
+    """All 30 teams; the Odds API uses the full name, abbreviation and nickname are alternates."""
+    now = datetime(2025, 10, 1)
+    for team_id, abbr, full_name in NBA_TEAMS:
+        nickname = full_name.split(" ")[-1]
+        session.add(TeamMapping(
+            id=str(uuid.uuid4()), nba_team_id=team_id, nba_abbreviation=abbr,
+            nba_full_name=full_name, nba_city=full_name.rsplit(" ", 1)[0],
+            odds_api_name=full_name, odds_api_key=full_name.lower().replace(" ", ""),
+            alternate_names=json.dumps([abbr, nickname]), created_at=now, updated_at=now
+        ))
+    session.commit()
+
+
+def season_schedule(n_games=1230, n_events=1300, seed=3, start=datetime(2025, 10, 21)):
+    """
+    Generated NBA schedule and Odds API events.
+
+    Up to 15 games a day (no team twice per day). Each game gets one event;
+    ~10% tip off 3 hours from the NBA time (0.95), ~5% use a team's
+    nickname (alternate name) and ~5% have no event at all. Extra events on
+    off days pad the odds list to n_events.
+
+    Returns:
+        (nba_games, odds_games)
+    """
+    rng = random.Random(seed)
+    nba_games, odds_games = [], []
+    day = 0
+    while len(nba_games) < n_games:
+        teams = NBA_TEAMS[:]
+        rng.shuffle(teams)
+        for i in range(min(rng.randint(2, 15), n_games - len(nba_games))):
+            home, away = teams[2 * i], teams[2 * i + 1]
+            tip = start + timedelta(days=day, hours=rng.choice([19, 19, 20, 21, 22]))
+            game_id = f"00225{len(nba_games):05d}"
+            nba_games.append({
+                'id': game_id, 'game_date': tip, 'home_team_id': home[0], 'away_team_id': away[0]
+            })
+            roll = rng.random()
+            if roll < 0.05:
+                continue
+            home_name = home[2].split(" ")[-1] if roll < 0.10 else home[2]
+            odds_games.append({
+                'id': f"evt{game_id}",
+                'commence_time': tip + timedelta(hours=3 if roll > 0.90 else 0),
+                'home_team': home_name,
+                'away_team': away[2],
+            })
+        day += 2 if day % 7 == 6 else 1
+
+    while len(odds_games) < n_events:
+        home, away = rng.sample(NBA_TEAMS, 2)
+        odds_games.append({
+            'id': f"extra{len(odds_games)}",
+            'commence_time': start - timedelta(days=rng.randint(2, 20), hours=-19),
+            'home_team': home[2],
+            'away_team': away[2],
+        })
+    rng.shuffle(odds_games)
+    return nba_games, odds_games
+
+
+@pytest.fixture
+def teams(sqlite_session):
+    add_team_mappings(sqlite_session)
+    return sqlite_session
+
+
+class _QueryCounter:
+    """Counts SQL statements sent to the session's engine."""
+
+    def __init__(self, session):
+        self.engine = session.get_bind()
+        self.count = 0
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+class TestIndexedMatching:
+    """Same results as the per-game scorer."""
+
+    def test_matches_equal_find_match(self, teams):
+        nba_games, odds_games = season_schedule(n_games=60, n_events=70)
+        matcher = GameMatcher(teams)
+
+        expected = {}
+        for game in nba_games:
+            match = asyncio.run(matcher.find_match(game, odds_games))
+            if match:
+                expected[game['id']] = (match['odds_event_id'], match['match_confidence'])
+
+        results = asyncio.run(matcher.batch_match_games(nba_games, odds_games, date_tolerance_days=0))
+
+        actual = {m['nba_game_id']: (m['odds_event_id'], m['match_confidence']) for m in results['matches']}
+        assert actual == expected
+        assert {conf for _, conf in actual.values()} >= {1.0, 0.95}
+        assert results['unmatched'] == len(nba_games) - len(expected) > 0
+
+    def test_utc_rollover_within_tolerance(self, teams):
+        game = {'id': '0022500001', 'game_date': datetime(2026, 1, 14, 19, 30),
+                'home_team_id': 1610612738, 'away_team_id': 1610612755}
+        event_row = {'id': 'evt1', 'commence_time': datetime(2026, 1, 15, 0, 30),
+                     'home_team': 'Boston Celtics', 'away_team': 'Philadelphia 76ers'}
+        matcher = GameMatcher(teams)
+
+        strict = asyncio.run(matcher.batch_match_games([game], [event_row], date_tolerance_days=0))
+        teams.query(GameMapping).delete()
+        tolerant = asyncio.run(matcher.batch_match_games([game], [event_row]))
+
+        assert strict['matched'] == 0
+        assert tolerant['matches'][0]['odds_event_id'] == 'evt1'
+        assert tolerant['matches'][0]['match_confidence'] == 0.95
+
+
+class TestPrefetchAndBulkWrite:
+    """Existing mappings, bulk upsert and query count."""
+
+    def _mapping(self, nba_game_id, status, odds_event_id=None):
+        now = datetime(2025, 10, 20)
+        return GameMapping(
+            id=str(uuid.uuid4()), nba_game_id=nba_game_id, nba_home_team_id=1, nba_away_team_id=2,
+            odds_event_id=odds_event_id, game_date=now.date(), match_confidence=0.0 if not odds_event_id else 1.0,
+            match_method='none' if not odds_event_id else 'manual', status=status,
+            created_at=now, updated_at=now
+        )
+
+    def test_existing_mappings(self, teams):
+        nba_games, odds_games = season_schedule(n_games=20, n_events=20, seed=5)
+        by_game = {e['id'][3:]: e for e in odds_games if e['id'].startswith('evt')}
+        cached, pending, stolen = [g['id'] for g in nba_games if g['id'] in by_game][:3]
+        teams.add_all([
+            self._mapping(cached, 'matched', 'manual_evt'),
+            self._mapping(pending, 'pending'),
+            self._mapping('0021999999', 'matched', by_game[stolen]['id']),
+        ])
+        teams.commit()
+
+        results = asyncio.run(GameMatcher(teams).batch_match_games(nba_games, odds_games))
+
+        by_id = {m['nba_game_id']: m for m in results['matches']}
+        assert by_id[cached]['cached'] is True
+        assert by_id[cached]['odds_event_id'] == 'manual_evt'
+        assert by_id[pending]['cached'] is False
+        assert stolen not in by_id
+
+        upgraded = teams.query(GameMapping).filter(GameMapping.nba_game_id == pending).one()
+        teams.refresh(upgraded)
+        assert upgraded.status == 'matched'
+        assert upgraded.odds_event_id == by_game[pending]['id']
+        assert upgraded.created_at == datetime(2025, 10, 20)
+
+    def test_bulk_rows_and_audit(self, teams):
+        nba_games, odds_games = season_schedule(n_games=40, n_events=40, seed=11)
+
+        results = asyncio.run(GameMatcher(teams).batch_match_games(nba_games, odds_games))
+
+        rows = teams.query(GameMapping).all()
+        assert len(rows) == len(nba_games)
+        assert sum(r.status == 'matched' for r in rows) == results['matched']
+        assert sum(r.status == 'manual_review' for r in rows) == results['unmatched']
+        audits = teams.query(MatchAuditLog).filter(MatchAuditLog.entity_type == 'game').all()
+        assert len(audits) == results['matched']
+        assert json.loads(audits[0].match_details)['odds_game_data']['id']
+
+    def test_query_count_independent_of_games(self, teams):
+        counts = []
+        for n_games in (30, 300):
+            teams.query(GameMapping).delete()
+            teams.query(MatchAuditLog).delete()
+            teams.commit()
+            nba_games, odds_games = season_schedule(n_games=n_games, n_events=n_games)
+
+            with _QueryCounter(teams) as queries:
+                asyncio.run(GameMatcher(teams).batch_match_games(nba_games, odds_games))
+
+            counts.append(queries.count)
+        assert counts[0] == counts[1] <= 6
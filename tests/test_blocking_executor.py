@@ -0,0 +1,169 @@
+"""Unit tests for the shared blocking-call executor.
+
+Test Strategy:
+1. Blocking calls run on worker threads; the event loop keeps serving
+   other coroutines meanwhile
+2. Per-source token bucket spaces request starts; other sources are not
+   throttled by it
+3. A call that overruns its timeout raises BlockingCallTimeout and is
+   counted; errors propagate and are counted
+4. Queue depth and in-flight counts reflect calls waiting for a worker
+5. nba_api service calls go through the shared executor
+"""
+import asyncio
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from app.core import metrics
+from app.core.blocking import BlockingCallTimeout, BlockingExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = BlockingExecutor(
+        max_workers=2, default_timeout=5, rate_limits={"slow_api": 10.0}, timeouts={}
+    )
+    yield executor
+    executor.shutdown(wait=True)
+
+
+class TestOffloading:
+    """Calls leave the event loop free."""
+
+    def test_loop_stays_responsive(self, executor):
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        async def run():
+            return await asyncio.gather(
+                executor.run("other", time.sleep, 0.2),
+                ticker()
+            )
+
+        started = time.monotonic()
+        asyncio.run(run())
+
+        assert len(ticks) == 5
+        assert ticks[-1] - started < 0.2
+        assert threading.current_thread().name == "MainThread"
+
+    def test_returns_result_with_args(self, executor):
+        result = asyncio.run(executor.run("other", lambda a, b=0: a + b, 2, b=3))
+
+        assert result == 5
+
+
+class TestRateLimit:
+    """Token bucket per source."""
+
+    def test_request_starts_are_spaced(self, executor):
+        starts = []
+
+        async def run():
+            await asyncio.gather(*(
+                executor.run("slow_api", lambda: starts.append(time.monotonic()))
+                for _ in range(4)
+            ))
+
+        asyncio.run(run())
+
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert len(starts) == 4
+        assert min(gaps) >= 0.08
+
+    def test_unlisted_source_not_throttled(self, executor):
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(*(executor.run("other", int) for _ in range(10)))
+            return time.monotonic() - started
+
+        assert asyncio.run(run()) < 0.2
+
+
+class TestTimeoutsAndErrors:
+    """Timeouts, errors and their counters."""
+
+    def test_timeout_raises_and_is_counted(self, executor):
+        before = metrics.blocking_call_timeouts_total.labels(source="other")._value.get()
+
+        with pytest.raises(BlockingCallTimeout, match="timed out after 0.05s"):
+            asyncio.run(executor.run("other", time.sleep, 0.3, timeout=0.05))
+
+        stats = executor.stats()["sources"]["other"]
+        assert stats["timeouts"] == 1
+        assert stats["queued"] == 0
+        assert metrics.blocking_call_timeouts_total.labels(source="other")._value.get() == before + 1
+
+    def test_error_propagates(self, executor):
+        def boom():
+            raise ValueError("upstream said no")
+
+        with pytest.raises(ValueError, match="upstream said no"):
+            asyncio.run(executor.run("other", boom))
+
+        stats = executor.stats()["sources"]["other"]
+        assert stats["errors"] == 1
+        assert stats["calls"] == 1
+        assert stats["active"] == 0
+
+
+class TestQueueDepth:
+    """Calls beyond max_workers wait in the queue."""
+
+    def test_queue_depth_while_workers_busy(self, executor):
+        release = threading.Event()
+        observed = {}
+
+        async def run():
+            calls = [asyncio.ensure_future(executor.run("other", release.wait, 5)) for _ in range(5)]
+            await asyncio.sleep(0.1)
+            observed.update(executor.stats()["sources"]["other"])
+            observed["gauge"] = metrics.blocking_calls_queued.labels(source="other")._value.get()
+            release.set()
+            await asyncio.gather(*calls)
+
+        asyncio.run(run())
+
+        assert observed["active"] == 2
+        assert observed["queued"] == 3
+        assert observed["gauge"] >= 3
+        stats = executor.stats()["sources"]["other"]
+        assert stats["calls"] == 5
+        assert stats["queued"] == stats["active"] == 0
+        assert stats["avg_wait_seconds"] > 0
+
+
+class TestServiceIntegration:
+    """nba_api services use the shared executor."""
+
+    def test_team_stats_run_on_executor(self, monkeypatch):
+        from nba_api.stats.endpoints import leaguedashteamstats
+
+        from app.services.nba.nba_api_service import NbaApiService
+
+        threads = []
+
+        class FakeTeamStats:
+            def __init__(self, **kwargs):
+                threads.append(threading.current_thread().name)
+
+            def get_data_frames(self):
+                return [pd.DataFrame({
+                    "TEAM_ABBREVIATION": ["BOS"], "OFF_RATING": [121.0], "DEF_RATING": [110.5],
+                    "PACE": [98.2], "PTS": [118.0], "REB": [45.0], "AST": [26.0]
+                })]
+
+        monkeypatch.setattr(leaguedashteamstats, "LeagueDashTeamStats", FakeTeamStats)
+
+        result = asyncio.run(NbaApiService(db=None).get_team_matchup_stats("BOS"))
+
+        assert result["offensive_rating"] == 121.0
+        assert threads and threads[0].startswith("blocking")
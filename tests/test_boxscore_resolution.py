@@ -0,0 +1,350 @@
+"""Unit tests for set-based prediction resolution in BoxscoreImportService.
+
+Test Strategy:
+1. One game resolves every unresolved prediction with actual value,
+   difference and OVER/UNDER correctness (bookmaker line, falling back to
+   the predicted value)
+2. PlayerStats lines are created once per player, or updated in place for
+   players that already have one
+3. Statement count does not grow with the number of predictions
+4. Dry run writes nothing and returns the diff of what would change
+5. Predictions for players missing from the boxscore are reported and left
+   unresolved
+6. resolve_games fetches boxscores concurrently under the semaphore and
+   commits each game in its own session, opened only after its boxscore
+   arrives; a failing game is reported and rolled back without affecting
+   the others, and a missing boxscore fails without a session or a refetch
+"""
+import asyncio
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.models import Game, Player, PlayerStats, Prediction, Sport
+from app.services.nba.boxscore_import_service import BoxscoreImportService
+
+BOXSCORE = {
+    "GAME_ID": "0022500101",
+    "PlayerStats": [
+        {"PLAYER_ID": "2544", "PTS": 28, "REB": 8, "AST": 9, "FG3M": 2, "MIN": "36:30"},
+        {"PLAYER_ID": "201939", "PTS": 31, "REB": 5, "AST": 6, "FG3M": 6, "MIN": "34:10"},
+        {"PLAYER_ID": "1629029", "PTS": 19, "REB": 11, "AST": 4, "FG3M": 1, "MIN": "30:00"},
+    ],
+}
+
+
+def add_players(session):
+    now = datetime(2026, 1, 15)
+    session.add(Sport(id="nba", name="NBA", active=True, created_at=now, updated_at=now))
+    for external_id, name in [("2544", "LeBron James"), ("201939", "Stephen Curry"),
+                              ("1629029", "Luka Doncic"), ("1630178", "Tyrese Maxey")]:
+        session.add(Player(
+            id=f"player-{external_id}", sport_id="nba", external_id=external_id, name=name,
+            team="LAL", active=True, created_at=now, updated_at=now
+        ))
+    session.commit()
+
+
+def add_game(session, external_id=BOXSCORE["GAME_ID"]):
+    now = datetime(2026, 1, 15)
+    game = Game(
+        id=str(uuid.uuid4()), sport_id="nba", external_id=external_id, id_source="nba",
+        game_date=now, away_team="LAL", home_team="GSW", season=2026, status="final",
+        created_at=now, updated_at=now
+    )
+    session.add(game)
+    session.commit()
+    return game
+
+
+@pytest.fixture
+def game(sqlite_session):
+    add_players(sqlite_session)
+    return add_game(sqlite_session)
+
+
+def add_prediction(session, game, external_id, stat_type, predicted, recommendation, line=None):
+    prediction = Prediction(
+        id=str(uuid.uuid4()), sport_id="nba", player_id=f"player-{external_id}", game_id=game.id,
+        stat_type=stat_type, predicted_value=predicted, bookmaker_line=line,
+        recommendation=recommendation, confidence=0.6, created_at=datetime(2026, 1, 15)
+    )
+    session.add(prediction)
+    session.commit()
+    return prediction.id
+
+
+@pytest.fixture
+def service(sqlite_session, monkeypatch):
+    service = BoxscoreImportService(sqlite_session)
+
+    async def get_boxscore(game_id):
+        return BOXSCORE
+
+    monkeypatch.setattr(service.nba_service, "get_boxscore", get_boxscore)
+    return service
+
+
+class TestResolveGame:
+    """Bulk resolution of one game."""
+
+    def test_resolves_predictions(self, service, sqlite_session, game):
+        over = add_prediction(sqlite_session, game, "2544", "points", 26.0, "OVER", line=25.5)
+        under = add_prediction(sqlite_session, game, "2544", "assists", 8.0, "UNDER", line=7.5)
+        legacy = add_prediction(sqlite_session, game, "201939", "threes", 4.5, "OVER")
+
+        result = asyncio.run(service._resolve_game(game))
+        sqlite_session.commit()
+
+        assert result["predictions_resolved"] == 3
+        assert result["errors"] == []
+        rows = {p.id: p for p in sqlite_session.query(Prediction).populate_existing()}
+        assert (rows[over].actual_value, rows[over].was_correct) == (28, True)
+        assert rows[over].difference == pytest.approx(2.0)
+        assert (rows[under].actual_value, rows[under].was_correct) == (9, False)
+        assert (rows[legacy].actual_value, rows[legacy].was_correct) == (6, True)
+        assert all(p.actuals_resolved_at is not None for p in rows.values())
+
+    def test_player_stats_created_and_updated(self, service, sqlite_session, game):
+        sqlite_session.add(PlayerStats(
+            id="existing", player_id="player-201939", game_id=game.id, points=0,
+            created_at=datetime(2026, 1, 15)
+        ))
+        sqlite_session.commit()
+        add_prediction(sqlite_session, game, "2544", "points", 26.0, "OVER", line=25.5)
+        add_prediction(sqlite_session, game, "2544", "rebounds", 7.0, "OVER", line=6.5)
+        add_prediction(sqlite_session, game, "201939", "points", 29.0, "OVER", line=28.5)
+
+        result = asyncio.run(service._resolve_game(game))
+        sqlite_session.commit()
+
+        assert (result["player_stats_created"], result["player_stats_updated"]) == (1, 1)
+        lines = {s.player_id: s for s in sqlite_session.query(PlayerStats).populate_existing()}
+        assert len(lines) == 2
+        assert lines["player-201939"].id == "existing"
+        assert lines["player-201939"].points == 31
+        assert (lines["player-2544"].rebounds, lines["player-2544"].minutes) == (8, 36)
+
+    def test_statement_count_is_constant(self, service, sqlite_session, game):
+        for external_id in ("2544", "201939", "1629029"):
+            for stat_type in ("points", "rebounds", "assists", "threes"):
+                add_prediction(sqlite_session, game, external_id, stat_type, 5.0, "OVER", line=4.5)
+
+        statements = []
+        engine = sqlite_session.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            result = asyncio.run(service._resolve_game(game))
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert result["predictions_resolved"] == 12
+        # Mapping check, predictions, existing stats, stats upsert, predictions update, audit insert
+        assert len(statements) <= 6
+
+    def test_missing_player_is_reported(self, service, sqlite_session, game):
+        missing = add_prediction(sqlite_session, game, "1630178", "points", 24.0, "OVER", line=23.5)
+
+        result = asyncio.run(service._resolve_game(game))
+
+        assert result["predictions_resolved"] == 0
+        assert result["errors"] == ["No stats for Tyrese Maxey (external_id: 1630178)"]
+        assert sqlite_session.get(Prediction, missing).actuals_resolved_at is None
+
+
+class TestDryRun:
+    """Diff instead of writes."""
+
+    def test_dry_run_returns_diff(self, service, sqlite_session, game):
+        sqlite_session.add(PlayerStats(
+            id="existing", player_id="player-201939", game_id=game.id, points=31, rebounds=5,
+            assists=6, threes=5, minutes=34, created_at=datetime(2026, 1, 15)
+        ))
+        sqlite_session.commit()
+        prediction_id = add_prediction(sqlite_session, game, "2544", "points", 26.0, "OVER", line=25.5)
+        add_prediction(sqlite_session, game, "201939", "threes", 4.5, "UNDER", line=4.5)
+
+        result = asyncio.run(service._resolve_game(game, dry_run=True))
+
+        assert result["predictions_resolved"] == 2
+        diff = result["diff"]
+        first = next(p for p in diff["predictions"] if p["prediction_id"] == prediction_id)
+        assert (first["actual_value"], first["was_correct"]) == (28, True)
+        stats = {s["player_id"]: s for s in diff["player_stats"]}
+        assert stats["player-2544"]["action"] == "create"
+        assert stats["player-2544"]["values"]["points"] == 28
+        assert stats["player-201939"] == {
+            "game_id": game.id, "player_id": "player-201939", "action": "update",
+            "changes": {"threes": [5, 6]}
+        }
+
+        assert sqlite_session.get(Prediction, prediction_id).actuals_resolved_at is None
+        assert sqlite_session.query(PlayerStats).count() == 1
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Sessions on one SQLite file, so each game can have its own."""
+    from app.models.unified import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'resolve.db'}")
+    created_indexes = set()
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+            for index in table.indexes:
+                if index.name not in created_indexes:
+                    created_indexes.add(index.name)
+                    conn.execute(CreateIndex(index))
+
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+class TestResolveGames:
+    """Concurrent multi-game runner."""
+
+    @pytest.fixture
+    def games(self, session_factory):
+        db = session_factory()
+        add_players(db)
+        games = [add_game(db, external_id=f"00225001{i:02d}") for i in range(4)]
+        for game in games:
+            add_prediction(db, game, "2544", "points", 26.0, "OVER", line=25.5)
+        game_ids = [game.id for game in games]
+        db.close()
+        return game_ids
+
+    def make_service(self, session_factory, failing=(), delay=0.1):
+        in_flight = []
+        peak = []
+
+        async def get_boxscore(game_id):
+            in_flight.append(game_id)
+            peak.append(len(in_flight))
+            await asyncio.sleep(delay)
+            in_flight.remove(game_id)
+            return {} if game_id in failing else BOXSCORE
+
+        db = session_factory()
+        service = BoxscoreImportService(db, session_factory=session_factory)
+        service.nba_service.get_boxscore = get_boxscore
+        return service, peak
+
+    def test_fetches_concurrently_under_semaphore(self, session_factory, games):
+        service, peak = self.make_service(session_factory)
+
+        started = time.monotonic()
+        stats = asyncio.run(service.resolve_games(games, max_concurrency=2))
+        elapsed = time.monotonic() - started
+
+        assert max(peak) == 2
+        assert elapsed < 0.35  # two rounds of 0.1s, not four
+        assert (stats["games_processed"], stats["games_failed"]) == (4, 0)
+        assert stats["predictions_resolved"] == 4
+        db = session_factory()
+        assert db.query(Prediction).filter(Prediction.actuals_resolved_at.is_(None)).count() == 0
+        db.close()
+
+    def test_sessions_not_held_across_fetches(self, session_factory):
+        db = session_factory()
+        add_players(db)
+        games = {}
+        for i in range(12):
+            game = add_game(db, external_id=f"00225002{i:02d}")
+            add_prediction(db, game, "2544", "points", 26.0, "OVER", line=25.5)
+            games[game.id] = game.external_id
+        db.close()
+
+        open_sessions = []
+        peak = []
+
+        def counting_factory():
+            session = session_factory()
+            close = session.close
+
+            def tracked_close():
+                if session in open_sessions:
+                    open_sessions.remove(session)
+                close()
+
+            session.close = tracked_close
+            open_sessions.append(session)
+            peak.append(len(open_sessions))
+            return session
+
+        async def get_boxscore(game_id):
+            await asyncio.sleep(0.01)
+            return BOXSCORE
+
+        service = BoxscoreImportService(session_factory(), session_factory=counting_factory)
+        service.nba_service.get_boxscore = get_boxscore
+
+        stats = asyncio.run(service.resolve_games(list(games), max_concurrency=6, external_ids=games))
+
+        assert (stats["games_processed"], stats["games_failed"]) == (12, 0)
+        assert len(peak) == 12
+        assert max(peak) == 1
+        assert open_sessions == []
+
+    def test_failed_game_is_reported_and_others_commit(self, session_factory, games):
+        service, _ = self.make_service(session_factory, failing={"0022500101"}, delay=0)
+
+        stats = asyncio.run(service.resolve_games(games + ["missing-game"]))
+
+        by_status = {}
+        for game in stats["games"]:
+            by_status.setdefault(game["status"], []).append(game)
+        assert len(by_status["resolved"]) == 3
+        assert [g["external_id"] for g in by_status["failed"]] == ["0022500101"]
+        assert by_status["not_found"][0]["game_id"] == "missing-game"
+        assert stats["games_failed"] == 2
+        assert "No boxscore data for 0022500101" in stats["errors"]
+
+        db = session_factory()
+        unresolved = db.query(Prediction).filter(Prediction.actuals_resolved_at.is_(None)).all()
+        assert len(unresolved) == 1
+        assert db.query(PlayerStats).count() == 3
+        db.close()
+
+    def test_missing_boxscore_fails_without_session(self, session_factory, games):
+        service, _ = self.make_service(session_factory, delay=0)
+        fetch = service.nba_service.get_boxscore
+        fetched = []
+        sessions = []
+
+        async def get_boxscore(external_id):
+            fetched.append(external_id)
+            return None if external_id == "0022500101" else await fetch(external_id)
+
+        def counting_factory():
+            sessions.append(1)
+            return session_factory()
+
+        service.nba_service.get_boxscore = get_boxscore
+        service._session_factory = counting_factory
+
+        stats = asyncio.run(service.resolve_games(games))
+
+        failed = [g for g in stats["games"] if g["status"] == "failed"]
+        assert [g["external_id"] for g in failed] == ["0022500101"]
+        assert failed[0]["errors"] == ["No boxscore data for 0022500101"]
+        assert sorted(fetched) == [f"00225001{i:02d}" for i in range(4)]
+        assert len(sessions) == 3
+
+    def test_dry_run_commits_nothing(self, session_factory, games):
+        service, _ = self.make_service(session_factory, delay=0)
+
+        stats = asyncio.run(service.resolve_games(games, dry_run=True))
+
+        assert stats["predictions_resolved"] == 4
+        assert len(stats["diff"]["predictions"]) == 4
+        db = session_factory()
+        assert db.query(PlayerStats).count() == 0
+        db.close()
@@ -0,0 +1,207 @@
+"""Unit tests for the slate feature bundle used by EnhancedPredictionService.
+
+Test Strategy:
+1. Build a SlateFeatures bundle in memory (no database)
+2. Verify per-player lookups (active players, recent form, injury boost,
+   rest days, estimated lines) read from the bundle
+3. Verify the database session is never queried while the bundle covers the game
+4. Against SQLite, SlateFeatureLoader keeps the most recent N box scores
+   per player (ROW_NUMBER window) and loads the bundle in five statements
+"""
+import uuid
+from datetime import datetime, date, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event
+
+from app.models import Game, Player, PlayerInjury, PlayerSeasonStats, PlayerStats, Sport
+from app.services.nba.enhanced_prediction_service import EnhancedPredictionService
+from app.services.nba.feature_loader import SlateFeatureLoader, SlateFeatures, InjuredPlayer
+
+
+def _player(pid, team, name=None, position="PG"):
+    return SimpleNamespace(
+        id=pid, name=name or pid, team=team, position=position, birth_date=None
+    )
+
+
+def _season_stats(pid, games=40, minutes=32.0, last_game_date=None):
+    return SimpleNamespace(
+        player_id=pid,
+        games_count=games,
+        avg_minutes=minutes,
+        points_per_36=24.0,
+        rebounds_per_36=6.0,
+        assists_per_36=7.0,
+        threes_per_36=3.0,
+        last_game_date=last_game_date or date.today() - timedelta(days=1),
+    )
+
+
+def _box_score(points, minutes=36):
+    return SimpleNamespace(points=points, rebounds=5, assists=6, threes=2, minutes=minutes)
+
+
+@pytest.fixture
+def slate():
+    game = SimpleNamespace(
+        id="game-1", home_team="BOS", away_team="PHI",
+        game_date=datetime.combine(date.today(), datetime.min.time()),
+    )
+    star = _player("p1", "BOS", "Star Guard")
+    injured = _player("p2", "BOS", "Hurt Guard")
+    bench = _player("p3", "PHI", "Deep Bench")
+
+    features = SlateFeatures(season="2025-26", games_back=10)
+    features.game_ids = {game.id}
+    features.teams = {"BOS", "PHI"}
+    features.players_by_team = {"BOS": [star, injured], "PHI": [bench]}
+    features.player_ids = {"p1", "p2", "p3"}
+    features.season_stats = {
+        "p1": _season_stats("p1"),
+        "p2": _season_stats("p2"),
+        "p3": _season_stats("p3", games=3, minutes=6.0),
+    }
+    features.recent_stats = {"p1": [_box_score(p) for p in (30, 28, 25, 27, 31)]}
+    features.injuries_by_team = {
+        "BOS": [InjuredPlayer(id="p2", position="PG", name="Hurt Guard", status="OUT")],
+        "PHI": [],
+    }
+    return game, features
+
+
+def _service_with(features):
+    db = MagicMock()
+    db.query.side_effect = AssertionError("unexpected per-player query")
+    service = EnhancedPredictionService(db)
+    service._features = features
+    return service
+
+
+class TestSlateFeatureBundle:
+    """Per-player lookups should be served from the in-memory bundle."""
+
+    def test_active_players_filters_from_bundle(self, slate):
+        game, features = slate
+        service = _service_with(features)
+
+        players = service._get_active_players(game)
+
+        assert [p.id for p in players] == ["p1"]
+
+    def test_recent_form_uses_bundle(self, slate):
+        game, features = slate
+        service = _service_with(features)
+
+        form = service._get_recent_form(features.players_by_team["BOS"][0], "points")
+
+        assert form["sample_size"] == 5
+        assert form["career_games"] == 40
+        assert 25.0 <= form["ewma_per_36"] <= 31.0
+
+    def test_teammate_injury_boost_uses_bundle(self, slate):
+        game, features = slate
+        service = _service_with(features)
+
+        boost = service._calculate_teammate_injury_boost(
+            features.players_by_team["BOS"][0], game, "points"
+        )
+
+        # Same-position teammate out: 0.5 * (24 * 0.6) / 24 = 0.30, capped at 0.20
+        assert boost == pytest.approx(0.20)
+
+    def test_rest_days_and_estimated_line_use_bundle(self, slate):
+        game, features = slate
+        service = _service_with(features)
+        star = features.players_by_team["BOS"][0]
+
+        assert service._get_rest_days_since_last_game(star, game) == 1
+        assert service._estimate_line_from_season_stats(star, "points")["line"] == 23.0
+
+    def test_player_outside_bundle_falls_back_to_database(self, slate):
+        game, features = slate
+        service = _service_with(features)
+        outsider = _player("p9", "LAL")
+
+        with pytest.raises(AssertionError, match="unexpected per-player query"):
+            service._get_rest_days_since_last_game(outsider, game)
+
+    def test_bundle_lookups_for_missing_data(self, slate):
+        _, features = slate
+
+        assert features.covers_player("p3")
+        assert features.get_recent_stats("p3", 10) == []
+        assert features.get_injured_ids() == {"p2"}
+        assert features.get_lineup("game-1", "p1") is None
+
+
+class TestSlateFeatureLoader:
+    """Bundle loaded from a real database."""
+
+    @pytest.fixture
+    def db(self, sqlite_session):
+        now = datetime(2026, 1, 15, 12)
+        db = sqlite_session
+        db.add(Sport(id="nba", name="NBA", active=True, created_at=now, updated_at=now))
+        for pid, team in (("p1", "BOS"), ("p2", "BOS"), ("p3", "PHI"), ("p4", "LAL")):
+            db.add(Player(
+                id=pid, sport_id="nba", external_id=pid, name=pid, team=team,
+                active=True, created_at=now, updated_at=now
+            ))
+        db.commit()
+
+        # p1 has 14 box scores, p2 three, p3 none; p4 is not on the slate
+        for day in range(14):
+            played = now - timedelta(days=14 - day)
+            past = Game(
+                id=f"past-{day}", sport_id="nba", external_id=f"past-{day}", game_date=played,
+                away_team="PHI", home_team="BOS", season=2026, status="final",
+                created_at=played, updated_at=played
+            )
+            db.add(past)
+            for pid in ("p1", "p4") + (("p2",) if day < 3 else ()):
+                db.add(PlayerStats(
+                    id=str(uuid.uuid4()), player_id=pid, game_id=past.id,
+                    points=day, created_at=played
+                ))
+        db.add(PlayerSeasonStats(
+            id="season-p1", player_id="p1", season="2025-26", games_count=14,
+            points_per_36=24.0, rebounds_per_36=6.0, assists_per_36=7.0, threes_per_36=3.0,
+            avg_minutes=32.0, fetched_at=now, created_at=now, updated_at=now
+        ))
+        db.add(PlayerInjury(
+            id="injury-p2", player_id="p2", status="OUT", reported_date=date.today(),
+            created_at=now, updated_at=now
+        ))
+        db.add(Game(
+            id="tonight", sport_id="nba", external_id="tonight", game_date=now,
+            away_team="PHI", home_team="BOS", season=2026, status="scheduled",
+            created_at=now, updated_at=now
+        ))
+        db.commit()
+        return db
+
+    def test_recent_stats_and_statement_count(self, db):
+        game = db.get(Game, "tonight")
+        loader = SlateFeatureLoader(db, season="2025-26", games_back=10)
+
+        statements = []
+        engine = db.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            features = loader.load_for_games([game])
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(statements) == features.query_count == 5
+        assert features.player_ids == {"p1", "p2", "p3"}
+        # Most recent first, capped at games_back
+        assert [s.points for s in features.get_recent_stats("p1", 10)] == list(range(13, 3, -1))
+        assert [s.points for s in features.get_recent_stats("p2", 10)] == [2, 1, 0]
+        assert features.get_recent_stats("p3", 10) == []
+        assert set(features.recent_stats) == {"p1", "p2"}
+        assert features.get_season_stats("p1").games_count == 14
+        assert features.get_injured_ids() == {"p2"}
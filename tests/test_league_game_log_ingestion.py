@@ -0,0 +1,158 @@
+"""Unit tests for bulk league-wide game log ingestion.
+
+Test Strategy:
+1. Minutes and stat columns convert column-wise ("MM:SS", numbers, blanks)
+2. One leaguegamelog call (served by the upstream stand-in) upserts every
+   known player's stat lines, creates missing games and skips unknown players
+3. The watermark advances to the latest game date; the next run fetches only
+   from the watermark and re-upserts without duplicating rows
+4. Bulk sync_all_active_players caches per-36 averages for every player
+   from stored stat lines; a player whose row fails keeps the others
+"""
+import asyncio
+import json
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from app.models import Game, Player, PlayerSeasonStats, PlayerStats, Sport, SyncMetadata
+from app.services.nba.nba_api_service import NbaApiService, configure_nba_stats_base_url
+
+FIXTURE = Path(__file__).parent / "fixtures" / "nba_api" / "leaguegamelog.json"
+
+
+def _league_log():
+    result_set = json.loads(FIXTURE.read_text())["resultSets"][0]
+    return pd.DataFrame(result_set["rowSet"], columns=result_set["headers"])
+
+
+@pytest.fixture
+def service(sqlite_session, upstream_stub, monkeypatch):
+    from nba_api.stats.library.http import NBAStatsHTTP
+
+    monkeypatch.setattr(NBAStatsHTTP, "base_url", NBAStatsHTTP.base_url)
+    configure_nba_stats_base_url(upstream_stub.nba_stats_url)
+
+    now = datetime(2026, 1, 15)
+    sqlite_session.add(Sport(id="nba", name="NBA", active=True, created_at=now, updated_at=now))
+    players = _league_log().drop_duplicates("PLAYER_ID")
+    # Leave the last team's players out of the players table
+    unknown_team = players["TEAM_ABBREVIATION"].iloc[-1]
+    for nba_api_id, name, team in zip(players["PLAYER_ID"], players["PLAYER_NAME"], players["TEAM_ABBREVIATION"]):
+        if team == unknown_team:
+            continue
+        sqlite_session.add(Player(
+            id=str(uuid.uuid4()), sport_id="nba", external_id=f"nba-{nba_api_id}", name=name,
+            team=team, nba_api_id=int(nba_api_id), active=True, created_at=now, updated_at=now
+        ))
+    sqlite_session.commit()
+    return NbaApiService(sqlite_session)
+
+
+class TestColumnConversion:
+    """Vectorized replacements for the per-row parsing."""
+
+    def test_minutes_column(self):
+        minutes = pd.Series(["25:30", "31", "", None, "bad", "0:45"], dtype=object)
+
+        parsed = NbaApiService._minutes_column(minutes).tolist()
+
+        assert parsed == [25.5, 31.0, 0.0, 0.0, 0.0, 0.75]
+        assert NbaApiService._minutes_column(pd.Series([34, 12.5])).tolist() == [34.0, 12.5]
+
+    def test_player_game_logs_without_iterrows(self, service):
+        games = asyncio.run(service.get_player_game_logs(1628369, games_limit=10))
+
+        assert len(games) == 10
+        assert isinstance(games[0]["game_date"], date)
+        assert all(isinstance(g["points"], int) for g in games)
+
+
+class TestIngestLeagueGameLogs:
+    """One dataset call, batched upsert, watermark."""
+
+    def test_first_run_upserts_all_known_players(self, service, sqlite_session, upstream_stub):
+        frame = _league_log()
+
+        result = asyncio.run(service.ingest_league_game_logs("2025-26"))
+
+        unknown = frame[~frame["PLAYER_ID"].isin([p.nba_api_id for p in sqlite_session.query(Player)])]
+        assert result["rows_fetched"] == len(frame)
+        assert result["games_created"] == frame["GAME_ID"].nunique()
+        assert result["unmatched_players"] == unknown["PLAYER_ID"].nunique() > 0
+        assert result["stats_upserted"] == len(frame) - len(unknown)
+        assert sqlite_session.query(PlayerStats).count() == result["stats_upserted"]
+        assert result["watermark"] == frame["GAME_DATE"].max()
+        assert upstream_stub.stats()["requests"] == {"nba_stats.leaguegamelog": 1}
+
+        row = frame.iloc[0]
+        game = sqlite_session.query(Game).filter(Game.external_id == row["GAME_ID"]).one()
+        team, _, opponent = row["MATCHUP"].split(" ")
+        assert {game.home_team, game.away_team} == {team, opponent}
+        assert game.status == "final"
+
+    def test_next_run_fetches_from_watermark(self, service, sqlite_session):
+        frame = _league_log()
+        latest = frame["GAME_DATE"].max()
+        first = asyncio.run(service.ingest_league_game_logs("2025-26"))
+        stored = sqlite_session.query(PlayerStats).join(Game).filter(
+            Game.game_date == datetime.fromisoformat(latest)
+        ).first()
+        points = stored.points
+        stored.points = -1
+        sqlite_session.commit()
+
+        second = asyncio.run(service.ingest_league_game_logs("2025-26"))
+
+        assert second["date_from"] == latest
+        assert second["rows_fetched"] == (frame["GAME_DATE"] == latest).sum()
+        assert second["games_created"] == 0
+        assert sqlite_session.query(PlayerStats).count() == first["stats_upserted"]
+        metadata = sqlite_session.query(SyncMetadata).filter(
+            SyncMetadata.data_type == "player_game_logs"
+        ).one()
+        assert metadata.watermark == datetime.fromisoformat(latest)
+        assert metadata.last_sync_status == "success"
+
+        # Lines on the re-fetched watermark date are updated in place
+        sqlite_session.refresh(stored)
+        assert stored.points == points
+
+
+class TestBulkSeasonAverages:
+    """sync_all_active_players(bulk=True)."""
+
+    def test_bulk_sync_caches_per_36(self, service, sqlite_session):
+        result = asyncio.run(service.sync_all_active_players(games_limit=50, season="2025-26", bulk=True))
+
+        frame = _league_log()
+        tatum = frame[frame["PLAYER_NAME"] == "Jayson Tatum"]
+        player = sqlite_session.query(Player).filter(Player.name == "Jayson Tatum").one()
+        cached = sqlite_session.query(PlayerSeasonStats).filter(PlayerSeasonStats.player_id == player.id).one()
+
+        assert result["success"] == result["total"] == sqlite_session.query(Player).count()
+        assert result["game_logs"]["stats_upserted"] > 0
+        assert cached.games_count == len(tatum)
+        assert cached.points_per_36 == round(tatum["PTS"].sum() * 36.0 / tatum["MIN"].sum(), 2)
+        assert cached.last_game_date.isoformat() == tatum["GAME_DATE"].max()
+
+    def test_failed_player_keeps_other_rows(self, service, sqlite_session, monkeypatch):
+        compute = service._season_averages_from_player_stats
+        failed = []
+
+        def with_bad_row(players, games_limit, season):
+            averages = compute(players, games_limit, season)
+            middle = players[len(players) // 2].id
+            averages[middle] = dict(averages[middle], avg_minutes=None)  # NOT NULL violation
+            failed.append(middle)
+            return averages
+
+        monkeypatch.setattr(service, "_season_averages_from_player_stats", with_bad_row)
+        result = asyncio.run(service.sync_all_active_players(games_limit=50, season="2025-26", bulk=True))
+
+        cached = {row.player_id for row in sqlite_session.query(PlayerSeasonStats)}
+        assert (result["errors"], result["success"]) == (1, result["total"] - 1)
+        assert cached == {p.id for p in sqlite_session.query(Player)} - set(failed)
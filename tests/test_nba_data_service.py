@@ -182,7 +182,7 @@ class TestNbaDataServiceFetchAllPlayerStats:
 
     @pytest.mark.asyncio
     async def test_fetch_all_player_stats_rate_limiting(self, db_session: Session):
-        """Should respect NBA_API_REQUEST_DELAY between requests."""
+        """Should space consecutive requests by NBA_API_REQUEST_DELAY."""
         import asyncio
         from app.core.config import settings
 
@@ -203,11 +203,12 @@ class TestNbaDataServiceFetchAllPlayerStats:
 
             start_time = datetime.now()
 
+            await service.fetch_all_player_stats()
             await service.fetch_all_player_stats()
 
             elapsed = (datetime.now() - start_time).total_seconds()
 
-            # Should have delayed by NBA_API_REQUEST_DELAY
+            # Request starts are spaced by NBA_API_REQUEST_DELAY
             assert elapsed >= settings.NBA_API_REQUEST_DELAY
 
 
@@ -0,0 +1,116 @@
+"""Unit tests for the indexed normalized_name columns.
+
+Test Strategy:
+1. Player.normalized_name and PlayerAlias.normalized_name follow
+   name_normalizer.normalize on create and on rename
+2. PlayerResolver's cold normalized lookup is one equality query that
+   SQLite plans on ix_player_aliases_source_normalized
+3. PlayerIdentityResolver canonical-name lookup matches punctuation and
+   accent variants through players.normalized_name and still rejects a
+   Jr/Sr conflict
+4. The backfill script fills rows written without normalized_name
+"""
+import asyncio
+import importlib.util
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import insert, text
+
+from app.models import Player, PlayerAlias
+from app.services.core.identity_resolver import PlayerIdentityResolver
+from app.services.sync.matchers.player_resolver import PlayerResolver
+
+NOW = datetime(2026, 1, 1)
+
+
+def _player(name, team="NOP", sport_id="nba"):
+    return Player(
+        id=str(uuid.uuid4()), sport_id=sport_id, external_id=str(uuid.uuid4()), id_source="nba",
+        name=name, team=team, active=True, created_at=NOW, updated_at=NOW
+    )
+
+
+def _load_backfill_script():
+    path = Path(__file__).parent.parent / "scripts" / "backfill_normalized_names.py"
+    spec = importlib.util.spec_from_file_location("backfill_normalized_names", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestColumnMaintenance:
+    """Models keep normalized_name in step with the name."""
+
+    def test_set_on_create_and_rename(self, sqlite_session):
+        player = _player("P.J. Tucker")
+        alias = PlayerAlias(
+            id=str(uuid.uuid4()), nba_player_id=1, canonical_name="Luka Dončić", alias_name="Luka Dončić",
+            alias_source="odds_api", match_confidence=1.0, is_verified=False, created_at=NOW
+        )
+        sqlite_session.add_all([player, alias])
+        sqlite_session.commit()
+
+        player.name = "Tim Hardaway Jr."
+        sqlite_session.commit()
+        sqlite_session.expire_all()
+
+        assert player.normalized_name == "tim hardaway"
+        assert alias.normalized_name == "luka doncic"
+
+
+class TestIndexedLookups:
+    """Normalized lookups are single indexed equality queries."""
+
+    def test_alias_normalized_lookup_uses_index(self, sqlite_session):
+        sqlite_session.add(PlayerAlias(
+            id=str(uuid.uuid4()), nba_player_id=1628378, canonical_name="Donovan Mitchell",
+            alias_name="Donovan Mitchell", alias_source="odds_api", match_confidence=1.0,
+            is_verified=False, created_at=NOW
+        ))
+        sqlite_session.commit()
+
+        result = asyncio.run(PlayerResolver(sqlite_session)._normalized_lookup("DONOVAN  MITCHELL", "odds_api"))
+        plan = sqlite_session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM player_aliases "
+            "WHERE alias_source = 'odds_api' AND normalized_name = 'donovan mitchell'"
+        )).all()
+
+        assert result['nba_player_id'] == 1628378
+        assert result['match_method'] == 'normalized'
+        assert "ix_player_aliases_source_normalized" in " ".join(row[-1] for row in plan)
+
+    def test_identity_resolver_variants_and_suffix_conflict(self, sqlite_session):
+        sqlite_session.add_all([_player("P.J. Tucker", team="LAC"), _player("Gary Payton Sr.", team="GSW")])
+        sqlite_session.commit()
+        resolver = PlayerIdentityResolver(sqlite_session)
+
+        assert resolver._find_by_canonical_name("nba", "PJ Tucker").name == "P.J. Tucker"
+        assert resolver._find_by_team_and_name("nba", "LAC", "p.j. tucker").name == "P.J. Tucker"
+        assert resolver._find_by_canonical_name("nba", "Gary Payton Jr.") is None
+        assert resolver._find_by_canonical_name("nfl", "PJ Tucker") is None
+
+
+class TestBackfill:
+    """scripts/backfill_normalized_names.py."""
+
+    def test_fills_missing_rows(self, sqlite_session):
+        backfill = _load_backfill_script()
+        sqlite_session.execute(insert(PlayerAlias), [
+            {'id': f"a{i}", 'nba_player_id': i, 'canonical_name': name, 'alias_name': name,
+             'alias_source': 'espn', 'match_confidence': 1.0, 'is_verified': False, 'created_at': NOW}
+            for i, name in enumerate(["Nikola Jokić", "Jaren Jackson Jr.", "O.G. Anunoby"])
+        ])
+        sqlite_session.commit()
+
+        dry = backfill.backfill_table(sqlite_session, PlayerAlias, PlayerAlias.alias_name, batch_size=2)
+        changed = backfill.backfill_table(
+            sqlite_session, PlayerAlias, PlayerAlias.alias_name, batch_size=2, dry_run=False
+        )
+        again = backfill.backfill_table(sqlite_session, PlayerAlias, PlayerAlias.alias_name, dry_run=False)
+
+        names = sorted(n for (n,) in sqlite_session.query(PlayerAlias.normalized_name))
+        assert (dry, changed, again) == (3, 3, 0)
+        assert names == ["jaren jackson", "nikola jokic", "og anunoby"]
@@ -0,0 +1,156 @@
+"""Unit tests for the shared Odds API response cache.
+
+Test Strategy:
+1. SQLite backend is shared across backend instances (other processes) and
+   survives re-opening the file (restarts); every connection is closed
+2. Entries expire after their TTL; hits credit the entry's quota cost
+3. Factory falls back to memory for unknown/unavailable backends
+4. OddsApiService serves a second service instance from the shared cache,
+   recording hit/miss/saved-request metrics; quota cost counts every
+   configured region
+"""
+import asyncio
+import sqlite3
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core import metrics
+from app.services.core import odds_cache
+from app.services.core.odds_api_service import OddsApiService
+from app.services.core.odds_cache import (
+    MemoryOddsCache, SQLiteOddsCache, create_odds_cache
+)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "odds_cache.sqlite3")
+
+
+def _counter(counter, endpoint):
+    return counter.labels(endpoint=endpoint)._value.get()
+
+
+class TestSQLiteOddsCache:
+    """Cross-instance sharing, expiry and quota accounting."""
+
+    def test_shared_across_instances(self, cache_path):
+        writer = SQLiteOddsCache(cache_path)
+        writer.set("player_props:event_id=evt", {"bookmakers": [1, 2]}, ttl=300, quota_cost=4)
+
+        # A second instance stands in for another process or a restart
+        reader = SQLiteOddsCache(cache_path)
+
+        assert reader.get("player_props:event_id=evt") == ({"bookmakers": [1, 2]}, 4)
+        assert reader.get("player_props:event_id=other") is None
+
+    def test_expiry(self, cache_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(odds_cache.time, "time", lambda: now[0])
+        cache = SQLiteOddsCache(cache_path)
+        cache.set("upcoming_games:days=7", [], ttl=600, quota_cost=3)
+
+        now[0] += 599
+        assert cache.get("upcoming_games:days=7") is not None
+        now[0] += 1
+        assert cache.get("upcoming_games:days=7") is None
+
+    def test_hits_credit_quota_saved(self, cache_path):
+        cache = SQLiteOddsCache(cache_path)
+        cache.set("a", {"x": 1}, ttl=300, quota_cost=4)
+        cache.set("b", {"y": 2}, ttl=300, quota_cost=3)
+
+        for _ in range(3):
+            cache.get("a")
+        cache.get("b")
+
+        stats = SQLiteOddsCache(cache_path).stats()
+        assert (stats["entries"], stats["hits"], stats["quota_saved"]) == (2, 4, 15)
+
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+
+    def test_connections_closed(self, cache_path, monkeypatch):
+        connect = sqlite3.connect
+        opened = []
+
+        def tracking_connect(*args, **kwargs):
+            opened.append(connect(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(odds_cache.sqlite3, "connect", tracking_connect)
+        cache = SQLiteOddsCache(cache_path)
+        cache.set("a", {"x": 1}, ttl=300, quota_cost=4)
+        cache.get("a")
+        cache.get("missing")
+        cache.stats()
+
+        assert len(opened) == 5
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+
+class TestCreateOddsCache:
+    """Backend selection."""
+
+    def test_sqlite_backend(self, cache_path, monkeypatch):
+        monkeypatch.setattr("app.core.config.settings.ODDS_API_CACHE_PATH", cache_path)
+
+        assert isinstance(create_odds_cache("sqlite"), SQLiteOddsCache)
+
+    def test_unknown_or_unconfigured_falls_back_to_memory(self, monkeypatch):
+        monkeypatch.setattr("app.core.config.settings.ODDS_API_CACHE_REDIS_URL", None)
+        monkeypatch.setattr("app.core.config.settings.REDIS_URL", None)
+
+        assert isinstance(create_odds_cache("bogus"), MemoryOddsCache)
+        assert isinstance(create_odds_cache("redis"), MemoryOddsCache)
+
+
+class TestServiceSharedCache:
+    """OddsApiService instances share responses through the backend."""
+
+    def test_second_instance_served_from_cache(self, cache_path):
+        props = {"bookmakers": [{"key": "fanduel", "markets": []}]}
+        first = OddsApiService(api_key="k", cache_ttl=300, cache_backend=SQLiteOddsCache(cache_path))
+        second = OddsApiService(api_key="k", cache_ttl=300, cache_backend=SQLiteOddsCache(cache_path))
+        for service in (first, second):
+            service._get_client = AsyncMock()
+            service._fetch_player_props_with_breaker = AsyncMock(return_value=(props, 200))
+
+        hits_before = _counter(metrics.odds_api_cache_hits_total, "player_props")
+        saved_before = _counter(metrics.odds_api_cache_requests_saved_total, "player_props")
+
+        fetched = asyncio.run(first.get_event_player_props("evt-1"))
+        cached = asyncio.run(second.get_event_player_props("evt-1"))
+
+        assert cached == fetched
+        first._fetch_player_props_with_breaker.assert_awaited_once()
+        second._fetch_player_props_with_breaker.assert_not_awaited()
+        assert second.get_cache_stats()["quota_saved"] == 4
+        assert first.get_cache_stats()["misses"] == 1
+        assert _counter(metrics.odds_api_cache_hits_total, "player_props") == hits_before + 1
+        assert _counter(metrics.odds_api_cache_requests_saved_total, "player_props") == saved_before + 4
+
+    def test_quota_cost_counts_regions(self, monkeypatch):
+        monkeypatch.setattr("app.core.config.settings.ODDS_API_REGIONS", "us,uk")
+        service = OddsApiService(api_key="k", cache_ttl=300, cache_backend=MemoryOddsCache())
+        service._get_client = AsyncMock()
+        service._fetch_player_props_with_breaker = AsyncMock(return_value=({"bookmakers": []}, 200))
+
+        asyncio.run(service.get_event_player_props("evt-1"))
+        asyncio.run(service.get_event_player_props("evt-1"))
+
+        assert service.get_cache_stats()["quota_saved"] == 8
+
+    def test_failed_response_not_cached(self):
+        service = OddsApiService(api_key="k", cache_ttl=300, cache_backend=MemoryOddsCache())
+        service._get_client = AsyncMock()
+        service._fetch_player_props_with_breaker = AsyncMock(return_value=({}, 422))
+
+        asyncio.run(service.get_event_player_props("evt-1"))
+        asyncio.run(service.get_event_player_props("evt-1"))
+
+        assert service._fetch_player_props_with_breaker.await_count == 2
+        assert service.get_cache_stats()["backend"]["entries"] == 0
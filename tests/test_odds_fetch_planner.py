@@ -0,0 +1,280 @@
+"""Unit tests for the quota-aware odds fetch planner.
+
+Test Strategy:
+1. Events closer to tip-off get shorter refresh intervals; started and
+   out-of-horizon events are not planned
+2. The schedule's daily cost stays within the budget derived from the
+   remaining quota and days left in the billing period; request costs count
+   every configured region
+3. Less quota means longer intervals, then fewer (closest-first) events;
+   unknown quota is estimated pro rata
+4. run_due fetches the slate and due events only, with cache TTLs set to
+   the planned intervals; an empty slate is re-fetched once per slate
+   interval
+5. Upstream failures through the real OddsApiService error paths: a failed
+   slate keeps the previous one and retries on backoff; failed events are
+   not stamped or charged and stay due
+6. Scheduler ticks that fetch something are recorded in sync_metadata
+7. The admin endpoint returns the current plan
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pybreaker import CircuitBreakerError
+
+from app.api.routes.admin import odds as admin_odds
+from app.models import SyncMetadata
+from app.services.core.odds_api_service import OddsApiError, OddsApiService
+from app.services.core.odds_cache import MemoryOddsCache
+from app.services.core.odds_fetch_planner import OddsFetchPlanner
+from app.services.sync.orchestrator import SyncOrchestrator
+
+NOW = datetime(2026, 1, 15, 18, 0, tzinfo=timezone.utc)
+
+
+def _game(event_id, hours_ahead):
+    return {
+        "id": event_id,
+        "commence_time": (NOW + timedelta(hours=hours_ahead)).isoformat().replace("+00:00", "Z"),
+        "home_team": "Boston Celtics",
+        "away_team": "New York Knicks",
+    }
+
+
+SLATE = [
+    _game("tonight-soon", 0.5),
+    _game("tonight-late", 4),
+    _game("tomorrow", 26),
+    _game("in-three-days", 70),
+    _game("next-week", 150),
+    _game("started", -1),
+]
+
+
+@pytest.fixture
+def planner():
+    return OddsFetchPlanner(monthly_quota=20000, billing_day=1, reserve_fraction=0.1, horizon_hours=72)
+
+
+def _by_id(plan):
+    return {e.event_id: e for e in plan.events}
+
+
+class TestPlan:
+    """Budget and per-event intervals."""
+
+    def test_closer_events_refresh_more_often(self, planner):
+        plan = planner.plan(SLATE, requests_remaining=10000, now=NOW)
+        events = _by_id(plan)
+
+        assert set(events) == {"tonight-soon", "tonight-late", "tomorrow", "in-three-days"}
+        assert (
+            events["tonight-soon"].interval_minutes
+            < events["tonight-late"].interval_minutes
+            < events["tomorrow"].interval_minutes
+            <= events["in-three-days"].interval_minutes
+        )
+        assert all(e.next_fetch_at == NOW for e in plan.events)
+
+    def test_cost_within_budget(self, planner):
+        plan = planner.plan(SLATE, requests_remaining=6000, now=NOW)
+
+        # 17 days left in January after the 15th at 18:00 UTC
+        assert plan.days_left_in_period == pytest.approx(16.25)
+        assert plan.daily_budget == pytest.approx(6000 * 0.9 / 16.25)
+        assert plan.planned_daily_cost <= plan.daily_budget * 1.01
+
+    def test_less_quota_means_longer_intervals(self, planner):
+        rich = _by_id(planner.plan(SLATE, requests_remaining=15000, now=NOW))
+        poor = _by_id(planner.plan(SLATE, requests_remaining=800, now=NOW))
+
+        for event_id in rich:
+            assert poor[event_id].interval_minutes >= rich[event_id].interval_minutes
+        assert poor["tonight-soon"].interval_minutes > rich["tonight-soon"].interval_minutes
+
+    def test_nearly_exhausted_quota_keeps_closest_events(self, planner):
+        plan = planner.plan(SLATE, requests_remaining=300, now=NOW)
+
+        assert [e.event_id for e in plan.events] == ["tonight-soon", "tonight-late"]
+        assert planner.plan(SLATE, requests_remaining=0, now=NOW).events == []
+
+    def test_unknown_quota_estimated_pro_rata(self, planner):
+        plan = planner.plan(SLATE, requests_remaining=None, now=NOW)
+
+        assert plan.quota_source == "estimated"
+        assert plan.requests_remaining == int(20000 * 16.25 / 31)
+
+    def test_billing_period_resets_on_billing_day(self):
+        planner = OddsFetchPlanner(billing_day=20)
+
+        start, end = planner.period_bounds(NOW)
+
+        assert (start.month, start.day, end.month, end.day) == (12, 20, 1, 20)
+
+    def test_costs_count_every_region(self, planner, monkeypatch):
+        monkeypatch.setattr("app.core.config.settings.ODDS_API_REGIONS", "us,uk")
+
+        plan = planner.plan(SLATE, requests_remaining=10000, now=NOW)
+
+        assert (plan.slate_cost, plan.props_cost) == (6, 8)
+
+
+class TestRunDue:
+    """Scheduler ticks fetch only what is due."""
+
+    @pytest.fixture
+    def odds_service(self):
+        service = MagicMock()
+        service.requests_remaining = 10000
+        service.get_upcoming_games_with_odds = AsyncMock(return_value=SLATE)
+        service.get_event_player_props = AsyncMock(return_value={"data": {"bookmakers": []}})
+        return service
+
+    def test_first_tick_fetches_slate_and_every_event(self, planner, odds_service):
+        result = asyncio.run(planner.run_due(odds_service, now=NOW))
+
+        assert result["slate_fetched"] is True
+        assert result["events_fetched"][0] == "tonight-soon"
+        assert set(result["events_fetched"]) == {"tonight-soon", "tonight-late", "tomorrow", "in-three-days"}
+        assert result["quota_spent"] == 3 + 4 * 4
+
+        kwargs = odds_service.get_event_player_props.await_args_list[0].kwargs
+        interval = _by_id(planner.last_plan)["tonight-soon"].interval_minutes
+        assert kwargs == {"force_refresh": True, "cache_ttl": interval * 60, "raise_errors": True}
+
+    def test_later_tick_fetches_only_due_events(self, planner, odds_service):
+        asyncio.run(planner.run_due(odds_service, now=NOW))
+        soon_interval = _by_id(planner.last_plan)["tonight-soon"].interval_minutes
+        odds_service.get_event_player_props.reset_mock()
+        odds_service.get_upcoming_games_with_odds.reset_mock()
+
+        result = asyncio.run(planner.run_due(odds_service, now=NOW + timedelta(minutes=soon_interval)))
+
+        assert result["slate_fetched"] is False
+        assert result["events_fetched"] == ["tonight-soon"]
+        odds_service.get_upcoming_games_with_odds.assert_not_awaited()
+
+    def test_refreshes_once_inside_final_interval(self, planner, odds_service):
+        asyncio.run(planner.run_due(odds_service, now=NOW))
+        late = _by_id(planner.last_plan)["tonight-late"]
+
+        assert late.next_fetch_at <= late.commence_time - timedelta(minutes=late.interval_minutes)
+
+    def test_empty_slate_fetched_once_per_interval(self, planner, odds_service):
+        odds_service.get_upcoming_games_with_odds = AsyncMock(return_value=[])
+
+        for tick in range(0, 24 * 60, 5):
+            asyncio.run(planner.run_due(odds_service, now=NOW + timedelta(minutes=tick)))
+
+        interval = planner.last_plan.slate_interval_minutes
+        assert odds_service.get_upcoming_games_with_odds.await_count == 24 * 60 // interval
+        odds_service.get_event_player_props.assert_not_awaited()
+
+    def test_tick_recorded_in_sync_metadata(self, planner, odds_service, sqlite_session):
+        orchestrator = SyncOrchestrator(sqlite_session)
+
+        asyncio.run(orchestrator.sync_planned_odds(planner=planner, odds_service=odds_service))
+        row = sqlite_session.query(SyncMetadata).filter(
+            SyncMetadata.source == "odds_api", SyncMetadata.data_type == "odds"
+        ).one()
+        assert (row.last_sync_status, row.records_processed, row.records_failed) == ("success", len(SLATE) + 4, 0)
+        started = row.last_sync_started_at
+
+        # Nothing due a minute later: the row is left alone
+        planner_tick = planner.run_due
+        planner.run_due = lambda service: planner_tick(service, now=NOW + timedelta(minutes=1))
+        asyncio.run(orchestrator.sync_planned_odds(planner=planner, odds_service=odds_service))
+        assert row.last_sync_started_at == started
+
+        failing = OddsFetchPlanner(monthly_quota=20000, billing_day=1, reserve_fraction=0.1, horizon_hours=72)
+        odds_service.get_upcoming_games_with_odds = AsyncMock(side_effect=OddsApiError("circuit open"))
+        asyncio.run(orchestrator.sync_planned_odds(planner=failing, odds_service=odds_service))
+        sqlite_session.refresh(row)
+        assert (row.last_sync_status, row.error_message) == ("failed", "circuit open")
+
+
+class TestUpstreamFailures:
+    """run_due against the real OddsApiService error handling."""
+
+    @pytest.fixture
+    def service(self):
+        service = OddsApiService(api_key="k", cache_ttl=300, cache_backend=MemoryOddsCache())
+        service.games_calls = 0
+        service.props_calls = 0
+        service.props_status = 200
+
+        async def client():
+            return None
+
+        async def games(days_ahead, client):
+            service.games_calls += 1
+            return SLATE
+
+        async def props(event_id, markets, client):
+            service.props_calls += 1
+            return ({"bookmakers": []}, service.props_status)
+
+        service._get_client = client
+        service._fetch_games_with_breaker = games
+        service._fetch_player_props_with_breaker = props
+        return service
+
+    def test_failed_slate_keeps_previous_and_backs_off(self, planner, service):
+        asyncio.run(planner.run_due(service, now=NOW))
+        slate_interval = planner.last_plan.slate_interval_minutes
+        assert slate_interval == 60
+
+        async def breaker_open(days_ahead, client):
+            service.games_calls += 1
+            raise CircuitBreakerError("open")
+
+        service._fetch_games_with_breaker = breaker_open
+        service.games_calls = 0
+        for tick in range(60, 120, 5):
+            result = asyncio.run(planner.run_due(service, now=NOW + timedelta(minutes=tick)))
+            assert result["slate_fetched"] is False
+
+        # Attempts at 60, 75 and 105 minutes; the next waits the full slate interval
+        assert service.games_calls == 3
+        assert planner.last_plan.slate_next_fetch_at == NOW + timedelta(minutes=105 + 60)
+        assert {"tonight-late", "tomorrow", "in-three-days"} <= {e.event_id for e in planner.last_plan.events}
+
+    def test_failed_props_stay_due_and_cost_nothing(self, planner, service):
+        service.props_status = 500
+
+        first = asyncio.run(planner.run_due(service, now=NOW))
+
+        assert first["events_fetched"] == []
+        assert len(first["events_failed"]) == 4
+        assert first["quota_spent"] == 3  # the slate only
+        assert all(e.last_fetched_at is None for e in planner.last_plan.events)
+
+        service.props_status = 200
+        second = asyncio.run(planner.run_due(service, now=NOW + timedelta(minutes=5)))
+
+        assert set(second["events_fetched"]) == set(first["events_failed"])
+        assert service.props_calls == 8
+
+
+class TestAdminEndpoint:
+    """GET /api/admin/odds/plan."""
+
+    def test_returns_current_plan(self, planner, monkeypatch):
+        planner.plan(SLATE, requests_remaining=10000, now=NOW)
+        monkeypatch.setattr(admin_odds, "get_odds_fetch_planner", lambda: planner)
+        monkeypatch.setattr(admin_odds.settings, "ADMIN_TOKEN", "")
+
+        body = asyncio.run(admin_odds.get_odds_plan(refresh=False, x_admin_token=None))
+
+        assert body["requests_remaining"] == 10000
+        assert [e["event_id"] for e in body["events"]][0] == "tonight-soon"
+
+    def test_rejects_bad_token(self, monkeypatch):
+        monkeypatch.setattr(admin_odds.settings, "ADMIN_TOKEN", "secret")
+
+        with pytest.raises(Exception) as exc:
+            asyncio.run(admin_odds.get_odds_plan(refresh=False, x_admin_token="wrong"))
+
+        assert exc.value.status_code == 401
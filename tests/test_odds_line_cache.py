@@ -0,0 +1,108 @@
+"""Unit tests for the compact odds line cache.
+
+Test Strategy:
+1. One compiled index per (event, snapshot version); newer snapshots replace older
+2. Size bound evicts least recently used events; TTL expires entries
+3. Hit/miss statistics
+4. EnhancedPredictionService keeps a single compact entry per game across
+   every player/stat lookup
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.nba import odds_line_cache
+from app.services.nba.enhanced_prediction_service import EnhancedPredictionService
+from app.services.nba.odds_line_cache import OddsLineCache
+from app.services.nba.player_props_parser import PlayerPropsParser, PropLineIndex
+from tests.test_player_props_parser import STAT_TYPES, load_payload, payload_player_names
+
+
+def _index(event_id, version="2026-01-15T20:00:00Z"):
+    return PropLineIndex(event_id=event_id, snapshot_version=version)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(odds_line_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestOddsLineCache:
+    """Keying, bounds and statistics."""
+
+    def test_newer_snapshot_replaces_older(self):
+        cache = OddsLineCache()
+        old, new = _index("evt", "v1"), _index("evt", "v2")
+
+        cache.put(old)
+        cache.put(new)
+
+        assert len(cache) == 1
+        assert cache.get("evt") is new
+        assert cache.stats()["replaced_snapshots"] == 1
+
+    def test_lru_eviction(self):
+        cache = OddsLineCache(max_entries=2)
+        cache.put(_index("a"))
+        cache.put(_index("b"))
+        cache.get("a")  # a is now most recently used
+
+        cache.put(_index("c"))
+
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self, clock):
+        cache = OddsLineCache(ttl_seconds=300)
+        cache.put(_index("evt"))
+
+        clock[0] += 299
+        assert cache.get("evt") is not None
+        clock[0] += 1
+        assert cache.get("evt") is None
+        assert len(cache) == 0
+        assert cache.stats()["expirations"] == 1
+
+    def test_hit_statistics(self):
+        cache = OddsLineCache()
+        cache.put(_index("evt"))
+
+        cache.get("evt")
+        cache.get("evt")
+        cache.get("other")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+        assert stats["hit_rate"] == pytest.approx(0.667)
+
+
+class TestServiceOddsCache:
+    """The prediction service stores one compact index per game."""
+
+    def test_one_entry_per_game(self):
+        payload = load_payload()
+        odds_service = MagicMock()
+        odds_service.get_event_player_props = AsyncMock(return_value=payload)
+        service = EnhancedPredictionService(MagicMock(), odds_api_service=odds_service)
+        service._game_odds_mapper = MagicMock()
+        service._game_odds_mapper.get_odds_event_id = AsyncMock(return_value="evt-1")
+        game = SimpleNamespace(id="game-1")
+
+        asyncio.run(service._prefetch_event_odds(game))
+        names = payload_player_names(payload)
+        lines = [
+            service._get_bookmaker_line(SimpleNamespace(name=name), game, stat, "fanduel")
+            for name in names for stat in STAT_TYPES
+        ]
+
+        stats = service.get_odds_cache_stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == len(names) * len(STAT_TYPES)
+        assert service._odds_cache.get("evt-1").snapshot_version == PlayerPropsParser.snapshot_version(payload)
+        assert all(line["line_source"] != "estimated" for line in lines)
+        odds_service.get_event_player_props.assert_awaited_once()
@@ -0,0 +1,149 @@
+"""Unit tests for change-only odds snapshot ingestion.
+
+Test Strategy:
+1. Fingerprints are stable across int/float prices and change with line or price
+2. First capture writes every line (Over/Under prices paired per player)
+3. Re-capturing identical odds writes nothing and reports lines as unchanged
+4. Only moved lines are written on a later capture; rows stored before
+   fingerprints existed are compared by line and prices
+"""
+import asyncio
+import copy
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models import Game, HistoricalOddsSnapshot, Player, Sport
+from app.services.nba.historical_odds_service import HistoricalOddsService, line_fingerprint
+
+EVENT_ID = "a" * 32
+
+
+def _outcomes(player, line, over, under):
+    return [
+        {"name": "Over", "description": player, "point": line, "price": over},
+        {"name": "Under", "description": player, "point": line, "price": under},
+    ]
+
+
+PROPS = {
+    "event_id": EVENT_ID,
+    "data": {
+        "bookmakers": [
+            {
+                "key": "fanduel",
+                "title": "FanDuel",
+                "markets": [
+                    {"key": "player_points", "outcomes": (
+                        _outcomes("Jayson Tatum", 27.5, -115, -105)
+                        + _outcomes("Jalen Brunson", 26.5, -110, -110)
+                    )},
+                    {"key": "player_assists", "outcomes": _outcomes("Jalen Brunson", 7.5, 100, -120)},
+                ],
+            },
+            {
+                "key": "draftkings",
+                "title": "DraftKings",
+                "markets": [
+                    {"key": "player_points", "outcomes": _outcomes("Jayson Tatum", 27.5, -112, -108)},
+                    {"key": "player_spreads", "outcomes": []},
+                ],
+            },
+        ]
+    },
+}
+
+
+@pytest.fixture
+def game(sqlite_session):
+    now = datetime(2026, 1, 15, 12)
+    sqlite_session.add(Sport(id="nba", name="NBA", active=True, created_at=now, updated_at=now))
+    game = Game(
+        id=str(uuid.uuid4()), sport_id="nba", external_id=EVENT_ID,
+        game_date=datetime(2026, 1, 16, 0, 30), away_team="NYK", home_team="BOS",
+        season=2026, status="scheduled", created_at=now, updated_at=now
+    )
+    sqlite_session.add(game)
+    for name, team in [("Jayson Tatum", "BOS"), ("Jalen Brunson", "NYK")]:
+        sqlite_session.add(Player(
+            id=str(uuid.uuid4()), sport_id="nba", external_id=name, name=name,
+            team=team, active=True, created_at=now, updated_at=now
+        ))
+    sqlite_session.commit()
+    return game
+
+
+def _service(db, props):
+    service = HistoricalOddsService(db)
+    service._odds_api = MagicMock()
+    service._odds_api.get_event_player_props = AsyncMock(return_value=props)
+    return service
+
+
+def _capture(db, game, props):
+    return asyncio.run(_service(db, props).batch_capture_game_odds(game.id, starters_only=False))
+
+
+class TestLineFingerprint:
+    """Content hashing of a line and its prices."""
+
+    def test_stable_and_sensitive(self):
+        base = line_fingerprint("g", "p", "points", "FanDuel", 27.5, -115, -105)
+
+        assert base == line_fingerprint("g", "p", "points", "FanDuel", 27.5, -115.0, -105.0)
+        assert base != line_fingerprint("g", "p", "points", "FanDuel", 28.5, -115, -105)
+        assert base != line_fingerprint("g", "p", "points", "FanDuel", 27.5, -120, -105)
+        assert base != line_fingerprint("g", "p", "points", "DraftKings", 27.5, -115, -105)
+        assert len(base) == 16
+
+
+class TestChangeOnlyCapture:
+    """Only new and moved lines are written."""
+
+    def test_first_capture_writes_all_lines(self, sqlite_session, game):
+        result = _capture(sqlite_session, game, PROPS)
+
+        assert result == {"captured": 4, "new": 4, "moved": 0, "unchanged": 0, "errors": 0}
+        tatum_fd = sqlite_session.query(HistoricalOddsSnapshot).join(Player).filter(
+            Player.name == "Jayson Tatum", HistoricalOddsSnapshot.bookmaker_name == "FanDuel"
+        ).one()
+        assert (tatum_fd.bookmaker_line, tatum_fd.over_price, tatum_fd.under_price) == (27.5, -115, -105)
+        assert tatum_fd.line_hash
+
+    def test_identical_recapture_writes_nothing(self, sqlite_session, game):
+        _capture(sqlite_session, game, PROPS)
+
+        result = _capture(sqlite_session, game, PROPS)
+
+        assert result == {"captured": 0, "new": 0, "moved": 0, "unchanged": 4, "errors": 0}
+        assert sqlite_session.query(HistoricalOddsSnapshot).count() == 4
+
+    def test_only_moved_lines_written(self, sqlite_session, game):
+        _capture(sqlite_session, game, PROPS)
+        moved = copy.deepcopy(PROPS)
+        fanduel_points = moved["data"]["bookmakers"][0]["markets"][0]
+        fanduel_points["outcomes"][0]["point"] = fanduel_points["outcomes"][1]["point"] = 28.5
+        moved["data"]["bookmakers"][1]["markets"][0]["outcomes"][1]["price"] = -110
+
+        result = _capture(sqlite_session, game, moved)
+
+        assert (result["moved"], result["unchanged"], result["captured"]) == (2, 2, 2)
+        lines = [
+            row.bookmaker_line for row in sqlite_session.query(HistoricalOddsSnapshot).filter(
+                HistoricalOddsSnapshot.bookmaker_name == "FanDuel",
+                HistoricalOddsSnapshot.stat_type == "points",
+            ).join(Player).filter(Player.name == "Jayson Tatum")
+            .order_by(HistoricalOddsSnapshot.snapshot_time)
+        ]
+        assert lines == [27.5, 28.5]
+
+    def test_legacy_rows_without_fingerprint(self, sqlite_session, game):
+        _capture(sqlite_session, game, PROPS)
+        sqlite_session.query(HistoricalOddsSnapshot).update({"line_hash": None})
+        sqlite_session.commit()
+
+        result = _capture(sqlite_session, game, PROPS)
+
+        assert result["unchanged"] == 4 and result["captured"] == 0
@@ -0,0 +1,164 @@
+"""Unit tests for the PlayerResolver alias index.
+
+Test Strategy:
+1. batch_resolve_players over 500 names reads player_aliases once and
+   returns the same results as resolve_player name by name
+2. Fuzzy typos resolve through the batch cdist pass with the same
+   confidence as the single-name extractOne path
+3. create_or_update_alias updates the cached index without a reload;
+   invalidate_alias_index forces one
+4. Indexes are per source
+5. Exact and normalized lookups do not load an index that is not cached
+"""
+import asyncio
+import random
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.models import PlayerAlias
+from app.services.sync.matchers.player_resolver import PlayerResolver, invalidate_alias_index
+
+FIRST = ["Jalen", "Tyrese", "Anthony", "Darius", "Keegan", "Mikal", "Scottie", "Franz", "Jaren",
+         "Desmond", "Cade", "Evan", "Paolo", "Alperen", "Dyson", "Bennedict", "Walker", "Trey",
+         "Cam", "Onyeka"]
+LAST = ["Brunson", "Haliburton", "Edwards", "Garland", "Murray", "Bridges", "Barnes", "Wagner",
+        "Jackson", "Bane", "Cunningham", "Mobley", "Banchero", "Sengun", "Daniels", "Mathurin",
+        "Kessler", "Murphy", "Thomas", "Okongwu", "Johnson", "Green", "Porter", "Williams", "Dosunmu"]
+
+
+def _alias(nba_player_id, name, source="odds_api"):
+    return PlayerAlias(
+        id=str(uuid.uuid4()), nba_player_id=nba_player_id, canonical_name=name, alias_name=name,
+        alias_source=source, match_confidence=1.0, is_verified=False, created_at=datetime(2026, 1, 1)
+    )
+
+
+@pytest.fixture
+def aliases(sqlite_session):
+    names = [f"{first} {last}" for first in FIRST for last in LAST]
+    for nba_player_id, name in enumerate(names, start=1):
+        sqlite_session.add(_alias(nba_player_id, name))
+    sqlite_session.add(_alias(9001, "Jalen Brunson", source="espn"))
+    sqlite_session.commit()
+    return names
+
+
+def _payload(names, size=500, seed=4):
+    """Mix of exact names, case/punctuation variants, one-letter typos and unknowns."""
+    rng = random.Random(seed)
+    payload = []
+    for _ in range(size):
+        name = rng.choice(names)
+        roll = rng.random()
+        if roll < 0.5:
+            payload.append(name)
+        elif roll < 0.7:
+            payload.append(name.upper() + " Jr.")
+        elif roll < 0.9:
+            i = rng.randrange(1, len(name) - 1)
+            payload.append(name[:i] + name[i + 1:])
+        else:
+            payload.append(f"Unknown Prospect {rng.randint(1, 99)}")
+    return payload
+
+
+class _Selects:
+    """Counts SELECTs on player_aliases."""
+
+    def __init__(self, session):
+        self.engine = session.get_bind()
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and "player_aliases" in statement:
+            self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+class TestBatchResolve:
+    """One table read, one vectorized scoring pass."""
+
+    def test_500_names_one_read_same_results(self, sqlite_session, aliases):
+        payload = _payload(aliases)
+        resolver = PlayerResolver(sqlite_session)
+
+        with _Selects(sqlite_session) as selects:
+            batch = asyncio.run(resolver.batch_resolve_players(payload))
+
+        single = [asyncio.run(resolver.resolve_player(name)) for name in payload]
+
+        assert selects.count == 1
+        assert batch == single
+        methods = {r['match_method'] for r in batch if r}
+        assert methods == {'exact', 'normalized', 'fuzzy'}
+        assert sum(r is None for r in batch) > 0
+
+    def test_fuzzy_typo_confidence(self, sqlite_session, aliases):
+        resolver = PlayerResolver(sqlite_session)
+
+        [result] = asyncio.run(resolver.batch_resolve_players(["Tyrese Halliburton"], context={'team_match': True}))
+
+        assert result['canonical_name'] == "Tyrese Haliburton"
+        assert result['match_method'] == 'fuzzy'
+        assert result == asyncio.run(resolver.resolve_player("Tyrese Halliburton", context={'team_match': True}))
+
+
+class TestIndexMaintenance:
+    """Writes through the resolver and per-source indexes."""
+
+    def test_create_alias_updates_index_in_place(self, sqlite_session, aliases):
+        resolver = PlayerResolver(sqlite_session)
+        asyncio.run(resolver.batch_resolve_players(["Jalen Brunson"]))
+
+        asyncio.run(resolver.create_or_update_alias(
+            nba_player_id=1, canonical_name="Jalen Brunson", alias_name="J. Brunson",
+            alias_source="odds_api", match_confidence=0.9
+        ))
+        with _Selects(sqlite_session) as selects:
+            result = asyncio.run(resolver.resolve_player("J. Brunson"))
+
+        assert selects.count == 0
+        assert result['match_method'] == 'exact'
+        assert result['match_confidence'] == 0.9
+
+    def test_invalidate_reloads(self, sqlite_session, aliases):
+        resolver = PlayerResolver(sqlite_session)
+        asyncio.run(resolver.batch_resolve_players(["Jalen Brunson"]))
+        sqlite_session.add(_alias(7777, "Victor Wembanyama"))
+        sqlite_session.commit()
+
+        stale = asyncio.run(resolver.resolve_player("Victor Wembanyama"))
+        invalidate_alias_index("odds_api")
+        fresh = asyncio.run(resolver.resolve_player("Victor Wembanyama"))
+
+        assert stale is None
+        assert fresh['nba_player_id'] == 7777
+
+    def test_sources_are_separate(self, sqlite_session, aliases):
+        resolver = PlayerResolver(sqlite_session)
+
+        odds = asyncio.run(resolver.resolve_player("Jalen Brunson", source="odds_api"))
+        espn = asyncio.run(resolver.resolve_player("Jalen Brunson", source="espn"))
+        nba = asyncio.run(resolver.resolve_player("Jalen Brunson", source="nba_api"))
+
+        assert (odds['nba_player_id'], espn['nba_player_id'], nba) == (1, 9001, None)
+
+    def test_cold_lookups_skip_index_load(self, sqlite_session, aliases):
+        resolver = PlayerResolver(sqlite_session)
+
+        with _Selects(sqlite_session) as selects:
+            exact = asyncio.run(resolver.resolve_player("Jalen Brunson"))
+            normalized = asyncio.run(resolver.resolve_player("JALEN BRUNSON JR."))
+
+        assert selects.count == 3
+        assert (exact['match_method'], normalized['match_method']) == ('exact', 'normalized')
+        assert PlayerResolver._cached_index("odds_api") is None
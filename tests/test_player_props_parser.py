@@ -0,0 +1,153 @@
+"""Unit tests for the compiled per-event prop line index.
+
+Test Strategy:
+1. Parity: indexed lookups match the original full-scan lookup for every
+   player/stat in a recorded 10-bookmaker props payload
+2. Bookmaker priority decides the best line; per-bookmaker lines are kept
+3. One compile per response object, reused across lookups
+4. extract_all_player_lines reads from the same index
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.nba.player_props_parser import PlayerPropsParser
+
+FIXTURE = Path(__file__).parent / "fixtures" / "odds_api" / "nba_event_player_props_10_books.json"
+STAT_TYPES = ["points", "rebounds", "assists", "threes"]
+
+
+def load_payload():
+    with open(FIXTURE) as f:
+        return json.load(f)
+
+
+def payload_player_names(payload):
+    return sorted({
+        outcome["description"]
+        for bookmaker in payload["data"]["bookmakers"]
+        for market in bookmaker["markets"]
+        for outcome in market["outcomes"]
+    })
+
+
+def legacy_extract_player_lines(parser, odds_response, player_name, stat_type):
+    """Reference copy of the original per-lookup scan of the whole response."""
+    market_key = parser.MARKET_MAP.get(stat_type)
+    normalized_search_name = parser._normalize_player_name(player_name)
+    all_lines = []
+
+    for bookmaker in odds_response["data"].get("bookmakers", []):
+        bookmaker_key = bookmaker.get("key", "")
+        bookmaker_title = bookmaker.get("title", bookmaker_key)
+        target_market = None
+        for market in bookmaker.get("markets", []):
+            if market.get("key") == market_key:
+                target_market = market
+                break
+        if not target_market:
+            continue
+
+        over_outcome = under_outcome = None
+        for outcome in target_market.get("outcomes", []):
+            if parser._player_matches(
+                outcome.get("name", ""), outcome.get("description", ""), normalized_search_name
+            ):
+                if "over" in outcome.get("name", "").lower():
+                    over_outcome = outcome
+                elif "under" in outcome.get("name", "").lower():
+                    under_outcome = outcome
+
+        if over_outcome and under_outcome:
+            line_data = parser._extract_line_from_outcomes(
+                over_outcome, under_outcome, bookmaker_key, bookmaker_title
+            )
+            if line_data:
+                line_data["priority"] = parser._get_bookmaker_priority(bookmaker_key)
+                all_lines.append(line_data)
+
+    if not all_lines:
+        return None
+    all_lines.sort(key=lambda x: x.get("priority", 999))
+    return all_lines[0]
+
+
+@pytest.fixture
+def payload():
+    return load_payload()
+
+
+class TestIndexParity:
+    """Indexed lookups return the same line as the full scan."""
+
+    @pytest.mark.parametrize("priority", [None, ["fanduel"], ["espnbet", "betmgm"]])
+    def test_matches_full_scan(self, payload, priority):
+        parser = PlayerPropsParser(bookmaker_priority=priority)
+
+        for name in payload_player_names(payload):
+            for stat_type in STAT_TYPES:
+                expected = legacy_extract_player_lines(parser, payload, name, stat_type)
+                actual = parser.extract_player_lines(payload, name, stat_type)
+                if expected is None:
+                    assert actual is None
+                    continue
+                for key in ("line", "over_price", "under_price", "bookmaker", "priority"):
+                    assert actual[key] == expected[key], (name, stat_type, key)
+
+    def test_name_variants_fall_back_to_partial_match(self, payload):
+        parser = PlayerPropsParser()
+
+        line = parser.extract_player_lines(payload, "Kelly Oubre", "points")
+
+        assert line is not None
+        assert line == parser.extract_player_lines(payload, "Kelly Oubre Jr.", "points")
+
+
+class TestLineIndex:
+    """Compiled index contents and reuse."""
+
+    def test_index_keeps_every_bookmaker(self, payload):
+        parser = PlayerPropsParser()
+        index = parser.get_line_index(payload)
+
+        per_book = index.lines[("jayson tatum", "points")]
+        offering = {
+            bookmaker["key"]
+            for bookmaker in payload["data"]["bookmakers"]
+            for market in bookmaker["markets"] if market["key"] == "player_points"
+            for outcome in market["outcomes"] if outcome["description"] == "Jayson Tatum"
+        }
+
+        assert set(per_book) == offering
+        assert index.get("jayson tatum", "points")["bookmaker"] == "draftkings"
+        assert index.get("jayson tatum", "points", bookmaker="FanDuel") == per_book["fanduel"]
+        assert per_book["fanduel"]["last_update"] == "2026-01-15T21:11:00Z"
+
+    def test_index_compiled_once_per_response(self, payload, monkeypatch):
+        parser = PlayerPropsParser()
+        compiles = []
+        original = parser.build_line_index
+        monkeypatch.setattr(parser, "build_line_index", lambda r: compiles.append(1) or original(r))
+
+        for name in payload_player_names(payload):
+            parser.extract_player_lines(payload, name, "points")
+        parser.extract_player_lines(load_payload(), "Jayson Tatum", "points")
+
+        assert len(compiles) == 2
+
+    def test_extract_all_player_lines_uses_index(self, payload):
+        parser = PlayerPropsParser()
+
+        lines = parser.extract_all_player_lines(payload, "rebounds")
+
+        assert set(lines) <= set(payload_player_names(payload))
+        assert lines["Joel Embiid"] == parser.extract_player_lines(payload, "Joel Embiid", "rebounds")
+        assert parser.extract_all_player_lines(payload, "blocks") == {}
+
+    def test_unknown_or_empty_inputs(self, payload):
+        parser = PlayerPropsParser()
+
+        assert parser.extract_player_lines(payload, "Nobody Here", "points") is None
+        assert parser.extract_player_lines({"data": {}}, "Jayson Tatum", "points") is None
+        assert len(parser.build_line_index({"data": {"bookmakers": []}})) == 0
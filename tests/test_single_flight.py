@@ -0,0 +1,164 @@
+"""Unit tests for single-flight request coalescing.
+
+Test Strategy:
+1. SingleFlight: concurrent callers for one key share one call, its result
+   and its exception; the key is released once the call finishes
+2. OddsApiService: 50 concurrent get_event_player_props /
+   get_upcoming_games_with_odds callers cause exactly one upstream request
+3. ESPNApiService._fetch: 50 concurrent callers share one request and its
+   error; different URLs are not coalesced
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.core.espn_service import ESPNApiService
+from app.services.core.odds_api_service import OddsApiService
+from app.services.core.odds_cache import MemoryOddsCache
+from app.utils.async_utils import SingleFlight
+
+CALLERS = 50
+
+
+class Upstream:
+    """Slow fake upstream call that counts invocations."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+async def _gather(func, *args, count=CALLERS):
+    return await asyncio.gather(*(func(*args) for _ in range(count)), return_exceptions=True)
+
+
+class TestSingleFlight:
+    """Coalescing primitive."""
+
+    def test_concurrent_callers_share_result(self):
+        flight = SingleFlight()
+        upstream = Upstream(result={"ok": True})
+
+        async def run():
+            return await _gather(lambda: flight.do("key", upstream))
+
+        results = asyncio.run(run())
+
+        assert upstream.calls == 1
+        assert all(r is results[0] for r in results)
+        assert (flight.calls, flight.coalesced, flight.in_flight()) == (1, CALLERS - 1, 0)
+
+    def test_concurrent_callers_share_error_then_retry(self):
+        flight = SingleFlight()
+        upstream = Upstream(error=ValueError("boom"))
+
+        async def run():
+            shared = await _gather(lambda: flight.do("key", upstream))
+            upstream.error = None
+            upstream.result = "fresh"
+            return shared, await flight.do("key", upstream)
+
+        shared, retried = asyncio.run(run())
+
+        assert all(isinstance(r, ValueError) for r in shared)
+        assert retried == "fresh"
+        assert upstream.calls == 2
+
+    def test_distinct_keys_not_coalesced(self):
+        flight = SingleFlight()
+        upstream = Upstream(result=1)
+
+        async def run():
+            await asyncio.gather(*(flight.do(k, upstream) for k in ("a", "b", "a", "b")))
+
+        asyncio.run(run())
+
+        assert upstream.calls == 2
+
+
+class TestOddsApiServiceCoalescing:
+    """Concurrent Odds API cache misses share one request."""
+
+    @pytest.fixture
+    def service(self):
+        service = OddsApiService(api_key="k", cache_ttl=300, cache_backend=MemoryOddsCache())
+
+        async def client():
+            return None
+
+        service._get_client = client
+        return service
+
+    def test_event_player_props(self, service):
+        upstream = Upstream(result=({"bookmakers": [{"key": "fanduel"}]}, 200))
+        service._fetch_player_props_with_breaker = upstream
+
+        results = asyncio.run(_gather(service.get_event_player_props, "evt-1"))
+
+        assert upstream.calls == 1
+        assert all(r == results[0] for r in results)
+        assert results[0]["data"]["bookmakers"][0]["key"] == "fanduel"
+        assert service.get_cache_stats()["coalesced_requests"] == CALLERS - 1
+
+    def test_upcoming_games(self, service):
+        upstream = Upstream(result=[{"id": "g1"}])
+        service._fetch_games_with_breaker = upstream
+
+        results = asyncio.run(_gather(service.get_upcoming_games_with_odds, 7))
+
+        assert upstream.calls == 1
+        assert all(r == [{"id": "g1"}] for r in results)
+
+
+class TestESPNCoalescing:
+    """Concurrent ESPN fetches share one request and its error."""
+
+    URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
+
+    @pytest.fixture
+    def service(self):
+        service = ESPNApiService(cache_ttl=300)
+
+        async def client():
+            return None
+
+        service._get_client = client
+        return service
+
+    def test_shared_result(self, service):
+        upstream = Upstream(result={"events": []})
+        service._fetch_with_breaker = upstream
+
+        results = asyncio.run(_gather(service._fetch, self.URL, False))
+
+        assert upstream.calls == 1
+        assert all(r == {"events": []} for r in results)
+
+    def test_shared_error(self, service):
+        upstream = Upstream(error=httpx.ConnectError("down"))
+        service._fetch_with_breaker = upstream
+
+        results = asyncio.run(_gather(service._fetch, self.URL))
+
+        assert upstream.calls == 1
+        assert all(isinstance(r, httpx.ConnectError) for r in results)
+
+    def test_different_urls_fetched_separately(self, service):
+        upstream = Upstream(result={"events": []})
+        service._fetch_with_breaker = upstream
+
+        async def run():
+            await asyncio.gather(service._fetch(self.URL), service._fetch(self.URL + "?dates=20260115"))
+
+        asyncio.run(run())
+
+        assert upstream.calls == 2
@@ -0,0 +1,108 @@
+"""Unit tests for the process-pool slate generator.
+
+Test Strategy:
+1. Prediction services return column rows instead of writing when persist=False
+2. The single writer bulk inserts rows in batches and counts predictions
+3. Failed games are reported without stopping the run
+4. generate_predictions_for_date delegates to slate mode when workers > 1
+"""
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models import Prediction
+from app.services.core.multi_sport_service import MultiSportPredictionService
+from app.services.core.slate_generator import SlateGenerator, SlateRunStats
+from app.services.nba.prediction_service import PredictionService
+
+
+class FakeSportService:
+    """Returns two predictions per game; games listed in fail_on raise."""
+
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.persist_flags = []
+
+    def generate_predictions_for_game(self, game_id, stat_types=None, persist=True):
+        self.persist_flags.append(persist)
+        if game_id in self.fail_on:
+            raise RuntimeError("boom")
+        return [
+            {"player": f"{game_id}-{i}", "stat_type": "points",
+             "record": {"id": f"{game_id}-{i}", "game_id": game_id}}
+            for i in range(2)
+        ]
+
+
+@pytest.fixture
+def fake_service():
+    service = FakeSportService(fail_on={"g2"})
+    with patch.object(MultiSportPredictionService, "get_sport_service", return_value=service):
+        yield service
+
+
+class TestSlateGenerator:
+    """In-process mode exercises the same compute/write split as the pool."""
+
+    def test_rows_bulk_inserted_in_batches(self, fake_service):
+        db = MagicMock()
+        generator = SlateGenerator(db, workers=1, write_batch_size=3)
+
+        stats = generator.run_games([("nba", "g1"), ("nba", "g3"), ("nba", "g4")])
+
+        assert fake_service.persist_flags == [False, False, False]
+        inserted = [call.args[1] for call in db.execute.call_args_list]
+        assert [len(rows) for rows in inserted] == [4, 2]
+        assert stats.predictions == 6
+        assert stats.predictions_by_sport == {"nba": 6}
+        assert db.commit.call_count == 2
+
+    def test_failed_games_are_reported(self, fake_service):
+        generator = SlateGenerator(MagicMock(), workers=0)
+
+        stats = generator.run_games([("nba", "g1"), ("nba", "g2")], keep_results=True)
+
+        assert (stats.games_succeeded, stats.games_failed) == (1, 1)
+        assert stats.failures[0]["game_id"] == "g2"
+        assert "boom" in stats.failures[0]["error"]
+        assert list(stats.results_by_game) == ["g1"]
+        assert "record" not in stats.results_by_game["g1"][0]
+
+    def test_throughput_metrics(self):
+        stats = SlateRunStats(workers=4, games_total=10, predictions=400, wall_seconds=2.0)
+
+        summary = stats.to_dict()
+
+        assert summary["games_per_second"] == 5.0
+        assert summary["predictions_per_second"] == 200.0
+
+    def test_date_mode_delegates_to_slate(self):
+        service = MultiSportPredictionService(MagicMock())
+        slate_stats = SlateRunStats(workers=4, results_by_game={"g1": [{"player": "x"}]})
+
+        with patch.object(service, "generate_slate", return_value=slate_stats) as generate_slate:
+            result = service.generate_predictions_for_date("nba", date(2026, 1, 5), workers=4)
+
+        assert result == {"g1": [{"player": "x"}]}
+        generate_slate.assert_called_once_with(
+            ["nba"], [date(2026, 1, 5)], None, 4, keep_results=True
+        )
+
+
+class TestPredictionRows:
+    """persist=False hands back rows for the writer."""
+
+    def test_prediction_to_row_omits_unset_columns(self):
+        service = PredictionService(MagicMock())
+        record = service._create_prediction_record(
+            player_id="p1", game_id="g1", stat_type="points",
+            predicted_value=21.5, recommendation="OVER", confidence=0.7
+        )
+
+        row = service._prediction_to_row(record)
+
+        assert row["player_id"] == "p1"
+        assert row["predicted_value"] == 21.5
+        assert "sport_id" not in row  # left to the column default
+        assert Prediction(**row).game_id == "g1"
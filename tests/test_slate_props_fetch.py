@@ -0,0 +1,156 @@
+"""Unit tests for concurrent slate-wide player props fetching.
+
+Test Strategy:
+1. A 12-event slate takes about as long as the slowest request, not the sum
+2. Results stream in completion order and in-flight requests never exceed
+   the concurrency limit; duplicate event IDs are fetched once
+3. AsyncRateLimiter spaces request starts after the initial burst
+4. SyncOrchestrator.sync_odds(include_props=True) stores each event's lines
+   as its response arrives
+"""
+import asyncio
+import copy
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models import HistoricalOddsSnapshot
+from app.services.core.odds_api_service import OddsApiService
+from app.services.core.odds_cache import MemoryOddsCache
+from app.services.sync.orchestrator import SyncOrchestrator
+from app.utils.async_utils import AsyncRateLimiter
+from tests.test_odds_snapshot_ingestion import EVENT_ID, PROPS, game  # noqa: F401
+
+SLATE_SIZE = 12
+REQUEST_SECONDS = 0.1
+
+
+class SlowUpstream:
+    """Fake props endpoint with per-event latency that tracks concurrency."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, event_id, markets, client):
+        self.calls.append(event_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(event_id, REQUEST_SECONDS))
+        finally:
+            self.active -= 1
+        return {"bookmakers": [{"key": "fanduel", "event": event_id}]}, 200
+
+
+@pytest.fixture
+def service():
+    service = OddsApiService(api_key="k", cache_ttl=300, cache_backend=MemoryOddsCache())
+
+    async def client():
+        return None
+
+    service._get_client = client
+    service._rate_limiter = AsyncRateLimiter(0)
+    return service
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+class TestStreamEventPlayerProps:
+    """Bounded-parallel slate fetch."""
+
+    def test_slate_takes_about_one_request(self, service):
+        upstream = SlowUpstream()
+        service._fetch_player_props_with_breaker = upstream
+        event_ids = [f"evt-{i}" for i in range(SLATE_SIZE)]
+
+        started = time.perf_counter()
+        results = asyncio.run(_collect(
+            service.stream_event_player_props(event_ids, max_concurrency=SLATE_SIZE)
+        ))
+        elapsed = time.perf_counter() - started
+
+        assert sorted(e for e, _ in results) == sorted(event_ids)
+        assert elapsed < REQUEST_SECONDS * 3
+        assert upstream.peak == SLATE_SIZE
+
+    def test_yields_in_completion_order(self, service):
+        service._fetch_player_props_with_breaker = SlowUpstream(
+            delays={"slow": 0.15, "medium": 0.08, "fast": 0.01}
+        )
+
+        results = asyncio.run(_collect(
+            service.stream_event_player_props(["slow", "medium", "fast"])
+        ))
+
+        assert [event_id for event_id, _ in results] == ["fast", "medium", "slow"]
+        assert results[0][1]["data"]["bookmakers"][0]["event"] == "fast"
+
+    def test_concurrency_bounded_and_duplicates_fetched_once(self, service):
+        upstream = SlowUpstream()
+        service._fetch_player_props_with_breaker = upstream
+        event_ids = [f"evt-{i}" for i in range(SLATE_SIZE)] * 2
+
+        results = asyncio.run(_collect(
+            service.stream_event_player_props(event_ids, max_concurrency=4)
+        ))
+
+        assert len(results) == SLATE_SIZE
+        assert len(upstream.calls) == SLATE_SIZE
+        assert upstream.peak == 4
+
+
+class TestAsyncRateLimiter:
+    """Request start spacing."""
+
+    def test_spaces_starts_after_burst(self):
+        limiter = AsyncRateLimiter(rate_per_second=50, burst=2)
+
+        async def run():
+            started = time.perf_counter()
+            await asyncio.gather(*(limiter.acquire() for _ in range(7)))
+            return time.perf_counter() - started
+
+        elapsed = asyncio.run(run())
+
+        # 2 start immediately, the other 5 are spaced 20ms apart
+        assert elapsed >= 0.09
+        assert limiter.waits == 5
+
+    def test_disabled_when_rate_not_positive(self):
+        limiter = AsyncRateLimiter(rate_per_second=0)
+
+        asyncio.run(limiter.acquire())
+
+        assert limiter.waits == 0
+
+
+class TestSyncOddsWithProps:
+    """Slate props stream into snapshot ingestion."""
+
+    def test_props_ingested_per_event(self, sqlite_session, game):  # noqa: F811
+        other_event = "b" * 32
+
+        async def stream(event_ids, max_concurrency=None):
+            for event_id in event_ids:
+                yield event_id, copy.deepcopy(PROPS)
+
+        adapter = MagicMock()
+        adapter.fetch_odds = AsyncMock(return_value=[{"id": EVENT_ID}, {"id": other_event}])
+        adapter.stream_player_props = stream
+
+        orchestrator = SyncOrchestrator(sqlite_session)
+        orchestrator._odds_adapter = adapter
+
+        result = asyncio.run(orchestrator.sync_odds(include_props=True))
+
+        assert result["props"]["events"] == 2
+        assert result["props"]["games_matched"] == 1
+        assert result["props"]["snapshots_written"] == 4
+        assert sqlite_session.query(HistoricalOddsSnapshot).count() == 4
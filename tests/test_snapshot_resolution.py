@@ -0,0 +1,219 @@
+"""Unit tests for set-based odds snapshot resolution.
+
+Test Strategy:
+1. One game's snapshots get actual value and OVER/UNDER/PUSH from the
+   stat column their stat type maps to, in a single UPDATE
+2. Snapshots without a stat line or with an unmapped stat type stay
+   unresolved and are counted as errors; resolved ones are not touched again
+3. Season backfill resolves every unresolved snapshot of that season's
+   games only; with no season it resolves all of them
+4. Resolving adds to hit_rate_aggregates incrementally; a rebuild gives
+   the same counts
+5. get_batch_hit_rates answers a whole slate in one query with the same
+   figures as get_player_hit_rate, honouring starters_only
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models import Game, HistoricalOddsSnapshot, HitRateAggregate, Player, PlayerStats, Sport
+from app.services.nba.historical_odds_service import HistoricalOddsService
+
+NOW = datetime(2026, 1, 15, 12)
+
+
+@pytest.fixture
+def db(sqlite_session):
+    sqlite_session.add(Sport(id="nba", name="NBA", active=True, created_at=NOW, updated_at=NOW))
+    for name in ("Jayson Tatum", "Jalen Brunson"):
+        sqlite_session.add(Player(
+            id=name, sport_id="nba", external_id=name, name=name,
+            team="BOS", active=True, created_at=NOW, updated_at=NOW
+        ))
+    sqlite_session.commit()
+    return sqlite_session
+
+
+def add_game(db, stats_by_player, season=2026):
+    game = Game(
+        id=str(uuid.uuid4()), sport_id="nba", external_id=str(uuid.uuid4()),
+        game_date=NOW, away_team="NYK", home_team="BOS", season=season,
+        status="final", created_at=NOW, updated_at=NOW
+    )
+    db.add(game)
+    for player_id, stats in stats_by_player.items():
+        db.add(PlayerStats(
+            id=str(uuid.uuid4()), player_id=player_id, game_id=game.id,
+            created_at=NOW, **stats
+        ))
+    db.commit()
+    return game
+
+
+def add_snapshot(db, game, player_id, stat_type, line, snapshot_time=NOW, was_starter=False,
+                 bookmaker_name="FanDuel"):
+    snapshot = HistoricalOddsSnapshot(
+        id=str(uuid.uuid4()), game_id=game.id, player_id=player_id, stat_type=stat_type,
+        bookmaker_name=bookmaker_name, bookmaker_line=line, snapshot_time=snapshot_time,
+        was_starter=was_starter, created_at=NOW
+    )
+    db.add(snapshot)
+    db.commit()
+    return snapshot.id
+
+
+def results(db):
+    db.expire_all()
+    return {s.id: (s.actual_value, s.hit_result) for s in db.query(HistoricalOddsSnapshot)}
+
+
+class TestResolveGame:
+    """One UPDATE per game."""
+
+    def test_over_under_push(self, db):
+        game = add_game(db, {"Jayson Tatum": {"points": 30, "rebounds": 8, "assists": 5, "threes": 4}})
+        over = add_snapshot(db, game, "Jayson Tatum", "points", 27.5)
+        under = add_snapshot(db, game, "Jayson Tatum", "rebounds", 8.5)
+        push = add_snapshot(db, game, "Jayson Tatum", "assists", 5.0)
+        threes = add_snapshot(db, game, "Jayson Tatum", "threes", 3.5)
+
+        statements = []
+        engine = db.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            result = HistoricalOddsService(db).resolve_snapshots_for_game(game.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert result == {"resolved": 4, "errors": 0}
+        assert sum(s.lstrip().upper().startswith("UPDATE") for s in statements) == 1
+        resolved = results(db)
+        assert resolved[over] == (30, "OVER")
+        assert resolved[under] == (8, "UNDER")
+        assert resolved[push] == (5, "PUSH")
+        assert resolved[threes] == (4, "OVER")
+
+    def test_missing_stats_are_errors(self, db):
+        game = add_game(db, {"Jayson Tatum": {"points": 30, "rebounds": None}})
+        add_snapshot(db, game, "Jayson Tatum", "points", 27.5)
+        no_value = add_snapshot(db, game, "Jayson Tatum", "rebounds", 8.5)
+        unmapped = add_snapshot(db, game, "Jayson Tatum", "steals", 1.5)
+        no_stats = add_snapshot(db, game, "Jalen Brunson", "points", 26.5)
+
+        service = HistoricalOddsService(db)
+        result = service.resolve_snapshots_for_game(game.id)
+
+        assert result == {"resolved": 1, "errors": 3}
+        resolved = results(db)
+        assert all(resolved[i] == (None, None) for i in (no_value, unmapped, no_stats))
+        # Already-resolved snapshots are not counted again
+        assert service.resolve_snapshots_for_game(game.id) == {"resolved": 0, "errors": 3}
+
+
+class TestSeasonBackfill:
+    """Every unresolved snapshot in one statement."""
+
+    def test_resolves_only_the_season(self, db):
+        current = [add_game(db, {"Jayson Tatum": {"points": 20}}) for _ in range(3)]
+        previous = add_game(db, {"Jayson Tatum": {"points": 20}}, season=2025)
+        ids = [add_snapshot(db, game, "Jayson Tatum", "points", 22.5) for game in current]
+        old = add_snapshot(db, previous, "Jayson Tatum", "points", 22.5)
+
+        service = HistoricalOddsService(db)
+        assert service.resolve_unresolved_snapshots(season=2026) == {"resolved": 3, "errors": 0}
+        resolved = results(db)
+        assert all(resolved[i] == (20, "UNDER") for i in ids)
+        assert resolved[old] == (None, None)
+
+        assert service.resolve_unresolved_snapshots() == {"resolved": 1, "errors": 0}
+        assert results(db)[old] == (20, "UNDER")
+
+
+class TestHitRateAggregates:
+    """Aggregates maintained on resolve and read per slate."""
+
+    @pytest.fixture
+    def season(self, db):
+        """Six recent games: Tatum scores 30 (OVER 27.5 at FanDuel, 31.5 at DraftKings) or 20."""
+        today = datetime.utcnow().replace(hour=0, minute=30, microsecond=0)
+        for day in range(6):
+            points = 30 if day % 3 else 20
+            game = add_game(db, {"Jayson Tatum": {"points": points, "assists": 5}})
+            tipoff = today - timedelta(days=day + 1)
+            add_snapshot(db, game, "Jayson Tatum", "points", 27.5, tipoff, was_starter=True)
+            add_snapshot(db, game, "Jayson Tatum", "points", 31.5, tipoff,
+                         was_starter=True, bookmaker_name="DraftKings")
+            add_snapshot(db, game, "Jayson Tatum", "assists", 5.0, tipoff, was_starter=day < 2)
+        return HistoricalOddsService(db)
+
+    def test_resolve_adds_counts(self, db, season):
+        assert season.resolve_unresolved_snapshots()["resolved"] == 18
+
+        rows = db.query(HitRateAggregate).all()
+        fanduel = [r for r in rows if r.stat_type == "points" and r.bookmaker_name == "FanDuel"]
+        assert len(fanduel) == 6
+        assert sum(r.over_hits for r in fanduel) == 4
+        assert sum(r.under_hits for r in fanduel) == 2
+        assert sum(r.pushes for r in rows if r.stat_type == "assists") == 6
+
+        counts = sorted((r.player_id, r.stat_type, r.bookmaker_name, r.was_starter, r.bucket_date,
+                         r.over_hits, r.under_hits, r.pushes) for r in rows)
+        season.rebuild_hit_rate_aggregates()
+        db.expire_all()
+        assert sorted((r.player_id, r.stat_type, r.bookmaker_name, r.was_starter, r.bucket_date,
+                       r.over_hits, r.under_hits, r.pushes) for r in db.query(HitRateAggregate)) == counts
+
+    def test_incremental_adds_to_existing_day(self, db, season):
+        season.resolve_unresolved_snapshots()
+        yesterday = datetime.utcnow().replace(hour=0, minute=30, microsecond=0) - timedelta(days=1)
+        game = add_game(db, {"Jayson Tatum": {"points": 26}})
+        add_snapshot(db, game, "Jayson Tatum", "points", 25.5, yesterday, was_starter=True)
+
+        assert season.resolve_snapshots_for_game(game.id)["resolved"] == 1
+        db.expire_all()
+        row = db.query(HitRateAggregate).filter(
+            HitRateAggregate.stat_type == "points", HitRateAggregate.bookmaker_name == "FanDuel",
+            HitRateAggregate.bucket_date == yesterday.date()
+        ).one()
+        assert (row.over_hits, row.under_hits) == (1, 1)
+
+    def test_batch_matches_single_player(self, db, season):
+        season.resolve_unresolved_snapshots()
+
+        statements = []
+        engine = db.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            batch = season.get_batch_hit_rates(
+                ["Jayson Tatum", "Jalen Brunson"], ["points", "assists"], games_back=20
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 1
+        for stat_type in ("points", "assists"):
+            assert batch["Jayson Tatum"][stat_type] == season.get_player_hit_rate(
+                "Jayson Tatum", stat_type, games_back=20
+            )
+        assert batch["Jayson Tatum"]["points"]["over_hits"] == 4
+        assert batch["Jayson Tatum"]["assists"]["total_games"] == 2  # starters only
+        assert batch["Jalen Brunson"]["points"]["total_games"] == 0
+
+        weight = season.calculate_hit_rate_weight(
+            batch["Jayson Tatum"]["points"]["hit_rate"], batch["Jayson Tatum"]["points"]["total_games"]
+        )
+        assert weight == 0.7
+
+    def test_games_back_counts_whole_days(self, db, season):
+        season.resolve_unresolved_snapshots()
+
+        rates = season.get_batch_hit_rates(["Jayson Tatum"], ["points"], games_back=3)
+
+        # Two snapshots (FanDuel + DraftKings) per day: two days reach 3
+        assert rates["Jayson Tatum"]["points"]["total_games"] == 4
+        rates = season.get_batch_hit_rates(["Jayson Tatum"], ["assists"], games_back=5, starters_only=False)
+        assert rates["Jayson Tatum"]["assists"]["total_games"] == 5
@@ -0,0 +1,274 @@
+"""Unit tests for the incremental sync DAG.
+
+Test Strategy:
+1. run_stages runs independent stages concurrently, starts a stage only
+   after its dependencies and skips dependents of a failed stage
+2. Bad graphs (unknown dependency, cycle) are rejected before running
+3. run_incremental_sync matches a fresh slate, then on an unchanged
+   second run writes no games, matches nothing and skips the stats ingest
+4. A game going final triggers exactly one game log ingest and advances
+   the stats watermark
+5. An Odds API failure skips matching but games and stats still run;
+   per-stage durations are recorded in sync_metadata
+6. Concurrent stages use separate sessions: a stage failing while another
+   is in flight does not roll back the other's writes
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.models import Game, GameMapping, SyncMetadata
+from app.services.sync.adapters.nba_api_adapter import NbaApiAdapter
+from app.services.sync.dag import SyncStage, run_stages
+from app.services.sync.orchestrator import SyncOrchestrator
+from tests.test_batch_game_matcher import NBA_TEAMS, add_team_mappings
+
+
+def _stage(name, log, delay=0.0, depends_on=(), fail=False):
+    async def run(deps):
+        log.append(('start', name, time.monotonic(), sorted(deps)))
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} broke")
+        return {'name': name}
+    return SyncStage(name, run, depends_on=depends_on)
+
+
+class TestRunStages:
+    """Ordering, concurrency and failure propagation."""
+
+    def test_branches_concurrent_dependents_wait(self):
+        log = []
+        stages = [
+            _stage('games', log, 0.1),
+            _stage('odds', log, 0.1),
+            _stage('match', log, depends_on=('games', 'odds')),
+            _stage('stats', log, depends_on=('games',)),
+        ]
+
+        started = time.monotonic()
+        run = asyncio.run(run_stages(stages))
+        elapsed = time.monotonic() - started
+
+        starts = {name: (at, deps) for _, name, at, deps in log}
+        assert run['success'] is True
+        assert elapsed < 0.18
+        assert starts['match'][1] == ['games', 'odds']
+        assert starts['match'][0] - starts['games'][0] >= 0.09
+        assert run['stages']['games']['duration_ms'] >= 90
+        assert run['stages']['match']['result'] == {'name': 'match'}
+
+    def test_failure_skips_dependents_only(self):
+        log = []
+        stages = [
+            _stage('games', log),
+            _stage('odds', log, fail=True),
+            _stage('match', log, depends_on=('games', 'odds')),
+            _stage('stats', log, depends_on=('games',)),
+        ]
+
+        run = asyncio.run(run_stages(stages))
+
+        status = {name: entry['status'] for name, entry in run['stages'].items()}
+        assert status == {'games': 'success', 'odds': 'failed', 'match': 'skipped', 'stats': 'success'}
+        assert run['stages']['odds']['error'] == 'odds broke'
+        assert run['stages']['match']['blocked_by'] == ['odds']
+        assert run['success'] is False
+
+    @pytest.mark.parametrize("stages, message", [
+        ([SyncStage('a', AsyncMock(), depends_on=('missing',))], "unknown stages"),
+        ([SyncStage('a', AsyncMock(), depends_on=('b',)), SyncStage('b', AsyncMock(), depends_on=('a',))], "cycle"),
+    ])
+    def test_bad_graph_rejected(self, stages, message):
+        with pytest.raises(ValueError, match=message):
+            asyncio.run(run_stages(stages))
+
+
+def _scoreboard(games):
+    """todaysScoreboard payload for (game_id, home, away, tip, status) tuples."""
+    teams = {team_id: abbr for team_id, abbr, _ in NBA_TEAMS}
+    return {'scoreboard': {'gameDate': '2026-01-14', 'games': [
+        {
+            'gameId': game_id, 'gameStatus': status,
+            'gameTimeUTC': tip.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'homeTeam': {'teamId': home, 'teamTricode': teams[home], 'score': 0},
+            'awayTeam': {'teamId': away, 'teamTricode': teams[away], 'score': 0},
+        }
+        for game_id, home, away, tip, status in games
+    ]}}
+
+
+class _FakeOdds:
+    def __init__(self, events):
+        self.events = events
+        self.calls = 0
+
+    async def fetch_odds(self, upcoming_only=True, days=7):
+        self.calls += 1
+        if isinstance(self.events, Exception):
+            raise self.events
+        return self.events
+
+
+@pytest.fixture
+def slate():
+    tip = datetime(2026, 1, 15, 0, 30)
+    games = [
+        ('0022500601', 1610612738, 1610612755, tip, 1),
+        ('0022500602', 1610612747, 1610612744, tip + timedelta(hours=2), 1),
+    ]
+    events = [
+        {'id': 'evt601', 'commence_time': tip, 'home_team': 'Boston Celtics', 'away_team': 'Philadelphia 76ers'},
+        {'id': 'evt602', 'commence_time': tip + timedelta(hours=2),
+         'home_team': 'Los Angeles Lakers', 'away_team': 'Golden State Warriors'},
+    ]
+    return games, events
+
+
+def _orchestrator(monkeypatch, session, games, odds, session_factory=None):
+    """Orchestrator with stubbed upstreams and the stats ingest mock.
+
+    Stages build their own adapters, so the nba_api stubs are patched on
+    the adapter class.
+    """
+    sync_stats = AsyncMock(return_value={'total': 450, 'success': 440, 'no_data': 10, 'errors': 0})
+    monkeypatch.setattr(
+        NbaApiAdapter, '_fetch_nba_scoreboard_with_retry', AsyncMock(return_value=_scoreboard(games))
+    )
+    monkeypatch.setattr(NbaApiAdapter, 'sync_all_player_stats', sync_stats)
+    orchestrator = SyncOrchestrator(session, session_factory=session_factory)
+    orchestrator._odds_adapter = odds
+    return orchestrator, sync_stats
+
+
+class TestIncrementalSync:
+    """run_incremental_sync against SQLite with stubbed upstreams."""
+
+    def test_second_run_does_no_work(self, sqlite_session, slate, monkeypatch):
+        add_team_mappings(sqlite_session)
+        games, events = slate
+
+        first, _ = _orchestrator(monkeypatch, sqlite_session, games, _FakeOdds(events))
+        first = asyncio.run(first.run_incremental_sync())
+        orchestrator, sync_stats = _orchestrator(monkeypatch, sqlite_session, games, _FakeOdds(events))
+        second = asyncio.run(orchestrator.run_incremental_sync())
+
+        assert first['success'] and second['success']
+        assert first['stages']['games']['result']['changed'] == 2
+        assert first['stages']['match']['result']['matched'] == 2
+        assert second['stages']['games']['result']['changed'] == 0
+        assert second['stages']['odds']['result']['matched'] == 0
+        assert second['stages']['match']['result']['processed'] == 0
+        assert second['stages']['stats']['result']['new_final_games'] is False
+        sync_stats.assert_not_called()
+        assert sqlite_session.query(GameMapping).filter(GameMapping.status == 'matched').count() == 2
+
+    def test_final_game_triggers_one_ingest(self, sqlite_session, slate, monkeypatch):
+        add_team_mappings(sqlite_session)
+        games, events = slate
+        first, _ = _orchestrator(monkeypatch, sqlite_session, games, _FakeOdds(events))
+        asyncio.run(first.run_incremental_sync())
+
+        games[0] = games[0][:4] + (3,)
+        orchestrator, sync_stats = _orchestrator(monkeypatch, sqlite_session, games, _FakeOdds(events))
+        run = asyncio.run(orchestrator.run_incremental_sync())
+        again, again_sync_stats = _orchestrator(monkeypatch, sqlite_session, games, _FakeOdds(events))
+        asyncio.run(again.run_incremental_sync())
+
+        final = sqlite_session.query(Game).filter(Game.external_id == '0022500601').one()
+        stats_meta = sqlite_session.query(SyncMetadata).filter(
+            SyncMetadata.source == 'nba_api', SyncMetadata.data_type == 'player_stats'
+        ).one()
+        assert run['stages']['games']['result']['changed'] == 1
+        assert run['stages']['stats']['result']['matched'] == 440
+        sync_stats.assert_awaited_once_with(games_limit=50, season='2025-26', bulk=True)
+        again_sync_stats.assert_not_called()
+        assert stats_meta.watermark == final.updated_at
+
+    def test_odds_failure_skips_match_only(self, sqlite_session, slate, monkeypatch):
+        add_team_mappings(sqlite_session)
+        games, _ = slate
+        games[0] = games[0][:4] + (3,)
+
+        orchestrator, _ = _orchestrator(
+            monkeypatch, sqlite_session, games, _FakeOdds(RuntimeError("quota exhausted"))
+        )
+        run = asyncio.run(orchestrator.run_incremental_sync())
+
+        status = {name: entry['status'] for name, entry in run['stages'].items()}
+        assert status == {'games': 'success', 'odds': 'failed', 'match': 'skipped', 'stats': 'success'}
+        rows = {
+            (m.source, m.data_type): m for m in sqlite_session.query(SyncMetadata)
+        }
+        assert rows[('odds_api', 'odds')].last_sync_status == 'failed'
+        assert rows[('odds_api', 'odds')].error_message == 'quota exhausted'
+        assert rows[('nba_api', 'games')].last_sync_status == 'success'
+        assert rows[('nba_api', 'games')].sync_duration_ms is not None
+        assert ('sync', 'game_matching') not in rows
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Sessions on one SQLite file, so each stage can have its own."""
+    from app.models.unified import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'sync.db'}")
+    created_indexes = set()
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+            for index in table.indexes:
+                if index.name not in created_indexes:
+                    created_indexes.add(index.name)
+                    conn.execute(CreateIndex(index))
+
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+class TestStageSessions:
+    """Concurrent stages do not share a session."""
+
+    def test_failing_stage_keeps_sibling_writes(self, session_factory, slate, monkeypatch):
+        db = session_factory()
+        add_team_mappings(db)
+        games, _ = slate
+
+        opened = []
+
+        def counting_factory():
+            session = session_factory()
+            opened.append(session)
+            return session
+
+        orchestrator, _ = _orchestrator(
+            monkeypatch, db, games, _FakeOdds(RuntimeError("quota exhausted")),
+            session_factory=counting_factory
+        )
+
+        async def slow_scoreboard(*args, **kwargs):
+            # Still in flight when the odds stage fails and rolls back
+            await asyncio.sleep(0.05)
+            return _scoreboard(games)
+
+        monkeypatch.setattr(NbaApiAdapter, '_fetch_nba_scoreboard_with_retry', slow_scoreboard)
+
+        run = asyncio.run(orchestrator.run_incremental_sync(include_stats=False))
+
+        status = {name: entry['status'] for name, entry in run['stages'].items()}
+        assert status == {'games': 'success', 'odds': 'failed', 'match': 'skipped'}
+        assert len(opened) == 2
+        assert db not in opened
+
+        check = session_factory()
+        rows = {(m.source, m.data_type): m.last_sync_status for m in check.query(SyncMetadata)}
+        assert rows == {('nba_api', 'games'): 'success', ('odds_api', 'odds'): 'failed'}
+        assert check.query(Game).count() == 2
+        check.close()
+        db.close()
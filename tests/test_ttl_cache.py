@@ -0,0 +1,147 @@
+"""Unit tests for the shared bounded TTL/LRU cache.
+
+Test Strategy:
+1. Entries expire after their TTL; reads refresh LRU order and the least
+   recently used entry is evicted past max_size
+2. sweep() drops expired entries without a read
+3. Stats count hits, misses, evictions and expirations per namespace and
+   are exported as Prometheus gauges
+4. Services share one bounded cache per namespace; GameOddsMapper
+   remembers live-query fallback misses
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core import metrics
+from app.core.cache import TTLCache, all_cache_stats, get_cache, sweep_all_caches
+from app.services.core.odds_cache import MemoryOddsCache
+from app.services.nba.game_odds_mapper import GameOddsMapper
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestTTLCache:
+    """Expiry, LRU eviction and sweeping."""
+
+    def test_entries_expire_after_ttl(self, clock):
+        cache = TTLCache("test", max_size=10, default_ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=5)
+
+        clock[0] += 10
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_least_recently_used_evicted(self, clock):
+        cache = TTLCache("test", max_size=3)
+        for key in "abc":
+            cache.set(key, key)
+        cache.get("a")
+
+        cache.set("d", "d")
+
+        assert "b" not in cache
+        assert all(k in cache for k in "acd")
+        assert len(cache) == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_sweep_drops_expired_without_reads(self, clock):
+        cache = TTLCache("test", max_size=100, default_ttl=30, sweep_interval=3600)
+        for i in range(10):
+            cache.set(i, i, ttl=10 if i % 2 else 60)
+
+        clock[0] += 20
+
+        assert cache.sweep() == 5
+        assert len(cache) == 5
+        assert cache.stats()["misses"] == 0
+
+    def test_writes_sweep_when_interval_elapsed(self, clock):
+        cache = TTLCache("test", max_size=100, sweep_interval=60)
+        cache.set("old", 1, ttl=10)
+        clock[0] += 61
+
+        cache.set("new", 2)
+
+        assert len(cache) == 1
+
+    def test_stats(self, clock):
+        cache = TTLCache("test", max_size=10)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(0.667, abs=1e-3)
+
+
+class TestRegistry:
+    """Namespace caches, sweeping and gauges."""
+
+    def test_namespace_shared_and_bounded(self):
+        first = get_cache("test_registry", max_size=2)
+
+        assert get_cache("test_registry", max_size=100) is first
+        assert first.max_size == 2
+
+    def test_sweep_all_and_gauges(self, clock):
+        cache = get_cache("test_gauges", max_size=5)
+        cache.set("fresh", 1, ttl=100)
+        cache.set("stale", 2, ttl=1)
+        cache.get("fresh")
+        clock[0] += 5
+
+        assert sweep_all_caches() >= 1
+        metrics.update_cache_metrics()
+
+        assert all_cache_stats()["test_gauges"]["entries"] == 1
+        assert metrics.cache_entries.labels(namespace="test_gauges")._value.get() == 1
+        assert metrics.cache_hits.labels(namespace="test_gauges")._value.get() == 1
+
+
+class TestServiceCaches:
+    """Migrated services use the bounded caches."""
+
+    def test_memory_odds_cache_is_bounded(self):
+        backend = MemoryOddsCache(TTLCache("odds_api_test", max_size=2))
+        for key in "abc":
+            backend.set(key, {"k": key}, ttl=60, quota_cost=4)
+
+        assert backend.get("a") is None
+        assert backend.get("c") == ({"k": "c"}, 4)
+        assert backend.stats() == {"backend": "memory", "entries": 2, "hits": 1, "quota_saved": 4}
+
+    def test_espn_instances_share_cache(self):
+        from app.services.core.espn_service import ESPNApiService
+
+        first, second = ESPNApiService(cache_ttl=300), ESPNApiService(cache_ttl=300)
+        asyncio.run(first._set_cache("scoreboard", {"events": []}))
+
+        assert asyncio.run(second._get_cached("scoreboard")) == {"events": []}
+        assert first._cache is get_cache("espn")
+
+    def test_game_odds_mapper_remembers_fallback_miss(self):
+        odds_service = MagicMock()
+        odds_service.get_upcoming_games_with_odds = AsyncMock(return_value=[])
+        mapper = GameOddsMapper(MagicMock(), odds_api_service=odds_service)
+        game = SimpleNamespace(id="game-1", away_team="NYK", home_team="BOS")
+
+        async def run():
+            return [await mapper._query_odds_api_fallback(game) for _ in range(3)]
+
+        assert asyncio.run(run()) == [None, None, None]
+        assert odds_service.get_upcoming_games_with_odds.await_count == 1
@@ -0,0 +1,151 @@
+"""Integration tests against the offline upstream stand-in server.
+
+Test Strategy:
+1. OddsApiService pointed at the stub fetches the slate and 10-book props,
+   tracks quota from the x-requests-* headers and hits 401 once it is spent
+2. ESPNApiService parses the stub's scoreboard and boxscore
+3. nba_api endpoints follow NBA_STATS_BASE_URL; the CDN scoreboard follows
+   NBA_CDN_BASE_URL
+4. Latency and error injection apply to upstream routes, not /_stub controls
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services.core.espn_service import ESPNApiService
+from app.services.core.odds_api_service import OddsApiService
+from app.services.core.odds_cache import MemoryOddsCache
+
+
+def _odds_service(stub):
+    return OddsApiService(
+        api_key="stub", cache_ttl=300, cache_backend=MemoryOddsCache(), base_url=stub.odds_api_url
+    )
+
+
+async def _run_and_close(service, coro):
+    try:
+        return await coro
+    finally:
+        await service.close()
+
+
+class TestOddsApiStub:
+    """The Odds API routes and quota accounting."""
+
+    def test_slate_and_props(self, upstream_stub):
+        upstream_stub.configure(events=14)
+        service = _odds_service(upstream_stub)
+
+        async def run():
+            games = await service.get_upcoming_games_with_odds(days_ahead=7)
+            props = await service.get_event_player_props(games[-1]["id"])
+            return games, props
+
+        games, props = asyncio.run(_run_and_close(service, run()))
+
+        assert len(games) == 14
+        assert len({g["id"] for g in games}) == 14
+        assert len(props["data"]["bookmakers"]) >= 10
+        assert props["data"]["home_team"] == games[-1]["home_team"]
+        assert service.requests_remaining == upstream_stub.stats()["quota_remaining"]
+
+    def test_quota_exhaustion_returns_401(self, upstream_stub):
+        upstream_stub.configure(quota=4)
+
+        with httpx.Client(base_url=upstream_stub.odds_api_url) as client:
+            params = {"apiKey": "stub", "markets": "player_points,player_rebounds,player_assists"}
+            first = client.get("/sports/basketball_nba/events/abc/odds", params=params)
+            second = client.get("/sports/basketball_nba/events/abc/odds", params=params)
+
+        assert first.status_code == 200
+        assert first.headers["x-requests-remaining"] == "1"
+        assert first.headers["x-requests-last"] == "3"
+        assert second.status_code == 401
+        assert second.json()["error_code"] == "OUT_OF_USAGE_CREDITS"
+
+
+class TestEspnStub:
+    """ESPN site API routes."""
+
+    def test_scoreboard_and_boxscore(self, upstream_stub):
+        service = ESPNApiService(cache_ttl=300, base_url=upstream_stub.espn_url)
+
+        async def run():
+            games = await service.get_scoreboard("nba", date="20260115")
+            boxscore = await service.get_boxscore("nba", int(games[0]["id"]))
+            return games, boxscore
+
+        games, boxscore = asyncio.run(run())
+
+        assert len(games) == 10
+        assert games[0]["home_abbr"] == "BOS"
+        assert len(boxscore["PlayerStats"]) == 16
+        assert all(row["PTS"] is not None for row in boxscore["PlayerStats"])
+
+
+class TestNbaStub:
+    """nba_api stats and NBA.com CDN routes."""
+
+    @pytest.fixture
+    def stats_base_url(self, upstream_stub):
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        from app.services.nba.nba_api_service import configure_nba_stats_base_url
+
+        original = NBAStatsHTTP.base_url
+        configure_nba_stats_base_url(upstream_stub.nba_stats_url)
+        yield
+        NBAStatsHTTP.base_url = original
+
+    def test_player_game_log(self, upstream_stub, stats_base_url):
+        from nba_api.stats.endpoints import playergamelog
+
+        frame = playergamelog.PlayerGameLog(player_id=1628369, season="2025-26").get_data_frames()[0]
+
+        assert len(frame) == 40
+        assert set(frame["Player_ID"]) == {1628369}
+        assert upstream_stub.stats()["requests"]["nba_stats.playergamelog"] == 1
+
+    def test_league_game_log_date_filter(self, upstream_stub, stats_base_url):
+        from nba_api.stats.endpoints import leaguegamelog
+
+        frame = leaguegamelog.LeagueGameLog(
+            player_or_team_abbreviation="P", season="2025-26",
+            date_from_nullable="01/13/2026", date_to_nullable="01/13/2026"
+        ).get_data_frames()[0]
+
+        assert len(frame) > 100
+        assert set(frame["GAME_DATE"]) == {"2026-01-13"}
+
+    def test_cdn_scoreboard(self, upstream_stub, sqlite_session, monkeypatch):
+        from app.core.config import settings
+        from app.models import Game
+        from app.services.sync.adapters.nba_api_adapter import NbaApiAdapter
+
+        monkeypatch.setattr(settings, "NBA_CDN_BASE_URL", upstream_stub.nba_cdn_url)
+
+        games = asyncio.run(NbaApiAdapter(sqlite_session).fetch_games())
+
+        assert len(games) == 10
+        assert {g["home_team"] for g in games} >= {"BOS", "MIA", "CHI"}
+        assert sqlite_session.query(Game).count() == 10
+
+
+class TestFaultInjection:
+    """Latency and error rate."""
+
+    def test_error_rate_and_latency(self, upstream_stub):
+        upstream_stub.configure(error_rate=0.5, error_status=503, latency_ms=20, seed=7)
+
+        with httpx.Client(base_url=upstream_stub.url) as client:
+            started = time.perf_counter()
+            statuses = [client.get("/v4/sports", params={"apiKey": "stub"}).status_code for _ in range(20)]
+            elapsed = time.perf_counter() - started
+            control = client.get("/_stub/stats").json()
+
+        assert set(statuses) == {200, 503}
+        assert control["errors_injected"] == statuses.count(503)
+        assert elapsed >= 20 * 0.02